@@ -0,0 +1,220 @@
+"""Throughput and latency benchmarks for the MCP tools, over stdio and streamable HTTP.
+
+Starts the offline Graph API simulator, launches the server as a subprocess
+pointed at it (META_ADS_GRAPH_API_BASE), and times tools/call round-trips
+through a real MCP client session for each transport. Every tool in the tool
+manifest is benchmarked with the simulator's fixture for it
+(GraphSimulator.tool_calls); tools that cannot run offline are listed with the
+reason in graph_simulator.UNSIMULATED_TOOLS and skipped:
+
+    python benchmarks/bench_tools.py                          # both transports
+    python benchmarks/bench_tools.py --transport stdio --iterations 50 --latency 0.05
+    python benchmarks/bench_tools.py --json results.json      # save results
+    python benchmarks/bench_tools.py --compare results.json   # fail on regressions
+
+With --compare, every (transport, case) whose median latency grew by more than
+--max-regression (default 25%) over the baseline is reported and the script
+exits with status 1, so it can gate CI the way asv continuous does.
+
+The response cache and client-side rate limiter are disabled by default so
+every call exercises the full request path; pass --cache / --rate-limit to
+measure with them on.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+from meta_ads_mcp.core.graph_simulator import (
+    UNSIMULATED_TOOLS,
+    BackgroundSimulator,
+    add_simulator_arguments,
+    simulator_from_args,
+)
+from meta_ads_mcp.core.load_test import (
+    free_port,
+    server_environment,
+    start_http_server,
+    stop_process,
+    summarize,
+    text_reports_error,
+)
+from meta_ads_mcp.core.tool_manifest import load_manifest
+
+
+ACCESS_TOKEN = "benchmark-token"
+
+
+async def measure_case(session: ClientSession, tool: str, arguments: Dict[str, Any],
+                       iterations: int, warmup: int, concurrency: int) -> Dict[str, Any]:
+    """Call one tool repeatedly on an initialized session and summarize the latencies"""
+    arguments = dict(arguments, access_token=ACCESS_TOKEN)
+    for _ in range(warmup):
+        await session.call_tool(tool, arguments)
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = iterations
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            result = await session.call_tool(tool, arguments)
+            latencies.append(time.perf_counter() - started)
+            if result.isError or _has_error(result):
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def _has_error(result) -> bool:
+    return any(text_reports_error(content.text) for content in result.content if getattr(content, "text", None))
+
+
+async def run_cases(session: ClientSession, transport: str, cases, args) -> List[Dict[str, Any]]:
+    await session.initialize()
+    results = []
+    for label, tool, arguments in cases:
+        summary = await measure_case(session, tool, arguments, args.iterations, args.warmup, args.concurrency)
+        results.append({"transport": transport, "case": label, "tool": tool, **summary})
+        _print_row(results[-1])
+    return results
+
+
+async def bench_stdio(cases, env: Dict[str, str], args) -> List[Dict[str, Any]]:
+    params = StdioServerParameters(command=sys.executable, args=["-m", "meta_ads_mcp"], env=env)
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write, read_timeout_seconds=timedelta(seconds=60)) as session:
+                return await run_cases(session, "stdio", cases, args)
+
+
+async def bench_http(cases, env: Dict[str, str], args) -> List[Dict[str, Any]]:
+    port = free_port()
+    process = start_http_server(env, port)
+    try:
+        async with streamablehttp_client(f"http://127.0.0.1:{port}/mcp") as (read, write, _):
+            async with ClientSession(read, write, read_timeout_seconds=timedelta(seconds=60)) as session:
+                return await run_cases(session, "http", cases, args)
+    finally:
+        stop_process(process)
+
+
+def _print_header() -> None:
+    print(f"{'transport':<10} {'case':<44} {'calls':>6} {'errors':>6} {'mean ms':>9} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ops/s':>9}")
+
+
+def _print_row(row: Dict[str, Any]) -> None:
+    print(f"{row['transport']:<10} {row['case']:<44} {row['calls']:>6} {row['errors']:>6} {row['mean_ms']:>9.2f} "
+          f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['ops_per_second']:>9.1f}",
+          flush=True)
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, max_regression: float) -> List[str]:
+    """
+    Compare median latencies against a saved run.
+
+    Returns:
+        One message per (transport, case) that regressed beyond max_regression
+    """
+    with open(baseline_path) as f:
+        baseline = {(row["transport"], row["case"]): row for row in json.load(f)["results"]}
+    regressions = []
+    for row in results:
+        previous = baseline.get((row["transport"], row["case"]))
+        if not previous or not previous["p50_ms"]:
+            continue
+        change = row["p50_ms"] / previous["p50_ms"] - 1
+        if change > max_regression:
+            regressions.append(f"{row['transport']} {row['case']}: p50 {previous['p50_ms']:.2f} ms -> "
+                               f"{row['p50_ms']:.2f} ms (+{change:.0%})")
+    return regressions
+
+
+async def run(args) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    simulator = simulator_from_args(args)
+    manifest = load_manifest()
+    if manifest is None:
+        raise SystemExit("Tool manifest not found; run `meta-ads-mcp --write-tool-manifest` first")
+    tool_names = [tool["name"] for tool in manifest]
+    cases = simulator.manifest_cases(tool_names)
+    skipped = [name for name in tool_names if name in UNSIMULATED_TOOLS]
+    if skipped:
+        print(f"Not benchmarked (no offline equivalent): {', '.join(skipped)}")
+    if args.cases:
+        wanted = set(args.cases.split(","))
+        cases = [case for case in cases if case[0] in wanted or case[1] in wanted]
+
+    results: List[Dict[str, Any]] = []
+    with BackgroundSimulator(simulator) as background:
+        env = server_environment(background.api_base, args.cache, args.rate_limit)
+        _print_header()
+        if args.transport in ("stdio", "both"):
+            results += await bench_stdio(cases, env, args)
+        if args.transport in ("http", "both"):
+            results += await bench_http(cases, env, args)
+        graph_stats = simulator.stats()
+    return results, graph_stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Meta Ads MCP tools against the Graph API simulator")
+    parser.add_argument("--transport", choices=["stdio", "http", "both"], default="both")
+    parser.add_argument("--iterations", type=int, default=20, help="Measured calls per case")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured calls per case before timing")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent calls in flight per case")
+    parser.add_argument("--cases", help="Comma-separated case labels or tool names to run (default: all)")
+    parser.add_argument("--cache", action="store_true", help="Leave the response cache enabled")
+    parser.add_argument("--rate-limit", action="store_true", help="Leave the client-side rate limiter enabled")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--compare", help="Baseline results file to compare median latencies against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed relative p50 slowdown before --compare fails (default: 0.25)")
+    add_simulator_arguments(parser)
+    args = parser.parse_args(argv)
+
+    results, graph_stats = asyncio.run(run(args))
+    print(f"\nGraph simulator served {graph_stats['requests']} requests: {graph_stats['responses_by_status']}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "meta": {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                    "options": {k: v for k, v in vars(args).items() if k not in ("json", "compare")},
+                },
+                "results": results,
+                "graph": graph_stats,
+            }, f, indent=2)
+        print(f"Results written to {args.json}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.max_regression)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.max_regression:.0%}:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"\nNo regressions beyond {args.max_regression:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
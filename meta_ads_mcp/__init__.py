@@ -29,26 +29,13 @@ __all__ = [
     'main'
 ]
 
-# Import key functions to make them available at package level
-from .core import (
-    get_ad_accounts,
-    get_account_info,
-    get_campaigns,
-    get_campaign_details,
-    create_campaign,
-    get_adsets,
-    get_adset_details,
-    update_adset,
-    get_ads,
-    get_ad_details,
-    get_ad_creatives,
-    get_ad_image,
-    update_ad,
-    get_insights,
-    get_login_link,
-    login_cli,
-    main
-)
+def __getattr__(name):
+    # Resolve tool functions through core on first access so that importing the
+    # package does not import tool modules the lazy startup mode defers
+    if name in __all__:
+        from . import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Define a main function to be used as a package entry point
 def entrypoint():
@@ -1,20 +1,50 @@
 """Core functionality for Meta Ads API MCP package."""
 
-from .server import mcp_server
-from .accounts import get_ad_accounts, get_account_info
-from .campaigns import get_campaigns, get_campaign_details, create_campaign
-from .adsets import get_adsets, get_adset_details, update_adset
-from .ads import get_ads, get_ad_details, get_ad_creatives, get_ad_image, update_ad
-from .insights import get_insights
-from .authentication import get_login_link
-from .server import login_cli, main
-from .auth import login
-from .ads_library import search_ads_archive, upload_video_from_supabase, list_account_videos, list_supabase_videos
-from .budget_schedules import create_budget_schedule
-from . import reports  # Import module to register conditional tools
-from . import duplication  # Import module to register conditional duplication tools
-from . import leadgen_forms  # Import module to register lead form tools
-from . import search_targeting  # Import module to register search and targeting tools
+import importlib
+
+from .server import mcp_server, login_cli, main
+from .tool_manifest import LAZY_TOOLS, load_tool_modules, register_lazy_tools
+
+# Importing a tool module registers its tools. In lazy mode the schemas come
+# from the tool manifest and each module is imported on its first tool call.
+if not (LAZY_TOOLS and register_lazy_tools(mcp_server)):
+    load_tool_modules()
+
+# Public tool functions, resolved from their module on first access
+_EXPORTS = {
+    'get_ad_accounts': 'accounts',
+    'get_account_info': 'accounts',
+    'get_campaigns': 'campaigns',
+    'get_campaign_details': 'campaigns',
+    'create_campaign': 'campaigns',
+    'get_adsets': 'adsets',
+    'get_adset_details': 'adsets',
+    'update_adset': 'adsets',
+    'get_ads': 'ads',
+    'get_ad_details': 'ads',
+    'get_ad_creatives': 'ads',
+    'get_ad_image': 'ads',
+    'update_ad': 'ads',
+    'get_insights': 'insights',
+    'get_login_link': 'authentication',
+    'login': 'auth',
+    'search_ads_archive': 'ads_library',
+    'upload_video_from_supabase': 'ads_library',
+    'list_account_videos': 'ads_library',
+    'list_supabase_videos': 'ads_library',
+    'create_budget_schedule': 'budget_schedules',
+    'batch_api_request': 'batch',
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'mcp_server',
@@ -41,4 +71,5 @@ __all__ = [
     'list_account_videos',
     'list_supabase_videos',
     'create_budget_schedule',
-] 
\ No newline at end of file
+    'batch_api_request',
+]
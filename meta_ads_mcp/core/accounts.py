@@ -4,6 +4,13 @@ import json
 from typing import Optional
 from .api import meta_api_tool, make_api_request
 from .server import mcp_server
+from .rate_limit import rate_limiter
+from .circuit_breaker import circuit_breakers
+from .tenants import tenant_registry
+from .token_introspection import token_introspector
+from .cache import response_cache
+from .singleflight import request_coalescer
+from .serialization import dumps_result
 
 
 @mcp_server.tool()
@@ -25,7 +32,7 @@ async def get_ad_accounts(access_token: str = None, user_id: str = "me", limit:
     
     data = await make_api_request(endpoint, access_token, params)
     
-    return json.dumps(data, indent=2)
+    return data
 
 
 @mcp_server.tool()
@@ -46,7 +53,7 @@ async def get_account_info(access_token: str = None, account_id: str = None) ->
         if "data" in accounts_data and accounts_data["data"]:
             account_id = accounts_data["data"][0]["id"]
         else:
-            return json.dumps({"error": "No account ID specified and no accounts found for user"}, indent=2)
+            return {"error": "No account ID specified and no accounts found for user"}
     
     # Ensure account_id has the 'act_' prefix for API compatibility
     if not account_id.startswith("act_"):
@@ -59,4 +66,52 @@ async def get_account_info(access_token: str = None, account_id: str = None) ->
     
     data = await make_api_request(endpoint, access_token, params)
     
-    return json.dumps(data, indent=2) 
\ No newline at end of file
+    return data
+
+
+@mcp_server.tool()
+async def get_rate_limit_status(account_id: str = None) -> str:
+    """
+    Get current Meta API rate-limit utilization as reported by the usage headers.
+    
+    Requests are automatically slowed down as utilization approaches Meta's limits.
+    Use this to check how much headroom is left before running many calls.
+    Accounts or endpoints whose circuit breaker is open are listed under "circuit_breakers".
+    
+    Args:
+        account_id: Optional Meta Ads account ID (format: act_XXXXXXXXX) to limit the output to
+    """
+    # HTTP clients with their own token see their own account buckets and breakers
+    tenant = tenant_registry.current_identity()
+    status = rate_limiter.get_status(account_id, tenant)
+    status["circuit_breakers"] = circuit_breakers.get_status(tenant)
+    return dumps_result(status)
+
+
+@mcp_server.tool()
+async def get_api_cache_stats(clear: bool = False) -> str:
+    """
+    Get hit/miss statistics for the Graph API response cache.
+    
+    Read-only Graph responses are cached in memory with per-endpoint TTLs and
+    invalidated when the same object is written. Concurrent identical reads are
+    coalesced into a single request.
+    
+    Args:
+        clear: Empty the cache after reading the statistics (default: False). HTTP clients
+            with their own token only remove the responses fetched with that token.
+    """
+    stats = {
+        "cache": response_cache.get_stats(),
+        "coalescing": request_coalescer.get_stats(),
+        "token_introspection": token_introspector.get_stats(),
+    }
+    if clear:
+        tenant = tenant_registry.current_identity()
+        if tenant is None:
+            response_cache.clear()
+        else:
+            # One client must not wipe the responses cached for everyone else
+            stats["cleared_entries"] = await response_cache.clear_tenant(tenant)
+        stats["cleared"] = True
+    return dumps_result(stats)
@@ -2,22 +2,26 @@
 
 import json
 from typing import Optional, Dict, Any, List
-import io
-from PIL import Image as PILImage
 from mcp.server.fastmcp import Image
 import os
 import time
 
 from .api import meta_api_tool, make_api_request
 from .accounts import get_ad_accounts
-from .utils import download_image, try_multiple_download_methods, extract_creative_image_urls
+from .utils import logger, download_image, try_multiple_download_methods, extract_creative_image_urls
 from .server import mcp_server
+from .batch import make_batch_request, batch_get
+from .pagination import fetch_all_pages, fetch_all_page_size
+from .tracing import tracer
+from .image_processing import image_processor
+from .image_store import image_store
 
 
 @mcp_server.tool()
 @meta_api_tool
 async def get_ads(access_token: str = None, account_id: str = None, limit: int = 10, 
-                 campaign_id: str = "", adset_id: str = "") -> str:
+                 campaign_id: str = "", adset_id: str = "", after: str = "",
+                 fetch_all: bool = False, max_items: int = None) -> str:
     """
     Get ads for a Meta Ads account with optional filtering.
     
@@ -27,6 +31,9 @@ async def get_ads(access_token: str = None, account_id: str = None, limit: int =
         limit: Maximum number of ads to return (default: 10)
         campaign_id: Optional campaign ID to filter by
         adset_id: Optional ad set ID to filter by
+        after: Pagination cursor to get the next set of results
+        fetch_all: Follow pagination cursors and return all ads in one response, fetching at least 500 per page (default: False)
+        max_items: Maximum total number of ads to return across pages (implies fetch_all)
     """
     # If no account ID is specified, try to get the first one for the user
     if not account_id:
@@ -36,7 +43,7 @@ async def get_ads(access_token: str = None, account_id: str = None, limit: int =
         if "data" in accounts_data and accounts_data["data"]:
             account_id = accounts_data["data"][0]["id"]
         else:
-            return json.dumps({"error": "No account ID specified and no accounts found for user"}, indent=2)
+            return {"error": "No account ID specified and no accounts found for user"}
     
     # Use campaign-specific endpoint if campaign_id is provided
     if campaign_id:
@@ -59,9 +66,16 @@ async def get_ads(access_token: str = None, account_id: str = None, limit: int =
         if adset_id:
             params["adset_id"] = adset_id
 
-    data = await make_api_request(endpoint, access_token, params)
+    if after:
+        params["after"] = after
+    
+    if fetch_all or max_items is not None:
+        params["limit"] = fetch_all_page_size(limit)
+        data = await fetch_all_pages(endpoint, access_token, params, max_items=max_items)
+    else:
+        data = await make_api_request(endpoint, access_token, params)
     
-    return json.dumps(data, indent=2)
+    return data
 
 
 @mcp_server.tool()
@@ -75,7 +89,7 @@ async def get_ad_details(access_token: str = None, ad_id: str = None) -> str:
         ad_id: Meta Ads ad ID
     """
     if not ad_id:
-        return json.dumps({"error": "No ad ID provided"}, indent=2)
+        return {"error": "No ad ID provided"}
         
     endpoint = f"{ad_id}"
     params = {
@@ -84,7 +98,7 @@ async def get_ad_details(access_token: str = None, ad_id: str = None) -> str:
     
     data = await make_api_request(endpoint, access_token, params)
     
-    return json.dumps(data, indent=2)
+    return data
 
 
 @mcp_server.tool()
@@ -115,16 +129,16 @@ async def create_ad(
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     if not name:
-        return json.dumps({"error": "No ad name provided"}, indent=2)
+        return {"error": "No ad name provided"}
     
     if not adset_id:
-        return json.dumps({"error": "No ad set ID provided"}, indent=2)
+        return {"error": "No ad set ID provided"}
     
     if not creative_id:
-        return json.dumps({"error": "No creative ID provided"}, indent=2)
+        return {"error": "No creative ID provided"}
     
     endpoint = f"{account_id}/ads"
     
@@ -145,14 +159,14 @@ async def create_ad(
     
     try:
         data = await make_api_request(endpoint, access_token, params, method="POST")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return {
             "error": "Failed to create ad",
             "details": error_msg,
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -166,7 +180,7 @@ async def get_ad_creatives(access_token: str = None, ad_id: str = None) -> str:
         ad_id: Meta Ads ad ID
     """
     if not ad_id:
-        return json.dumps({"error": "No ad ID provided"}, indent=2)
+        return {"error": "No ad ID provided"}
         
     endpoint = f"{ad_id}/adcreatives"
     params = {
@@ -181,7 +195,100 @@ async def get_ad_creatives(access_token: str = None, ad_id: str = None) -> str:
             # Llama a la nueva función de utilidad
             creative['image_urls_for_viewing'] = extract_creative_image_urls(creative)
     
-    return json.dumps(data, indent=2)
+    return data
+
+
+async def _get_ad_and_creative_details(ad_id: str, access_token: str) -> tuple:
+    """
+    Fetch an ad and its creative details in a single batch round-trip.
+    
+    Args:
+        ad_id: Meta Ads ad ID
+        access_token: Meta API access token
+    
+    Returns:
+        Tuple of (ad_data, creative_details) dictionaries shaped like make_api_request output;
+        either carries an "error" key when its sub-request failed
+    """
+    results = await make_batch_request([
+        {
+            "name": "ad",
+            "method": "GET",
+            "endpoint": ad_id,
+            "params": {"fields": "creative{id},account_id"}
+        },
+        {
+            "method": "GET",
+            "relative_url": "?ids={result=ad:$.creative.id}&fields=id,name,image_hash,asset_feed_spec"
+        }
+    ], access_token)
+    
+    ad_result, creative_result = results
+    ad_data = ad_result["data"] if "data" in ad_result else {"error": ad_result["error"]}
+    
+    # The ids= lookup returns a dictionary keyed by creative ID
+    creative_details = {}
+    if "error" in creative_result:
+        creative_details = {"error": creative_result["error"]}
+    elif isinstance(creative_result.get("data"), dict):
+        creative_details = next(iter(creative_result["data"].values()), {})
+    
+    return ad_data, creative_details
+
+
+async def _get_image_bytes(account_id: str, image_hash: str, access_token: str) -> tuple:
+    """
+    Get the original bytes of an ad image, from the image cache when possible.
+    
+    Image hashes identify content, so a cached copy never goes stale. On a miss
+    the image URL is looked up through adimages and downloaded, then cached.
+    
+    Returns:
+        (image bytes, None) on success or (None, error message)
+    """
+    image_bytes = await image_store.get(image_hash)
+    if image_bytes:
+        logger.debug("Using cached image for hash %s", image_hash)
+        return image_bytes, None
+    
+    # Fetch image data using adimages endpoint with specific format
+    image_endpoint = f"act_{account_id}/adimages"
+    
+    # Format the hashes parameter exactly as in our successful curl test
+    hashes_str = f'["{image_hash}"]'  # Format first hash only, as JSON string array
+    
+    image_params = {
+        "fields": "hash,url,width,height,name,status",
+        "hashes": hashes_str
+    }
+    
+    print(f"Requesting image data with params: {image_params}")
+    image_data = await make_api_request(image_endpoint, access_token, image_params)
+    
+    if "error" in image_data:
+        return None, f"Failed to get image data - {json.dumps(image_data)}"
+    
+    if "data" not in image_data or not image_data["data"]:
+        return None, "No image data returned from API"
+    
+    # Get the first image URL
+    first_image = image_data["data"][0]
+    image_url = first_image.get("url")
+    
+    if not image_url:
+        return None, "No valid image URL found"
+    
+    print(f"Downloading image from URL: {image_url}")
+    
+    # Download the image
+    image_bytes = await download_image(image_url)
+    
+    if not image_bytes:
+        return None, "Failed to download image"
+    
+    await image_store.put(image_hash, image_bytes, first_image)
+    return image_bytes, None
+
 
 @mcp_server.tool()
 @meta_api_tool
@@ -201,13 +308,8 @@ async def get_ad_image(access_token: str = None, ad_id: str = None) -> Image:
         
     print(f"Attempting to get and analyze creative image for ad {ad_id}")
     
-    # First, get creative and account IDs
-    ad_endpoint = f"{ad_id}"
-    ad_params = {
-        "fields": "creative{id},account_id"
-    }
-    
-    ad_data = await make_api_request(ad_endpoint, access_token, ad_params)
+    # First, get creative and account IDs along with the creative details
+    ad_data, creative_details = await _get_ad_and_creative_details(ad_id, access_token)
     
     if "error" in ad_data:
         return f"Error: Could not get ad data - {json.dumps(ad_data)}"
@@ -226,13 +328,8 @@ async def get_ad_image(access_token: str = None, ad_id: str = None) -> Image:
     if not creative_id:
         return "Error: No creative ID found"
     
-    # Get creative details to find image hash
-    creative_endpoint = f"{creative_id}"
-    creative_params = {
-        "fields": "id,name,image_hash,asset_feed_spec"
-    }
-    
-    creative_details = await make_api_request(creative_endpoint, access_token, creative_params)
+    if "error" in creative_details:
+        return f"Error: Could not get creative details - {json.dumps(creative_details)}"
     
     # Identify image hashes to use from creative
     image_hashes = []
@@ -264,59 +361,29 @@ async def get_ad_image(access_token: str = None, ad_id: str = None) -> Image:
     
     print(f"Found image hashes: {image_hashes}")
     
-    # Now fetch image data using adimages endpoint with specific format
-    image_endpoint = f"act_{account_id}/adimages"
-    
-    # Format the hashes parameter exactly as in our successful curl test
-    hashes_str = f'["{image_hashes[0]}"]'  # Format first hash only, as JSON string array
-    
-    image_params = {
-        "fields": "hash,url,width,height,name,status",
-        "hashes": hashes_str
-    }
+    # Reuse the converted image when this hash was processed recently
+    processed = image_processor.lookup(image_hashes[0])
+    if processed is not None:
+        return Image(data=processed[0], format="jpeg")
     
-    print(f"Requesting image data with params: {image_params}")
-    image_data = await make_api_request(image_endpoint, access_token, image_params)
-    
-    if "error" in image_data:
-        return f"Error: Failed to get image data - {json.dumps(image_data)}"
+    image_bytes, error = await _get_image_bytes(account_id, image_hashes[0], access_token)
+    if error:
+        return f"Error: {error}"
     
-    if "data" not in image_data or not image_data["data"]:
-        return "Error: No image data returned from API"
-    
-    # Get the first image URL
-    first_image = image_data["data"][0]
-    image_url = first_image.get("url")
-    
-    if not image_url:
-        return "Error: No valid image URL found"
-    
-    print(f"Downloading image from URL: {image_url}")
-    
-    # Download the image
-    image_bytes = await download_image(image_url)
-    
-    if not image_bytes:
-        return "Error: Failed to download image"
-    
-    try:
-        # Convert bytes to PIL Image
-        img = PILImage.open(io.BytesIO(image_bytes))
-        
-        # Convert to RGB if needed
-        if img.mode != "RGB":
-            img = img.convert("RGB")
+    with tracer.start_span("image.process", {"image.input.size": len(image_bytes)}) as span:
+        try:
+            # Decode, downscale and re-encode off the event loop
+            img_bytes, info = await image_processor.process(image_bytes, image_hashes[0])
+            span.set_attribute("image.width", info["width"])
+            span.set_attribute("image.height", info["height"])
+            span.set_attribute("image.output.size", len(img_bytes))
             
-        # Create a byte stream of the image data
-        byte_arr = io.BytesIO()
-        img.save(byte_arr, format="JPEG")
-        img_bytes = byte_arr.getvalue()
-        
-        # Return as an Image object that LLM can directly analyze
-        return Image(data=img_bytes, format="jpeg")
-        
-    except Exception as e:
-        return f"Error processing image: {str(e)}"
+            # Return as an Image object that LLM can directly analyze
+            return Image(data=img_bytes, format="jpeg")
+            
+        except Exception as e:
+            span.set_error(str(e))
+            return f"Error processing image: {str(e)}"
 
 
 @mcp_server.tool()
@@ -334,39 +401,30 @@ async def save_ad_image_locally(access_token: str = None, ad_id: str = None, out
         The file path to the saved image, or an error message string.
     """
     if not ad_id:
-        return json.dumps({"error": "No ad ID provided"}, indent=2)
+        return {"error": "No ad ID provided"}
         
     print(f"Attempting to get and save creative image for ad {ad_id}")
     
-    # First, get creative and account IDs
-    ad_endpoint = f"{ad_id}"
-    ad_params = {
-        "fields": "creative{id},account_id"
-    }
-    
-    ad_data = await make_api_request(ad_endpoint, access_token, ad_params)
+    # First, get creative and account IDs along with the creative details
+    ad_data, creative_details = await _get_ad_and_creative_details(ad_id, access_token)
     
     if "error" in ad_data:
-        return json.dumps({"error": f"Could not get ad data - {json.dumps(ad_data)}"}, indent=2)
+        return {"error": f"Could not get ad data - {json.dumps(ad_data)}"}
     
     account_id = ad_data.get("account_id")
     if not account_id:
-        return json.dumps({"error": "No account ID found for ad"}, indent=2)
+        return {"error": "No account ID found for ad"}
     
     if "creative" not in ad_data:
-        return json.dumps({"error": "No creative found for this ad"}, indent=2)
+        return {"error": "No creative found for this ad"}
         
     creative_data = ad_data.get("creative", {})
     creative_id = creative_data.get("id")
     if not creative_id:
-        return json.dumps({"error": "No creative ID found"}, indent=2)
+        return {"error": "No creative ID found"}
     
-    # Get creative details to find image hash
-    creative_endpoint = f"{creative_id}"
-    creative_params = {
-        "fields": "id,name,image_hash,asset_feed_spec"
-    }
-    creative_details = await make_api_request(creative_endpoint, access_token, creative_params)
+    if "error" in creative_details:
+        return {"error": f"Could not get creative details - {json.dumps(creative_details)}"}
     
     image_hashes = []
     if "image_hash" in creative_details:
@@ -389,60 +447,37 @@ async def save_ad_image_locally(access_token: str = None, ad_id: str = None, out
 
 
     if not image_hashes:
-        return json.dumps({"error": "No image hashes found in creative or fallback"}, indent=2)
+        return {"error": "No image hashes found in creative or fallback"}
 
     print(f"Found image hashes: {image_hashes}")
     
-    # Fetch image data using the first hash
-    image_endpoint = f"act_{account_id}/adimages"
-    hashes_str = f'["{image_hashes[0]}"]'
-    image_params = {
-        "fields": "hash,url,width,height,name,status",
-        "hashes": hashes_str
-    }
-    
-    print(f"Requesting image data with params: {image_params}")
-    image_data = await make_api_request(image_endpoint, access_token, image_params)
-    
-    if "error" in image_data:
-        return json.dumps({"error": f"Failed to get image data - {json.dumps(image_data)}"}, indent=2)
-    
-    if "data" not in image_data or not image_data["data"]:
-        return json.dumps({"error": "No image data returned from API"}, indent=2)
-        
-    first_image = image_data["data"][0]
-    image_url = first_image.get("url")
-    
-    if not image_url:
-        return json.dumps({"error": "No valid image URL found in API response"}, indent=2)
-        
-    print(f"Downloading image from URL: {image_url}")
-    
-    # Download and Save Image
-    image_bytes = await download_image(image_url)
+    # Create a filename (e.g., using ad_id and image hash)
+    file_extension = ".jpg" # Default extension, could try to infer from headers later
+    filename = f"{ad_id}_{image_hashes[0]}{file_extension}"
+    filepath = os.path.join(output_dir, filename)
+    
+    # Served from the image cache when this hash was downloaded before
+    if not await image_store.copy_to(image_hashes[0], filepath):
+        image_bytes, error = await _get_image_bytes(account_id, image_hashes[0], access_token)
+        if error:
+            return {"error": error}
+        
+        # Freshly cached images are copied too; write directly when they could not be cached
+        if not await image_store.copy_to(image_hashes[0], filepath):
+            try:
+                # Ensure output directory exists
+                if not os.path.exists(output_dir):
+                    os.makedirs(output_dir)
+                    
+                # Save the image bytes to the file
+                with open(filepath, "wb") as f:
+                    f.write(image_bytes)
+                    
+            except Exception as e:
+                return {"error": f"Failed to save image: {str(e)}"}
     
-    if not image_bytes:
-        return json.dumps({"error": "Failed to download image"}, indent=2)
-        
-    try:
-        # Ensure output directory exists
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
-        # Create a filename (e.g., using ad_id and image hash)
-        file_extension = ".jpg" # Default extension, could try to infer from headers later
-        filename = f"{ad_id}_{image_hashes[0]}{file_extension}"
-        filepath = os.path.join(output_dir, filename)
-        
-        # Save the image bytes to the file
-        with open(filepath, "wb") as f:
-            f.write(image_bytes)
-            
-        print(f"Image saved successfully to: {filepath}")
-        return json.dumps({"filepath": filepath}, indent=2) # Return JSON with filepath
-
-    except Exception as e:
-        return json.dumps({"error": f"Failed to save image: {str(e)}"}, indent=2)
+    print(f"Image saved successfully to: {filepath}")
+    return {"filepath": filepath} # Return JSON with filepath
 
 
 @mcp_server.tool()
@@ -465,7 +500,7 @@ async def update_ad(
         access_token: Meta API access token (optional - will use cached token if not provided)
     """
     if not ad_id:
-        return json.dumps({"error": "Ad ID is required"}, indent=2)
+        return {"error": "Ad ID is required"}
 
     params = {}
     if status:
@@ -477,12 +512,12 @@ async def update_ad(
         params["tracking_specs"] = json.dumps(tracking_specs) # Needs to be JSON encoded string
 
     if not params:
-        return json.dumps({"error": "No update parameters provided (status, bid_amount, or tracking_specs)"}, indent=2)
+        return {"error": "No update parameters provided (status, bid_amount, or tracking_specs)"}
 
     endpoint = f"{ad_id}"
     data = await make_api_request(endpoint, access_token, params, method='POST')
 
-    return json.dumps(data, indent=2)
+    return data
 
 
 @mcp_server.tool()
@@ -507,10 +542,10 @@ async def upload_ad_image(
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     if not image_path:
-        return json.dumps({"error": "No image path provided"}, indent=2)
+        return {"error": "No image path provided"}
     
     # Ensure account_id has the 'act_' prefix for API compatibility
     if not account_id.startswith("act_"):
@@ -518,7 +553,7 @@ async def upload_ad_image(
     
     # Check if image file exists
     if not os.path.exists(image_path):
-        return json.dumps({"error": f"Image file not found: {image_path}"}, indent=2)
+        return {"error": f"Image file not found: {image_path}"}
     
     try:
         # Read image file
@@ -546,13 +581,13 @@ async def upload_ad_image(
         print(f"Uploading image to Facebook Ad Account {account_id}")
         data = await make_api_request(endpoint, access_token, params, method="POST")
         
-        return json.dumps(data, indent=2)
+        return data
     
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to upload image",
             "details": str(e)
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -591,10 +626,10 @@ async def create_ad_creative(
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     if not image_hash:
-        return json.dumps({"error": "No image hash provided"}, indent=2)
+        return {"error": "No image hash provided"}
     
     if not name:
         name = f"Creative {int(time.time())}"
@@ -619,16 +654,16 @@ async def create_ad_creative(
                 page_id = pages_data["data"][0]["id"]
                 print(f"Using page ID: {page_id} ({pages_data['data'][0].get('name', 'Unknown')})")
             else:
-                return json.dumps({
+                return {
                     "error": "No page ID provided and no pages found for this account",
                     "suggestion": "Please provide a page_id parameter"
-                }, indent=2)
+                }
         except Exception as e:
-            return json.dumps({
+            return {
                 "error": "Error finding page for account",
                 "details": str(e),
                 "suggestion": "Please provide a page_id parameter"
-            }, indent=2)
+            }
     
     # Prepare the creative data
     creative_data = {
@@ -676,20 +711,32 @@ async def create_ad_creative(
             }
             
             creative_details = await make_api_request(creative_endpoint, access_token, creative_params)
-            return json.dumps({
+            return {
                 "success": True,
                 "creative_id": creative_id,
                 "details": creative_details
-            }, indent=2)
+            }
         
-        return json.dumps(data, indent=2)
+        return data
     
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to create ad creative",
             "details": str(e),
             "creative_data_sent": creative_data
-        }, indent=2)
+        }
+
+
+async def _get_page_details(page_ids, access_token: str) -> List[Dict[str, Any]]:
+    """Fetch details for several pages with batched Graph requests, skipping failures"""
+    page_params = {
+        "fields": "id,name,username,category,fan_count,link,verification_status,picture"
+    }
+    pages = await batch_get(
+        [{"endpoint": f"{page_id}", "params": page_params} for page_id in page_ids],
+        access_token
+    )
+    return [page_data for page_data in pages if isinstance(page_data, dict) and "id" in page_data]
 
 
 @mcp_server.tool()
@@ -707,7 +754,7 @@ async def get_account_pages(access_token: str = None, account_id: str = None) ->
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     # Handle special case for 'me'
     if account_id == "me":
@@ -718,12 +765,12 @@ async def get_account_pages(access_token: str = None, account_id: str = None) ->
             }
             
             user_pages_data = await make_api_request(endpoint, access_token, params)
-            return json.dumps(user_pages_data, indent=2)
+            return user_pages_data
         except Exception as e:
-            return json.dumps({
+            return {
                 "error": "Failed to get user pages",
                 "details": str(e)
-            }, indent=2)
+            }
     
     # Ensure account_id has the 'act_' prefix for regular accounts
     if not account_id.startswith("act_"):
@@ -748,22 +795,12 @@ async def get_account_pages(access_token: str = None, account_id: str = None) ->
                 if "creative" in ad and "creative" in ad and "object_story_spec" in ad["creative"] and "page_id" in ad["creative"]["object_story_spec"]:
                     page_ids.add(ad["creative"]["object_story_spec"]["page_id"])
         
-        # If we found page IDs, get details for each
+        # If we found page IDs, get details for all of them in batched requests
         if page_ids:
-            page_details = {"data": []}
-            
-            for page_id in page_ids:
-                page_endpoint = f"{page_id}"
-                page_params = {
-                    "fields": "id,name,username,category,fan_count,link,verification_status,picture"
-                }
-                
-                page_data = await make_api_request(page_endpoint, access_token, page_params)
-                if "id" in page_data:
-                    page_details["data"].append(page_data)
+            page_details = {"data": await _get_page_details(page_ids, access_token)}
             
             if page_details["data"]:
-                return json.dumps(page_details, indent=2)
+                return page_details
         
         # Approach 2: Try client_pages endpoint
         endpoint = f"{account_id}/client_pages"
@@ -774,7 +811,7 @@ async def get_account_pages(access_token: str = None, account_id: str = None) ->
         client_pages_data = await make_api_request(endpoint, access_token, params)
         
         if "data" in client_pages_data and client_pages_data["data"]:
-            return json.dumps(client_pages_data, indent=2)
+            return client_pages_data
         
         # Approach 3: Try promoted_objects endpoint to find page IDs
         endpoint = f"{account_id}/promoted_objects"
@@ -791,29 +828,20 @@ async def get_account_pages(access_token: str = None, account_id: str = None) ->
                     page_ids.add(obj["page_id"])
             
             if page_ids:
-                page_details = {"data": []}
-                for page_id in page_ids:
-                    page_endpoint = f"{page_id}"
-                    page_params = {
-                        "fields": "id,name,username,category,fan_count,link,verification_status,picture"
-                    }
-                    
-                    page_data = await make_api_request(page_endpoint, access_token, page_params)
-                    if "id" in page_data:
-                        page_details["data"].append(page_data)
+                page_details = {"data": await _get_page_details(page_ids, access_token)}
                 
                 if page_details["data"]:
-                    return json.dumps(page_details, indent=2)
+                    return page_details
         
         # If all approaches failed, return empty data with a message
-        return json.dumps({
+        return {
             "data": [],
             "message": "No pages found associated with this account",
             "suggestion": "You may need to create a page or provide a page_id explicitly when creating ads"
-        }, indent=2)
+        }
         
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get account pages",
             "details": str(e)
-        }, indent=2)
+        }
@@ -7,6 +7,8 @@ from typing import Optional, List, Dict, Any
 from .api import meta_api_tool, make_api_request
 from .server import mcp_server
 from .utils import logger
+from .http_client import get_http_client
+from .pagination import fetch_all_pages, fetch_all_page_size
 
 
 @mcp_server.tool()
@@ -17,7 +19,10 @@ async def search_ads_archive(
     ad_type: str = "ALL",
     ad_reached_countries: List[str] = None,
     limit: int = 25,  # Default limit, adjust as needed
-    fields: str = "ad_creation_time,ad_creative_body,ad_creative_link_caption,ad_creative_link_description,ad_creative_link_title,ad_delivery_start_time,ad_delivery_stop_time,ad_snapshot_url,currency,demographic_distribution,funding_entity,impressions,page_id,page_name,publisher_platform,region_distribution,spend"
+    fields: str = "ad_creation_time,ad_creative_body,ad_creative_link_caption,ad_creative_link_description,ad_creative_link_title,ad_delivery_start_time,ad_delivery_stop_time,ad_snapshot_url,currency,demographic_distribution,funding_entity,impressions,page_id,page_name,publisher_platform,region_distribution,spend",
+    after: str = "",
+    fetch_all: bool = False,
+    max_items: int = None
 ) -> str:
     """
     Search the Facebook Ads Library archive.
@@ -29,6 +34,9 @@ async def search_ads_archive(
         ad_reached_countries: List of country codes (e.g., ["US", "GB"]).
         limit: Maximum number of ads to return.
         fields: Comma-separated string of fields to retrieve for each ad.
+        after: Pagination cursor to get the next set of results
+        fetch_all: Follow pagination cursors and return all ads in one response, fetching at least 500 per page (default: False)
+        max_items: Maximum total number of ads to return across pages (implies fetch_all)
 
     Example Usage via curl equivalent:
         curl -G \\
@@ -44,10 +52,10 @@ async def search_ads_archive(
         pass
 
     if not search_terms:
-        return json.dumps({"error": "search_terms parameter is required"}, indent=2)
+        return {"error": "search_terms parameter is required"}
 
     if not ad_reached_countries:
-        return json.dumps({"error": "ad_reached_countries parameter is required"}, indent=2)
+        return {"error": "ad_reached_countries parameter is required"}
 
     endpoint = "ads_archive"
     params = {
@@ -57,19 +65,25 @@ async def search_ads_archive(
         "limit": limit,
         "fields": fields,
     }
+    if after:
+        params["after"] = after
 
     try:
-        data = await make_api_request(endpoint, access_token, params, method="GET")
-        return json.dumps(data, indent=2)
+        if fetch_all or max_items is not None:
+            params["limit"] = fetch_all_page_size(limit)
+            data = await fetch_all_pages(endpoint, access_token, params, max_items=max_items)
+        else:
+            data = await make_api_request(endpoint, access_token, params, method="GET")
+        return data
     except Exception as e:
         error_msg = str(e)
         # Consider logging the full error for debugging
         # print(f"Error calling Ads Library API: {error_msg}")
-        return json.dumps({
+        return {
             "error": "Failed to search ads archive",
             "details": error_msg,
             "params_sent": {k: v for k, v in params.items() if k != 'access_token'} # Avoid logging token
-        }, indent=2) 
+        } 
 
 
 @mcp_server.tool()
@@ -105,10 +119,10 @@ async def upload_video_from_supabase(
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     if not supabase_video_path:
-        return json.dumps({"error": "No Supabase video path provided"}, indent=2)
+        return {"error": "No Supabase video path provided"}
     
     # Ensure account_id has the 'act_' prefix for API compatibility
     if not account_id.startswith("act_"):
@@ -125,10 +139,10 @@ async def upload_video_from_supabase(
         logger.info(f"Downloading video from Supabase: {video_url}")
         
         # Download video from Supabase
-        async with httpx.AsyncClient() as client:
-            response = await client.get(video_url, timeout=60.0)  # Longer timeout for videos
-            response.raise_for_status()
-            video_bytes = response.content
+        client = get_http_client()
+        response = await client.get(video_url, timeout=60.0)  # Longer timeout for videos
+        response.raise_for_status()
+        video_bytes = response.content
             
         logger.info(f"Successfully downloaded video: {len(video_bytes)} bytes")
         
@@ -154,25 +168,25 @@ async def upload_video_from_supabase(
         if "id" in data:
             logger.info(f"Successfully uploaded video with ID: {data['id']}")
         
-        return json.dumps(data, indent=2)
+        return data
     
     except httpx.HTTPStatusError as e:
         error_msg = f"Failed to download video from Supabase: HTTP {e.response.status_code}"
         logger.error(error_msg)
-        return json.dumps({
+        return {
             "error": error_msg,
             "video_url": video_url,
             "status_code": e.response.status_code
-        }, indent=2)
+        }
         
     except Exception as e:
         error_msg = f"Failed to upload video: {str(e)}"
         logger.error(error_msg)
-        return json.dumps({
+        return {
             "error": error_msg,
             "video_url": video_url,
             "video_path": supabase_video_path
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -181,7 +195,10 @@ async def list_account_videos(
     access_token: str = None,
     account_id: str = None,
     limit: int = 25,
-    fields: str = "id,title,description,created_time,length,status,thumbnails"
+    fields: str = "id,title,description,created_time,length,status,thumbnails",
+    after: str = "",
+    fetch_all: bool = False,
+    max_items: int = None
 ) -> str:
     """
     List all videos in the Meta Ads account library.
@@ -191,13 +208,16 @@ async def list_account_videos(
         account_id: Meta Ads account ID (format: act_XXXXXXXXX)
         limit: Maximum number of videos to return (default: 25)
         fields: Comma-separated fields to retrieve for each video
+        after: Pagination cursor to get the next set of results
+        fetch_all: Follow pagination cursors and return all videos in one response, fetching at least 500 per page (default: False)
+        max_items: Maximum total number of videos to return across pages (implies fetch_all)
     
     Returns:
         JSON response with list of videos in the account
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     # Ensure account_id has the 'act_' prefix for API compatibility
     if not account_id.startswith("act_"):
@@ -210,19 +230,25 @@ async def list_account_videos(
         "limit": limit,
         "fields": fields
     }
+    if after:
+        params["after"] = after
     
     try:
         logger.info(f"Fetching videos from Meta Ad Account {account_id}")
-        data = await make_api_request(endpoint, access_token, params, method="GET")
-        return json.dumps(data, indent=2)
+        if fetch_all or max_items is not None:
+            params["limit"] = fetch_all_page_size(limit)
+            data = await fetch_all_pages(endpoint, access_token, params, max_items=max_items)
+        else:
+            data = await make_api_request(endpoint, access_token, params, method="GET")
+        return data
         
     except Exception as e:
         error_msg = f"Failed to fetch account videos: {str(e)}"
         logger.error(error_msg)
-        return json.dumps({
+        return {
             "error": error_msg,
             "account_id": account_id
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
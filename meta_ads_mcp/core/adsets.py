@@ -3,6 +3,7 @@
 import json
 from typing import Optional, Dict, Any, List
 from .api import meta_api_tool, make_api_request
+from .pagination import fetch_all_pages, fetch_all_page_size
 from .accounts import get_ad_accounts
 from .server import mcp_server
 import asyncio
@@ -12,7 +13,8 @@ import urllib.parse
 
 @mcp_server.tool()
 @meta_api_tool
-async def get_adsets(access_token: str = None, account_id: str = None, limit: int = 10, campaign_id: str = "") -> str:
+async def get_adsets(access_token: str = None, account_id: str = None, limit: int = 10, campaign_id: str = "",
+                     after: str = "", fetch_all: bool = False, max_items: int = None) -> str:
     """
     Get ad sets for a Meta Ads account with optional filtering by campaign.
     
@@ -21,6 +23,9 @@ async def get_adsets(access_token: str = None, account_id: str = None, limit: in
         account_id: Meta Ads account ID (format: act_XXXXXXXXX)
         limit: Maximum number of ad sets to return (default: 10)
         campaign_id: Optional campaign ID to filter by
+        after: Pagination cursor to get the next set of results
+        fetch_all: Follow pagination cursors and return all ad sets in one response, fetching at least 500 per page (default: False)
+        max_items: Maximum total number of ad sets to return across pages (implies fetch_all)
     """
     # If no account ID is specified, try to get the first one for the user
     if not account_id:
@@ -30,7 +35,7 @@ async def get_adsets(access_token: str = None, account_id: str = None, limit: in
         if "data" in accounts_data and accounts_data["data"]:
             account_id = accounts_data["data"][0]["id"]
         else:
-            return json.dumps({"error": "No account ID specified and no accounts found for user"}, indent=2)
+            return {"error": "No account ID specified and no accounts found for user"}
     
     # Change endpoint based on whether campaign_id is provided
     if campaign_id:
@@ -49,9 +54,16 @@ async def get_adsets(access_token: str = None, account_id: str = None, limit: in
         # Note: Removed the attempt to add campaign_id to params for the account endpoint case, 
         # as it was ineffective and the logic now uses the correct endpoint for campaign filtering.
 
-    data = await make_api_request(endpoint, access_token, params)
+    if after:
+        params["after"] = after
+    
+    if fetch_all or max_items is not None:
+        params["limit"] = fetch_all_page_size(limit)
+        data = await fetch_all_pages(endpoint, access_token, params, max_items=max_items)
+    else:
+        data = await make_api_request(endpoint, access_token, params)
     
-    return json.dumps(data, indent=2)
+    return data
 
 
 @mcp_server.tool()
@@ -71,7 +83,7 @@ async def get_adset_details(access_token: str = None, adset_id: str = None) -> s
         }
     """
     if not adset_id:
-        return json.dumps({"error": "No ad set ID provided"}, indent=2)
+        return {"error": "No ad set ID provided"}
     
     endpoint = f"{adset_id}"
     # Explicitly prioritize frequency_control_specs in the fields request
@@ -87,7 +99,7 @@ async def get_adset_details(access_token: str = None, adset_id: str = None) -> s
             'note': 'No frequency_control_specs field was returned by the API. This means either no frequency caps are set or the API did not include this field in the response.'
         }
     
-    return json.dumps(data, indent=2)
+    return data
 
 
 @mcp_server.tool()
@@ -152,19 +164,19 @@ async def create_adset(
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     if not campaign_id:
-        return json.dumps({"error": "No campaign ID provided"}, indent=2)
+        return {"error": "No campaign ID provided"}
     
     if not name:
-        return json.dumps({"error": "No ad set name provided"}, indent=2)
+        return {"error": "No ad set name provided"}
     
     if not optimization_goal:
-        return json.dumps({"error": "No optimization goal provided"}, indent=2)
+        return {"error": "No optimization goal provided"}
     
     if not billing_event:
-        return json.dumps({"error": "No billing event provided"}, indent=2)
+        return {"error": "No billing event provided"}
     
     # Basic targeting is required if not provided
     if not targeting:
@@ -242,14 +254,14 @@ async def create_adset(
     
     try:
         data = await make_api_request(endpoint, access_token, params, method="POST")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return {
             "error": "Failed to create ad set",
             "details": error_msg,
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -273,7 +285,7 @@ async def update_adset(adset_id: str, frequency_control_specs: List[Dict[str, An
         access_token: Meta API access token (optional - will use cached token if not provided)
     """
     if not adset_id:
-        return json.dumps({"error": "No ad set ID provided"}, indent=2)
+        return {"error": "No ad set ID provided"}
     
     changes = {}
     
@@ -319,7 +331,7 @@ async def update_adset(adset_id: str, frequency_control_specs: List[Dict[str, An
             changes['targeting'] = targeting
     
     if not changes:
-        return json.dumps({"error": "No update parameters provided"}, indent=2)
+        return {"error": "No update parameters provided"}
     
     # Get current ad set details for comparison
     current_details_json = await get_adset_details(adset_id=adset_id, access_token=access_token)
@@ -348,7 +360,7 @@ async def update_adset(adset_id: str, frequency_control_specs: List[Dict[str, An
         "note": "Click the link to confirm and apply your ad set updates. Refresh the browser page if it doesn't load immediately."
     }
     
-    return json.dumps(response, indent=2)
+    return response
 
 
 @mcp_server.tool()
@@ -479,12 +491,12 @@ async def get_optimization_goals_and_billing_events(access_token: str = None) ->
         }
     }
     
-    return json.dumps({
+    return {
         "optimization_goals": optimization_goals,
         "billing_events": billing_events,
         "bid_strategies": bid_strategies,
         "usage": "Use these configurations when creating or updating ad sets. Ensure compatibility between objective, optimization goal, and billing event."
-    }, indent=2)
+    }
 
 
 @mcp_server.tool()
@@ -525,13 +537,13 @@ async def create_advantage_plus_adset(
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     if not campaign_id:
-        return json.dumps({"error": "No campaign ID provided"}, indent=2)
+        return {"error": "No campaign ID provided"}
     
     if not name:
-        return json.dumps({"error": "No ad set name provided"}, indent=2)
+        return {"error": "No ad set name provided"}
     
     # Advantage+ targeting with minimal geographic targeting
     advantage_plus_targeting = {
@@ -573,11 +585,11 @@ async def create_advantage_plus_adset(
     
     try:
         data = await make_api_request(endpoint, access_token, params, method="POST")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return {
             "error": "Failed to create Advantage+ ad set",
             "details": error_msg,
             "params_sent": params
-        }, indent=2) 
\ No newline at end of file
+        } 
\ No newline at end of file
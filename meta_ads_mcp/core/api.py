@@ -5,23 +5,40 @@ import json
 import httpx
 import asyncio
 import functools
+import logging
 import os
 from .auth import needs_authentication, get_current_access_token, auth_manager, start_callback_server, shutdown_callback_server
 from .utils import logger
+from .http_client import get_http_client
+from .rate_limit import rate_limiter
+from .retry import retry_policy, get_retry_after
+from .error_classifier import classify_graph_error, classify_result, AUTH, THROTTLED, PERMISSION
+from .circuit_breaker import circuit_breakers
+from .singleflight import request_coalescer, make_request_key
+from .cache import response_cache
+from .tenants import tenant_registry
+from .token_introspection import token_introspector
+from .serialization import dumps_result
+from .metrics import runtime_metrics, endpoint_template
+from .tracing import tracer
 
 # Constants
 META_GRAPH_API_VERSION = "v22.0"
-META_GRAPH_API_BASE = f"https://graph.facebook.com/{META_GRAPH_API_VERSION}"
+# Overridable to run against a local Graph API simulator (see graph_simulator.py)
+META_GRAPH_API_BASE = (os.environ.get("META_ADS_GRAPH_API_BASE", "").rstrip("/")
+                       or f"https://graph.facebook.com/{META_GRAPH_API_VERSION}")
 USER_AGENT = "meta-ads-mcp/1.0"
 
 # Log key environment and configuration at startup
 logger.info("Core API module initialized")
 logger.info(f"Graph API Version: {META_GRAPH_API_VERSION}")
+if os.environ.get("META_ADS_GRAPH_API_BASE"):
+    logger.info(f"Graph API base URL overridden: {META_GRAPH_API_BASE}")
 logger.info(f"META_APP_ID env var present: {'Yes' if os.environ.get('META_APP_ID') else 'No'}")
 
 class GraphAPIError(Exception):
     """Exception raised for errors from the Graph API."""
-    def __init__(self, error_data: Dict[str, Any]):
+    def __init__(self, error_data: Dict[str, Any], access_token: Optional[str] = None):
         self.error_data = error_data
         self.message = error_data.get('message', 'Unknown Graph API error')
         super().__init__(self.message)
@@ -30,31 +47,66 @@ class GraphAPIError(Exception):
         logger.error(f"Graph API Error: {self.message}")
         logger.debug(f"Error details: {error_data}")
         
-        # Check if this is an auth error
-        if "code" in error_data and error_data["code"] in [190, 102, 4]:
-            # Common auth error codes
+        # Only invalidate the token for genuine auth errors, not throttling or permission errors
+        if classify_graph_error(error_data) == AUTH:
             logger.warning(f"Auth error detected (code: {error_data['code']}). Invalidating token.")
-            auth_manager.invalidate_token()
+            tenant = tenant_registry.identity_for(access_token) if access_token else tenant_registry.current_identity()
+            _invalidate_token(tenant)
+
+
+def _invalidate_token(tenant: Optional[str]) -> None:
+    """Invalidate the server's own token, or only the rejected token of an HTTP tenant"""
+    if tenant is None:
+        auth_manager.invalidate_token()
+    else:
+        tenant_registry.revoke(tenant)
 
 
 async def make_api_request(
     endpoint: str,
     access_token: str,
     params: Optional[Dict[str, Any]] = None,
-    method: str = "GET"
+    method: str = "GET",
+    allow_retry: Optional[bool] = None,
+    limit_endpoint: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Make a request to the Meta Graph API.
     
+    Transient failures (5xx, timeouts, throttling codes) are retried with
+    exponential backoff. Only GET requests are retried by default.
+    
     Args:
         endpoint: API endpoint path (without base URL)
         access_token: Meta API access token
         params: Additional query parameters
         method: HTTP method (GET, POST, DELETE)
+        allow_retry: True to retry this request even if it is a write, False to never retry it,
+                     None for the default policy
+        limit_endpoint: Endpoint whose rate-limit bucket and circuit breaker this request
+                        counts against (defaults to endpoint)
     
     Returns:
         API response as a dictionary
     """
+    with tracer.start_span("graph.request", {"http.method": method, "meta.endpoint": endpoint_template(endpoint)}) as span:
+        result = await _make_api_request(endpoint, access_token, params, method, allow_retry, span, limit_endpoint)
+        if span.is_recording and isinstance(result, dict) and "error" in result:
+            error = result["error"]
+            span.set_error(error.get("message", "error") if isinstance(error, dict) else str(error))
+        return result
+
+
+async def _make_api_request(
+    endpoint: str,
+    access_token: str,
+    params: Optional[Dict[str, Any]],
+    method: str,
+    allow_retry: Optional[bool],
+    span: Any,
+    limit_endpoint: Optional[str] = None
+) -> Dict[str, Any]:
+    """Serve a request from the cache, an identical in-flight request or Meta"""
     # Validate access token before proceeding
     if not access_token:
         logger.error("API request attempted with blank access token")
@@ -65,8 +117,59 @@ async def make_api_request(
                 "action_required": "Please authenticate first"
             }
         }
-        
+    
+    tenant = tenant_registry.identity_for(access_token)
+    if tenant is not None:
+        # Fail fast on a bearer token Meta has just rejected
+        rejected = tenant_registry.check(tenant)
+        if rejected:
+            return rejected
+    
+    if method == "GET":
+        key = make_request_key(access_token, endpoint, params)
+        cached = await response_cache.lookup(key)
+        span.set_attribute("meta.cache_hit", cached is not None)
+        if cached is not None:
+            logger.debug("Cache hit: GET %s", endpoint)
+            return cached
+        # Concurrent identical reads share one in-flight request
+        return await request_coalescer.do(
+            key, lambda: _fetch_and_cache(key, endpoint, access_token, params, allow_retry, tenant, limit_endpoint)
+        )
+    
+    result = await _execute_api_request(endpoint, access_token, params, method, allow_retry, tenant, limit_endpoint)
+    # Drop cached reads of the object that was just written
+    await response_cache.invalidate_write(endpoint, params)
+    return result
+
+
+async def _fetch_and_cache(
+    key: Any,
+    endpoint: str,
+    access_token: str,
+    params: Optional[Dict[str, Any]],
+    allow_retry: Optional[bool],
+    tenant: Optional[str] = None,
+    limit_endpoint: Optional[str] = None
+) -> Dict[str, Any]:
+    """Send a GET request and cache a successful response"""
+    result = await _execute_api_request(endpoint, access_token, params, "GET", allow_retry, tenant, limit_endpoint)
+    await response_cache.store(key, endpoint, result)
+    return result
+
+
+async def _execute_api_request(
+    endpoint: str,
+    access_token: str,
+    params: Optional[Dict[str, Any]],
+    method: str,
+    allow_retry: Optional[bool],
+    tenant: Optional[str] = None,
+    limit_endpoint: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the request, send it and retry transient failures"""
     url = f"{META_GRAPH_API_BASE}/{endpoint}"
+    limit_endpoint = limit_endpoint or endpoint
     
     headers = {
         "User-Agent": USER_AGENT,
@@ -75,104 +178,208 @@ async def make_api_request(
     request_params = params or {}
     request_params["access_token"] = access_token
     
-    # Logging the request (masking token for security)
-    masked_params = {k: "***TOKEN***" if k == "access_token" else v for k, v in request_params.items()}
-    logger.debug(f"API Request: {method} {url}")
-    logger.debug(f"Request params: {masked_params}")
-    
     # Check for app_id in params
     app_id = auth_manager.app_id
-    logger.debug(f"Current app_id from auth_manager: {app_id}")
     
-    async with httpx.AsyncClient() as client:
+    # Logging the request (masking token for security); skipped entirely unless debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("API Request: %s %s", method, url)
+        logger.debug("Request params: %s", _mask_params(request_params))
+        logger.debug("Current app_id from auth_manager: %s", app_id)
+    
+    client = get_http_client()
+    
+    attempt = 1
+    while True:
+        # Fail fast while Meta is throttling or failing this account/endpoint
+        rejected = circuit_breakers.check(limit_endpoint, tenant)
+        if rejected:
+            runtime_metrics.record_circuit_rejection(endpoint)
+            return rejected
+        
+        recorded = False
         try:
-            if method == "GET":
-                response = await client.get(url, params=request_params, headers=headers, timeout=30.0)
-            elif method == "POST":
-                # For Meta API, POST requests need data, not JSON
-                if 'targeting' in request_params and isinstance(request_params['targeting'], dict):
-                    # Convert targeting dict to string for the API
-                    request_params['targeting'] = json.dumps(request_params['targeting'])
-                
-                # Convert lists and dicts to JSON strings    
-                for key, value in request_params.items():
-                    if isinstance(value, (list, dict)):
-                        request_params[key] = json.dumps(value)
-                
-                logger.debug(f"POST params (prepared): {masked_params}")
-                response = await client.post(url, data=request_params, headers=headers, timeout=30.0)
-            elif method == "DELETE":
-                response = await client.delete(url, params=request_params, headers=headers, timeout=30.0)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            result = await _send_request(client, endpoint, url, method, request_params, headers, app_id, tenant, limit_endpoint)
+            category = classify_result(result)
+            delay = retry_policy.next_delay(method, result, attempt, allow_retry)
+            # A retry already waits out Meta's Retry-After; it only holds the breaker open once we give up
+            open_for = get_retry_after(result) if category == THROTTLED and delay is None else None
+            circuit_breakers.record(limit_endpoint, category, open_for, tenant)
+            recorded = True
+        finally:
+            if not recorded:
+                # A cancelled half-open trial must not hold the breaker's only slot forever
+                circuit_breakers.release(limit_endpoint, tenant)
+        
+        if delay is None:
+            return result
+        logger.warning("Transient error on %s %s (attempt %d/%d), retrying in %.2fs",
+                       method, endpoint, attempt, retry_policy.max_attempts, delay)
+        runtime_metrics.record_retry(endpoint)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _send_request(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    url: str,
+    method: str,
+    request_params: Dict[str, Any],
+    headers: Dict[str, str],
+    app_id: Optional[str],
+    tenant: Optional[str] = None,
+    limit_endpoint: Optional[str] = None
+) -> Dict[str, Any]:
+    """Send a single Graph API request and convert the response or failure into a dictionary"""
+    limit_endpoint = limit_endpoint or endpoint
+    # Wait if Meta's usage headers say we are close to a rate limit
+    runtime_metrics.record_rate_limit_wait(await rate_limiter.acquire(limit_endpoint, tenant))
+    
+    status = "error"
+    started = runtime_metrics.graph_request_started()
+    span = tracer.start_span("graph.http", {"http.method": method})
+    try:
+        if method == "GET":
+            response = await client.get(url, params=request_params, headers=headers, timeout=30.0)
+        elif method == "POST":
+            # For Meta API, POST requests need data, not JSON
+            if 'targeting' in request_params and isinstance(request_params['targeting'], dict):
+                # Convert targeting dict to string for the API
+                request_params['targeting'] = json.dumps(request_params['targeting'])
             
-            response.raise_for_status()
-            logger.debug(f"API Response status: {response.status_code}")
+            # Convert lists and dicts to JSON strings    
+            for key, value in request_params.items():
+                if isinstance(value, (list, dict)):
+                    request_params[key] = json.dumps(value)
             
-            # Ensure the response is JSON and return it as a dictionary
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                # If not JSON, return text content in a structured format
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("POST params (prepared): %s", _mask_params(request_params))
+            response = await client.post(url, data=request_params, headers=headers, timeout=30.0)
+        elif method == "DELETE":
+            response = await client.delete(url, params=request_params, headers=headers, timeout=30.0)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        status = response.status_code
+        if span.is_recording:
+            span.set_attribute("http.status_code", status)
+            span.set_attribute("http.request.body.size", len(response.request.content or b"") if response.request else None)
+            span.set_attribute("http.response.body.size", len(response.content))
+        rate_limiter.record_response(limit_endpoint, response.headers, tenant)
+        response.raise_for_status()
+        logger.debug("API Response status: %s", response.status_code)
+        
+        # Ensure the response is JSON and return it as a dictionary
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            # If not JSON, return text content in a structured format
+            return {
+                "text_response": response.text,
+                "status_code": response.status_code
+            }
+    
+    except httpx.HTTPStatusError as e:
+        error_info = {}
+        try:
+            error_info = e.response.json()
+        except:
+            error_info = {"status_code": e.response.status_code, "text": e.response.text}
+        
+        logger.error(f"HTTP Error: {e.response.status_code} - {error_info}")
+        
+        error_obj = error_info.get("error", {}) if isinstance(error_info, dict) else {}
+        category = classify_graph_error(error_obj, e.response.status_code)
+        
+        if category == AUTH:
+            # Only a dead token warrants re-authentication
+            logger.warning(f"Detected authentication error (status {e.response.status_code}, code {error_obj.get('code')}). Invalidating token.")
+            _invalidate_token(tenant)
+        elif category == THROTTLED:
+            # Rate limits are not auth failures; keep the token and let the throttler back off
+            logger.warning(f"Meta rate limit hit (code {error_obj.get('code')}) for {endpoint}")
+        elif category == PERMISSION:
+            logger.warning(f"Permission error (code {error_obj.get('code')}) for {endpoint}")
+            # Log more details about app ID related errors
+            if error_obj.get("code") == 200 and "Provide valid app ID" in error_obj.get("message", ""):
+                logger.error("Meta API authentication configuration issue")
+                logger.error(f"Current app_id: {app_id}")
+                # Provide a clearer error message without the confusing "Provide valid app ID" message
                 return {
-                    "text_response": response.text,
-                    "status_code": response.status_code
+                    "error": {
+                        "message": "Meta API authentication configuration issue. Please check your app credentials.",
+                        "original_error": error_obj.get("message"),
+                        "code": error_obj.get("code"),
+                        "category": category
+                    }
                 }
         
-        except httpx.HTTPStatusError as e:
-            error_info = {}
-            try:
-                error_info = e.response.json()
-            except:
-                error_info = {"status_code": e.response.status_code, "text": e.response.text}
-            
-            logger.error(f"HTTP Error: {e.response.status_code} - {error_info}")
-            
-            # Check for authentication errors
-            if e.response.status_code == 401 or e.response.status_code == 403:
-                logger.warning("Detected authentication error (401/403)")
-                auth_manager.invalidate_token()
-            elif "error" in error_info:
-                error_obj = error_info.get("error", {})
-                # Check for specific FB API errors related to auth
-                if isinstance(error_obj, dict) and error_obj.get("code") in [190, 102, 4, 200, 10]:
-                    logger.warning(f"Detected Facebook API auth error: {error_obj.get('code')}")
-                    # Log more details about app ID related errors
-                    if error_obj.get("code") == 200 and "Provide valid app ID" in error_obj.get("message", ""):
-                        logger.error("Meta API authentication configuration issue")
-                        logger.error(f"Current app_id: {app_id}")
-                        # Provide a clearer error message without the confusing "Provide valid app ID" message
-                        return {
-                            "error": {
-                                "message": "Meta API authentication configuration issue. Please check your app credentials.",
-                                "original_error": error_obj.get("message"),
-                                "code": error_obj.get("code")
-                            }
-                        }
-                    auth_manager.invalidate_token()
-            
-            # Include full details for technical users
-            full_response = {
-                "headers": dict(e.response.headers),
-                "status_code": e.response.status_code,
-                "url": str(e.response.url),
-                "reason": getattr(e.response, "reason_phrase", "Unknown reason"),
-                "request_method": e.request.method,
-                "request_url": str(e.request.url)
+        # Include full details for technical users
+        full_response = {
+            "headers": dict(e.response.headers),
+            "status_code": e.response.status_code,
+            "url": str(e.response.url),
+            "reason": getattr(e.response, "reason_phrase", "Unknown reason"),
+            "request_method": e.request.method,
+            "request_url": str(e.request.url)
+        }
+        
+        # Return a properly structured error object
+        return {
+            "error": {
+                "message": f"HTTP Error: {e.response.status_code}",
+                "category": category,
+                "details": error_info,
+                "full_response": full_response
             }
-            
-            # Return a properly structured error object
-            return {
-                "error": {
-                    "message": f"HTTP Error: {e.response.status_code}",
-                    "details": error_info,
-                    "full_response": full_response
+        }
+    
+    except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as e:
+        status = "timeout" if isinstance(e, httpx.TimeoutException) else "network_error"
+        logger.error(f"Network Error: {type(e).__name__}: {str(e)}")
+        return {
+            "error": {
+                "message": f"Network error: {str(e) or type(e).__name__}",
+                "is_transient": True
+            }
+        }
+    
+    except Exception as e:
+        logger.error(f"Request Error: {str(e)}")
+        return {"error": {"message": str(e)}}
+    
+    finally:
+        runtime_metrics.graph_request_finished(method, endpoint, status, started)
+        if not isinstance(status, int) or status >= 400:
+            span.set_error(str(status))
+        span.end()
+
+
+def _mask_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy params with the access token masked, for logging"""
+    return {k: "***TOKEN***" if k == "access_token" else v for k, v in params.items()}
+
+
+def _app_id_error_response(result: Dict[str, Any], app_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Replace the confusing "Provide valid app ID" Graph error with a clearer one, if present"""
+    details = result.get("details")
+    error_obj = details.get("error") if isinstance(details, dict) else None
+    if isinstance(error_obj, dict) and error_obj.get("code") == 200 and "Provide valid app ID" in error_obj.get("message", ""):
+        logger.error("Meta API authentication configuration issue")
+        logger.error(f"Current app_id: {app_id}")
+        return {
+            "error": {
+                "message": "Meta API Configuration Issue",
+                "details": {
+                    "description": "Your Meta API app is not properly configured",
+                    "action_required": "Check your META_APP_ID environment variable",
+                    "current_app_id": app_id,
+                    "original_error": error_obj.get("message")
                 }
             }
-        
-        except Exception as e:
-            logger.error(f"Request Error: {str(e)}")
-            return {"error": {"message": str(e)}}
+        }
+    return None
 
 
 # Generic wrapper for all Meta API tools
@@ -180,18 +387,19 @@ def meta_api_tool(func):
     """Decorator for Meta API tools that handles authentication and error handling."""
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
+        call = runtime_metrics.tool_call(func.__name__)
+        span = tracer.start_span(f"tool {func.__name__}", {"mcp.tool.name": func.__name__})
+        status = "ok"
         try:
-            # Log function call
-            logger.debug(f"Function call: {func.__name__}")
-            logger.debug(f"Args: {args}")
-            # Log kwargs without sensitive info
-            safe_kwargs = {k: ('***TOKEN***' if k == 'access_token' else v) for k, v in kwargs.items()}
-            logger.debug(f"Kwargs: {safe_kwargs}")
-            
-            # Log app ID information
             app_id = auth_manager.app_id
-            logger.debug(f"Current app_id: {app_id}")
-            logger.debug(f"META_APP_ID env var: {os.environ.get('META_APP_ID')}")
+            
+            # Log function call, kwargs without sensitive info and app ID information
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Function call: %s", func.__name__)
+                logger.debug("Args: %s", args)
+                logger.debug("Kwargs: %s", _mask_params(kwargs))
+                logger.debug("Current app_id: %s", app_id)
+                logger.debug("META_APP_ID env var: %s", os.environ.get('META_APP_ID'))
             
             # If access_token is not in kwargs or not kwargs['access_token'], try to get it from auth_manager
             if 'access_token' not in kwargs or not kwargs['access_token']:
@@ -240,7 +448,8 @@ def meta_api_tool(func):
                     logger.error("ISSUE DETECTED: Pipeboard authentication configured but no valid token available")
                     logger.error("ACTION REQUIRED: Complete authentication via Pipeboard service")
                 
-                return json.dumps({
+                status = "auth_required"
+                return dumps_result({
                     "error": {
                         "message": "Authentication Required",
                         "details": {
@@ -255,46 +464,52 @@ def meta_api_tool(func):
                             "markdown_link": f"[Click here to authenticate with Meta Ads API]({auth_url})"
                         }
                     }
-                }, indent=2)
+                })
+            
+            # Fail fast on a token debug_token reported as invalid (only when introspection is enabled)
+            rejected = await token_introspector.check(kwargs['access_token'])
+            if rejected:
+                status = "auth_required"
+                return dumps_result(rejected)
                 
             # Call the original function
             result = await func(*args, **kwargs)
             
-            # If the result is a string (JSON), try to parse it to check for errors
+            # Tools return Python objects: inspect them directly and serialize once
+            if isinstance(result, (dict, list)):
+                if isinstance(result, dict) and "error" in result:
+                    status = "error"
+                    logger.error(f"Error in API response: {result['error']}")
+                    friendly_error = _app_id_error_response(result, app_id)
+                    if friendly_error:
+                        return dumps_result(friendly_error)
+                return dumps_result(result)
+            
+            # Tools that still return a JSON string are parsed to check for errors
             if isinstance(result, str):
                 try:
                     result_dict = json.loads(result)
-                    if "error" in result_dict:
+                    if isinstance(result_dict, dict) and "error" in result_dict:
+                        status = "error"
                         logger.error(f"Error in API response: {result_dict['error']}")
-                        # If this is an app ID error, log more details
-                        if isinstance(result_dict.get("details", {}).get("error", {}), dict):
-                            error_obj = result_dict["details"]["error"]
-                            if error_obj.get("code") == 200 and "Provide valid app ID" in error_obj.get("message", ""):
-                                logger.error("Meta API authentication configuration issue")
-                                logger.error(f"Current app_id: {app_id}")
-                                # Replace the confusing error with a more user-friendly one
-                                return json.dumps({
-                                    "error": {
-                                        "message": "Meta API Configuration Issue",
-                                        "details": {
-                                            "description": "Your Meta API app is not properly configured",
-                                            "action_required": "Check your META_APP_ID environment variable",
-                                            "current_app_id": app_id,
-                                            "original_error": error_obj.get("message")
-                                        }
-                                    }
-                                }, indent=2)
+                        friendly_error = _app_id_error_response(result_dict, app_id)
+                        if friendly_error:
+                            return dumps_result(friendly_error)
                 except Exception:
                     # Not JSON or other parsing error, wrap it in a dictionary
-                    return json.dumps({"data": result}, indent=2)
-            
-            # If result is already a dictionary, ensure it's properly serialized
-            if isinstance(result, dict):
-                return json.dumps(result, indent=2)
+                    return dumps_result({"data": result})
             
             return result
         except Exception as e:
+            status = "exception"
             logger.error(f"Error in {func.__name__}: {str(e)}")
-            return json.dumps({"error": str(e)}, indent=2)
+            return dumps_result({"error": str(e)})
+        finally:
+            if call:
+                call.finish(status)
+            if status != "ok":
+                span.set_error(status)
+            span.set_attribute("mcp.tool.status", status)
+            span.end()
     
     return wrapper 
\ No newline at end of file
@@ -21,6 +21,7 @@ from .callback_server import (
 
 # Import the new Pipeboard authentication
 from .pipeboard_auth import pipeboard_auth_manager
+from .token_refresher import token_refresher
 
 # Auth constants
 AUTH_SCOPE = "ads_management,ads_read,business_management,public_profile"
@@ -92,6 +93,12 @@ class TokenInfo:
         self.created_at = int(time.time())
         logger.debug(f"TokenInfo created. Expires in: {expires_in if expires_in else 'Not specified'}")
     
+    def expiry_time(self) -> Optional[float]:
+        """Get the expiration time as a Unix timestamp, or None if unknown"""
+        if not self.expires_in:
+            return None
+        return self.created_at + self.expires_in
+    
     def is_expired(self) -> bool:
         """Check if the token is expired"""
         if not self.expires_in:
@@ -248,6 +255,19 @@ class AuthManager:
             return None
         
         return self.token_info.access_token
+    
+    async def get_access_token_async(self) -> Optional[str]:
+        """
+        Get the current access token without blocking the event loop
+        
+        Returns:
+            Access token if available, None otherwise
+        """
+        # Pipeboard refreshes go over the network; the local token needs no I/O
+        if self.use_pipeboard:
+            return await pipeboard_auth_manager.get_access_token_async()
+        
+        return self.get_access_token()
         
     def invalidate_token(self) -> None:
         """Invalidate the current token, usually because it has expired or is invalid"""
@@ -428,9 +448,12 @@ async def get_current_access_token() -> Optional[str]:
     
     # Attempt to get access token
     try:
-        token = auth_manager.get_access_token()
+        token = await auth_manager.get_access_token_async()
         
         if token:
+            # Renew the token in the background before it expires
+            token_refresher.ensure_started()
+            
             # Add basic token validation - check if it looks like a valid token
             if len(token) < 20:  # Most Meta tokens are much longer
                 logger.error(f"TOKEN VALIDATION FAILED: Token appears malformed (length: {len(token)})")
@@ -496,7 +519,8 @@ def login():
                 # Verify token works by getting basic user info
                 try:
                     from .api import make_api_request
-                    result = asyncio.run(make_api_request("me", token, {}))
+                    from .http_client import run_with_private_client
+                    result = run_with_private_client(make_api_request("me", token, {}))
                     print(f"Authenticated as: {result.get('name', 'Unknown')} (ID: {result.get('id', 'Unknown')})")
                     return
                 except Exception as e:
@@ -31,7 +31,7 @@ async def get_login_link(access_token: str = None) -> str:
     if using_pipeboard:
         # Handle Pipeboard authentication
         # Check if we have a cached token
-        cached_token = pipeboard_auth_manager.get_access_token()
+        cached_token = await pipeboard_auth_manager.get_access_token_async()
         token_status = "No token" if not cached_token else "Valid token"
         
         # If we already have a valid token and none was provided, just return success
@@ -0,0 +1,300 @@
+"""Graph API batch request functionality for Meta Ads API."""
+
+import json
+import re
+from typing import Optional, Dict, Any, List
+from urllib.parse import urlencode
+from .api import meta_api_tool, make_api_request
+from .rate_limit import get_rate_limit_key
+from .server import mcp_server
+from .utils import logger
+
+
+# Graph API accepts at most 50 sub-requests per batch call
+MAX_BATCH_SIZE = 50
+
+# Matches JSONPath result references like {result=get-ad:$.creative.id}
+RESULT_REFERENCE_PATTERN = re.compile(r"\{result=([^:}]+):")
+
+# Characters left unescaped in relative URLs so JSONPath references reach Graph intact
+_RELATIVE_URL_SAFE_CHARS = "{}=:$.*,[]"
+
+# Rate-limit and circuit breaker key for batch calls that span several ad accounts
+BATCH_LIMIT_KEY = "batch"
+
+
+def build_relative_url(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a batch relative_url from an endpoint and query parameters.
+
+    Args:
+        endpoint: API endpoint path (without base URL)
+        params: Query parameters; lists and dicts are JSON encoded
+
+    Returns:
+        Relative URL suitable for a batch sub-request
+    """
+    if not params:
+        return endpoint
+
+    prepared = {}
+    for key, value in params.items():
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value)
+        prepared[key] = value
+
+    separator = "&" if "?" in endpoint else "?"
+    return f"{endpoint}{separator}{urlencode(prepared, safe=_RELATIVE_URL_SAFE_CHARS)}"
+
+
+def _normalize_sub_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a caller-supplied sub-request into the Graph batch wire format"""
+    method = request.get("method", "GET").upper()
+
+    if "relative_url" in request:
+        relative_url = request["relative_url"]
+    elif "endpoint" in request:
+        # Convenience form mirroring make_api_request(endpoint, params)
+        query_params = request.get("params") if method in ("GET", "DELETE") else None
+        relative_url = build_relative_url(request["endpoint"], query_params)
+    else:
+        raise ValueError("Each batch request needs either 'relative_url' or 'endpoint'")
+
+    sub_request = {
+        "method": method,
+        "relative_url": relative_url.lstrip("/")
+    }
+
+    body = request.get("body")
+    if body is None and method == "POST" and "endpoint" in request:
+        body = request.get("params")
+    if body:
+        if isinstance(body, dict):
+            body = urlencode(
+                {k: json.dumps(v) if isinstance(v, (list, dict)) else v for k, v in body.items()},
+                safe=_RELATIVE_URL_SAFE_CHARS
+            )
+        sub_request["body"] = body
+
+    if request.get("name"):
+        sub_request["name"] = request["name"]
+        # Named requests are omitted from the response by default; we want per-item results
+        sub_request["omit_response_on_success"] = request.get("omit_response_on_success", False)
+    if request.get("depends_on"):
+        sub_request["depends_on"] = request["depends_on"]
+
+    return sub_request
+
+
+def _referenced_names(sub_request: Dict[str, Any]) -> List[str]:
+    """Get the names of other sub-requests that this one depends on"""
+    names = []
+    if sub_request.get("depends_on"):
+        names.append(sub_request["depends_on"])
+    for field in ("relative_url", "body"):
+        value = sub_request.get(field)
+        if isinstance(value, str):
+            names.extend(RESULT_REFERENCE_PATTERN.findall(value))
+    return names
+
+
+def _chunk_requests(sub_requests: List[Dict[str, Any]], max_size: int = MAX_BATCH_SIZE) -> List[List[int]]:
+    """
+    Split sub-requests into batches of at most max_size, keeping dependent requests together.
+
+    Graph only resolves depends_on and {result=...} references within one batch call,
+    so requests linked by a dependency are grouped before chunking.
+
+    Returns:
+        List of chunks, each a list of indexes into sub_requests
+    """
+    # Union-find over request indexes joined by name references
+    parent = list(range(len(sub_requests)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    name_to_index = {r["name"]: i for i, r in enumerate(sub_requests) if r.get("name")}
+    for i, sub_request in enumerate(sub_requests):
+        for name in _referenced_names(sub_request):
+            if name not in name_to_index:
+                raise ValueError(f"Batch request {i} references unknown request name '{name}'")
+            parent[find(i)] = find(name_to_index[name])
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(sub_requests)):
+        groups.setdefault(find(i), []).append(i)
+
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    for group in sorted(groups.values(), key=lambda g: g[0]):
+        if len(group) > max_size:
+            raise ValueError(f"A group of {len(group)} dependent batch requests exceeds the limit of {max_size}")
+        if len(current) + len(group) > max_size:
+            chunks.append(current)
+            current = []
+        current.extend(group)
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def _limit_endpoint(batch_payload: List[Dict[str, Any]]) -> str:
+    """
+    Get the key a batch call counts against for rate limiting and circuit breaking.
+
+    Graph charges each sub-request to its own ad account, so a batch whose
+    sub-requests all target one account shares that account's bucket and breaker.
+    Anything else uses a dedicated batch key rather than the root endpoint.
+    """
+    accounts = {get_rate_limit_key(r["relative_url"]) for r in batch_payload}
+    if len(accounts) == 1 and None not in accounts:
+        return accounts.pop()
+    return BATCH_LIMIT_KEY
+
+
+def _parse_batch_item(item: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert one entry of a Graph batch response into a per-item result"""
+    if item is None:
+        # Graph returns null when a sub-request was skipped because its dependency failed
+        return {
+            "status_code": None,
+            "error": {"message": "Request not executed because a request it depends on failed"}
+        }
+
+    body = item.get("body")
+    try:
+        parsed_body = json.loads(body) if isinstance(body, str) and body else body
+    except json.JSONDecodeError:
+        parsed_body = {"text_response": body}
+
+    result = {"status_code": item.get("code")}
+    if isinstance(parsed_body, dict) and "error" in parsed_body:
+        result["error"] = parsed_body["error"]
+    else:
+        result["data"] = parsed_body
+    return result
+
+
+async def make_batch_request(
+    requests: List[Dict[str, Any]],
+    access_token: str,
+    max_batch_size: int = MAX_BATCH_SIZE
+) -> List[Dict[str, Any]]:
+    """
+    Execute Graph API sub-requests through the batch endpoint.
+
+    Sub-requests are coalesced into ceil(N / max_batch_size) POST /?batch= calls.
+    Each call is rate limited and circuit broken under its sub-requests' ad account
+    when they share one, and under BATCH_LIMIT_KEY otherwise. Results are not served
+    from or stored in the response cache; write sub-requests still invalidate it.
+
+    Args:
+        requests: Sub-requests. Each is either in Graph wire format
+                  ({"method", "relative_url", "body", "name", "depends_on"}) or in
+                  make_api_request form ({"method", "endpoint", "params", "name", "depends_on"}).
+                  relative_url and body may contain JSONPath references such as
+                  {result=name:$.data.*.id}.
+        access_token: Meta API access token
+        max_batch_size: Maximum sub-requests per batch call (capped at 50)
+
+    Returns:
+        One result per sub-request, in order. Each result has "status_code" and
+        either "data" (parsed response body) or "error".
+    """
+    if not requests:
+        return []
+
+    max_batch_size = max(1, min(max_batch_size, MAX_BATCH_SIZE))
+    sub_requests = [_normalize_sub_request(r) for r in requests]
+    chunks = _chunk_requests(sub_requests, max_batch_size)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(sub_requests)
+
+    logger.debug(f"Executing {len(sub_requests)} batch sub-requests in {len(chunks)} batch call(s)")
+
+    for chunk in chunks:
+        batch_payload = [sub_requests[i] for i in chunk]
+        # The batch call itself is a POST, but it is safe to retry when every sub-request is a read
+        read_only = all(r["method"] == "GET" for r in batch_payload)
+        response = await make_api_request(
+            "", access_token, {"batch": batch_payload, "include_headers": "false"},
+            method="POST", allow_retry=read_only or None,
+            limit_endpoint=_limit_endpoint(batch_payload)
+        )
+
+        if isinstance(response, list):
+            for position, index in enumerate(chunk):
+                item = response[position] if position < len(response) else None
+                results[index] = _parse_batch_item(item)
+        else:
+            # The whole batch call failed; report the same error for every item in it
+            error = response.get("error", response) if isinstance(response, dict) else {"message": str(response)}
+            for index in chunk:
+                results[index] = {"status_code": None, "error": error}
+
+    for index, sub_request in enumerate(sub_requests):
+        if sub_request.get("name"):
+            results[index]["name"] = sub_request["name"]
+
+    return results
+
+
+async def batch_get(
+    requests: List[Dict[str, Any]],
+    access_token: str
+) -> List[Dict[str, Any]]:
+    """
+    Fetch several Graph objects with batched GET requests.
+
+    Args:
+        requests: List of {"endpoint": ..., "params": {...}} dictionaries
+        access_token: Meta API access token
+
+    Returns:
+        One response per request shaped like make_api_request output
+        (the parsed body, or {"error": ...} on failure)
+    """
+    results = await make_batch_request(
+        [{"method": "GET", **request} for request in requests],
+        access_token
+    )
+    return [result["data"] if "data" in result else {"error": result["error"]} for result in results]
+
+
+@mcp_server.tool()
+@meta_api_tool
+async def batch_api_request(
+    access_token: str = None,
+    requests: List[Dict[str, Any]] = None
+) -> str:
+    """
+    Execute multiple Graph API requests in as few HTTP round-trips as possible.
+
+    Requests are grouped into Graph batch calls of up to 50 sub-requests each.
+    Use "name" and "depends_on" with JSONPath references to chain requests, e.g.
+    [{"name": "ad", "relative_url": "123?fields=creative"},
+     {"relative_url": "?ids={result=ad:$.creative.id}&fields=name,image_hash"}]
+
+    Args:
+        access_token: Meta API access token (optional - will use cached token if not provided)
+        requests: List of sub-requests. Each has "method" (GET, POST, DELETE; default GET) and
+                  either "relative_url" (e.g. "act_123/campaigns?fields=id,name") or
+                  "endpoint" plus "params". Optional keys: "body" (for POST), "name",
+                  "depends_on", "omit_response_on_success".
+
+    Returns:
+        JSON with one result per request, in order, each holding "status_code" and "data" or "error"
+    """
+    if not requests:
+        return {"error": "No requests provided"}
+
+    try:
+        results = await make_batch_request(requests, access_token)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    return {"results": results}
@@ -0,0 +1,303 @@
+"""In-memory TTL + LRU cache for read-only Graph API responses."""
+
+import copy
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from .utils import logger
+from .disk_cache import disk_cache, DISK_CACHE_ENABLED
+
+
+# Cache configuration (overridable through environment variables)
+CACHE_ENABLED = os.environ.get("META_ADS_CACHE_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+CACHE_DEFAULT_TTL = float(os.environ.get("META_ADS_CACHE_DEFAULT_TTL", "60"))  # seconds
+CACHE_MAX_ENTRIES = int(os.environ.get("META_ADS_CACHE_MAX_ENTRIES", "1000"))
+CACHE_MAX_BYTES = int(os.environ.get("META_ADS_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+# How often the memory tier replays writes made by other processes sharing the persistent tier
+CACHE_SYNC_INTERVAL = float(os.environ.get("META_ADS_CACHE_SYNC_INTERVAL", "1"))  # seconds
+
+# Per-endpoint TTLs in seconds, first match wins. A TTL of 0 disables caching.
+DEFAULT_CACHE_POLICIES: List[Tuple[str, float]] = [
+    # Lead submissions arrive continuously
+    (r"/leads$", 0),
+    # Token introspection keeps its own TTL (see token_introspection.py)
+    (r"^debug_token$", 0),
+    # Targeting catalogs: interests, countries, languages, demographics
+    (r"^(search|targetingbrowse)$", 6 * 3600),
+    (r"^act_\d+/(targetingsearch|targetingvalidation)$", 3600),
+    (r"/(insights|delivery_estimate)$", 300),
+    (r"^ads_archive$", 600),
+    # Account info and the pages/accounts a user can access
+    (r"^(me|act_\d+)$", 600),
+    (r"/(adaccounts|accounts|assigned_pages|client_pages|promoted_objects)$", 600),
+    # Object lists change as campaigns are edited
+    (r"/(campaigns|adsets|ads|adcreatives|adimages|advideos|leadgen_forms|budget_schedules)$", 60),
+    # Single object details
+    (r"^\d+$", 120),
+]
+
+
+def _object_id(endpoint: str) -> str:
+    """Get the object an endpoint belongs to (its first path segment)"""
+    return (endpoint or "").split("?", 1)[0].strip("/").split("/", 1)[0]
+
+
+class ResponseCache:
+    """Bounded LRU cache of Graph API responses with per-endpoint TTLs"""
+
+    def __init__(
+        self,
+        enabled: bool = CACHE_ENABLED,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+        default_ttl: float = CACHE_DEFAULT_TTL,
+        policies: Optional[List[Tuple[str, float]]] = None,
+        second_tier: Optional[Any] = None,
+        sync_interval: float = CACHE_SYNC_INTERVAL,
+    ):
+        self.enabled = enabled
+        # Optional persistent store (see disk_cache.DiskCache) consulted on memory misses
+        self.second_tier = second_tier
+        self.sync_interval = sync_interval
+        self._invalidation_seq: Optional[int] = None
+        self._last_sync = float("-inf")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.policies: List[Tuple[Pattern, float]] = [
+            (re.compile(pattern), ttl) for pattern, ttl in (policies if policies is not None else DEFAULT_CACHE_POLICIES)
+        ]
+        # key -> (expires_at, size, value)
+        self.entries: "OrderedDict[Any, Tuple[float, int, Any]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL in seconds for an endpoint"""
+        path = (endpoint or "").split("?", 1)[0].strip("/")
+        for pattern, ttl in self.policies:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        Returns:
+            A copy of the cached response, or None on a miss or expired entry
+        """
+        if not self.enabled:
+            return None
+
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, size, value = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(value)
+
+    def put(self, key: Any, endpoint: str, value: Any) -> None:
+        """
+        Cache a response for the endpoint's TTL. Error responses are never cached.
+
+        Args:
+            key: Cache key (see singleflight.make_request_key); key[1] must be the endpoint
+            endpoint: API endpoint path, used to look up the TTL
+            value: Response returned by the Graph API
+        """
+        if not self.enabled or (isinstance(value, dict) and "error" in value):
+            return
+
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+
+        self._store(key, value, ttl)
+
+    def _store(self, key: Any, value: Any, ttl: float) -> None:
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (time.monotonic() + ttl, size, copy.deepcopy(value))
+        self.total_bytes += size
+
+        while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            oldest_key = next(iter(self.entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def _remove(self, key: Any) -> None:
+        _, size, _ = self.entries.pop(key)
+        self.total_bytes -= size
+
+    def invalidate_object(self, object_id: str) -> int:
+        """
+        Drop cached responses that may contain a written object.
+
+        Removes the object's own entries (its details and edges) and every cached
+        list response, since an edit can change what a list contains.
+
+        Returns:
+            Number of entries removed
+        """
+        if not object_id:
+            return 0
+
+        stale = [
+            key for key in self.entries
+            if _object_id(key[1]) == object_id or "/" in key[1]
+        ]
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached response(s) after write to {object_id}")
+        return len(stale)
+
+    def invalidate_tenant(self, identity: str) -> int:
+        """
+        Drop in-memory responses fetched with one access token.
+
+        Args:
+            identity: token_identity of the token (key[0] of its cache keys)
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [key for key in self.entries if key[0] == identity]
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    async def clear_tenant(self, identity: str) -> int:
+        """Remove the responses fetched with one access token from both tiers"""
+        removed = self.invalidate_tenant(identity)
+        if self.second_tier is not None:
+            removed += await self.second_tier.invalidate_tenant(identity)
+        return removed
+
+    def _written_objects(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Get the objects a POST or DELETE request writes, including writes inside a Graph batch call"""
+        if _object_id(endpoint):
+            return [_object_id(endpoint)]
+
+        batch = (params or {}).get("batch")
+        if isinstance(batch, str):
+            try:
+                batch = json.loads(batch)
+            except json.JSONDecodeError:
+                batch = None
+        return [
+            _object_id(sub_request.get("relative_url", ""))
+            for sub_request in (batch if isinstance(batch, list) else [])
+            if isinstance(sub_request, dict) and sub_request.get("method", "GET").upper() != "GET"
+        ]
+
+    def invalidate_for_write(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """Invalidate in-memory responses affected by a POST or DELETE request"""
+        if not self.enabled or not self.entries:
+            return 0
+        return sum(self.invalidate_object(object_id) for object_id in self._written_objects(endpoint, params))
+
+    async def lookup(self, key: Any) -> Optional[Any]:
+        """
+        Get a cached response from memory, falling back to the second tier.
+
+        Second-tier hits are promoted into memory for their remaining TTL.
+        """
+        if self.enabled and self.second_tier is not None:
+            await self.sync_invalidations()
+        value = self.get(key)
+        if value is not None or not self.enabled or self.second_tier is None:
+            return value
+
+        entry = await self.second_tier.get(key)
+        if entry is None:
+            return None
+        value, ttl_left = entry
+        self._store(key, value, ttl_left)
+        return value
+
+    async def sync_invalidations(self, force: bool = False) -> int:
+        """
+        Drop memory entries for objects that other processes wrote to.
+
+        Other workers sharing the persistent tier log their writes there; this
+        replays the log at most once per sync_interval, which bounds how long a
+        stale memory entry can be served after another process's write.
+
+        Returns:
+            Number of memory entries removed
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sync < self.sync_interval:
+            return 0
+        self._last_sync = now
+        self._invalidation_seq, object_ids = await self.second_tier.invalidations_since(self._invalidation_seq)
+        return sum(self.invalidate_object(object_id) for object_id in dict.fromkeys(object_ids))
+
+    async def store(self, key: Any, endpoint: str, value: Any) -> None:
+        """Cache a response in memory and in the second tier"""
+        self.put(key, endpoint, value)
+        if not self.enabled or self.second_tier is None or (isinstance(value, dict) and "error" in value):
+            return
+        ttl = self.ttl_for(endpoint)
+        if ttl > 0:
+            await self.second_tier.put(key, endpoint, value, ttl)
+
+    async def invalidate_write(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """Invalidate responses affected by a POST or DELETE request in both tiers"""
+        removed = self.invalidate_for_write(endpoint, params)
+        if self.enabled and self.second_tier is not None:
+            removed += await self.second_tier.invalidate_objects(self._written_objects(endpoint, params))
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        self.entries.clear()
+        self.total_bytes = 0
+        if self.second_tier is not None:
+            self.second_tier.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics and current size"""
+        lookups = self.hits + self.misses
+        stats = {
+            "enabled": self.enabled,
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+        if self.second_tier is not None:
+            stats["persistent"] = self.second_tier.get_stats()
+        return stats
+
+
+# Global instance for easy access
+response_cache = ResponseCache(second_tier=disk_cache if DISK_CACHE_ENABLED else None)
@@ -2,7 +2,6 @@
 
 import threading
 import socket
-import asyncio
 import json
 import logging
 import webbrowser
@@ -12,6 +11,7 @@ from urllib.parse import urlparse, parse_qs, quote
 from typing import Dict, Any, Optional
 
 from .utils import logger
+from .http_client import run_with_private_client
 
 # Global token container for communication between threads
 token_container = {"token": None, "expires_in": None, "user_id": None}
@@ -474,7 +474,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
             })
             
             # Process the update asynchronously
-            result = asyncio.run(self._perform_update(object_id, token, changes))
+            result = run_with_private_client(self._perform_update(object_id, token, changes))
             self.wfile.write(json.dumps(result).encode())
         else:
             # Store the cancellation
@@ -836,10 +836,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
                 return {"error": {"message": f"Error fetching ad set data: {str(e)}"}}
         
         # Run the async function
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(get_adset_data())
-        loop.close()
+        result = run_with_private_client(get_adset_data())
         
         # Return the result
         self.send_response(200)
@@ -865,7 +862,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
             return await make_api_request(endpoint, token, params)
         
         # Run the async function to get data
-        result = asyncio.run(get_ad_data())
+        result = run_with_private_client(get_ad_data())
         
         # Send the response
         self.send_response(200)
@@ -3,13 +3,15 @@
 import json
 from typing import List, Optional, Dict, Any, Union
 from .api import meta_api_tool, make_api_request
+from .pagination import fetch_all_pages, fetch_all_page_size
 from .accounts import get_ad_accounts
 from .server import mcp_server
 
 
 @mcp_server.tool()
 @meta_api_tool
-async def get_campaigns(access_token: str = None, account_id: str = None, limit: int = 10, status_filter: str = "", after: str = "") -> str:
+async def get_campaigns(access_token: str = None, account_id: str = None, limit: int = 10, status_filter: str = "", after: str = "",
+                        fetch_all: bool = False, max_items: int = None) -> str:
     """
     Get campaigns for a Meta Ads account with optional filtering.
     
@@ -27,6 +29,8 @@ async def get_campaigns(access_token: str = None, account_id: str = None, limit:
                        Maps to the 'effective_status' API parameter, which expects an array
                        (this function handles the required JSON formatting). Leave empty for all statuses.
         after: Pagination cursor to get the next set of results
+        fetch_all: Follow pagination cursors and return all campaigns in one response, fetching at least 500 per page (default: False)
+        max_items: Maximum total number of campaigns to return across pages (implies fetch_all)
     """
     # If no account ID is specified, try to get the first one for the user
     if not account_id:
@@ -36,7 +40,7 @@ async def get_campaigns(access_token: str = None, account_id: str = None, limit:
         if "data" in accounts_data and accounts_data["data"]:
             account_id = accounts_data["data"][0]["id"]
         else:
-            return json.dumps({"error": "No account ID specified and no accounts found for user"}, indent=2)
+            return {"error": "No account ID specified and no accounts found for user"}
     
     endpoint = f"{account_id}/campaigns"
     params = {
@@ -51,9 +55,13 @@ async def get_campaigns(access_token: str = None, account_id: str = None, limit:
     if after:
         params["after"] = after
     
-    data = await make_api_request(endpoint, access_token, params)
+    if fetch_all or max_items is not None:
+        params["limit"] = fetch_all_page_size(limit)
+        data = await fetch_all_pages(endpoint, access_token, params, max_items=max_items)
+    else:
+        data = await make_api_request(endpoint, access_token, params)
     
-    return json.dumps(data, indent=2)
+    return data
 
 
 @mcp_server.tool()
@@ -71,7 +79,7 @@ async def get_campaign_details(access_token: str = None, campaign_id: str = None
         campaign_id: Meta Ads campaign ID
     """
     if not campaign_id:
-        return json.dumps({"error": "No campaign ID provided"}, indent=2)
+        return {"error": "No campaign ID provided"}
     
     endpoint = f"{campaign_id}"
     params = {
@@ -80,7 +88,7 @@ async def get_campaign_details(access_token: str = None, campaign_id: str = None
     
     data = await make_api_request(endpoint, access_token, params)
     
-    return json.dumps(data, indent=2)
+    return data
 
 
 @mcp_server.tool()
@@ -142,13 +150,13 @@ async def create_campaign(
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     if not name:
-        return json.dumps({"error": "No campaign name provided"}, indent=2)
+        return {"error": "No campaign name provided"}
         
     if not objective:
-        return json.dumps({"error": "No campaign objective provided"}, indent=2)
+        return {"error": "No campaign objective provided"}
     
     # Special_ad_categories is required by the API, set default if not provided
     if special_ad_categories is None:
@@ -234,14 +242,14 @@ async def create_campaign(
     
     try:
         data = await make_api_request(endpoint, access_token, params, method="POST")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return {
             "error": "Failed to create campaign",
             "details": error_msg,
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -279,7 +287,7 @@ async def update_campaign(
         objective: New campaign objective (Note: May not always be updatable)
     """
     if not campaign_id:
-        return json.dumps({"error": "No campaign ID provided"}, indent=2)
+        return {"error": "No campaign ID provided"}
 
     endpoint = f"{campaign_id}"
     
@@ -310,20 +318,20 @@ async def update_campaign(
         params["objective"] = objective # Caution: Objective changes might reset learning or be restricted
 
     if not params:
-        return json.dumps({"error": "No update parameters provided"}, indent=2)
+        return {"error": "No update parameters provided"}
 
     try:
         # Use POST method for updates as per Meta API documentation
         data = await make_api_request(endpoint, access_token, params, method="POST")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
         error_msg = str(e)
         # Include campaign_id in error for better context
-        return json.dumps({
+        return {
             "error": f"Failed to update campaign {campaign_id}",
             "details": error_msg,
             "params_sent": params # Be careful about logging sensitive data if any
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -360,10 +368,10 @@ async def create_advantage_plus_shopping_campaign(
     """
     # Check required parameters
     if not account_id:
-        return json.dumps({"error": "No account ID provided"}, indent=2)
+        return {"error": "No account ID provided"}
     
     if not name:
-        return json.dumps({"error": "No campaign name provided"}, indent=2)
+        return {"error": "No campaign name provided"}
     
     # Special_ad_categories is required by the API, set default if not provided
     if special_ad_categories is None:
@@ -403,14 +411,14 @@ async def create_advantage_plus_shopping_campaign(
     
     try:
         data = await make_api_request(endpoint, access_token, params, method="POST")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return {
             "error": "Failed to create Advantage+ Shopping Campaign",
             "details": error_msg,
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -525,7 +533,7 @@ async def get_campaign_objectives(access_token: str = None) -> str:
         }
     }
     
-    return json.dumps({
+    return {
         "objectives": objectives,
         "usage": "Use these objectives when creating campaigns. Each objective has specific optimization goals and billing events available."
-    }, indent=2) 
\ No newline at end of file
+    } 
\ No newline at end of file
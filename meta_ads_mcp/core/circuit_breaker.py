@@ -0,0 +1,230 @@
+"""Circuit breaker for failing or throttled Graph API paths.
+
+Each ad account (or, for requests outside an account, each endpoint shape) gets
+its own breaker. After repeated throttling or server failures the breaker opens
+and requests on that path fail fast instead of piling onto a limit Meta is
+already enforcing. Once the recovery timeout passes, a single trial request is
+let through (half-open); its outcome closes or re-opens the breaker.
+"""
+
+import os
+import re
+import time
+from typing import Any, Dict, Optional
+
+from .error_classifier import THROTTLED, TRANSIENT
+from .rate_limit import get_rate_limit_key
+from .utils import logger
+
+
+# Circuit breaker configuration (overridable through environment variables)
+CIRCUIT_BREAKER_ENABLED = os.environ.get("META_ADS_CIRCUIT_BREAKER_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.environ.get("META_ADS_CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = float(os.environ.get("META_ADS_CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "30"))  # seconds
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Only these failures say something about the health of the path itself
+TRIPPING_CATEGORIES = {THROTTLED, TRANSIENT}
+
+_NUMERIC_ID_PATTERN = re.compile(r"^\d+$")
+
+
+def get_circuit_key(endpoint: str) -> str:
+    """
+    Get the breaker key for an endpoint.
+
+    Requests under an ad account share the account's breaker. Other requests are
+    grouped by endpoint shape with object IDs collapsed, e.g. "{id}/insights".
+    """
+    account_key = get_rate_limit_key(endpoint)
+    if account_key:
+        return account_key
+    path = (endpoint or "").split("?", 1)[0].strip("/")
+    return "/".join("{id}" if _NUMERIC_ID_PATTERN.match(part) else part for part in path.split("/")) or "/"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open state machine for a single path"""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_until = 0.0
+        self.trial_in_flight = False
+        self.last_error: Optional[str] = None
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, moving an expired open breaker to half-open"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if time.monotonic() < self.opened_until:
+                return False
+            self.state = HALF_OPEN
+            self.trial_in_flight = False
+        # Half-open: let exactly one trial request through
+        if self.trial_in_flight:
+            return False
+        self.trial_in_flight = True
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker will let a trial request through"""
+        return max(0.0, self.opened_until - time.monotonic())
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.trial_in_flight = False
+        self.last_error = None
+
+    def record_failure(self, category: str, open_for: Optional[float] = None) -> bool:
+        """
+        Record a failed request.
+
+        Args:
+            category: Error category from error_classifier
+            open_for: Seconds Meta asked us to stay away, if known
+
+        Returns:
+            True if this failure opened the breaker
+        """
+        self.last_error = category
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold or open_for:
+            self.state = OPEN
+            self.trial_in_flight = False
+            self.opened_until = time.monotonic() + max(self.recovery_timeout, open_for or 0.0)
+            return True
+        return False
+
+    def release(self) -> None:
+        """Release a half-open trial slot whose request did not count either way"""
+        self.trial_in_flight = False
+
+    def status(self) -> Dict[str, Any]:
+        """Get a snapshot of the breaker state"""
+        if self.state == OPEN and time.monotonic() >= self.opened_until:
+            state = HALF_OPEN
+        else:
+            state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self.failures,
+            "retry_after_seconds": round(self.retry_after(), 1) if state == OPEN else 0,
+            "last_error_category": self.last_error,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Holds one circuit breaker per ad account / endpoint shape"""
+
+    def __init__(self, enabled: bool = CIRCUIT_BREAKER_ENABLED):
+        self.enabled = enabled
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        # Breakers of HTTP clients using their own tokens, by tenant (see tenants.py)
+        self.tenant_breakers: Dict[str, Dict[str, CircuitBreaker]] = {}
+
+    def _breaker(self, key: str, tenant: Optional[str] = None) -> CircuitBreaker:
+        breakers = self.breakers if tenant is None else self.tenant_breakers.setdefault(tenant, {})
+        breaker = breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            breakers[key] = breaker
+        return breaker
+
+    def forget(self, tenant: str) -> None:
+        """Drop the breakers of a tenant"""
+        self.tenant_breakers.pop(tenant, None)
+
+    def check(self, endpoint: str, tenant: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Check whether a request to the endpoint may proceed.
+
+        Args:
+            endpoint: API endpoint path the request is for
+            tenant: Tenant identity of the request, or None for the server's own token
+
+        Returns:
+            None if the request may be sent, otherwise an error result to return immediately
+        """
+        if not self.enabled:
+            return None
+
+        key = get_circuit_key(endpoint)
+        breaker = self._breaker(key, tenant)
+        if breaker.allow_request():
+            return None
+
+        retry_after = round(breaker.retry_after(), 1)
+        logger.warning(f"Circuit open for {key}; failing fast (retry in {retry_after}s)")
+        return {
+            "error": {
+                "message": f"Requests to {key} are temporarily suspended after repeated {breaker.last_error} errors from Meta",
+                "category": breaker.last_error,
+                "circuit_breaker": key,
+                "retry_after_seconds": retry_after,
+            }
+        }
+
+    def record(self, endpoint: str, category: Optional[str], open_for: Optional[float] = None,
+               tenant: Optional[str] = None) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            endpoint: API endpoint path the request was sent to
+            category: Error category from error_classifier, or None on success
+            open_for: Seconds Meta asked us to stay away, if known
+            tenant: Tenant identity of the request, or None for the server's own token
+        """
+        if not self.enabled:
+            return
+
+        key = get_circuit_key(endpoint)
+        breaker = self._breaker(key, tenant)
+        if category is None:
+            breaker.record_success()
+        elif category in TRIPPING_CATEGORIES:
+            if breaker.record_failure(category, open_for):
+                logger.warning(f"Circuit opened for {key} after {breaker.failures} {category} error(s)")
+        else:
+            # Client, permission and auth errors say nothing about the path's health
+            breaker.release()
+
+    def release(self, endpoint: str, tenant: Optional[str] = None) -> None:
+        """
+        Give back a half-open trial slot for a request that ended without an outcome.
+
+        Args:
+            endpoint: API endpoint path the request was sent to
+            tenant: Tenant identity of the request, or None for the server's own token
+        """
+        if not self.enabled:
+            return
+        breakers = self.breakers if tenant is None else self.tenant_breakers.get(tenant, {})
+        breaker = breakers.get(get_circuit_key(endpoint))
+        if breaker is not None:
+            breaker.release()
+
+    def get_status(self, tenant: Optional[str] = None) -> Dict[str, Any]:
+        """Get the state of every breaker that is not closed, for the server's own token or a tenant"""
+        breakers = self.breakers if tenant is None else self.tenant_breakers.get(tenant, {})
+        return {
+            key: breaker.status()
+            for key, breaker in breakers.items()
+            if breaker.status()["state"] != CLOSED
+        }
+
+
+# Global instance for easy access
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,297 @@
+"""Persistent SQLite second tier for the Graph API response cache.
+
+The database lives next to the token cache (e.g. ~/.config/meta-ads-mcp) and runs
+in WAL mode so several server processes can read and write it concurrently.
+Warm restarts and multi-worker deployments share cached reads through it, and
+writes are recorded in an invalidation log so other processes can drop stale
+entries from their in-memory tier.
+"""
+
+import asyncio
+import json
+import os
+import pathlib
+import platform
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .utils import logger
+
+
+# Disk cache configuration (overridable through environment variables)
+DISK_CACHE_ENABLED = os.environ.get("META_ADS_DISK_CACHE", "").lower() in ("1", "true", "yes", "on")
+DISK_CACHE_PATH = os.environ.get("META_ADS_DISK_CACHE_PATH", "")
+DISK_CACHE_MAX_BYTES = int(os.environ.get("META_ADS_DISK_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+DISK_CACHE_MAX_ENTRIES = int(os.environ.get("META_ADS_DISK_CACHE_MAX_ENTRIES", "50000"))
+DISK_CACHE_MAINTENANCE_INTERVAL = float(os.environ.get("META_ADS_DISK_CACHE_MAINTENANCE_INTERVAL", "600"))  # seconds
+
+# Invalidation log entries older than this are pruned during maintenance
+INVALIDATION_LOG_RETENTION = 3600.0  # seconds
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    object_id TEXT NOT NULL,
+    is_list INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS responses_object_id ON responses (object_id);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS invalidations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    origin TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    object_ids TEXT NOT NULL
+);
+"""
+
+
+def _get_cache_db_path() -> pathlib.Path:
+    """Get the platform-specific path for the response cache database"""
+    if DISK_CACHE_PATH:
+        path = pathlib.Path(DISK_CACHE_PATH).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    if platform.system() == "Windows":
+        base_path = pathlib.Path(os.environ.get("APPDATA", ""))
+    elif platform.system() == "Darwin":  # macOS
+        base_path = pathlib.Path.home() / "Library" / "Application Support"
+    else:  # Assume Linux/Unix
+        base_path = pathlib.Path.home() / ".config"
+
+    cache_dir = base_path / "meta-ads-mcp"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    return cache_dir / "response_cache.sqlite3"
+
+
+def _serialize_key(key: Any) -> str:
+    return json.dumps(key, default=str)
+
+
+def _split_endpoint(endpoint: str) -> Tuple[str, int]:
+    """Get the object ID and whether the endpoint is a list edge"""
+    path = (endpoint or "").split("?", 1)[0].strip("/")
+    return path.split("/", 1)[0], int("/" in path)
+
+
+class DiskCache:
+    """SQLite-backed response store with TTL expiry, size caps and periodic compaction"""
+
+    def __init__(
+        self,
+        path: Optional[pathlib.Path] = None,
+        max_bytes: int = DISK_CACHE_MAX_BYTES,
+        max_entries: int = DISK_CACHE_MAX_ENTRIES,
+        maintenance_interval: float = DISK_CACHE_MAINTENANCE_INTERVAL,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.maintenance_interval = maintenance_interval
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._last_maintenance = time.monotonic()
+        # Identifies this process's rows in the invalidation log
+        self.origin = uuid.uuid4().hex
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self._conn is None:
+            if self.path is None:
+                self.path = _get_cache_db_path()
+            conn = sqlite3.connect(str(self.path), timeout=1.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            logger.info(f"Opened persistent response cache at {self.path}")
+        return self._conn
+
+    def _run(self, func, *args):
+        """Run a database operation under the connection lock, logging rather than raising errors"""
+        with self._lock:
+            try:
+                return func(self._connection(), *args)
+            except sqlite3.Error as e:
+                self.errors += 1
+                logger.warning(f"Persistent response cache error: {e}")
+                return None
+
+    # Synchronous operations (run in a worker thread by the async API below)
+
+    def _get(self, conn: sqlite3.Connection, key: str) -> Optional[Tuple[Any, float]]:
+        now = time.time()
+        row = conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] <= now:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0]), row[1] - now
+
+    def _put(self, conn: sqlite3.Connection, key: str, endpoint: str, value: str, ttl: float) -> None:
+        now = time.time()
+        object_id, is_list = _split_endpoint(endpoint)
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, object_id, is_list, expires_at, accessed_at, size, value) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, object_id, is_list, now + ttl, now, len(value), value)
+        )
+
+    def _invalidate(self, conn: sqlite3.Connection, object_ids: Tuple[str, ...]) -> int:
+        placeholders = ",".join("?" for _ in object_ids)
+        cursor = conn.execute(
+            f"DELETE FROM responses WHERE is_list = 1 OR object_id IN ({placeholders})",
+            object_ids
+        )
+        conn.execute(
+            "INSERT INTO invalidations (origin, created_at, object_ids) VALUES (?, ?, ?)",
+            (self.origin, time.time(), json.dumps(object_ids))
+        )
+        return cursor.rowcount
+
+    def _invalidations_since(self, conn: sqlite3.Connection, seq: Optional[int]) -> Tuple[int, List[str]]:
+        if seq is None:
+            # First sync: only later writes matter to a memory tier that starts now
+            return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM invalidations").fetchone()[0], []
+        rows = conn.execute(
+            "SELECT seq, origin, object_ids FROM invalidations WHERE seq > ? ORDER BY seq", (seq,)
+        ).fetchall()
+        object_ids = [object_id for _, origin, ids in rows if origin != self.origin for object_id in json.loads(ids)]
+        return (rows[-1][0] if rows else seq), object_ids
+
+    def _maintain(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        """Expire old rows, enforce the size caps and compact the database file"""
+        expired = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),)).rowcount
+
+        evicted = 0
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count > self.max_entries or total > self.max_bytes:
+            # Evict least recently used rows until both caps hold again
+            rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+            stale = []
+            for key, size in rows:
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                stale.append((key,))
+                count -= 1
+                total -= size
+            conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+            evicted = len(stale)
+
+        conn.execute("DELETE FROM invalidations WHERE created_at <= ?", (time.time() - INVALIDATION_LOG_RETENTION,))
+        conn.execute("PRAGMA incremental_vacuum")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return {"expired": expired, "evicted": evicted, "entries": count, "bytes": total}
+
+    def _invalidate_prefix(self, conn: sqlite3.Connection, prefix: str) -> int:
+        return conn.execute("DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)).rowcount
+
+    def _clear(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM responses")
+        conn.execute("DELETE FROM invalidations")
+        conn.execute("VACUUM")
+
+    def _stats(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        return conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+    # Async API used by the response cache
+
+    async def get(self, key: Any) -> Optional[Tuple[Any, float]]:
+        """
+        Get a cached response.
+
+        Returns:
+            (value, seconds until expiry), or None on a miss
+        """
+        entry = await asyncio.to_thread(self._run, self._get, _serialize_key(key))
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def put(self, key: Any, endpoint: str, value: Any, ttl: float) -> None:
+        """Store a response for ttl seconds"""
+        serialized = json.dumps(value, default=str)
+        if len(serialized) > self.max_bytes:
+            return
+        await asyncio.to_thread(self._run, self._put, _serialize_key(key), endpoint, serialized, ttl)
+        if time.monotonic() - self._last_maintenance >= self.maintenance_interval:
+            await self.maintain()
+
+    async def invalidate_objects(self, object_ids: Iterable[str]) -> int:
+        """Drop cached responses for the given objects and every cached list response"""
+        object_ids = tuple(object_id for object_id in object_ids if object_id)
+        if not object_ids:
+            return 0
+        return await asyncio.to_thread(self._run, self._invalidate, object_ids) or 0
+
+    async def invalidate_tenant(self, identity: str) -> int:
+        """Drop cached responses fetched with one access token (keys starting with its token_identity)"""
+        # Serialized keys are JSON lists whose first item is the identity
+        prefix = _serialize_key([identity])[:-1] + ","
+        return await asyncio.to_thread(self._run, self._invalidate_prefix, prefix) or 0
+
+    async def invalidations_since(self, seq: Optional[int]) -> Tuple[Optional[int], List[str]]:
+        """
+        Get objects written by other processes since an invalidation log position.
+
+        Args:
+            seq: Last position seen, or None to start from the current end of the log
+
+        Returns:
+            (new position, object IDs to invalidate)
+        """
+        result = await asyncio.to_thread(self._run, self._invalidations_since, seq)
+        return result if result is not None else (seq, [])
+
+    async def maintain(self) -> Optional[Dict[str, int]]:
+        """Run the expiry/eviction/compaction job"""
+        self._last_maintenance = time.monotonic()
+        result = await asyncio.to_thread(self._run, self._maintain)
+        if result and (result["expired"] or result["evicted"]):
+            logger.debug(f"Persistent response cache maintenance: {result}")
+        return result
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        self._run(self._clear)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics and database size"""
+        entries, total = self._run(self._stats) or (0, 0)
+        return {
+            "path": str(self.path) if self.path else None,
+            "entries": entries,
+            "bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global instance for easy access
+disk_cache = DiskCache()
@@ -6,6 +6,7 @@ import httpx
 from typing import Optional, Dict, Any, List, Union
 from .server import mcp_server
 from .api import meta_api_tool
+from .http_client import get_http_client
 
 
 # Only register the duplication functions if the environment variable is set
@@ -208,99 +209,100 @@ async def _forward_duplication_request(resource_type: str, resource_id: str, acc
         clean_options = {k: v for k, v in options.items() if v is not None}
         
         # Make the request to the cloud service
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                endpoint,
-                headers=headers,
-                json=clean_options
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return json.dumps(result, indent=2)
-            elif response.status_code == 403:
-                # Premium feature upgrade message
-                return json.dumps({
-                    "error": "premium_feature_required",
-                    "message": f"Professional {resource_type} duplication is a premium feature",
-                    "details": {
-                        "feature": f"Meta Ads {resource_type.title()} Duplication",
-                        "description": f"Duplicate {resource_type}s with advanced options and bulk operations",
-                        "benefits": [
-                            "Preserve all targeting and optimization settings",
-                            "Bulk duplication across campaigns",
-                            "Advanced naming and organization options",
-                            "Cross-account duplication support",
-                            "Performance-based automatic duplication",
-                            "Template system for reusable patterns",
-                            "Compliance validation (DSA, youth targeting)",
-                            "White-label client reporting"
-                        ],
-                        "upgrade_url": "https://pipeboard.co/upgrade",
-                        "contact_email": "info@pipeboard.co",
-                        "early_access": "Contact us for early access and special pricing"
-                    },
-                    "request_parameters": {
+        client = get_http_client()
+        response = await client.post(
+            endpoint,
+            headers=headers,
+            json=clean_options,
+            timeout=30.0
+        )
+        
+        if response.status_code == 200:
+            result = response.json()
+            return json.dumps(result, indent=2)
+        elif response.status_code == 403:
+            # Premium feature upgrade message
+            return json.dumps({
+                "error": "premium_feature_required",
+                "message": f"Professional {resource_type} duplication is a premium feature",
+                "details": {
+                    "feature": f"Meta Ads {resource_type.title()} Duplication",
+                    "description": f"Duplicate {resource_type}s with advanced options and bulk operations",
+                    "benefits": [
+                        "Preserve all targeting and optimization settings",
+                        "Bulk duplication across campaigns",
+                        "Advanced naming and organization options",
+                        "Cross-account duplication support",
+                        "Performance-based automatic duplication",
+                        "Template system for reusable patterns",
+                        "Compliance validation (DSA, youth targeting)",
+                        "White-label client reporting"
+                    ],
+                    "upgrade_url": "https://pipeboard.co/upgrade",
+                    "contact_email": "info@pipeboard.co",
+                    "early_access": "Contact us for early access and special pricing"
+                },
+                "request_parameters": {
+                    "resource_type": resource_type,
+                    "resource_id": resource_id,
+                    **clean_options
+                },
+                "preview": {
+                    "would_duplicate": {
                         "resource_type": resource_type,
                         "resource_id": resource_id,
-                        **clean_options
+                        "new_name": f"Original Name{options.get('name_suffix', ' - Copy')}",
+                        "status": options.get('new_status', 'PAUSED')
                     },
-                    "preview": {
-                        "would_duplicate": {
-                            "resource_type": resource_type,
-                            "resource_id": resource_id,
-                            "new_name": f"Original Name{options.get('name_suffix', ' - Copy')}",
-                            "status": options.get('new_status', 'PAUSED')
-                        },
-                        "estimated_components": _get_estimated_components(resource_type, options),
-                        "supported_features": [
-                            "Name customization",
-                            "Budget modification", 
-                            "Status control",
-                            "Cross-campaign/adset movement",
-                            "Creative text modifications",
-                            "Schedule preservation",
-                            "Targeting duplication",
-                            "Performance tracking"
-                        ]
-                    }
-                }, indent=2)
-            elif response.status_code == 401:
-                return json.dumps({
-                    "error": "authentication_failed",
-                    "message": "Invalid or expired access token",
-                    "details": {
-                        "suggestion": "Please reconnect your Meta Ads account",
-                        "status_code": response.status_code
-                    }
-                }, indent=2)
-            elif response.status_code == 429:
-                return json.dumps({
-                    "error": "rate_limit_exceeded", 
-                    "message": "Meta API rate limit exceeded",
-                    "details": {
-                        "suggestion": "Please wait before retrying",
-                        "retry_after": response.headers.get("Retry-After", "60")
-                    }
-                }, indent=2)
-            else:
-                error_detail = response.text
-                try:
-                    error_json = response.json()
-                    error_detail = error_json.get("message", error_detail)
-                except:
-                    pass
-                
-                return json.dumps({
-                    "error": "duplication_failed",
-                    "message": f"Failed to duplicate {resource_type}",
-                    "details": {
-                        "status_code": response.status_code,
-                        "error_detail": error_detail,
-                        "resource_type": resource_type,
-                        "resource_id": resource_id
-                    }
-                }, indent=2)
+                    "estimated_components": _get_estimated_components(resource_type, options),
+                    "supported_features": [
+                        "Name customization",
+                        "Budget modification", 
+                        "Status control",
+                        "Cross-campaign/adset movement",
+                        "Creative text modifications",
+                        "Schedule preservation",
+                        "Targeting duplication",
+                        "Performance tracking"
+                    ]
+                }
+            }, indent=2)
+        elif response.status_code == 401:
+            return json.dumps({
+                "error": "authentication_failed",
+                "message": "Invalid or expired access token",
+                "details": {
+                    "suggestion": "Please reconnect your Meta Ads account",
+                    "status_code": response.status_code
+                }
+            }, indent=2)
+        elif response.status_code == 429:
+            return json.dumps({
+                "error": "rate_limit_exceeded", 
+                "message": "Meta API rate limit exceeded",
+                "details": {
+                    "suggestion": "Please wait before retrying",
+                    "retry_after": response.headers.get("Retry-After", "60")
+                }
+            }, indent=2)
+        else:
+            error_detail = response.text
+            try:
+                error_json = response.json()
+                error_detail = error_json.get("message", error_detail)
+            except:
+                pass
+            
+            return json.dumps({
+                "error": "duplication_failed",
+                "message": f"Failed to duplicate {resource_type}",
+                "details": {
+                    "status_code": response.status_code,
+                    "error_detail": error_detail,
+                    "resource_type": resource_type,
+                    "resource_id": resource_id
+                }
+            }, indent=2)
     
     except httpx.TimeoutException:
         return json.dumps({
@@ -0,0 +1,80 @@
+"""Classification of Meta Graph API errors.
+
+Graph reports very different conditions through similar-looking errors: code 4
+is an app-level rate limit, 10 and 200-299 are missing permissions, and only
+190/102 mean the access token itself is unusable. Callers use the category to
+decide whether to invalidate the token, retry, or trip a circuit breaker.
+"""
+
+from typing import Any, Dict, Optional
+
+
+# Error categories
+AUTH = "auth"                # Token expired, revoked or malformed - re-authentication needed
+THROTTLED = "throttled"      # Rate limited by Meta - back off, the token is still valid
+PERMISSION = "permission"    # Token lacks a permission for this object - re-auth won't help
+TRANSIENT = "transient"      # Temporary server or network failure
+CLIENT = "client"            # Invalid request (bad parameter, unknown object, ...)
+
+AUTH_ERROR_CODES = {102, 190}
+# 4: app limit, 17: user limit, 32: page limit, 613: custom rate limit,
+# 80000-80014: business use case limits
+THROTTLING_ERROR_CODES = {4, 17, 32, 613} | set(range(80000, 80015))
+TRANSIENT_ERROR_CODES = {1, 2}
+PERMISSION_ERROR_CODES = {10} | set(range(200, 300))
+
+
+def classify_graph_error(error_obj: Optional[Dict[str, Any]], status_code: Optional[int] = None) -> str:
+    """
+    Classify a Graph API error object.
+
+    Args:
+        error_obj: The "error" object from a Graph API response body (may be empty)
+        status_code: HTTP status code of the response, if known
+
+    Returns:
+        One of AUTH, THROTTLED, PERMISSION, TRANSIENT or CLIENT
+    """
+    error_obj = error_obj if isinstance(error_obj, dict) else {}
+    code = error_obj.get("code")
+
+    if code in AUTH_ERROR_CODES:
+        return AUTH
+    if code in THROTTLING_ERROR_CODES or status_code == 429:
+        return THROTTLED
+    if code in PERMISSION_ERROR_CODES:
+        return PERMISSION
+    if code in TRANSIENT_ERROR_CODES or error_obj.get("is_transient"):
+        return TRANSIENT
+    if status_code is not None and status_code >= 500:
+        return TRANSIENT
+    if code is None and status_code == 401:
+        return AUTH
+    if code is None and status_code == 403:
+        return PERMISSION
+    return CLIENT
+
+
+def classify_result(result: Any) -> Optional[str]:
+    """
+    Classify the value returned by make_api_request.
+
+    Returns:
+        The error category, or None if the result is not an error
+    """
+    if not isinstance(result, dict) or not isinstance(result.get("error"), dict):
+        return None
+
+    error = result["error"]
+    if error.get("is_transient"):
+        return TRANSIENT
+    if "category" in error:
+        return error["category"]
+
+    details = error.get("details")
+    error_obj = details.get("error") if isinstance(details, dict) else None
+    full_response = error.get("full_response")
+    status_code = full_response.get("status_code") if isinstance(full_response, dict) else None
+    if error_obj is None and "code" in error:
+        error_obj = error
+    return classify_graph_error(error_obj, status_code)
@@ -0,0 +1,1062 @@
+"""Offline Graph API simulator for load tests and benchmarks.
+
+Serves a deterministic synthetic ad hierarchy (accounts, campaigns, ad sets,
+ads, creatives and images) over the same URLs as graph.facebook.com, so the
+server can run against it by pointing META_ADS_GRAPH_API_BASE at it:
+
+    python -m meta_ads_mcp.core.graph_simulator --port 9100 --campaigns 500
+    META_ADS_GRAPH_API_BASE=http://127.0.0.1:9100/v22.0 meta-ads-mcp
+
+It implements what the tools rely on: field selection (including nested
+fields like creative{id}), cursor pagination with paging.next, ?ids= lookups,
+batch requests with {result=name:$.path} references, insights with level and
+breakdowns, writes, and the x-app-usage / x-ad-account-usage /
+x-business-use-case-usage headers. Latency, transient errors and throttling
+can be injected at startup or changed at runtime through /_simulator/config.
+Any access token is accepted except ones starting with "expired" (code 190).
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+GRAPH_API_VERSION = "v22.0"
+DEFAULT_PORT = 9100
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 5000
+
+# Seconds of history used for the usage headers (Graph reports a rolling hour)
+USAGE_WINDOW = 3600.0
+
+OBJECTIVES = ["OUTCOME_TRAFFIC", "OUTCOME_SALES", "OUTCOME_LEADS", "OUTCOME_AWARENESS", "OUTCOME_ENGAGEMENT"]
+STATUSES = ["ACTIVE", "PAUSED", "ACTIVE", "ARCHIVED"]
+OPTIMIZATION_GOALS = ["LINK_CLICKS", "OFFSITE_CONVERSIONS", "REACH", "IMPRESSIONS"]
+BREAKDOWN_VALUES = {
+    "age": ["18-24", "25-34", "35-44", "45-54", "55-64", "65+"],
+    "gender": ["female", "male", "unknown"],
+    "country": ["US", "GB", "BR", "DE", "IN"],
+    "publisher_platform": ["facebook", "instagram", "audience_network", "messenger"],
+    "device_platform": ["mobile_app", "mobile_web", "desktop"],
+}
+
+# Edges listed for each object type and the object type they contain
+EDGES = {
+    "user": {"adaccounts": "account", "accounts": "page"},
+    "account": {"campaigns": "campaign", "adsets": "adset", "ads": "ad", "adcreatives": "creative", "adimages": "image"},
+    "campaign": {"adsets": "adset", "ads": "ad"},
+    "adset": {"ads": "ad"},
+    "ad": {"adcreatives": "creative"},
+    "page": {"leadgen_forms": "leadform"},
+    "leadform": {"leads": "lead"},
+}
+# Page every simulated creative promotes
+PAGE_ID = "200000000000001"
+
+# Registered tools that tool_calls() has no fixture for, and why
+UNSIMULATED_TOOLS = {
+    "get_login_link": "starts the OAuth flow and its local callback server instead of calling the Graph API",
+    "upload_ad_image": "reads an image file from the server's disk, which the benchmark machine does not provide",
+    "upload_video_from_supabase": "downloads the video from Supabase storage before uploading it",
+    "list_supabase_videos": "lists files in Supabase storage, not the Graph API",
+    "generate_report": "is served by Pipeboard, not the Graph API",
+    "duplicate_campaign": "is served by the Pipeboard duplication API, not the Graph API",
+    "duplicate_adset": "is served by the Pipeboard duplication API, not the Graph API",
+    "duplicate_ad": "is served by the Pipeboard duplication API, not the Graph API",
+    "duplicate_creative": "is served by the Pipeboard duplication API, not the Graph API",
+}
+LEVELS = ["account", "campaign", "adset", "ad"]
+
+_VERSION_PREFIX = re.compile(r"^v\d+\.\d+/?")
+_RESULT_REFERENCE = re.compile(r"\{result=([^:}]+):([^}]+)\}")
+
+
+def _graph_error(message: str, code: int, error_type: str = "OAuthException", **extra) -> Dict[str, Any]:
+    error = {"message": message, "type": error_type, "code": code, "fbtrace_id": f"SIM{random.getrandbits(40):x}"}
+    error.update(extra)
+    return {"error": error}
+
+
+def parse_fields(fields: str) -> Dict[str, Optional[Dict]]:
+    """
+    Parse a Graph fields expression into {name: nested fields or None}.
+
+    e.g. "id,creative{id,name},targeting" -> {"id": None, "creative": {"id": None, "name": None}, "targeting": None}
+    """
+    result: Dict[str, Optional[Dict]] = {}
+    depth = 0
+    start = 0
+    for position, char in enumerate(fields + ","):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            item = fields[start:position].strip()
+            start = position + 1
+            if not item:
+                continue
+            if "{" in item and item.endswith("}"):
+                name, nested = item.split("{", 1)
+                result[name.strip()] = parse_fields(nested[:-1])
+            else:
+                # Modifiers like insights.date_preset(...) select the base field
+                result[item.split(".", 1)[0]] = None
+    return result
+
+
+def select_fields(obj: Dict[str, Any], fields: Optional[Dict[str, Optional[Dict]]]) -> Dict[str, Any]:
+    """Keep only the requested fields of an object (id is always included, as on Graph)"""
+    if fields is None:
+        fields = {"id": None, "name": None}
+    selected = {"id": obj["id"]} if "id" in obj else {}
+    for name, nested in fields.items():
+        if name not in obj:
+            continue
+        value = obj[name]
+        if nested is not None and isinstance(value, dict):
+            value = select_fields(value, nested)
+        elif nested is not None and isinstance(value, list):
+            value = [select_fields(item, nested) if isinstance(item, dict) else item for item in value]
+        selected[name] = value
+    return selected
+
+
+def resolve_json_path(data: Any, path: str) -> Optional[str]:
+    """
+    Evaluate the JSONPath subset Graph batch references support ($.a.b, $.data.*.id).
+
+    Returns:
+        The value as a string (multiple values comma-joined), or None if nothing matched
+    """
+    values = [data]
+    for part in path.strip().lstrip("$").strip(".").split("."):
+        if not part:
+            continue
+        next_values = []
+        for value in values:
+            if part == "*" and isinstance(value, list):
+                next_values.extend(value)
+            elif isinstance(value, dict) and part in value:
+                next_values.append(value[part])
+            elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+                next_values.append(value[int(part)])
+        values = next_values
+    if not values:
+        return None
+    return ",".join(json.dumps(v) if isinstance(v, (dict, list)) else str(v) for v in values)
+
+
+def _decode_param(value: str) -> Any:
+    """Decode a form or query value the way Graph does (JSON when it parses as an object or list)"""
+    if value and value[0] in "[{":
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    return value
+
+
+def _encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(str(offset).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+    except (ValueError, UnicodeDecodeError):
+        return 0
+
+
+class GraphSimulator:
+    """Synthetic Graph API: data model, request dispatch and fault injection"""
+
+    def __init__(
+        self,
+        accounts: int = 2,
+        campaigns_per_account: int = 10,
+        adsets_per_campaign: int = 2,
+        ads_per_adset: int = 2,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        app_call_limit: int = 1_000_000,
+        account_call_limit: int = 100_000,
+        image_size: Tuple[int, int] = (600, 314),
+        seed: int = 0,
+    ):
+        """
+        Args:
+            accounts: Number of ad accounts of the simulated user
+            campaigns_per_account: Campaigns created in each account
+            adsets_per_campaign: Ad sets created in each campaign
+            ads_per_adset: Ads (each with its own creative and image) in each ad set
+            latency: Seconds added to every response
+            latency_jitter: Upper bound of a uniformly random extra delay in seconds
+            error_rate: Fraction of requests failing with a transient 500 (code 2)
+            throttle_rate: Fraction of requests failing with a user rate limit (code 17)
+            app_call_limit: Calls per usage window at which x-app-usage reaches 100%
+            account_call_limit: Calls per account per usage window at which the account is throttled
+            image_size: Width and height of the generated ad images
+            seed: Seed for fault injection and latency jitter
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.app_call_limit = app_call_limit
+        self.account_call_limit = account_call_limit
+        self.image_size = image_size
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._app_calls: Deque[float] = deque()
+        self._account_calls: Dict[str, Deque[float]] = {}
+        self._images: Dict[str, bytes] = {}
+        self._next_id = 120_210_000_000_000
+        self.request_count = 0
+        self.status_counts: Dict[int, int] = {}
+
+        self.objects: Dict[str, Dict[str, Any]] = {}
+        self.types: Dict[str, str] = {}
+        self.edges: Dict[Tuple[str, str], List[str]] = {}
+        self.user_id = "100000000000001"
+        self._add("user", {"id": self.user_id, "name": "Simulated User"}, [])
+        for account_index in range(accounts):
+            self._build_account(account_index, campaigns_per_account, adsets_per_campaign, ads_per_adset)
+        self._build_page()
+
+    # Data model
+
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return str(self._next_id)
+
+    def _add(self, object_type: str, obj: Dict[str, Any], parents: List[Tuple[str, str]]) -> Dict[str, Any]:
+        self.objects[obj["id"]] = obj
+        self.types[obj["id"]] = object_type
+        for parent in parents:
+            self.edges.setdefault(parent, []).append(obj["id"])
+        return obj
+
+    def _build_account(self, index: int, campaigns: int, adsets: int, ads: int) -> None:
+        account_number = str(1_000_000_000 + index)
+        account_id = f"act_{account_number}"
+        self._add("account", {
+            "id": account_id,
+            "account_id": account_number,
+            "name": f"Simulated Account {index + 1}",
+            "account_status": 1,
+            "currency": "USD",
+            "timezone_name": "America/Los_Angeles",
+            "amount_spent": str(1_000_000 + index * 12_345),
+            "balance": "0",
+            "age": 400.5,
+            "business_city": "Menlo Park",
+            "business_country_code": "US",
+            "owner": self.user_id,
+            "funding_source_details": {"id": f"fs{account_number}", "type": 1, "display_string": "Visa *1234"},
+        }, [(self.user_id, "adaccounts")])
+
+        for c in range(campaigns):
+            campaign_id = self._new_id()
+            status = STATUSES[c % len(STATUSES)]
+            self._add("campaign", {
+                "id": campaign_id,
+                "account_id": account_number,
+                "name": f"Campaign {c + 1} - {OBJECTIVES[c % len(OBJECTIVES)].split('_', 1)[1].title()}",
+                "objective": OBJECTIVES[c % len(OBJECTIVES)],
+                "status": status,
+                "configured_status": status,
+                "effective_status": status,
+                "buying_type": "AUCTION",
+                "bid_strategy": "LOWEST_COST_WITHOUT_CAP",
+                "daily_budget": str(1000 + (c % 20) * 500),
+                "budget_remaining": str(500 + (c % 20) * 250),
+                "special_ad_categories": [],
+                "pacing_type": ["standard"],
+                "start_time": "2024-01-01T00:00:00-0800",
+                "created_time": "2024-01-01T00:00:00-0800",
+                "updated_time": "2024-06-01T00:00:00-0700",
+            }, [(account_id, "campaigns")])
+
+            for s in range(adsets):
+                adset_id = self._new_id()
+                self._add("adset", {
+                    "id": adset_id,
+                    "account_id": account_number,
+                    "campaign_id": campaign_id,
+                    "name": f"Ad Set {c + 1}.{s + 1}",
+                    "status": status,
+                    "effective_status": status,
+                    "optimization_goal": OPTIMIZATION_GOALS[s % len(OPTIMIZATION_GOALS)],
+                    "billing_event": "IMPRESSIONS",
+                    "bid_strategy": "LOWEST_COST_WITHOUT_CAP",
+                    "daily_budget": str(500 + s * 100),
+                    "budget_remaining": str(250 + s * 50),
+                    "targeting": {
+                        "age_min": 18,
+                        "age_max": 65,
+                        "geo_locations": {"countries": ["US"], "location_types": ["home", "recent"]},
+                        "targeting_automation": {"advantage_audience": 1},
+                    },
+                    "frequency_control_specs": [{"event": "IMPRESSIONS", "interval_days": 7, "max_frequency": 3}],
+                    "destination_type": "WEBSITE",
+                    "start_time": "2024-01-01T00:00:00-0800",
+                    "created_time": "2024-01-01T00:00:00-0800",
+                    "updated_time": "2024-06-01T00:00:00-0700",
+                }, [(account_id, "adsets"), (campaign_id, "adsets")])
+
+                for a in range(ads):
+                    self._build_ad(account_id, account_number, campaign_id, adset_id, status, f"{c + 1}.{s + 1}.{a + 1}")
+
+    def _build_ad(self, account_id: str, account_number: str, campaign_id: str, adset_id: str,
+                  status: str, label: str) -> None:
+        ad_id = self._new_id()
+        creative_id = self._new_id()
+        image_hash = hashlib.md5(f"image-{ad_id}".encode()).hexdigest()
+        width, height = self.image_size
+        self._add("image", {
+            "id": f"{account_number}:{image_hash}",
+            "hash": image_hash,
+            "name": f"image_{label}.png",
+            "width": width,
+            "height": height,
+            "status": "ACTIVE",
+            "account_id": account_number,
+            # Replaced with an absolute URL to this simulator when served
+            "url": f"/images/{image_hash}.png",
+        }, [(account_id, "adimages")])
+        self._add("creative", {
+            "id": creative_id,
+            "account_id": account_number,
+            "name": f"Creative {label}",
+            "status": "ACTIVE",
+            "image_hash": image_hash,
+            "image_url": f"/images/{image_hash}.png",
+            "thumbnail_url": f"/images/{image_hash}.png",
+            "object_story_spec": {
+                "page_id": "200000000000001",
+                "link_data": {
+                    "image_hash": image_hash,
+                    "link": "https://example.com/",
+                    "message": f"Simulated ad {label}",
+                    "name": f"Headline {label}",
+                    "call_to_action": {"type": "LEARN_MORE"},
+                },
+            },
+        }, [(account_id, "adcreatives"), (ad_id, "adcreatives")])
+        self._add("ad", {
+            "id": ad_id,
+            "account_id": account_number,
+            "campaign_id": campaign_id,
+            "adset_id": adset_id,
+            "name": f"Ad {label}",
+            "status": status,
+            "effective_status": status,
+            "creative": {"id": creative_id},
+            "tracking_specs": [{"action.type": ["offsite_conversion"], "fb_pixel": ["300000000000001"]}],
+            "conversion_domain": "example.com",
+            "preview_shareable_link": f"https://fb.me/sim{ad_id}",
+            "created_time": "2024-01-01T00:00:00-0800",
+            "updated_time": "2024-06-01T00:00:00-0700",
+        }, [(account_id, "ads"), (campaign_id, "ads"), (adset_id, "ads")])
+
+    def _build_page(self) -> None:
+        """The Page behind the simulated creatives, with lead forms and leads (fixed IDs, so object IDs do not shift)"""
+        self._add("page", {
+            "id": PAGE_ID,
+            "name": "Simulated Page",
+            "username": "simulatedpage",
+            "category": "Product/service",
+            "fan_count": 12_345,
+            "link": f"https://www.facebook.com/{PAGE_ID}",
+            "verification_status": "not_verified",
+        }, [(self.user_id, "accounts")])
+        for f in range(2):
+            form_id = str(210_000_000_000_001 + f)
+            self._add("leadform", {
+                "id": form_id,
+                "name": f"Lead Form {f + 1}",
+                "status": "ACTIVE",
+                "locale": "en_US",
+                "leads_count": 5,
+                "privacy_policy_url": "https://example.com/privacy",
+                "questions": [{"key": "email", "label": "Email", "type": "EMAIL"},
+                              {"key": "full_name", "label": "Full name", "type": "FULL_NAME"}],
+                "created_time": "2024-01-01T00:00:00-0800",
+            }, [(PAGE_ID, "leadgen_forms")])
+            for n in range(5):
+                self._add("lead", {
+                    "id": f"{form_id}{n:03d}",
+                    "form_id": form_id,
+                    "created_time": "2024-05-01T00:00:00-0700",
+                    "field_data": [{"name": "email", "values": [f"lead{n + 1}@example.com"]},
+                                   {"name": "full_name", "values": [f"Lead {n + 1}"]}],
+                }, [(form_id, "leads")])
+
+    def first(self, object_type: str) -> Optional[str]:
+        """ID of the first object of a type, for building sample requests"""
+        return next((object_id for object_id, t in self.types.items() if t == object_type), None)
+
+    def _first_in(self, object_type: str, account_id: str) -> Optional[str]:
+        account_number = account_id.replace("act_", "")
+        return next((object_id for object_id, t in self.types.items()
+                     if t == object_type and self.objects[object_id].get("account_id") == account_number), None)
+
+    def tool_calls(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Calls exercising every tool that can run against the simulator, by tool name.
+
+        Tools missing here are listed in UNSIMULATED_TOOLS. Writes go to the last
+        account and the second lead form, so creating objects on every iteration
+        does not change what the read calls against the first account return.
+
+        Returns:
+            {tool name: [(label, arguments), ...]}; access_token is left to the caller
+        """
+        account_id = self.first("account")
+        campaign_id = self.first("campaign")
+        adset_id = self.first("adset")
+        ad_id = self.first("ad")
+        form_id, write_form_id = [object_id for object_id, t in self.types.items() if t == "leadform"][:2]
+        write_account = [object_id for object_id, t in self.types.items() if t == "account"][-1]
+        write_campaign = self._first_in("campaign", write_account)
+        write_adset = self._first_in("adset", write_account)
+        write_ad = self._first_in("ad", write_account)
+        write_creative = self._first_in("creative", write_account)
+        targeting = {"geo_locations": {"countries": ["US"]}, "age_min": 25, "age_max": 54}
+        reads = {label: (tool, arguments) for label, tool, arguments in self.sample_tool_calls()}
+        calls: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        for label, (tool, arguments) in reads.items():
+            calls.setdefault(tool, []).append((label, arguments))
+        calls.update({
+            "get_rate_limit_status": [("get_rate_limit_status", {"account_id": account_id})],
+            "get_api_cache_stats": [("get_api_cache_stats", {})],
+            "get_campaign_objectives": [("get_campaign_objectives", {})],
+            "get_optimization_goals_and_billing_events": [("get_optimization_goals_and_billing_events", {})],
+            "get_lead_form_question_types": [("get_lead_form_question_types", {})],
+            "create_lead_form_question": [("create_lead_form_question", {"question_type": "EMAIL"})],
+            "create_targeting_spec": [("create_targeting_spec", {"age_min": 25, "age_max": 54, "geo_locations": {"countries": ["US"]}})],
+            "save_ad_image_locally": [("save_ad_image_locally", {
+                "ad_id": ad_id, "output_dir": os.path.join(tempfile.gettempdir(), "meta-ads-simulator-images")})],
+            "get_account_pages": [("get_account_pages", {"account_id": account_id}),
+                                  ("get_account_pages[me]", {"account_id": "me"})],
+            "search_ads_archive": [("search_ads_archive", {"search_terms": "shoes", "ad_reached_countries": ["US"]})],
+            "list_account_videos": [("list_account_videos", {"account_id": account_id})],
+            "get_lead_forms": [("get_lead_forms", {"page_id": PAGE_ID})],
+            "get_lead_form_details": [("get_lead_form_details", {"form_id": form_id})],
+            "get_lead_form_submissions": [("get_lead_form_submissions", {"form_id": form_id})],
+            "search_interests": [("search_interests", {"search_term": "running"})],
+            "search_behaviors": [("search_behaviors", {"search_term": "travel"})],
+            "search_demographics": [("search_demographics", {"search_term": "parents"})],
+            "search_postal_codes": [("search_postal_codes", {"search_term": "941", "country_code": "US"})],
+            "search_cities": [("search_cities", {"search_term": "San", "country_code": "US"})],
+            "get_country_list": [("get_country_list", {})],
+            "get_language_list": [("get_language_list", {})],
+            "get_targeting_browse_categories": [("get_targeting_browse_categories", {})],
+            "get_audience_size_estimate": [("get_audience_size_estimate", {"account_id": account_id, "targeting": targeting})],
+            "get_targeting_suggestions": [("get_targeting_suggestions", {"account_id": account_id, "targeting": targeting})],
+            "validate_targeting_spec": [("validate_targeting_spec", {"account_id": account_id, "targeting": targeting})],
+            # Writes
+            "create_campaign": [("create_campaign", {
+                "account_id": write_account, "name": "Benchmark Campaign", "objective": "OUTCOME_TRAFFIC",
+                "special_ad_categories": [], "daily_budget": 1000})],
+            "update_campaign": [("update_campaign", {"campaign_id": write_campaign, "name": "Benchmark Campaign"})],
+            "create_advantage_plus_shopping_campaign": [("create_advantage_plus_shopping_campaign", {
+                "account_id": write_account, "name": "Benchmark Shopping Campaign", "daily_budget": 1000})],
+            "create_adset": [("create_adset", {
+                "account_id": write_account, "campaign_id": write_campaign, "name": "Benchmark Ad Set",
+                "optimization_goal": "LINK_CLICKS", "billing_event": "IMPRESSIONS", "daily_budget": 500,
+                "targeting": targeting})],
+            "update_adset": [("update_adset", {"adset_id": write_adset, "bid_amount": 150})],
+            "create_advantage_plus_adset": [("create_advantage_plus_adset", {
+                "account_id": write_account, "campaign_id": write_campaign, "name": "Benchmark Advantage+ Ad Set",
+                "optimization_goal": "OFFSITE_CONVERSIONS", "daily_budget": 500})],
+            "create_ad": [("create_ad", {
+                "account_id": write_account, "adset_id": write_adset, "creative_id": write_creative, "name": "Benchmark Ad"})],
+            "update_ad": [("update_ad", {"ad_id": write_ad, "bid_amount": 150})],
+            "create_ad_creative": [("create_ad_creative", {
+                "account_id": write_account, "name": "Benchmark Creative", "page_id": PAGE_ID,
+                "image_hash": self.objects[write_creative]["image_hash"], "link_url": "https://example.com/",
+                "message": "Benchmark creative"})],
+            "create_budget_schedule": [("create_budget_schedule", {
+                "campaign_id": write_campaign, "budget_value": 200, "budget_value_type": "ABSOLUTE",
+                "time_start": 1_900_000_000, "time_end": 1_900_086_400})],
+            "create_lead_form": [("create_lead_form", {
+                "page_id": PAGE_ID, "name": "Benchmark Lead Form", "privacy_policy_url": "https://example.com/privacy",
+                "questions": [{"type": "EMAIL"}]})],
+            "update_lead_form": [("update_lead_form", {"form_id": write_form_id, "name": "Benchmark Lead Form"})],
+            "delete_lead_form": [("delete_lead_form", {"form_id": write_form_id})],
+        })
+        return calls
+
+    def manifest_cases(self, tool_names: List[str]) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Cases covering the given registered tools, in order.
+
+        Raises:
+            ValueError: if a tool has neither a fixture in tool_calls() nor an entry in UNSIMULATED_TOOLS
+        """
+        calls = self.tool_calls()
+        missing = [name for name in tool_names if name not in calls and name not in UNSIMULATED_TOOLS]
+        if missing:
+            raise ValueError(f"No simulator fixture for tool(s) {', '.join(missing)}; add one to "
+                             "GraphSimulator.tool_calls() or list them in UNSIMULATED_TOOLS")
+        return [(label, name, arguments) for name in tool_names for label, arguments in calls.get(name, [])]
+
+    def sample_tool_calls(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        A representative set of read-only tool calls against the synthetic data.
+
+        Returns:
+            (label, tool name, arguments) tuples; access_token is left to the caller
+        """
+        account_id = self.first("account")
+        campaign_id = self.first("campaign")
+        adset_id = self.first("adset")
+        ad_id = self.first("ad")
+        return [
+            ("get_ad_accounts", "get_ad_accounts", {}),
+            ("get_account_info", "get_account_info", {"account_id": account_id}),
+            ("get_campaigns", "get_campaigns", {"account_id": account_id, "limit": 25}),
+            ("get_campaigns[fetch_all]", "get_campaigns", {"account_id": account_id, "limit": 100, "fetch_all": True}),
+            ("get_campaign_details", "get_campaign_details", {"campaign_id": campaign_id}),
+            ("get_adsets", "get_adsets", {"account_id": account_id, "limit": 25}),
+            ("get_adset_details", "get_adset_details", {"adset_id": adset_id}),
+            ("get_ads", "get_ads", {"account_id": account_id, "limit": 25}),
+            ("get_ad_details", "get_ad_details", {"ad_id": ad_id}),
+            ("get_ad_creatives", "get_ad_creatives", {"ad_id": ad_id}),
+            ("get_ad_image", "get_ad_image", {"ad_id": ad_id}),
+            ("get_insights", "get_insights", {"object_id": account_id, "time_range": "last_30d", "level": "campaign"}),
+            ("get_insights[breakdown]", "get_insights",
+             {"object_id": campaign_id, "time_range": "last_7d", "level": "ad", "breakdown": "age"}),
+            ("batch_api_request", "batch_api_request", {"requests": [
+                {"relative_url": f"{campaign_id}?fields=id,name,status"},
+                {"relative_url": f"{adset_id}?fields=id,name,status"},
+                {"relative_url": f"{ad_id}?fields=id,name,status"},
+            ]}),
+        ]
+
+    # Usage headers and fault injection
+
+    def _record_call(self, account_id: Optional[str], now: float) -> Tuple[float, Optional[float]]:
+        """Count a call and return app and account utilization in percent"""
+        with self._lock:
+            self.request_count += 1
+            cutoff = now - USAGE_WINDOW
+            self._app_calls.append(now)
+            while self._app_calls and self._app_calls[0] < cutoff:
+                self._app_calls.popleft()
+            app_pct = min(100.0, len(self._app_calls) * 100.0 / self.app_call_limit)
+            if not account_id:
+                return app_pct, None
+            calls = self._account_calls.setdefault(account_id, deque())
+            calls.append(now)
+            while calls and calls[0] < cutoff:
+                calls.popleft()
+            return app_pct, min(100.0, len(calls) * 100.0 / self.account_call_limit)
+
+    def usage_headers(self, account_id: Optional[str], app_pct: float, account_pct: Optional[float]) -> Dict[str, str]:
+        headers = {"x-app-usage": json.dumps({
+            "call_count": round(app_pct), "total_time": round(app_pct / 2), "total_cputime": round(app_pct / 2)
+        })}
+        if account_id and account_pct is not None:
+            regain = 0 if account_pct < 100 else 5
+            headers["x-ad-account-usage"] = json.dumps({
+                "acc_id_util_pct": round(account_pct, 2), "reset_time_duration": regain * 60, "ads_api_access_tier": "standard_access"
+            })
+            headers["x-business-use-case-usage"] = json.dumps({
+                account_id.replace("act_", ""): [{
+                    "type": "ads_management", "call_count": round(account_pct), "total_cputime": round(account_pct / 2),
+                    "total_time": round(account_pct / 2), "estimated_time_to_regain_access": regain,
+                }]
+            })
+        return headers
+
+    def _injected_fault(self, account_pct: Optional[float]) -> Optional[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.error_rate:
+            return 500, _graph_error("An unexpected error has occurred. Please retry your request later.",
+                                     2, is_transient=True)
+        if roll < self.error_rate + self.throttle_rate:
+            return 400, _graph_error("User request limit reached", 17, is_transient=True, error_subcode=2446079)
+        if account_pct is not None and account_pct >= 100:
+            return 400, _graph_error("There have been too many calls to this ad-account. Wait a bit and try again.",
+                                     80004, error_subcode=2446079)
+        return None
+
+    async def _delay(self) -> None:
+        delay = self.latency
+        if self.latency_jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def configure(self, **options) -> Dict[str, Any]:
+        """Change latency and fault injection at runtime; returns the current settings"""
+        for name, value in options.items():
+            if name not in self.config():
+                raise ValueError(f"Unknown simulator option: {name}")
+            setattr(self, name, type(getattr(self, name))(value))
+        return self.config()
+
+    def config(self) -> Dict[str, Any]:
+        return {
+            "latency": self.latency,
+            "latency_jitter": self.latency_jitter,
+            "error_rate": self.error_rate,
+            "throttle_rate": self.throttle_rate,
+            "app_call_limit": self.app_call_limit,
+            "account_call_limit": self.account_call_limit,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for object_type in self.types.values():
+            counts[object_type] = counts.get(object_type, 0) + 1
+        return {
+            "requests": self.request_count,
+            "responses_by_status": dict(self.status_counts),
+            "objects": counts,
+            "config": self.config(),
+        }
+
+    # Request dispatch
+
+    async def handle(self, method: str, path: str, params: Dict[str, Any], base_url: str) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Serve one Graph API request.
+
+        Args:
+            method: HTTP method
+            path: Path after the version prefix, e.g. "act_1/campaigns" ("" for the root)
+            params: Query and form parameters
+            base_url: Public URL of this simulator, used for paging.next and image URLs
+
+        Returns:
+            (status code, JSON body, response headers)
+        """
+        await self._delay()
+        path = _VERSION_PREFIX.sub("", path.strip("/"))
+        account_id = next((part for part in path.split("/") if part.startswith("act_")), None)
+        if account_id is None and path.split("/")[0] in self.objects:
+            owner = self.objects[path.split("/")[0]].get("account_id")
+            account_id = f"act_{owner}" if owner else None
+        app_pct, account_pct = self._record_call(account_id, time.time())
+        headers = self.usage_headers(account_id, app_pct, account_pct)
+
+        status, body = self._check_token(params.get("access_token"))
+        if status == 200:
+            fault = self._injected_fault(account_pct)
+            if fault:
+                status, body = fault
+            elif method == "POST" and path == "" and "batch" in params:
+                status, body = 200, await self._batch(params, base_url)
+            else:
+                status, body = self.dispatch(method, path, params, base_url)
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        return status, body, headers
+
+    def _check_token(self, token: Optional[str]) -> Tuple[int, Any]:
+        if not token:
+            return 400, _graph_error("An active access token must be used to query information about the current user.", 2500)
+        if token.startswith("expired"):
+            return 400, _graph_error("Error validating access token: Session has expired.", 190, error_subcode=463)
+        return 200, None
+
+    def dispatch(self, method: str, path: str, params: Dict[str, Any], base_url: str) -> Tuple[int, Any]:
+        """Route a request (without latency, usage accounting or fault injection)"""
+        parts = [part for part in path.split("/") if part]
+        if parts and parts[0] == "me":
+            parts[0] = self.user_id
+        fields = parse_fields(params["fields"]) if params.get("fields") else None
+
+        if not parts:
+            if method == "GET" and params.get("ids"):
+                return self._get_by_ids(params["ids"].split(","), fields, base_url)
+            return 400, _graph_error("Unsupported request to the root endpoint", 100)
+
+        if parts[0] in ("search", "targetingbrowse"):
+            return 200, self._search(params)
+        if parts[0] == "ads_archive":
+            return 200, self._paginate(self._search(dict(params, q=params.get("search_terms"), limit=50))["data"],
+                                       params, base_url, path)
+
+        object_id = parts[0]
+        if object_id not in self.objects:
+            return 400, _graph_error(
+                f"Unsupported {method.lower()} request. Object with ID '{object_id}' does not exist, "
+                "cannot be loaded due to missing permissions, or does not support this operation.",
+                100, "GraphMethodException", error_subcode=33)
+
+        if len(parts) == 1:
+            if method == "GET":
+                return 200, self._render(self.objects[object_id], fields, base_url)
+            if method == "POST":
+                self.objects[object_id].update({k: _decode_param(v) for k, v in params.items() if k != "access_token"})
+                return 200, {"success": True}
+            if method == "DELETE":
+                self.objects[object_id]["status"] = "DELETED"
+                self.objects[object_id]["effective_status"] = "DELETED"
+                return 200, {"success": True}
+            return 400, _graph_error(f"Unsupported method {method}", 100)
+
+        edge = parts[1]
+        if edge == "insights":
+            return 200, self._insights(object_id, params, base_url, path)
+        if method == "POST":
+            return 200, self._create(object_id, edge, params)
+        if method != "GET":
+            return 400, _graph_error(f"Unsupported {method.lower()} request on edge {edge}", 100)
+        return 200, self._list_edge(object_id, edge, params, fields, base_url, path)
+
+    def _render(self, obj: Dict[str, Any], fields, base_url: str) -> Dict[str, Any]:
+        rendered = select_fields(obj, fields)
+        for key in ("url", "image_url", "thumbnail_url"):
+            if isinstance(rendered.get(key), str) and rendered[key].startswith("/images/"):
+                rendered[key] = base_url.rstrip("/") + rendered[key]
+        return rendered
+
+    def _get_by_ids(self, ids: List[str], fields, base_url: str) -> Tuple[int, Any]:
+        missing = [object_id for object_id in ids if object_id not in self.objects]
+        if missing:
+            return 400, _graph_error(f"(#100) Some of the aliases you requested do not exist: {','.join(missing)}", 100)
+        return 200, {object_id: self._render(self.objects[object_id], fields, base_url) for object_id in ids}
+
+    def _list_edge(self, object_id: str, edge: str, params: Dict[str, Any], fields, base_url: str, path: str) -> Dict[str, Any]:
+        items = [self.objects[child] for child in self.edges.get((object_id, edge), [])]
+
+        statuses = _decode_param(params.get("effective_status", ""))
+        if isinstance(statuses, list) and statuses:
+            items = [item for item in items if item.get("effective_status") in statuses]
+        if edge == "ads" and params.get("adset_id"):
+            items = [item for item in items if item.get("adset_id") == params["adset_id"]]
+        hashes = _decode_param(params.get("hashes", ""))
+        if edge == "adimages" and isinstance(hashes, list):
+            items = [item for item in items if item.get("hash") in hashes]
+
+        return self._paginate([self._render(item, fields, base_url) for item in items], params, base_url, path)
+
+    def _paginate(self, items: List[Dict[str, Any]], params: Dict[str, Any], base_url: str, path: str) -> Dict[str, Any]:
+        try:
+            limit = max(1, min(int(params.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE))
+        except (TypeError, ValueError):
+            limit = DEFAULT_PAGE_SIZE
+        offset = _decode_cursor(params["after"]) if params.get("after") else 0
+        page = items[offset:offset + limit]
+        response: Dict[str, Any] = {"data": page}
+        if page:
+            response["paging"] = {"cursors": {"before": _encode_cursor(offset), "after": _encode_cursor(offset + len(page))}}
+            if offset + limit < len(items):
+                next_params = {k: v for k, v in params.items() if k != "after"}
+                next_params["after"] = response["paging"]["cursors"]["after"]
+                response["paging"]["next"] = f"{base_url.rstrip('/')}/{GRAPH_API_VERSION}/{path}?{urlencode(next_params)}"
+        return response
+
+    def _create(self, parent_id: str, edge: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        object_type = EDGES.get(self.types[parent_id], {}).get(edge)
+        if object_type is None:
+            # Edges this simulator does not model still acknowledge writes
+            return {"id": self._new_id(), "success": True}
+        obj = {k: _decode_param(v) for k, v in params.items() if k != "access_token"}
+        obj["id"] = self._new_id()
+        obj.setdefault("account_id", self.objects[parent_id].get("account_id"))
+        obj.setdefault("effective_status", obj.get("status", "PAUSED"))
+        parents = [(parent_id, edge)]
+        for key in ("campaign_id", "adset_id"):
+            if obj.get(key) in self.objects:
+                parents.append((obj[key], edge))
+        self._add(object_type, obj, parents)
+        return {"id": obj["id"]}
+
+    def _insights(self, object_id: str, params: Dict[str, Any], base_url: str, path: str) -> Dict[str, Any]:
+        object_type = self.types[object_id]
+        level = params.get("level") or object_type
+        if level not in LEVELS or object_type not in LEVELS or LEVELS.index(level) < LEVELS.index(object_type):
+            level = object_type
+        subjects = [self.objects[object_id]]
+        # Walk down the hierarchy to the requested level
+        for current, child_edge in (("account", "campaigns"), ("campaign", "adsets"), ("adset", "ads")):
+            if LEVELS.index(level) > LEVELS.index(current) and subjects and self.types[subjects[0]["id"]] == current:
+                subjects = [self.objects[child] for s in subjects for child in self.edges.get((s["id"], child_edge), [])]
+
+        period = params.get("time_range") or params.get("date_preset") or "maximum"
+        breakdowns = [b for b in (params.get("breakdowns") or "").split(",") if b]
+        rows = []
+        for subject in subjects:
+            combinations: List[Dict[str, str]] = [{}]
+            for breakdown in breakdowns:
+                values = BREAKDOWN_VALUES.get(breakdown, ["unknown"])
+                combinations = [dict(c, **{breakdown: v}) for c in combinations for v in values]
+            for combination in combinations:
+                rows.append(self._insights_row(subject, level, period, combination))
+        return self._paginate(rows, params, base_url, path)
+
+    def _insights_row(self, subject: Dict[str, Any], level: str, period: str, breakdown: Dict[str, str]) -> Dict[str, Any]:
+        rng = random.Random(zlib.crc32(f"{subject['id']}|{period}|{sorted(breakdown.items())}".encode()))
+        impressions = rng.randint(1_000, 500_000)
+        clicks = int(impressions * rng.uniform(0.005, 0.03))
+        reach = int(impressions / rng.uniform(1.1, 2.5))
+        spend = round(impressions * rng.uniform(2, 12) / 1000, 2)
+        conversions = int(clicks * rng.uniform(0.01, 0.1))
+        account = self.objects.get(f"act_{subject.get('account_id')}", subject)
+        row = {
+            "account_id": account.get("account_id"),
+            "account_name": account.get("name"),
+            "impressions": str(impressions),
+            "clicks": str(clicks),
+            "unique_clicks": str(int(clicks * 0.9)),
+            "spend": f"{spend:.2f}",
+            "reach": str(reach),
+            "frequency": f"{impressions / max(reach, 1):.6f}",
+            "cpc": f"{spend / max(clicks, 1):.6f}",
+            "cpm": f"{spend * 1000 / impressions:.6f}",
+            "ctr": f"{clicks * 100 / impressions:.6f}",
+            "actions": [
+                {"action_type": "link_click", "value": str(clicks)},
+                {"action_type": "offsite_conversion.fb_pixel_purchase", "value": str(conversions)},
+            ],
+            "cost_per_action_type": [{"action_type": "link_click", "value": f"{spend / max(clicks, 1):.6f}"}],
+            "date_start": "2024-05-01",
+            "date_stop": "2024-05-30",
+        }
+        for key in ("campaign", "adset", "ad"):
+            if LEVELS.index(level) >= LEVELS.index(key):
+                object_id = subject["id"] if level == key else subject.get(f"{key}_id")
+                if object_id in self.objects:
+                    row[f"{key}_id"] = object_id
+                    row[f"{key}_name"] = self.objects[object_id].get("name")
+        row.update(breakdown)
+        return row
+
+    def _search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        query = params.get("q") or params.get("type") or "result"
+        search_type = params.get("type", "adinterest")
+        try:
+            limit = int(params.get("limit", 10))
+        except ValueError:
+            limit = 10
+        rng = random.Random(zlib.crc32(f"{search_type}|{query}".encode()))
+        return {"data": [
+            {
+                "id": str(6_000_000_000_000 + rng.randint(0, 10**9)),
+                "name": f"{query} {i + 1}".strip(),
+                "type": search_type,
+                "audience_size_lower_bound": rng.randint(10_000, 1_000_000),
+                "audience_size_upper_bound": rng.randint(1_000_000, 10_000_000),
+                "path": ["Interests", f"{query}"],
+            }
+            for i in range(max(0, min(limit, 50)))
+        ]}
+
+    async def _batch(self, params: Dict[str, Any], base_url: str) -> List[Optional[Dict[str, Any]]]:
+        try:
+            sub_requests = json.loads(params["batch"])
+        except (TypeError, json.JSONDecodeError):
+            return [{"code": 400, "body": json.dumps(_graph_error("Invalid batch parameter", 100))}]
+        include_headers = str(params.get("include_headers", "true")).lower() != "false"
+        named_results: Dict[str, Any] = {}
+        failed: set = set()
+        responses: List[Optional[Dict[str, Any]]] = []
+
+        for sub_request in sub_requests:
+            relative_url = sub_request.get("relative_url", "")
+            body = sub_request.get("body", "")
+            references = _RESULT_REFERENCE.findall(f"{relative_url} {body}")
+            dependencies = {name for name, _ in references}
+            if sub_request.get("depends_on"):
+                dependencies.add(sub_request["depends_on"])
+            if dependencies & failed or not dependencies <= set(named_results):
+                responses.append(None)
+                if sub_request.get("name"):
+                    failed.add(sub_request["name"])
+                continue
+
+            def substitute(match):
+                return resolve_json_path(named_results[match.group(1)], match.group(2)) or ""
+
+            relative_url = _RESULT_REFERENCE.sub(substitute, relative_url)
+            body = _RESULT_REFERENCE.sub(substitute, body)
+            split = urlsplit(relative_url)
+            sub_params = dict(parse_qsl(split.query))
+            sub_params.update(parse_qsl(body))
+            sub_params["access_token"] = params.get("access_token")
+
+            status, result = self.dispatch(sub_request.get("method", "GET").upper(), split.path.strip("/"),
+                                           sub_params, base_url)
+            name = sub_request.get("name")
+            if name:
+                if status == 200:
+                    named_results[name] = result
+                else:
+                    failed.add(name)
+            item: Dict[str, Any] = {"code": status, "body": json.dumps(result)}
+            if include_headers:
+                item["headers"] = [{"name": "Content-Type", "value": "text/javascript; charset=UTF-8"}]
+            responses.append(item)
+        return responses
+
+    def image_bytes(self, image_hash: str) -> Optional[bytes]:
+        """PNG for an image hash, generated on first request"""
+        if image_hash not in self._images:
+            if not any(obj.get("hash") == image_hash for obj in self.objects.values() if "hash" in obj):
+                return None
+            from PIL import Image as PILImage
+
+            color = tuple(bytes.fromhex(image_hash[:6]))
+            buffer = io.BytesIO()
+            PILImage.new("RGB", self.image_size, color).save(buffer, format="PNG")
+            self._images[image_hash] = buffer.getvalue()
+        return self._images[image_hash]
+
+    # HTTP app
+
+    def create_app(self):
+        """Build the Starlette app serving this simulator"""
+        from starlette.applications import Starlette
+        from starlette.requests import Request
+        from starlette.responses import JSONResponse, Response
+        from starlette.routing import Route
+
+        async def graph_endpoint(request: Request) -> Response:
+            params = dict(request.query_params)
+            if request.method == "POST":
+                params.update(dict(await request.form()))
+            status, body, headers = await self.handle(request.method, request.path_params["path"], params,
+                                                      str(request.base_url))
+            return JSONResponse(body, status_code=status, headers=headers)
+
+        async def image_endpoint(request: Request) -> Response:
+            data = self.image_bytes(request.path_params["image_hash"])
+            if data is None:
+                return Response(status_code=404)
+            return Response(data, media_type="image/png")
+
+        async def stats_endpoint(request: Request) -> Response:
+            return JSONResponse(self.stats())
+
+        async def config_endpoint(request: Request) -> Response:
+            if request.method == "POST":
+                try:
+                    self.configure(**await request.json())
+                except (ValueError, TypeError) as e:
+                    return JSONResponse({"error": str(e)}, status_code=400)
+            return JSONResponse(self.config())
+
+        return Starlette(routes=[
+            Route("/_simulator/stats", stats_endpoint, methods=["GET"]),
+            Route("/_simulator/config", config_endpoint, methods=["GET", "POST"]),
+            Route("/images/{image_hash}.png", image_endpoint, methods=["GET"]),
+            Route("/{path:path}", graph_endpoint, methods=["GET", "POST", "DELETE"]),
+        ])
+
+
+class BackgroundSimulator:
+    """Runs a simulator with uvicorn on a background thread (for benchmarks and load tests)"""
+
+    def __init__(self, simulator: GraphSimulator, host: str = "127.0.0.1", port: int = 0):
+        import uvicorn
+
+        self.simulator = simulator
+        self.host = host
+        self._server = uvicorn.Server(uvicorn.Config(simulator.create_app(), host=host, port=port,
+                                                     log_level="warning", access_log=False))
+        self._thread = threading.Thread(target=self._server.run, name="graph-simulator", daemon=True)
+        self.port = port
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def api_base(self) -> str:
+        """Value for META_ADS_GRAPH_API_BASE"""
+        return f"{self.url}/{GRAPH_API_VERSION}"
+
+    def start(self, timeout: float = 10.0) -> "BackgroundSimulator":
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Graph simulator failed to start")
+            time.sleep(0.01)
+        self.port = self._server.servers[0].sockets[0].getsockname()[1]
+        return self
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+    def __enter__(self) -> "BackgroundSimulator":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def add_simulator_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options shared by every command that starts a simulator"""
+    parser.add_argument("--accounts", type=int, default=2, help="Number of ad accounts")
+    parser.add_argument("--campaigns", type=int, default=10, help="Campaigns per account")
+    parser.add_argument("--adsets", type=int, default=2, help="Ad sets per campaign")
+    parser.add_argument("--ads", type=int, default=2, help="Ads per ad set")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Maximum random extra latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with a transient 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests failing with rate limit code 17")
+    parser.add_argument("--account-call-limit", type=int, default=100_000,
+                        help="Calls per account per hour before the account is throttled")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for fault injection and jitter")
+
+
+def simulator_from_args(args: argparse.Namespace) -> GraphSimulator:
+    return GraphSimulator(
+        accounts=args.accounts,
+        campaigns_per_account=args.campaigns,
+        adsets_per_campaign=args.adsets,
+        ads_per_adset=args.ads,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        account_call_limit=args.account_call_limit,
+        seed=args.seed,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Offline Graph API simulator for Meta Ads MCP benchmarks")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    add_simulator_arguments(parser)
+    args = parser.parse_args(argv)
+
+    simulator = simulator_from_args(args)
+    counts = simulator.stats()["objects"]
+    print(f"Graph simulator with {counts.get('account', 0)} accounts, {counts.get('campaign', 0)} campaigns, "
+          f"{counts.get('adset', 0)} ad sets and {counts.get('ad', 0)} ads")
+    print(f"Set META_ADS_GRAPH_API_BASE=http://{args.host}:{args.port}/{GRAPH_API_VERSION}")
+    uvicorn.run(simulator.create_app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
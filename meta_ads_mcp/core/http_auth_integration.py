@@ -9,6 +9,7 @@ import asyncio
 import contextvars
 from typing import Optional
 from .utils import logger
+from .metrics import METRICS_PATH
 import json
 
 # Use context variables instead of thread-local storage for better async support
@@ -200,6 +201,10 @@ import json # Ensure json is imported if not already at the top
 
 class AuthInjectionMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
+        # Metrics scrapes carry no Meta credentials; their bearer token is checked by the endpoint
+        if request.url.path == METRICS_PATH:
+            return await call_next(request)
+        
         logger.debug(f"HTTP Auth Middleware: Processing request to {request.url.path}")
         logger.debug(f"HTTP Auth Middleware: Request headers: {list(request.headers.keys())}")
         
@@ -0,0 +1,210 @@
+"""Shared, pooled HTTP client for outbound requests made by Meta Ads MCP."""
+
+import asyncio
+import contextvars
+import os
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Optional
+
+import httpx
+
+from .token_refresher import token_refresher
+from .utils import logger
+
+
+# Connection pool configuration (overridable through environment variables)
+HTTP_MAX_CONNECTIONS = int(os.environ.get("META_ADS_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("META_ADS_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("META_ADS_HTTP_KEEPALIVE_EXPIRY", "30.0"))
+HTTP_TIMEOUT = float(os.environ.get("META_ADS_HTTP_TIMEOUT", "30.0"))
+HTTP2_ENABLED = os.environ.get("META_ADS_HTTP2", "").lower() in ("1", "true", "yes", "on")
+
+# Client used instead of the shared one inside private_http_client()
+_private_client: contextvars.ContextVar[Optional[httpx.AsyncClient]] = contextvars.ContextVar("private_http_client", default=None)
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HTTPClientManager:
+    """Owns process-wide httpx.AsyncClients with keep-alive connection pooling.
+
+    A client is created lazily for each event loop that asks for one, since
+    pooled connections cannot move between loops. Clients are kept per loop, so
+    a request from another loop (for example ``asyncio.run`` in the CLI login
+    flow) never replaces the server loop's pool. Code that runs on throwaway
+    loops should use run_with_private_client() so its client is closed with it.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+        timeout: float = HTTP_TIMEOUT,
+        http2: bool = HTTP2_ENABLED,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.http2 = http2
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        # Client handed out outside of any running event loop
+        self._unbound: Optional[httpx.AsyncClient] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a new pooled client using the configured limits"""
+        http2 = self.http2
+        if http2 and not _http2_available():
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1")
+            http2 = False
+
+        logger.info(
+            f"Creating shared HTTP client (max_connections={self.limits.max_connections}, "
+            f"max_keepalive={self.limits.max_keepalive_connections}, http2={http2})"
+        )
+        return httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=http2)
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the shared client for the running event loop, creating it if needed"""
+        private = _private_client.get()
+        if private is not None:
+            return private
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None:
+            if self._unbound is None or self._unbound.is_closed:
+                self._unbound = self._create_client()
+            return self._unbound
+
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            self._forget_closed_loops()
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
+
+    def _forget_closed_loops(self) -> None:
+        """Drop clients of loops that were closed without calling aclose()"""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            logger.debug("Dropping HTTP client of a closed event loop")
+            del self._clients[loop]
+
+    async def startup(self) -> None:
+        """Warm up the shared client when the server starts"""
+        self.get_client()
+
+    async def aclose(self) -> None:
+        """Close the running loop's client and release its pooled connections"""
+        clients = [self._clients.pop(asyncio.get_running_loop(), None), self._unbound]
+        self._unbound = None
+        for client in clients:
+            if client is not None and not client.is_closed:
+                logger.info("Closing shared HTTP client")
+                await client.aclose()
+
+
+# Global instance for easy access
+http_client_manager = HTTPClientManager()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled HTTP client"""
+    return http_client_manager.get_client()
+
+
+@asynccontextmanager
+async def private_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Route get_http_client() in this context to a short-lived client closed on exit"""
+    client = http_client_manager._create_client()
+    token = _private_client.set(client)
+    try:
+        yield client
+    finally:
+        _private_client.reset(token)
+        await client.aclose()
+
+
+def run_with_private_client(coro: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine on a new event loop with its own short-lived HTTP client.
+
+    For threads outside the server's event loop (e.g. the OAuth callback
+    server), so their requests neither replace nor leak the shared pool.
+    """
+    async def runner():
+        async with private_http_client():
+            return await coro
+
+    return asyncio.run(runner())
+
+
+async def _shutdown() -> None:
+    """Stop background work started while serving, then close the shared client"""
+    await token_refresher.stop()
+    await http_client_manager.aclose()
+
+
+def bind_to_server_lifecycle(mcp_server) -> None:
+    """Tie the shared client and the token refresher to the FastMCP server's startup and shutdown.
+
+    The transport coroutines run for the whole lifetime of the server inside its
+    event loop, so wrapping them gives us reliable startup/shutdown hooks for both
+    stdio and streamable HTTP.
+
+    Args:
+        mcp_server: FastMCP server instance to patch
+    """
+    for method_name in ("run_stdio_async", "run_streamable_http_async", "run_sse_async"):
+        original = getattr(mcp_server, method_name, None)
+        if original is None:
+            continue
+
+        async def run_with_http_client(*args, _original=original, **kwargs):
+            await http_client_manager.startup()
+            try:
+                return await _original(*args, **kwargs)
+            finally:
+                await _shutdown()
+
+        setattr(mcp_server, method_name, run_with_http_client)
+    logger.debug("Shared HTTP client bound to server lifecycle")
+
+
+def bind_to_app_lifespan(app) -> None:
+    """Tie the shared client to a Starlette app's lifespan.
+
+    Used when the app is served by an external ASGI server (multi-worker mode),
+    where FastMCP's run coroutines patched by bind_to_server_lifecycle never run.
+
+    Args:
+        app: Starlette app instance
+    """
+    from contextlib import asynccontextmanager
+
+    original = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan_with_http_client(app_):
+        await http_client_manager.startup()
+        try:
+            async with original(app_) as state:
+                yield state
+        finally:
+            await _shutdown()
+
+    app.router.lifespan_context = lifespan_with_http_client
@@ -0,0 +1,166 @@
+"""Off-loop image processing for ad creatives returned to the LLM."""
+
+import asyncio
+import io
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from .singleflight import SingleFlight
+from .utils import logger
+
+
+# Image processing configuration (overridable through environment variables)
+IMAGE_WORKERS = int(os.environ.get("META_ADS_IMAGE_WORKERS", str(min(4, os.cpu_count() or 1))))
+IMAGE_EXECUTOR = os.environ.get("META_ADS_IMAGE_EXECUTOR", "thread").lower()  # "thread" or "process"
+IMAGE_MAX_DIMENSION = int(os.environ.get("META_ADS_IMAGE_MAX_DIMENSION", "1568"))  # pixels, 0 keeps the original size
+IMAGE_JPEG_QUALITY = int(os.environ.get("META_ADS_IMAGE_QUALITY", "85"))
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get("META_ADS_IMAGE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+
+def process_image(image_bytes: bytes, max_dimension: int = IMAGE_MAX_DIMENSION,
+                  quality: int = IMAGE_JPEG_QUALITY) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Decode an image, convert it to RGB, downscale it and re-encode it as JPEG.
+
+    Runs in a worker thread or process, so it must stay a picklable module-level
+    function with no event loop access.
+
+    Args:
+        image_bytes: Encoded source image
+        max_dimension: Longest side of the output in pixels (0 keeps the original size)
+        quality: JPEG quality (1-95)
+
+    Returns:
+        (JPEG bytes, info with the source and output dimensions)
+    """
+    from PIL import Image as PILImage
+
+    img = PILImage.open(io.BytesIO(image_bytes))
+    info = {"width": img.width, "height": img.height, "format": img.format}
+
+    if max_dimension and max(img.size) > max_dimension:
+        # Let the JPEG decoder skip detail we are about to throw away
+        img.draft("RGB", (max_dimension, max_dimension))
+        img.thumbnail((max_dimension, max_dimension), PILImage.LANCZOS)
+
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    byte_arr = io.BytesIO()
+    img.save(byte_arr, format="JPEG", quality=quality)
+    info["output_width"], info["output_height"] = img.size
+    return byte_arr.getvalue(), info
+
+
+class ImageProcessor:
+    """Runs process_image on a bounded pool and reuses results per image hash"""
+
+    def __init__(
+        self,
+        workers: int = IMAGE_WORKERS,
+        executor_type: str = IMAGE_EXECUTOR,
+        max_dimension: int = IMAGE_MAX_DIMENSION,
+        quality: int = IMAGE_JPEG_QUALITY,
+        cache_max_bytes: int = IMAGE_CACHE_MAX_BYTES,
+    ):
+        self.workers = max(1, workers)
+        self.executor_type = executor_type
+        self.max_dimension = max_dimension
+        self.quality = quality
+        self.cache_max_bytes = cache_max_bytes
+        self.entries: "OrderedDict[Tuple[str, int, int], Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
+        self.total_bytes = 0
+        self._executor: Optional[Executor] = None
+        self._flights = SingleFlight(enabled=True)
+        self.processed = 0
+        self.hits = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="meta-ads-image")
+            logger.debug("Started %s image pool with %d workers", self.executor_type, self.workers)
+        return self._executor
+
+    def _key(self, image_hash: str) -> Tuple[str, int, int]:
+        return (image_hash, self.max_dimension, self.quality)
+
+    def lookup(self, image_hash: Optional[str]) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """Get an already processed image, refreshing its LRU position"""
+        if not image_hash:
+            return None
+        key = self._key(image_hash)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return entry
+
+    def _store(self, key: Tuple[str, int, int], entry: Tuple[bytes, Dict[str, Any]]) -> None:
+        size = len(entry[0])
+        if size > self.cache_max_bytes:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= len(previous[0])
+        self.entries[key] = entry
+        self.total_bytes += size
+        while self.total_bytes > self.cache_max_bytes:
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.total_bytes -= len(evicted)
+
+    async def process(self, image_bytes: bytes, image_hash: Optional[str] = None) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Convert an image to JPEG off the event loop.
+
+        Concurrent calls for the same image hash share one conversion, and the
+        result is kept for later calls with that hash.
+
+        Args:
+            image_bytes: Encoded source image
+            image_hash: Meta image hash used as the reuse key (None disables reuse)
+
+        Returns:
+            (JPEG bytes, info with the source and output dimensions)
+        """
+        cached = self.lookup(image_hash)
+        if cached is not None:
+            return cached
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            entry = await loop.run_in_executor(
+                self._get_executor(), process_image, image_bytes, self.max_dimension, self.quality
+            )
+            self.processed += 1
+            if image_hash:
+                self._store(self._key(image_hash), entry)
+            return entry
+
+        if not image_hash:
+            return await run()
+        return await self._flights.do(self._key(image_hash), run)
+
+    def clear(self) -> None:
+        """Drop all processed images"""
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool and reuse statistics"""
+        return {
+            "executor": self.executor_type,
+            "workers": self.workers,
+            "processed": self.processed,
+            "hits": self.hits,
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+        }
+
+
+# Global instance for easy access
+image_processor = ImageProcessor()
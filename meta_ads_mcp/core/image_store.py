@@ -0,0 +1,251 @@
+"""Content-addressed on-disk cache of ad images keyed by Meta image hash.
+
+Meta image hashes identify image content, so the bytes behind a hash never
+change. Downloaded images are kept under the config directory (e.g.
+~/.config/meta-ads-mcp/image_cache) as <hash[:2]>/<hash>, with the adimages
+metadata (URL, dimensions, name) in a <hash>.json sidecar. Least recently used
+images are evicted once the directory grows past its size cap. Files are written
+atomically, so several server processes can share one directory.
+"""
+
+import asyncio
+import json
+import os
+import pathlib
+import platform
+import re
+import shutil
+import stat
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .utils import logger
+
+
+# Image cache configuration (overridable through environment variables)
+IMAGE_STORE_ENABLED = os.environ.get("META_ADS_IMAGE_STORE", "true").lower() not in ("0", "false", "no", "off")
+IMAGE_STORE_DIR = os.environ.get("META_ADS_IMAGE_STORE_DIR", "")
+IMAGE_STORE_MAX_BYTES = int(os.environ.get("META_ADS_IMAGE_STORE_MAX_BYTES", str(500 * 1024 * 1024)))
+
+# Hashes become file names, so anything else is never cached
+_IMAGE_HASH_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+
+def _get_image_store_dir() -> pathlib.Path:
+    """Get the platform-specific directory for cached images"""
+    if IMAGE_STORE_DIR:
+        return pathlib.Path(IMAGE_STORE_DIR).expanduser()
+
+    if platform.system() == "Windows":
+        base_path = pathlib.Path(os.environ.get("APPDATA", ""))
+    elif platform.system() == "Darwin":  # macOS
+        base_path = pathlib.Path.home() / "Library" / "Application Support"
+    else:  # Assume Linux/Unix
+        base_path = pathlib.Path.home() / ".config"
+
+    return base_path / "meta-ads-mcp" / "image_cache"
+
+
+def _remove(path: pathlib.Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except PermissionError:
+        # Windows refuses to delete read-only files
+        os.chmod(path, stat.S_IWUSR | stat.S_IRUSR)
+        path.unlink()
+
+
+def _write_atomic(path: pathlib.Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        _remove(pathlib.Path(tmp))
+        raise
+
+
+class ImageStore:
+    """Size-bounded LRU store of image bytes and metadata addressed by image hash"""
+
+    def __init__(
+        self,
+        directory: Optional[pathlib.Path] = None,
+        max_bytes: int = IMAGE_STORE_MAX_BYTES,
+        enabled: bool = IMAGE_STORE_ENABLED,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        # Bytes on disk, counted on first write (None until then)
+        self.total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Puts run in concurrent worker threads; guards total_bytes and eviction
+        self._lock = threading.Lock()
+
+    def _paths(self, image_hash: str) -> Optional[Tuple[pathlib.Path, pathlib.Path]]:
+        """Get the data and metadata paths for a hash, or None when it cannot be cached"""
+        if not self.enabled or not image_hash or not _IMAGE_HASH_PATTERN.match(image_hash):
+            return None
+        if self.directory is None:
+            self.directory = _get_image_store_dir()
+        shard = self.directory / image_hash[:2]
+        return shard / image_hash, shard / f"{image_hash}.json"
+
+    # Synchronous operations (run in a worker thread by the async API below)
+
+    def _get(self, image_hash: str) -> Optional[bytes]:
+        paths = self._paths(image_hash)
+        if paths is None:
+            return None
+        try:
+            data = paths[0].read_bytes()
+        except OSError:
+            return None
+        try:
+            # The modification time doubles as the LRU timestamp
+            os.utime(paths[0])
+        except OSError:
+            pass
+        return data
+
+    def _get_metadata(self, image_hash: str) -> Optional[Dict[str, Any]]:
+        paths = self._paths(image_hash)
+        if paths is None:
+            return None
+        try:
+            return json.loads(paths[1].read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _put(self, image_hash: str, data: bytes, metadata: Optional[Dict[str, Any]]) -> bool:
+        paths = self._paths(image_hash)
+        if paths is None or len(data) > self.max_bytes:
+            return False
+        data_path, metadata_path = paths
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if self.total_bytes is None:
+                self.total_bytes = sum(size for _, size, _ in self._entries())
+
+            previous = data_path.stat().st_size if data_path.exists() else 0
+            _write_atomic(data_path, data)
+            if metadata is not None:
+                _write_atomic(metadata_path, json.dumps(dict(metadata, stored_at=time.time())).encode("utf-8"))
+            self.total_bytes += len(data) - previous
+
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+        return True
+
+    def _entries(self) -> List[Tuple[pathlib.Path, int, float]]:
+        """List cached images as (path, size, last access)"""
+        entries = []
+        if self.directory is None or not self.directory.exists():
+            return entries
+        for shard in self.directory.iterdir():
+            if not shard.is_dir():
+                continue
+            for path in shard.iterdir():
+                if path.suffix == ".json" or path.name.startswith(".tmp-"):
+                    continue
+                try:
+                    info = path.stat()
+                except OSError:
+                    continue
+                entries.append((path, info.st_size, info.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used images until the size cap holds again (call with _lock held)"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            _remove(path.with_name(f"{path.name}.json"))
+            total -= size
+            self.evictions += 1
+        self.total_bytes = total
+        logger.debug("Image cache holds %d bytes after eviction", total)
+
+    def _copy_to(self, image_hash: str, destination: pathlib.Path) -> bool:
+        paths = self._paths(image_hash)
+        if paths is None or not paths[0].exists():
+            return False
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(paths[0], destination)
+        os.utime(paths[0])
+        return True
+
+    def _run(self, func, *args):
+        """Run a file operation, logging rather than raising errors"""
+        try:
+            return func(*args)
+        except OSError as e:
+            logger.warning(f"Image cache error: {e}")
+            return None
+
+    # Async API used by the image tools
+
+    async def get(self, image_hash: str) -> Optional[bytes]:
+        """Get the cached bytes for an image hash"""
+        data = await asyncio.to_thread(self._run, self._get, image_hash)
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    async def get_metadata(self, image_hash: str) -> Optional[Dict[str, Any]]:
+        """Get the adimages metadata stored with an image hash"""
+        return await asyncio.to_thread(self._run, self._get_metadata, image_hash)
+
+    async def put(self, image_hash: str, data: bytes, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Store an image under its hash.
+
+        Args:
+            image_hash: Meta image hash
+            data: Downloaded image bytes
+            metadata: adimages fields (url, width, height, name, ...)
+
+        Returns:
+            True if the image was stored
+        """
+        return bool(await asyncio.to_thread(self._run, self._put, image_hash, data, metadata))
+
+    async def copy_to(self, image_hash: str, destination: str) -> bool:
+        """
+        Copy a cached image to destination, leaving the cache file untouched.
+
+        Returns:
+            True if the image was cached and copied
+        """
+        copied = bool(await asyncio.to_thread(self._run, self._copy_to, image_hash, pathlib.Path(destination)))
+        if copied:
+            self.hits += 1
+        return copied
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            "enabled": self.enabled,
+            "directory": str(self.directory) if self.directory else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes": self.total_bytes,
+        }
+
+
+# Global instance for easy access
+image_store = ImageStore()
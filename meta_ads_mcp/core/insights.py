@@ -3,7 +3,7 @@
 import json
 from typing import Optional, Union, Dict
 from .api import meta_api_tool, make_api_request
-from .utils import download_image, try_multiple_download_methods, ad_creative_images, create_resource_from_image
+from .utils import download_image, try_multiple_download_methods, create_resource_from_image
 from .server import mcp_server
 import base64
 import datetime
@@ -29,7 +29,7 @@ async def get_insights(access_token: str = None, object_id: str = None,
         level: Level of aggregation (ad, adset, campaign, account)
     """
     if not object_id:
-        return json.dumps({"error": "No object ID provided"}, indent=2)
+        return {"error": "No object ID provided"}
         
     endpoint = f"{object_id}/insights"
     params = {
@@ -43,7 +43,7 @@ async def get_insights(access_token: str = None, object_id: str = None,
         if "since" in time_range and "until" in time_range:
             params["time_range"] = json.dumps(time_range)
         else:
-            return json.dumps({"error": "Custom time_range must contain both 'since' and 'until' keys in YYYY-MM-DD format"}, indent=2)
+            return {"error": "Custom time_range must contain both 'since' and 'until' keys in YYYY-MM-DD format"}
     else:
         # Use preset date range
         params["date_preset"] = time_range
@@ -53,7 +53,7 @@ async def get_insights(access_token: str = None, object_id: str = None,
     
     data = await make_api_request(endpoint, access_token, params)
     
-    return json.dumps(data, indent=2)
+    return data
 
 
 
@@ -3,8 +3,10 @@
 import json
 from typing import Optional, List, Dict, Any, Union
 from .api import meta_api_tool, make_api_request
+from .pagination import fetch_all_pages, fetch_all_page_size
 from .accounts import get_ad_accounts
 from .server import mcp_server
+from .token_introspection import token_introspector
 
 
 @mcp_server.tool()
@@ -48,10 +50,10 @@ async def create_lead_form(
         JSON response with created lead form details
     """
     if not page_id:
-        return json.dumps({"error": "Page ID is required to create a lead form"}, indent=2)
+        return {"error": "Page ID is required to create a lead form"}
     
     if not name:
-        return json.dumps({"error": "Lead form name is required"}, indent=2)
+        return {"error": "Lead form name is required"}
     
     # Build the lead form data
     form_data = {
@@ -114,13 +116,13 @@ async def create_lead_form(
     
     try:
         data = await make_api_request(endpoint, access_token, form_data, method="POST")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to create lead form",
             "details": str(e),
             "form_data_sent": form_data
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -129,7 +131,10 @@ async def get_lead_forms(
     access_token: str = None,
     page_id: str = None,
     limit: int = 10,
-    fields: str = "id,name,status,locale,questions,context_card,thank_you_page,privacy_policy_url,created_time,expired_leads_count,leads_count"
+    fields: str = "id,name,status,locale,questions,context_card,thank_you_page,privacy_policy_url,created_time,expired_leads_count,leads_count",
+    after: str = "",
+    fetch_all: bool = False,
+    max_items: int = None
 ) -> str:
     """
     Get lead forms associated with a Facebook Page.
@@ -139,27 +144,36 @@ async def get_lead_forms(
         page_id: Facebook Page ID to get lead forms for
         limit: Maximum number of lead forms to return
         fields: Comma-separated list of fields to retrieve
+        after: Pagination cursor to get the next set of results
+        fetch_all: Follow pagination cursors and return all lead forms in one response, fetching at least 500 per page (default: False)
+        max_items: Maximum total number of lead forms to return across pages (implies fetch_all)
     
     Returns:
         JSON response with lead forms data
     """
     if not page_id:
-        return json.dumps({"error": "Page ID is required to get lead forms"}, indent=2)
+        return {"error": "Page ID is required to get lead forms"}
     
     endpoint = f"{page_id}/leadgen_forms"
     params = {
         "fields": fields,
         "limit": limit
     }
+    if after:
+        params["after"] = after
     
     try:
-        data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        if fetch_all or max_items is not None:
+            params["limit"] = fetch_all_page_size(limit)
+            data = await fetch_all_pages(endpoint, access_token, params, max_items=max_items)
+        else:
+            data = await make_api_request(endpoint, access_token, params)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get lead forms",
             "details": str(e)
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -181,7 +195,7 @@ async def get_lead_form_details(
         JSON response with lead form details
     """
     if not form_id:
-        return json.dumps({"error": "Form ID is required"}, indent=2)
+        return {"error": "Form ID is required"}
     
     endpoint = f"{form_id}"
     params = {
@@ -190,12 +204,12 @@ async def get_lead_form_details(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get lead form details",
             "details": str(e)
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -235,7 +249,7 @@ async def update_lead_form(
         JSON response with update result
     """
     if not form_id:
-        return json.dumps({"error": "Form ID is required to update lead form"}, indent=2)
+        return {"error": "Form ID is required to update lead form"}
     
     # Build update data with only provided fields
     update_data = {}
@@ -262,19 +276,19 @@ async def update_lead_form(
         update_data["block_display_for_non_targeted_viewer"] = block_display_for_non_targeted_viewer
     
     if not update_data:
-        return json.dumps({"error": "No update parameters provided"}, indent=2)
+        return {"error": "No update parameters provided"}
     
     endpoint = f"{form_id}"
     
     try:
         data = await make_api_request(endpoint, access_token, update_data, method="POST")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to update lead form",
             "details": str(e),
             "update_data_sent": update_data
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -300,7 +314,12 @@ async def get_lead_form_submissions(
         JSON response with lead submissions
     """
     if not form_id:
-        return json.dumps({"error": "Form ID is required to get lead submissions"}, indent=2)
+        return {"error": "Form ID is required to get lead submissions"}
+    
+    # Lead data needs its own permission; skip the request if the token is known to lack it
+    missing_scope = await token_introspector.check(access_token, ("leads_retrieval",), "get_lead_form_submissions")
+    if missing_scope:
+        return missing_scope
     
     endpoint = f"{form_id}/leads"
     params = {
@@ -314,12 +333,12 @@ async def get_lead_form_submissions(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get lead form submissions",
             "details": str(e)
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -339,23 +358,24 @@ async def delete_lead_form(
         JSON response with deletion result
     """
     if not form_id:
-        return json.dumps({"error": "Form ID is required to delete lead form"}, indent=2)
+        return {"error": "Form ID is required to delete lead form"}
     
     endpoint = f"{form_id}"
     
     try:
         data = await make_api_request(endpoint, access_token, {}, method="DELETE")
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to delete lead form",
             "details": str(e)
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
 @meta_api_tool
 async def create_lead_form_question(
+    access_token: str = None,
     question_type: str = None,
     required: bool = True,
     label: str = None,
@@ -366,6 +386,7 @@ async def create_lead_form_question(
     Helper function to create a lead form question configuration.
     
     Args:
+        access_token: Meta API access token (optional - will use cached token if not provided)
         question_type: Type of question (FIRST_NAME, LAST_NAME, EMAIL, PHONE, etc.)
         required: Whether the question is required
         label: Custom label for the question
@@ -376,7 +397,7 @@ async def create_lead_form_question(
         JSON configuration for the question
     """
     if not question_type:
-        return json.dumps({"error": "Question type is required"}, indent=2)
+        return {"error": "Question type is required"}
     
     question_config = {
         "type": question_type,
@@ -392,10 +413,10 @@ async def create_lead_form_question(
     if conditional_questions:
         question_config["conditional_questions"] = conditional_questions
     
-    return json.dumps({
+    return {
         "question_config": question_config,
         "usage": "Use this configuration in the 'questions' parameter when creating or updating a lead form"
-    }, indent=2)
+    }
 
 
 @mcp_server.tool()
@@ -443,7 +464,7 @@ async def get_lead_form_question_types(access_token: str = None) -> str:
         }
     }
     
-    return json.dumps({
+    return {
         "question_types": question_types,
         "usage": "Use these question types when creating questions for lead forms",
         "example": {
@@ -451,4 +472,4 @@ async def get_lead_form_question_types(access_token: str = None) -> str:
             "required": True,
             "label": "What's your first name?"
         }
-    }, indent=2)
\ No newline at end of file
+    }
\ No newline at end of file
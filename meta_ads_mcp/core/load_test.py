@@ -0,0 +1,351 @@
+"""Load generator for the streamable HTTP transport (meta-ads-mcp bench-http).
+
+Sends concurrent JSON-RPC tools/call requests to /mcp for a fixed duration and
+reports throughput, latency percentiles and error rates, overall and per tool.
+By default it starts the offline Graph API simulator and a server subprocess
+pointed at it; pass --url to load an already running server instead.
+
+Requests authenticate with an Authorization: Bearer header, so every call goes
+through AuthInjectionMiddleware and the context-token lookup. Running again with
+--auth argument (token passed as the access_token tool argument) isolates the
+per-request cost of that path.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .graph_simulator import BackgroundSimulator, add_simulator_arguments, simulator_from_args
+
+
+DEFAULT_TOKEN = "load-test-token"
+JSON_RPC_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, wall_time: float) -> Dict[str, Any]:
+    """
+    Summarize call latencies in seconds.
+
+    Returns:
+        Dictionary with calls, errors, error_rate, mean/p50/p95/p99 in milliseconds and ops_per_second
+    """
+    ordered = sorted(latencies)
+    return {
+        "calls": len(ordered),
+        "errors": errors,
+        "error_rate": round(errors / len(ordered), 4) if ordered else 0.0,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "ops_per_second": round(len(ordered) / wall_time, 2) if wall_time else 0.0,
+    }
+
+
+def text_reports_error(text: str) -> bool:
+    """Tools report Graph failures inside a successful result as {"error": ...} or "Error: ..." text"""
+    if text.startswith("Error"):
+        return True
+    if text.startswith("{") and '"error"' in text[:200]:
+        try:
+            return "error" in json.loads(text)
+        except json.JSONDecodeError:
+            return False
+    return False
+
+
+def classify_response(response: httpx.Response) -> Optional[str]:
+    """
+    Check a tools/call HTTP response.
+
+    Returns:
+        None on success, otherwise an error kind: http_<status>, jsonrpc_error, tool_error or graph_error
+    """
+    if response.status_code != 200:
+        return f"http_{response.status_code}"
+    body = response.text
+    if response.headers.get("content-type", "").startswith("text/event-stream"):
+        # SSE response mode: the JSON-RPC message is in the last data line
+        data_lines = [line[5:].strip() for line in body.splitlines() if line.startswith("data:")]
+        body = data_lines[-1] if data_lines else ""
+    try:
+        message = json.loads(body)
+    except json.JSONDecodeError:
+        return "invalid_response"
+    if "error" in message:
+        return "jsonrpc_error"
+    result = message.get("result") or {}
+    if result.get("isError"):
+        return "tool_error"
+    for content in result.get("content", []):
+        if content.get("type") == "text" and text_reports_error(content.get("text", "")):
+            return "graph_error"
+    return None
+
+
+def parse_tool_mix(spec: Optional[str], cases: List[Tuple[str, str, Dict[str, Any]]]) -> List[Tuple[Tuple[str, str, Dict[str, Any]], float]]:
+    """
+    Select weighted cases from a mix like "get_campaigns=5,get_ads=2,get_ad_image".
+
+    Names match case labels or tool names; a name without a weight counts once.
+    Without a spec every case gets weight 1.
+    """
+    if not spec:
+        return [(case, 1.0) for case in cases]
+    mix = []
+    for item in spec.split(","):
+        name, _, weight = item.strip().partition("=")
+        matches = [case for case in cases if name in (case[0], case[1])]
+        if not matches:
+            known = ", ".join(case[0] for case in cases)
+            raise ValueError(f"Unknown tool '{name}' in mix; choose from: {known}")
+        for case in matches:
+            mix.append((case, float(weight) if weight else 1.0))
+    return mix
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_environment(api_base: str, cache: bool = False, rate_limit: bool = False) -> Dict[str, str]:
+    """Environment for a server subprocess that talks to the Graph API simulator"""
+    env = dict(os.environ)
+    env.update({
+        "META_ADS_GRAPH_API_BASE": api_base,
+        "META_ADS_CACHE_ENABLED": "true" if cache else "false",
+        "META_ADS_DISK_CACHE": "false",
+        "META_ADS_RATE_LIMIT_ENABLED": "true" if rate_limit else "false",
+        "META_ADS_LOG_LEVEL": "WARNING",
+        # Keeps the server from starting an interactive login when no token is cached
+        "META_APP_ID": env.get("META_APP_ID", "benchmark"),
+        "META_APP_SECRET": env.get("META_APP_SECRET", "benchmark"),
+        # Used by the helper tools that take no access_token argument; the simulator accepts any token
+        "META_ACCESS_TOKEN": env.get("META_ACCESS_TOKEN", "benchmark-simulator-token"),
+    })
+    env.pop("PIPEBOARD_API_TOKEN", None)
+    return env
+
+
+def start_http_server(env: Dict[str, str], port: int, extra_args: Optional[List[str]] = None,
+                      timeout: float = 60.0) -> subprocess.Popen:
+    """Start `python -m meta_ads_mcp --transport streamable-http` and wait until it accepts connections"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "meta_ads_mcp", "--transport", "streamable-http",
+         "--host", "127.0.0.1", "--port", str(port), *(extra_args or [])],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return process
+        except OSError:
+            time.sleep(0.1)
+    stop_process(process)
+    raise RuntimeError("Timed out waiting for the HTTP server to start")
+
+
+def stop_process(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+class LoadTestStats:
+    """Latencies and outcomes collected during a load test"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+
+    def record(self, label: str, latency: float, error: Optional[str]) -> None:
+        self.latencies.setdefault(label, []).append(latency)
+        if error:
+            by_kind = self.errors.setdefault(label, {})
+            by_kind[error] = by_kind.get(error, 0) + 1
+
+    def report(self, wall_time: float) -> Dict[str, Any]:
+        all_latencies = [latency for values in self.latencies.values() for latency in values]
+        error_kinds: Dict[str, int] = {}
+        for by_kind in self.errors.values():
+            for kind, count in by_kind.items():
+                error_kinds[kind] = error_kinds.get(kind, 0) + count
+        return {
+            "duration_seconds": round(wall_time, 2),
+            "overall": summarize(all_latencies, sum(error_kinds.values()), wall_time),
+            "errors_by_kind": error_kinds,
+            "tools": {
+                label: dict(summarize(values, sum(self.errors.get(label, {}).values()), wall_time),
+                            errors_by_kind=self.errors.get(label, {}))
+                for label, values in sorted(self.latencies.items())
+            },
+        }
+
+
+async def run_load(
+    url: str,
+    mix: List[Tuple[Tuple[str, str, Dict[str, Any]], float]],
+    concurrency: int = 10,
+    duration: float = 10.0,
+    warmup: float = 1.0,
+    token: str = DEFAULT_TOKEN,
+    auth: str = "bearer",
+    timeout: float = 60.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Drive concurrent tools/call requests against a streamable HTTP endpoint.
+
+    Args:
+        url: MCP endpoint, e.g. http://127.0.0.1:8080/mcp/
+        mix: Weighted (label, tool, arguments) cases to sample from
+        concurrency: Number of requests kept in flight
+        duration: Seconds of measured load
+        warmup: Seconds of load before measuring starts
+        token: Access token sent with every call
+        auth: "bearer" sends an Authorization header; "argument" passes access_token as a tool argument
+        timeout: Per-request timeout in seconds
+        seed: Seed for sampling the tool mix
+
+    Returns:
+        Report with overall and per-tool throughput, latency percentiles and errors
+    """
+    cases = [case for case, _ in mix]
+    weights = [weight for _, weight in mix]
+    rng = random.Random(seed)
+    headers = dict(JSON_RPC_HEADERS)
+    if auth == "bearer":
+        headers["Authorization"] = f"Bearer {token}"
+    stats = LoadTestStats()
+    request_ids = iter(range(1, sys.maxsize))
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup
+    stop_at = measure_from + duration
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while loop.time() < stop_at:
+            label, tool, arguments = rng.choices(cases, weights)[0]
+            if auth == "argument":
+                arguments = dict(arguments, access_token=token)
+            payload = {"jsonrpc": "2.0", "id": next(request_ids), "method": "tools/call",
+                       "params": {"name": tool, "arguments": arguments}}
+            started = loop.time()
+            try:
+                response = await client.post(url, json=payload, headers=headers)
+                error = classify_response(response)
+            except httpx.TimeoutException:
+                error = "timeout"
+            except httpx.HTTPError as e:
+                error = type(e).__name__
+            if started >= measure_from:
+                stats.record(label, loop.time() - started, error)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True) as client:
+        await asyncio.gather(*(worker(client) for _ in range(max(1, concurrency))))
+    report = stats.report(duration)
+    report["settings"] = {"url": url, "concurrency": concurrency, "duration": duration, "warmup": warmup, "auth": auth}
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    settings = report["settings"]
+    overall = report["overall"]
+    lines = [
+        f"{settings['url']}: {settings['concurrency']} concurrent, {settings['duration']:g}s, auth={settings['auth']}",
+        f"Throughput: {overall['ops_per_second']:.1f} calls/s ({overall['calls']} calls)",
+        f"Latency: p50 {overall['p50_ms']:.1f} ms, p95 {overall['p95_ms']:.1f} ms, "
+        f"p99 {overall['p99_ms']:.1f} ms, mean {overall['mean_ms']:.1f} ms",
+        f"Errors: {overall['errors']} ({overall['error_rate']:.2%})"
+        + (f" {report['errors_by_kind']}" if report["errors_by_kind"] else ""),
+        "",
+        f"{'tool':<28} {'calls':>7} {'err %':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'calls/s':>9}",
+    ]
+    for label, row in report["tools"].items():
+        lines.append(f"{label:<28} {row['calls']:>7} {row['error_rate'] * 100:>7.2f} {row['p50_ms']:>9.1f} "
+                     f"{row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['ops_per_second']:>9.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="meta-ads-mcp bench-http",
+        description="Load test the streamable HTTP transport with concurrent tools/call requests",
+    )
+    parser.add_argument("--url", help="MCP endpoint of a running server (default: start one against the simulator)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight (default: 10)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of measured load (default: 10)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Seconds of unmeasured load first (default: 1)")
+    parser.add_argument("--mix", help='Weighted tool mix, e.g. "get_campaigns=5,get_insights=2,get_ad_image=1" '
+                                      "(default: every sample tool equally)")
+    parser.add_argument("--auth", choices=["bearer", "argument"], default="bearer",
+                        help="Send the token as a Bearer header (default) or as the access_token argument")
+    parser.add_argument("--token", default=DEFAULT_TOKEN, help="Access token to send")
+    parser.add_argument("--cache", action="store_true", help="Leave the server's response cache enabled")
+    parser.add_argument("--rate-limit", action="store_true", help="Leave the server's client-side rate limiter enabled")
+    parser.add_argument("--json", help="Write the report to this file")
+    add_simulator_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # The simulator's data is deterministic, so sample arguments also match a simulator started elsewhere
+    simulator = simulator_from_args(args)
+    try:
+        mix = parse_tool_mix(args.mix, simulator.sample_tool_calls())
+    except ValueError as e:
+        parser.error(str(e))
+
+    background = process = None
+    try:
+        url = args.url
+        if not url:
+            background = BackgroundSimulator(simulator).start()
+            port = free_port()
+            process = start_http_server(server_environment(background.api_base, args.cache, args.rate_limit), port)
+            url = f"http://127.0.0.1:{port}/mcp/"
+        report = asyncio.run(run_load(url, mix, args.concurrency, args.duration, args.warmup,
+                                      args.token, args.auth, seed=args.seed))
+        if background:
+            report["graph"] = simulator.stats()
+    finally:
+        if process:
+            stop_process(process)
+        if background:
+            background.stop()
+
+    print(format_report(report))
+    if "graph" in report:
+        print(f"\nGraph simulator served {report['graph']['requests']} requests: {report['graph']['responses_by_status']}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+    return 0
@@ -0,0 +1,372 @@
+"""Prometheus-style runtime metrics for the streamable HTTP transport.
+
+Tool calls and Graph API requests are recorded as they happen. Cache, request
+coalescing, rate-limit and circuit-breaker state is read from the existing
+global instances when /metrics is scraped, so it costs nothing between scrapes.
+The text exposition format is produced here; prometheus_client is not needed.
+"""
+
+import abc
+import bisect
+import hmac
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .cache import response_cache
+from .circuit_breaker import circuit_breakers
+from .rate_limit import rate_limiter, RATE_LIMIT_SLOWDOWN_THRESHOLD
+from .singleflight import request_coalescer
+from .utils import logger
+
+
+# Metrics configuration (overridable through environment variables)
+METRICS_ENABLED = os.environ.get("META_ADS_METRICS_ENABLED", "false").lower() in ("1", "true", "yes", "on")
+METRICS_PATH = os.environ.get("META_ADS_METRICS_PATH", "/metrics")
+# Bearer token scrapers must send; empty leaves the endpoint open
+METRICS_TOKEN = os.environ.get("META_ADS_METRICS_TOKEN", "")
+# Per-account rate-limit and circuit breaker series (one label value per ad account)
+METRICS_DETAILED = os.environ.get("META_ADS_METRICS_DETAILED", "false").lower() in ("1", "true", "yes", "on")
+
+# Latency buckets in seconds; Graph API calls range from tens of ms to tens of seconds
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_ACCOUNT_PATTERN = re.compile(r"act_\d+")
+_NUMERIC_SEGMENT_PATTERN = re.compile(r"(?<=/)\d+(?=/|$)|^\d+(?=/|$)")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Collapse object IDs in an endpoint so it can be used as a metric label.
+
+    e.g. "act_123/campaigns" -> "act_{id}/campaigns", "120211/insights" -> "{id}/insights"
+    """
+    path = (endpoint or "").split("?", 1)[0].strip("/")
+    path = _ACCOUNT_PATTERN.sub("act_{id}", path)
+    return _NUMERIC_SEGMENT_PATTERN.sub("{id}", path) or "/"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def render_family(name: str, kind: str, help_text: str, samples: Iterable[Tuple[str, Dict[str, Any], float]]) -> List[str]:
+    """
+    Render one metric family in the Prometheus text format.
+
+    Args:
+        name: Metric name
+        kind: counter, gauge or histogram
+        help_text: HELP line
+        samples: (sample name suffix, labels, value) triples
+
+    Returns:
+        Exposition lines
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for suffix, labels, value in samples:
+        lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+    return lines
+
+
+class _Metric(abc.ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    @abc.abstractmethod
+    def samples(self) -> Iterable[Tuple[str, Dict[str, Any], float]]:
+        """Get (sample name, labels, value) for every series of this metric"""
+
+    def render(self) -> List[str]:
+        return render_family(self.name, self.kind, self.help_text, self.samples())
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self.values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        return [("", self._labels(key), value) for key, value in self.values.items()]
+
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        self.values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (last one is +Inf), sum, count]
+        self.series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        series = self.series.get(key)
+        if series is None:
+            series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            self.series[key] = series
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def get_count(self, **labels) -> int:
+        series = self.series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def samples(self):
+        result = []
+        for key, (counts, total, count) in self.series.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                result.append(("_bucket", dict(labels, le=_format_value(bound)), cumulative))
+            result.append(("_sum", labels, total))
+            result.append(("_count", labels, count))
+        return result
+
+
+class ToolCall:
+    """Tracks one tool invocation from start to finish"""
+
+    def __init__(self, metrics: "RuntimeMetrics", tool: str):
+        self.metrics = metrics
+        self.tool = tool
+        self.started = time.perf_counter()
+        metrics.tool_calls_in_flight.inc()
+
+    def finish(self, status: str = "ok") -> None:
+        elapsed = time.perf_counter() - self.started
+        self.metrics.tool_calls_in_flight.dec()
+        self.metrics.tool_calls.inc(tool=self.tool, status=status)
+        self.metrics.tool_duration.observe(elapsed, tool=self.tool)
+
+
+class RuntimeMetrics:
+    """Metrics recorded by the tool wrapper and the Graph API request path"""
+
+    def __init__(self, enabled: bool = METRICS_ENABLED, detailed: bool = METRICS_DETAILED):
+        self.enabled = enabled
+        self.detailed = detailed
+        self.started_at = time.time()
+        self.tool_calls = Counter(
+            "meta_ads_tool_calls_total", "Tool calls by tool and outcome", ["tool", "status"])
+        self.tool_duration = Histogram(
+            "meta_ads_tool_duration_seconds", "Tool call latency", ["tool"])
+        self.tool_calls_in_flight = Gauge(
+            "meta_ads_tool_calls_in_flight", "Tool calls currently running")
+        self.graph_requests = Counter(
+            "meta_ads_graph_requests_total", "Graph API requests sent, by endpoint and HTTP status",
+            ["method", "endpoint", "status"])
+        self.graph_duration = Histogram(
+            "meta_ads_graph_request_duration_seconds", "Graph API request latency (network time only)",
+            ["method", "endpoint"])
+        self.graph_in_flight = Gauge(
+            "meta_ads_graph_requests_in_flight", "Graph API requests currently waiting for Meta")
+        self.graph_retries = Counter(
+            "meta_ads_graph_retries_total", "Graph API requests retried after a transient error", ["endpoint"])
+        self.rate_limit_wait = Counter(
+            "meta_ads_rate_limit_wait_seconds_total", "Time requests were held back by the local rate limiter")
+        self.circuit_rejections = Counter(
+            "meta_ads_circuit_breaker_rejections_total", "Requests rejected by an open circuit breaker", ["endpoint"])
+        self.metrics: List[_Metric] = [
+            self.tool_calls,
+            self.tool_duration,
+            self.tool_calls_in_flight,
+            self.graph_requests,
+            self.graph_duration,
+            self.graph_in_flight,
+            self.graph_retries,
+            self.rate_limit_wait,
+            self.circuit_rejections,
+        ]
+
+    def tool_call(self, tool: str) -> Optional[ToolCall]:
+        """Start tracking a tool call; call finish() on the result when it returns"""
+        return ToolCall(self, tool) if self.enabled else None
+
+    def graph_request_started(self) -> float:
+        """Mark a Graph API request as sent; returns the start time for graph_request_finished"""
+        if self.enabled:
+            self.graph_in_flight.inc()
+        return time.perf_counter()
+
+    def graph_request_finished(self, method: str, endpoint: str, status: Any, started: float) -> None:
+        """Record a completed Graph API request (status is the HTTP status or an error kind)"""
+        if not self.enabled:
+            return
+        template = endpoint_template(endpoint)
+        self.graph_in_flight.dec()
+        self.graph_requests.inc(method=method, endpoint=template, status=status)
+        self.graph_duration.observe(time.perf_counter() - started, method=method, endpoint=template)
+
+    def record_retry(self, endpoint: str) -> None:
+        if self.enabled:
+            self.graph_retries.inc(endpoint=endpoint_template(endpoint))
+
+    def record_rate_limit_wait(self, seconds: float) -> None:
+        if self.enabled and seconds > 0:
+            self.rate_limit_wait.inc(seconds)
+
+    def record_circuit_rejection(self, endpoint: str) -> None:
+        if self.enabled:
+            self.circuit_rejections.inc(endpoint=endpoint_template(endpoint))
+
+    def _state_lines(self) -> List[str]:
+        """Gauges read from the cache, coalescer, rate limiter and circuit breakers"""
+        lines: List[str] = []
+        cache = response_cache.get_stats()
+        tiers = [("memory", cache)]
+        if "persistent" in cache:
+            tiers.append(("disk", cache["persistent"]))
+        lines += render_family("meta_ads_cache_hits_total", "counter", "Response cache hits",
+                               [("", {"tier": tier}, stats["hits"]) for tier, stats in tiers])
+        lines += render_family("meta_ads_cache_misses_total", "counter", "Response cache misses",
+                               [("", {"tier": tier}, stats["misses"]) for tier, stats in tiers])
+        lines += render_family("meta_ads_cache_hit_ratio", "gauge", "Response cache hits / lookups since start",
+                               [("", {"tier": "memory"}, cache["hit_rate"])])
+        lines += render_family("meta_ads_cache_entries", "gauge", "Responses currently cached",
+                               [("", {"tier": tier}, stats["entries"]) for tier, stats in tiers])
+        lines += render_family("meta_ads_cache_bytes", "gauge", "Approximate size of cached responses",
+                               [("", {"tier": tier}, stats["bytes"]) for tier, stats in tiers])
+        lines += render_family("meta_ads_cache_evictions_total", "counter", "Responses evicted to stay under the cache limits",
+                               [("", {}, cache["evictions"])])
+
+        coalescer = request_coalescer.get_stats()
+        lines += render_family("meta_ads_coalesced_requests_total", "counter",
+                               "GET requests served by joining an identical in-flight request",
+                               [("", {}, coalescer["coalesced"])])
+
+        status = rate_limiter.get_status()
+        accounts = status["accounts"]
+        if self.detailed:
+            buckets = [("app", status["app"])] + list(accounts.items())
+        else:
+            # Account IDs as label values would publish every account and grow without bound
+            buckets = [("app", status["app"])]
+            if accounts:
+                buckets.append(("accounts_max", max(accounts.values(), key=lambda bucket: bucket["utilization_pct"])))
+        lines += render_family("meta_ads_rate_limit_utilization_percent", "gauge",
+                               "Latest Meta-reported usage (max of call count, CPU and time)",
+                               [("", {"bucket": key}, bucket["utilization_pct"]) for key, bucket in buckets])
+        lines += render_family("meta_ads_rate_limit_rate_per_second", "gauge",
+                               "Current local request rate allowed by the throttler (+Inf when not throttled)",
+                               [("", {"bucket": key}, float("inf") if bucket["current_rate_per_second"] is None
+                                 else bucket["current_rate_per_second"]) for key, bucket in buckets])
+        lines += render_family("meta_ads_rate_limit_throttled_accounts", "gauge",
+                               "Ad accounts whose usage is past the slowdown threshold",
+                               [("", {}, sum(1 for bucket in accounts.values()
+                                             if bucket["utilization_pct"] >= RATE_LIMIT_SLOWDOWN_THRESHOLD))])
+
+        breakers = circuit_breakers.get_status()
+        lines += render_family("meta_ads_circuit_breakers", "gauge", "Circuit breakers that are not closed, by state",
+                               [("", {"state": state}, sum(1 for breaker in breakers.values() if breaker["state"] == state))
+                                for state in ("open", "half_open")])
+        if self.detailed:
+            lines += render_family("meta_ads_circuit_breaker_open", "gauge",
+                                   "Circuit breakers that are not closed (1 = open, 0.5 = half open)",
+                                   [("", {"key": key}, 1 if breaker["state"] == "open" else 0.5)
+                                    for key, breaker in breakers.items()])
+
+        # Imported here: tenants depends on the HTTP auth middleware, which imports this module
+        from .tenants import tenant_registry
+        tenants = tenant_registry.get_stats()
+        lines += render_family("meta_ads_tenants", "gauge", "HTTP clients seen recently with their own access token",
+                               [("", {}, tenants["tenants"])])
+        lines += render_family("meta_ads_tenant_revocations_total", "counter",
+                               "Client access tokens rejected by Meta",
+                               [("", {}, tenants["revocations"])])
+        return lines
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        lines: List[str] = []
+        for metric in self.metrics:
+            lines += metric.render()
+        try:
+            lines += self._state_lines()
+        except Exception as e:
+            # A broken stats source must not take the whole scrape down
+            logger.error("Error collecting runtime state metrics: %s", e)
+        lines += render_family("meta_ads_process_start_time_seconds", "gauge", "Server start time (unix epoch)",
+                               [("", {}, self.started_at)])
+        return "\n".join(lines) + "\n"
+
+
+def bind_metrics_endpoint(mcp_server, path: str = METRICS_PATH, token: str = METRICS_TOKEN) -> None:
+    """
+    Serve the runtime metrics from the server's HTTP app.
+
+    Args:
+        mcp_server: FastMCP server instance (streamable HTTP transport)
+        path: URL path to serve the metrics on
+        token: Bearer token required from scrapers (empty for no check)
+    """
+    from starlette.responses import Response
+
+    expected = f"Bearer {token}".encode("utf-8")
+
+    @mcp_server.custom_route(path, methods=["GET"])
+    async def metrics_endpoint(request) -> Response:
+        if token and not hmac.compare_digest(request.headers.get("authorization", "").encode("utf-8"), expected):
+            return Response("Unauthorized\n", status_code=401, media_type=CONTENT_TYPE,
+                            headers={"WWW-Authenticate": "Bearer"})
+        return Response(runtime_metrics.render(), media_type=CONTENT_TYPE)
+
+    logger.info("Metrics endpoint available at %s", path)
+
+
+# Global instance for easy access
+runtime_metrics = RuntimeMetrics()
@@ -0,0 +1,181 @@
+"""Cursor pagination helpers for Meta Graph API list endpoints."""
+
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse, parse_qsl
+
+from .api import make_api_request
+from .utils import logger
+
+
+# Safety budget for fetch_all requests (overridable through environment variables)
+PAGINATION_MAX_PAGES = int(os.environ.get("META_ADS_PAGINATION_MAX_PAGES", "100"))
+PAGINATION_MAX_ITEMS = int(os.environ.get("META_ADS_PAGINATION_MAX_ITEMS", "10000"))
+
+# Graph API page size when no limit is given
+DEFAULT_PAGE_SIZE = 25
+# Page size for tools asked to fetch everything, so large accounts take few round trips
+FETCH_ALL_PAGE_SIZE = int(os.environ.get("META_ADS_FETCH_ALL_PAGE_SIZE", "500"))
+
+
+def _next_page_params(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the query parameters for the page after this response.
+
+    Prefers the "after" cursor and falls back to the query string of paging.next
+    (some edges, like insights, only return a next URL). Returns None on the last page.
+    """
+    paging = response.get("paging")
+    if not isinstance(paging, dict) or not paging.get("next"):
+        return None
+
+    after = paging.get("cursors", {}).get("after")
+    if after:
+        return {"after": after}
+
+    next_params = {k: v for k, v in parse_qsl(urlparse(paging["next"]).query) if k != "access_token"}
+    return next_params or None
+
+
+def fetch_all_page_size(limit: Optional[int]) -> int:
+    """Get the page size for a tool's fetch_all/max_items mode: its limit, raised to FETCH_ALL_PAGE_SIZE"""
+    return max(int(limit or DEFAULT_PAGE_SIZE), FETCH_ALL_PAGE_SIZE)
+
+
+async def iterate_pages(
+    endpoint: str,
+    access_token: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_pages: int = PAGINATION_MAX_PAGES,
+    max_items: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over the raw pages of a Graph API list endpoint, following cursors.
+
+    Args:
+        endpoint: API endpoint path (without base URL)
+        access_token: Meta API access token
+        params: Query parameters for the first page
+        max_pages: Maximum number of pages to fetch
+        max_items: Stop once this many items were returned. The last page's limit
+                   is shrunk so its "after" cursor resumes exactly where we stopped.
+
+    Yields:
+        Each page response as returned by make_api_request. An error response is
+        yielded as-is and ends the iteration.
+
+    Raises:
+        ValueError: If max_items is less than 1
+    """
+    if max_items is not None and max_items < 1:
+        raise ValueError(f"max_items must be at least 1, got {max_items}")
+    page_params = dict(params or {})
+    page_size = int(page_params.get("limit") or DEFAULT_PAGE_SIZE)
+    remaining = max_items
+    for _ in range(max(1, max_pages)):
+        if remaining is not None:
+            page_params["limit"] = min(page_size, remaining)
+        # make_api_request adds the access token to the params it is given
+        response = await make_api_request(endpoint, access_token, dict(page_params))
+        yield response
+
+        if not isinstance(response, dict) or "error" in response:
+            return
+        if remaining is not None:
+            remaining -= len(response.get("data", []))
+            if remaining <= 0:
+                return
+        next_params = _next_page_params(response)
+        if not next_params:
+            return
+        page_params.update(next_params)
+
+
+async def paginate(
+    endpoint: str,
+    access_token: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_items: Optional[int] = None,
+    max_pages: int = PAGINATION_MAX_PAGES
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over the items of a Graph API list endpoint across all pages.
+
+    Args:
+        endpoint: API endpoint path (without base URL)
+        access_token: Meta API access token
+        params: Query parameters for the first page
+        max_items: Stop after this many items
+        max_pages: Maximum number of pages to fetch
+
+    Yields:
+        Individual items from each page's "data" list. Stops silently on errors;
+        use fetch_all_pages to get error details.
+    """
+    async for page in iterate_pages(endpoint, access_token, params, max_pages, max_items):
+        for item in page.get("data", []) if isinstance(page, dict) else []:
+            yield item
+
+
+async def fetch_all_pages(
+    endpoint: str,
+    access_token: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_items: Optional[int] = None,
+    max_pages: int = PAGINATION_MAX_PAGES
+) -> Dict[str, Any]:
+    """
+    Collect the items of a Graph API list endpoint across pages into one response.
+
+    Args:
+        endpoint: API endpoint path (without base URL)
+        access_token: Meta API access token
+        params: Query parameters for the first page ("limit" is the page size)
+        max_items: Maximum number of items to return (capped at META_ADS_PAGINATION_MAX_ITEMS,
+                   which also applies when it is None); must be at least 1
+        max_pages: Maximum number of pages to fetch
+
+    Returns:
+        Dictionary with "data" (all items), "paging" (cursors of the last page fetched,
+        usable to resume with "after" when the budget ran out) and "summary".
+        If the first page fails its error response is returned unchanged; a later
+        failure returns the items collected so far plus "error". A max_items below 1
+        returns an error without making any request.
+    """
+    if max_items is not None and max_items < 1:
+        return {"error": {"message": f"max_items must be at least 1, got {max_items}"}}
+    max_items = min(max_items, PAGINATION_MAX_ITEMS) if max_items is not None else PAGINATION_MAX_ITEMS
+    items: List[Dict[str, Any]] = []
+    pages = 0
+    last_page: Dict[str, Any] = {}
+    error = None
+
+    async for page in iterate_pages(endpoint, access_token, params, max_pages, max_items):
+        if not isinstance(page, dict) or "error" in page:
+            if pages == 0:
+                return page
+            error = page.get("error") if isinstance(page, dict) else str(page)
+            break
+
+        pages += 1
+        last_page = page
+        items.extend(page.get("data", []))
+
+    # Guard against endpoints that ignore the requested limit
+    items = items[:max_items]
+    has_more = error is None and _next_page_params(last_page) is not None
+    logger.debug(f"Fetched {len(items)} items from {endpoint} in {pages} page(s)")
+
+    result: Dict[str, Any] = {
+        "data": items,
+        "summary": {
+            "total_items": len(items),
+            "pages_fetched": pages,
+            "has_more": has_more,
+        }
+    }
+    if has_more:
+        result["paging"] = last_page["paging"]
+    if error is not None:
+        result["error"] = error
+    return result
@@ -1,24 +1,54 @@
 """Authentication with Meta Ads API via pipeboard.co."""
 
+import asyncio
 import os
 import json
 import time
+import httpx
 import requests
 from pathlib import Path
 import platform
+from datetime import timezone
 from typing import Optional, Dict, Any
+from .singleflight import SingleFlight
 from .utils import logger
 
-# Enable more detailed logging
-import logging
-logger.setLevel(logging.DEBUG)
-
 # Base URL for pipeboard API
 PIPEBOARD_API_BASE = "https://pipeboard.co/api"
 
+# Timeout for token requests to Pipeboard, in seconds
+PIPEBOARD_TOKEN_TIMEOUT = 10.0
+
+# Tokens count as expired this many seconds early, so a request never starts with a token about to lapse
+TOKEN_EXPIRY_SKEW = float(os.environ.get("META_ADS_TOKEN_EXPIRY_SKEW", "60"))
+
 # Debug message about API base URL
 logger.info(f"Pipeboard API base URL: {PIPEBOARD_API_BASE}")
 
+def parse_expires_at(expires_at: Optional[str]) -> Optional[float]:
+    """
+    Parse an ISO 8601 expiration time into a Unix timestamp.
+    
+    Accepts any ISO 8601 form Pipeboard may send ("Z", "+05:30", "-08:00",
+    fractional seconds of any precision); times without an offset are UTC.
+    
+    Returns:
+        Unix timestamp, or None if expires_at is empty or cannot be parsed
+    """
+    if not expires_at:
+        return None
+    # Imported here to keep dateutil off the startup path when no Pipeboard token is used
+    from dateutil.parser import isoparse
+    try:
+        expires_datetime = isoparse(expires_at)
+    except (ValueError, OverflowError, TypeError) as e:
+        logger.error(f"Invalid expires_at value '{expires_at}': {e}")
+        return None
+    if expires_datetime.tzinfo is None:
+        expires_datetime = expires_datetime.replace(tzinfo=timezone.utc)
+    return expires_datetime.timestamp()
+
+
 class TokenInfo:
     """Stores token information including expiration"""
     def __init__(self, access_token: str, expires_at: str = None, token_type: str = None):
@@ -28,62 +58,31 @@ class TokenInfo:
         self.created_at = int(time.time())
         logger.debug(f"TokenInfo created. Expires at: {expires_at if expires_at else 'Not specified'}")
     
-    def is_expired(self) -> bool:
-        """Check if the token is expired"""
-        if not self.expires_at:
-            logger.debug("No expiration date set for token, assuming not expired")
-            return False  # If no expiration is set, assume it's not expired
+    @property
+    def expires_at(self) -> Optional[str]:
+        return self._expires_at
+    
+    @expires_at.setter
+    def expires_at(self, value: Optional[str]) -> None:
+        # Parsed once here so the per-request expiry check is a single comparison
+        self._expires_at = value
+        self._expires_at_ts = parse_expires_at(value)
+    
+    def expiry_time(self) -> Optional[float]:
+        """Get the expiration time as a Unix timestamp, or None if unknown"""
+        return self._expires_at_ts
+    
+    def is_expired(self, skew: float = None) -> bool:
+        """
+        Check if the token is expired
         
-        # Parse ISO 8601 date format to timestamp
-        try:
-            # Convert the expires_at string to a timestamp
-            # Format is like "2023-12-31T23:59:59.999Z" or "2023-12-31T23:59:59.999+00:00"
-            from datetime import datetime
-            
-            # Remove the Z suffix if present and handle +00:00 format
-            expires_at_str = self.expires_at
-            if expires_at_str.endswith('Z'):
-                expires_at_str = expires_at_str[:-1]  # Remove Z
-                
-            # Handle microseconds if present
-            if '.' in expires_at_str:
-                datetime_format = "%Y-%m-%dT%H:%M:%S.%f"
-            else:
-                datetime_format = "%Y-%m-%dT%H:%M:%S"
-                
-            # Handle timezone offset
-            timezone_offset = "+00:00"
-            if "+" in expires_at_str:
-                expires_at_str, timezone_offset = expires_at_str.split("+")
-                timezone_offset = "+" + timezone_offset
-            
-            # Parse the datetime without timezone info
-            expires_datetime = datetime.strptime(expires_at_str, datetime_format)
-            
-            # Convert to timestamp (assume UTC)
-            expires_timestamp = expires_datetime.timestamp()
-            current_time = time.time()
-            
-            # Check if token is expired and log result
-            is_expired = current_time > expires_timestamp
-            time_diff = expires_timestamp - current_time
-            if is_expired:
-                logger.debug(f"Token is expired! Current time: {datetime.fromtimestamp(current_time)}, " 
-                             f"Expires at: {datetime.fromtimestamp(expires_timestamp)}, "
-                             f"Expired {abs(time_diff):.0f} seconds ago")
-            else:
-                logger.debug(f"Token is still valid. Expires at: {datetime.fromtimestamp(expires_timestamp)}, "
-                             f"Time remaining: {time_diff:.0f} seconds")
-            
-            return is_expired
-        except Exception as e:
-            logger.error(f"Error parsing expiration date: {e}")
-            # Log the actual value to help diagnose format issues
-            logger.error(f"Invalid expires_at value: '{self.expires_at}'")
-            # Log detailed error information
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return False  # If we can't parse the date, assume it's not expired
+        Args:
+            skew: Seconds before the expiration time at which the token already
+                counts as expired (default: META_ADS_TOKEN_EXPIRY_SKEW)
+        """
+        if self._expires_at_ts is None:
+            return False  # If no expiration is set or it can't be parsed, assume it's not expired
+        return time.time() >= self._expires_at_ts - (TOKEN_EXPIRY_SKEW if skew is None else skew)
     
     def serialize(self) -> Dict[str, Any]:
         """Convert to a dictionary for storage"""
@@ -120,6 +119,8 @@ class PipeboardAuthManager:
         else:
             logger.info("Pipeboard authentication not enabled. Set PIPEBOARD_API_TOKEN environment variable to enable.")
         self.token_info = None
+        # Concurrent async callers share one refresh request
+        self._refresh_flight = SingleFlight(enabled=True)
         self._load_cached_token()
     
     def _get_token_cache_path(self) -> Path:
@@ -303,79 +304,131 @@ class PipeboardAuthManager:
             
             # Add timeout for better error messages
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                response = requests.get(url, headers=headers, timeout=PIPEBOARD_TOKEN_TIMEOUT)
             except requests.exceptions.Timeout:
                 logger.error("TOKEN VALIDATION FAILED: Timeout while connecting to Pipeboard API")
-                logger.error(f"Could not connect to {PIPEBOARD_API_BASE} within 10 seconds")
+                logger.error(f"Could not connect to {PIPEBOARD_API_BASE} within {PIPEBOARD_TOKEN_TIMEOUT:.0f} seconds")
                 return None
             except requests.exceptions.ConnectionError:
                 logger.error("TOKEN VALIDATION FAILED: Connection error with Pipeboard API")
                 logger.error(f"Could not connect to {PIPEBOARD_API_BASE} - check if service is running")
                 return None
                 
-            logger.info(f"Token request response status: {response.status_code}")
-            
-            # Better error handling with response content
-            if response.status_code != 200:
-                logger.error(f"TOKEN VALIDATION FAILED: HTTP error {response.status_code}")
-                error_text = response.text if response.text else "No response content"
-                logger.error(f"Response content: {error_text}")
-                
-                # Add more specific error messages for common status codes
-                if response.status_code == 401:
-                    logger.error("Authentication failed: Invalid Pipeboard API token")
-                elif response.status_code == 404:
-                    logger.error("Endpoint not found: Check if Pipeboard API service is running correctly")
-                elif response.status_code == 400:
-                    logger.error("Bad request: The request to Pipeboard API was malformed")
-                    
-                response.raise_for_status()
-                
-            try:
-                data = response.json()
-                logger.info(f"Received token response with keys: {', '.join(data.keys())}")
-            except json.JSONDecodeError:
-                logger.error("TOKEN VALIDATION FAILED: Invalid JSON response from Pipeboard API")
-                logger.error(f"Response content (first 100 chars): {response.text[:100]}")
-                return None
+            return self._token_from_response(response)
+        except requests.RequestException as e:
+            logger.error(f"Error getting access token: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error getting access token: {e}")
+            return None
+        
+    def _token_from_response(self, response) -> Optional[str]:
+        """
+        Store the token from a Pipeboard token response.
+        
+        Works with both requests and httpx responses.
+        
+        Returns:
+            Access token if the response carried one, None otherwise
+        """
+        logger.info(f"Token request response status: {response.status_code}")
+        
+        # Better error handling with response content
+        if response.status_code != 200:
+            logger.error(f"TOKEN VALIDATION FAILED: HTTP error {response.status_code}")
+            error_text = response.text if response.text else "No response content"
+            logger.error(f"Response content: {error_text}")
             
-            # Validate response data
-            if "access_token" not in data:
-                logger.error("TOKEN VALIDATION FAILED: No access_token in Pipeboard API response")
-                logger.error(f"Response keys: {', '.join(data.keys())}")
-                if "error" in data:
-                    logger.error(f"Error details: {data['error']}")
-                else:
-                    logger.error("No error information available in response")
-                return None
-                
-            # Create new token info
-            self.token_info = TokenInfo(
-                access_token=data.get("access_token"),
-                expires_at=data.get("expires_at"),
-                token_type=data.get("token_type", "bearer")
-            )
+            # Add more specific error messages for common status codes
+            if response.status_code == 401:
+                logger.error("Authentication failed: Invalid Pipeboard API token. Check your PIPEBOARD_API_TOKEN.")
+            elif response.status_code == 404:
+                logger.error("No token available: You might need to complete authorization first")
+            elif response.status_code == 400:
+                logger.error("Bad request: The request to Pipeboard API was malformed")
+            return None
             
-            # Save to cache
-            self._save_token_to_cache()
+        try:
+            data = response.json()
+            logger.info(f"Received token response with keys: {', '.join(data.keys())}")
+        except ValueError:
+            logger.error("TOKEN VALIDATION FAILED: Invalid JSON response from Pipeboard API")
+            logger.error(f"Response content (first 100 chars): {response.text[:100]}")
+            return None
+        
+        # Validate response data
+        if "access_token" not in data:
+            logger.error("TOKEN VALIDATION FAILED: No access_token in Pipeboard API response")
+            logger.error(f"Response keys: {', '.join(data.keys())}")
+            if "error" in data:
+                logger.error(f"Error details: {data['error']}")
+            else:
+                logger.error("No error information available in response")
+            return None
             
-            masked_token = self.token_info.access_token[:10] + "..." + self.token_info.access_token[-5:] if self.token_info.access_token else "None"
-            logger.info(f"Successfully retrieved access token: {masked_token}")
-            return self.token_info.access_token
-        except requests.RequestException as e:
-            status_code = e.response.status_code if hasattr(e, 'response') and e.response else None
-            response_text = e.response.text if hasattr(e, 'response') and e.response else "No response"
+        # Create new token info
+        self.token_info = TokenInfo(
+            access_token=data.get("access_token"),
+            expires_at=data.get("expires_at"),
+            token_type=data.get("token_type", "bearer")
+        )
+        
+        # Save to cache
+        self._save_token_to_cache()
+        
+        masked_token = self.token_info.access_token[:10] + "..." + self.token_info.access_token[-5:] if self.token_info.access_token else "None"
+        logger.info(f"Successfully retrieved access token: {masked_token}")
+        return self.token_info.access_token
+    
+    async def get_access_token_async(self, force_refresh: bool = False) -> Optional[str]:
+        """
+        Get the current access token without blocking the event loop
+        
+        A valid cached token is returned without any I/O. Otherwise concurrent
+        callers share a single refresh request, made with the pooled HTTP client.
+        
+        Args:
+            force_refresh: Force token refresh even if cached token exists
             
-            if status_code == 401:
-                logger.error(f"Unauthorized: Check your PIPEBOARD_API_TOKEN. Response: {response_text}")
-            elif status_code == 404:
-                logger.error(f"No token available: You might need to complete authorization first. Response: {response_text}")
-                # Return None so caller can handle the auth flow
-                return None
-            else:
-                logger.error(f"Error getting access token (status {status_code}): {e}")
-                logger.error(f"Response content: {response_text}")
+        Returns:
+            Access token if available, None otherwise
+        """
+        if not self.api_token:
+            logger.error("TOKEN VALIDATION FAILED: No Pipeboard API token configured")
+            logger.error("Please set PIPEBOARD_API_TOKEN environment variable")
             return None
+        
+        token_info = self.token_info
+        if not force_refresh and token_info and not token_info.is_expired():
+            return token_info.access_token
+        
+        return await self._refresh_flight.do(("pipeboard_token", force_refresh), self._refresh_token_async)
+    
+    async def _refresh_token_async(self) -> Optional[str]:
+        """Request a new token from Pipeboard (called by one caller at a time through the single-flight group)"""
+        from .http_client import get_http_client
+        
+        logger.info("Getting new token from Pipeboard")
+        url = f"{PIPEBOARD_API_BASE}/meta/token"
+        try:
+            response = await get_http_client().get(
+                url,
+                params={"api_token": self.api_token},
+                headers={"Content-Type": "application/json"},
+                timeout=PIPEBOARD_TOKEN_TIMEOUT
+            )
+        except httpx.TimeoutException:
+            logger.error("TOKEN VALIDATION FAILED: Timeout while connecting to Pipeboard API")
+            logger.error(f"Could not connect to {PIPEBOARD_API_BASE} within {PIPEBOARD_TOKEN_TIMEOUT:.0f} seconds")
+            return None
+        except httpx.HTTPError as e:
+            logger.error("TOKEN VALIDATION FAILED: Connection error with Pipeboard API")
+            logger.error(f"Could not connect to {PIPEBOARD_API_BASE} - check if service is running ({e})")
+            return None
+        
+        try:
+            # Writes the cache file, so keep it off the event loop
+            return await asyncio.to_thread(self._token_from_response, response)
         except Exception as e:
             logger.error(f"Unexpected error getting access token: {e}")
             return None
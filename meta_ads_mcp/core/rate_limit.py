@@ -0,0 +1,315 @@
+"""Rate-limit tracking and adaptive throttling for Meta Graph API requests.
+
+Meta reports how close an app and an ad account are to their rate limits through
+the x-app-usage, x-ad-account-usage and x-business-use-case-usage response headers.
+The throttler here reads those headers after every response and slows down (or
+pauses) further requests before Meta starts rejecting them.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Optional
+
+from .utils import logger
+
+
+# Throttling configuration (overridable through environment variables)
+RATE_LIMIT_ENABLED = os.environ.get("META_ADS_RATE_LIMIT_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+# Requests per second once usage reaches the slowdown threshold; below it requests are not limited
+RATE_LIMIT_BASE_RATE = float(os.environ.get("META_ADS_RATE_LIMIT_BASE_RATE", "20"))
+RATE_LIMIT_BURST = float(os.environ.get("META_ADS_RATE_LIMIT_BURST", "40"))
+RATE_LIMIT_SLOWDOWN_THRESHOLD = float(os.environ.get("META_ADS_RATE_LIMIT_SLOWDOWN_THRESHOLD", "75"))  # percent
+RATE_LIMIT_PAUSE_THRESHOLD = float(os.environ.get("META_ADS_RATE_LIMIT_PAUSE_THRESHOLD", "95"))  # percent
+RATE_LIMIT_MIN_FACTOR = 0.05
+
+APP_KEY = "app"
+# Business use case usage reported on requests not tied to an ad account in the URL
+BUSINESS_KEY = "business"
+AD_ACCOUNT_PATTERN = re.compile(r"(act_\d+)")
+
+
+def _parse_header_json(value: Optional[str]) -> Any:
+    """Parse a JSON usage header, returning None if it is missing or malformed"""
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        logger.debug(f"Could not parse usage header: {value[:100]}")
+        return None
+
+
+def get_rate_limit_key(endpoint: str) -> Optional[str]:
+    """Get the ad account key (act_XXX) an endpoint belongs to, if any"""
+    match = AD_ACCOUNT_PATTERN.search(endpoint or "")
+    return match.group(1) if match else None
+
+
+class TokenBucket:
+    """Token bucket whose refill rate is adjusted from reported utilization
+
+    Tokens are only required once Meta reports usage at or above the slowdown
+    threshold; until then requests pass straight through.
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT_BASE_RATE, capacity: float = RATE_LIMIT_BURST):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.utilization = 0.0
+        self.usage: Dict[str, Any] = {}
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    @property
+    def throttled(self) -> bool:
+        """Whether the reported utilization is high enough to limit the request rate"""
+        return self.utilization >= RATE_LIMIT_SLOWDOWN_THRESHOLD
+
+    def try_consume(self) -> float:
+        """
+        Try to take a token.
+
+        Returns:
+            0 if a token was taken, otherwise the number of seconds to wait before retrying
+        """
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+
+        self._refill(now)
+        if not self.throttled:
+            return 0.0
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> float:
+        """Wait until a token is available. Returns the total time spent waiting."""
+        waited = 0.0
+        while True:
+            delay = self.try_consume()
+            if delay <= 0:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def update_utilization(self, utilization: float, regain_seconds: float = 0.0) -> None:
+        """
+        Adjust the refill rate for the latest utilization reported by Meta.
+
+        Below the slowdown threshold requests are not limited. From the slowdown
+        threshold the rate starts at the base rate and drops linearly until the
+        pause threshold. At or above the pause threshold,
+        or when Meta reports a time to regain access, requests are held back.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self.utilization = utilization
+
+        if utilization < RATE_LIMIT_SLOWDOWN_THRESHOLD:
+            factor = 1.0
+        elif utilization >= RATE_LIMIT_PAUSE_THRESHOLD:
+            factor = RATE_LIMIT_MIN_FACTOR
+        else:
+            span = RATE_LIMIT_PAUSE_THRESHOLD - RATE_LIMIT_SLOWDOWN_THRESHOLD
+            factor = 1.0 - (utilization - RATE_LIMIT_SLOWDOWN_THRESHOLD) / span
+            factor = max(RATE_LIMIT_MIN_FACTOR, factor)
+        self.rate = self.base_rate * factor
+
+        if regain_seconds > 0:
+            self.blocked_until = max(self.blocked_until, now + regain_seconds)
+            self.tokens = 0
+
+    def block_for(self, seconds: float) -> None:
+        """Hold back all requests through this bucket for the given number of seconds"""
+        now = time.monotonic()
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0
+
+    def status(self) -> Dict[str, Any]:
+        """Get a snapshot of the bucket state"""
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "utilization_pct": round(self.utilization, 2),
+            # None while usage is below the slowdown threshold and requests are not limited
+            "current_rate_per_second": round(self.rate, 3) if self.throttled else None,
+            "available_tokens": round(self.tokens, 2),
+            "blocked_for_seconds": round(max(0.0, self.blocked_until - now), 1),
+            "usage": self.usage,
+        }
+
+
+class RateLimiter:
+    """Tracks Meta usage headers per app and per ad account and throttles requests"""
+
+    def __init__(self, enabled: bool = RATE_LIMIT_ENABLED):
+        self.enabled = enabled
+        self.buckets: Dict[str, TokenBucket] = {}
+        # Account buckets of HTTP clients using their own tokens, by tenant (see tenants.py)
+        self.tenant_buckets: Dict[str, Dict[str, TokenBucket]] = {}
+        # Latest x-business-use-case-usage by tenant (None for the server's own token), then business ID
+        self.business_use_cases: Dict[Optional[str], Dict[str, Any]] = {}
+
+    def _bucket(self, key: str, tenant: Optional[str] = None) -> TokenBucket:
+        buckets = self.buckets if tenant is None or key == APP_KEY else self.tenant_buckets.setdefault(tenant, {})
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket()
+            buckets[key] = bucket
+        return bucket
+
+    def forget(self, tenant: str) -> None:
+        """Drop the account buckets and business use case usage of a tenant"""
+        self.tenant_buckets.pop(tenant, None)
+        self.business_use_cases.pop(tenant, None)
+
+    async def acquire(self, endpoint: str, tenant: Optional[str] = None) -> float:
+        """
+        Wait for permission to send a request to the given endpoint.
+
+        The app bucket is shared, since Meta counts app usage across all tokens.
+        Account buckets, and the business bucket used for requests without an
+        ad account in the URL, are kept per tenant, so one client's throttled
+        accounts or business never delay another client's requests.
+
+        Args:
+            endpoint: API endpoint path (without base URL)
+            tenant: Tenant identity of the request, or None for the server's own token
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        waited = await self._bucket(APP_KEY).acquire()
+        account_key = get_rate_limit_key(endpoint)
+        if account_key:
+            waited += await self._bucket(account_key, tenant).acquire()
+        else:
+            buckets = self.buckets if tenant is None else self.tenant_buckets.get(tenant, {})
+            if BUSINESS_KEY in buckets:
+                waited += await buckets[BUSINESS_KEY].acquire()
+
+        if waited > 0:
+            logger.info(f"Throttled request to {endpoint} for {waited:.2f}s to stay under Meta rate limits")
+        return waited
+
+    def record_response(self, endpoint: str, headers, tenant: Optional[str] = None) -> None:
+        """
+        Update utilization from the usage headers of a Graph API response.
+
+        Args:
+            endpoint: API endpoint path the response belongs to
+            headers: Response headers (case-insensitive mapping)
+            tenant: Tenant identity of the request, or None for the server's own token
+        """
+        if not self.enabled or headers is None:
+            return
+
+        app_usage = _parse_header_json(headers.get("x-app-usage"))
+        if isinstance(app_usage, dict):
+            bucket = self._bucket(APP_KEY)
+            bucket.usage = app_usage
+            utilization = max(
+                float(app_usage.get("call_count", 0) or 0),
+                float(app_usage.get("total_time", 0) or 0),
+                float(app_usage.get("total_cputime", 0) or 0),
+            )
+            bucket.update_utilization(utilization)
+
+        account_key = get_rate_limit_key(endpoint)
+        account_utilization = None
+        account_regain = 0.0
+        account_usage: Dict[str, Any] = {}
+
+        ad_account_usage = _parse_header_json(headers.get("x-ad-account-usage"))
+        if isinstance(ad_account_usage, dict):
+            account_usage["ad_account"] = ad_account_usage
+            account_utilization = float(ad_account_usage.get("acc_id_util_pct", 0) or 0)
+            # reset_time_duration only matters once the account is actually at its limit
+            if account_utilization >= RATE_LIMIT_PAUSE_THRESHOLD:
+                account_regain = float(ad_account_usage.get("reset_time_duration", 0) or 0)
+
+        buc_usage = _parse_header_json(headers.get("x-business-use-case-usage"))
+        if isinstance(buc_usage, dict):
+            for business_id, entries in buc_usage.items():
+                self.business_use_cases.setdefault(tenant, {})[business_id] = entries
+                for entry in entries if isinstance(entries, list) else []:
+                    utilization = max(
+                        float(entry.get("call_count", 0) or 0),
+                        float(entry.get("total_time", 0) or 0),
+                        float(entry.get("total_cputime", 0) or 0),
+                    )
+                    # estimated_time_to_regain_access is reported in minutes
+                    regain = float(entry.get("estimated_time_to_regain_access", 0) or 0) * 60
+                    account_utilization = max(account_utilization or 0.0, utilization)
+                    account_regain = max(account_regain, regain)
+            account_usage["business_use_case"] = buc_usage
+
+        if account_utilization is not None:
+            if account_key:
+                bucket = self._bucket(account_key, tenant)
+                bucket.usage = account_usage
+                bucket.update_utilization(account_utilization, account_regain)
+            else:
+                # Usage not tied to an account in the URL belongs to the caller's business,
+                # never to the app bucket every tenant shares
+                bucket = self._bucket(BUSINESS_KEY, tenant)
+                bucket.usage = account_usage
+                bucket.update_utilization(account_utilization, account_regain)
+            if account_utilization >= RATE_LIMIT_SLOWDOWN_THRESHOLD:
+                logger.warning(
+                    f"Meta usage for {account_key or 'business'} at {account_utilization:.0f}%; "
+                    f"throttling to {bucket.rate:.2f} req/s"
+                )
+
+    def get_status(self, account_id: Optional[str] = None, tenant: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get current utilization and throttling state.
+
+        Args:
+            account_id: Optional ad account ID to limit the output to
+            tenant: Tenant whose account buckets to report, or None for the server's own token
+
+        Returns:
+            Dictionary with app-level, per-account and business use case usage
+        """
+        buckets = self.buckets if tenant is None else self.tenant_buckets.get(tenant, {})
+        if account_id:
+            key = account_id if account_id.startswith("act_") else f"act_{account_id}"
+            accounts = {key: buckets[key].status()} if key in buckets else {}
+        else:
+            accounts = {key: bucket.status() for key, bucket in buckets.items() if key not in (APP_KEY, BUSINESS_KEY)}
+
+        status = {
+            "enabled": self.enabled,
+            "app": self._bucket(APP_KEY).status(),
+            "accounts": accounts,
+            # Only the caller's own businesses
+            "business_use_cases": self.business_use_cases.get(tenant, {}),
+            "thresholds": {
+                "slowdown_pct": RATE_LIMIT_SLOWDOWN_THRESHOLD,
+                "pause_pct": RATE_LIMIT_PAUSE_THRESHOLD,
+            },
+        }
+        if BUSINESS_KEY in buckets:
+            status["business"] = buckets[BUSINESS_KEY].status()
+        return status
+
+
+# Global instance for easy access
+rate_limiter = RateLimiter()
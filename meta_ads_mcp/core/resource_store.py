@@ -0,0 +1,223 @@
+"""Bounded store for image resources served through meta-ads://images/{resource_id}.
+
+Resource bytes (and their base64 encoding, computed once per read burst) are
+kept in memory up to a byte budget. Least recently used resources are spilled
+to files in a per-process temporary directory, and dropped once that spill
+budget is exhausted too, so long-lived HTTP deployments stay bounded.
+"""
+
+import atexit
+import base64
+import os
+import pathlib
+import shutil
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .utils import logger
+
+
+# Resource store configuration (overridable through environment variables)
+RESOURCE_MEMORY_BYTES = int(os.environ.get("META_ADS_RESOURCE_MEMORY_BYTES", str(64 * 1024 * 1024)))
+RESOURCE_DISK_BYTES = int(os.environ.get("META_ADS_RESOURCE_DISK_BYTES", str(256 * 1024 * 1024)))
+RESOURCE_PAGE_SIZE = int(os.environ.get("META_ADS_RESOURCE_PAGE_SIZE", "100"))
+
+
+class ResourceEntry:
+    """One stored resource, resident in memory, spilled to a file, or both"""
+
+    __slots__ = ("resource_id", "name", "mime_type", "size", "seq", "data", "encoded", "path")
+
+    def __init__(self, resource_id: str, name: str, mime_type: str, data: bytes, seq: int):
+        self.resource_id = resource_id
+        self.name = name
+        self.mime_type = mime_type
+        self.size = len(data)
+        # Insertion order, used as the stable list_resources cursor
+        self.seq = seq
+        self.data: Optional[bytes] = data
+        self.encoded: Optional[str] = None
+        self.path: Optional[pathlib.Path] = None
+
+    @property
+    def memory_bytes(self) -> int:
+        return (len(self.data) if self.data is not None else 0) + (len(self.encoded) if self.encoded is not None else 0)
+
+
+class ResourceStore:
+    """LRU resource store with a memory budget and spill-to-disk overflow"""
+
+    def __init__(
+        self,
+        memory_bytes: int = RESOURCE_MEMORY_BYTES,
+        disk_bytes: int = RESOURCE_DISK_BYTES,
+        spill_dir: Optional[pathlib.Path] = None,
+    ):
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.spill_dir = spill_dir
+        # Least recently used first
+        self.entries: "OrderedDict[str, ResourceEntry]" = OrderedDict()
+        self.memory_used = 0
+        self.disk_used = 0
+        self._seq = 0
+        self.spills = 0
+        self.evictions = 0
+
+    def __contains__(self, resource_id: str) -> bool:
+        return resource_id in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def put(self, resource_id: str, data: bytes, name: str, mime_type: str = "image/jpeg") -> None:
+        """Store a resource, replacing any previous one with the same ID"""
+        self.remove(resource_id)
+        self._seq += 1
+        entry = ResourceEntry(resource_id, name, mime_type, data, self._seq)
+        self.entries[resource_id] = entry
+        self.memory_used += entry.memory_bytes
+        self._enforce_budgets()
+
+    def get_base64(self, resource_id: str) -> Optional[Dict[str, str]]:
+        """
+        Get a resource as base64 data.
+
+        The encoding is cached with the entry, so repeated reads of a resource
+        only pay for it once while the resource stays in memory.
+
+        Returns:
+            Dictionary with data and mimeType, or None if the resource is unknown
+        """
+        entry = self.entries.get(resource_id)
+        if entry is None:
+            return None
+        self.entries.move_to_end(resource_id)
+
+        if entry.encoded is None:
+            data = entry.data if entry.data is not None else self._read_spilled(entry)
+            if data is None:
+                return None
+            before = entry.memory_bytes
+            entry.encoded = base64.b64encode(data).decode("ascii")
+            # Keep the encoding rather than the raw bytes; the spill file has the bytes if needed again
+            if entry.path is not None:
+                entry.data = None
+            self.memory_used += entry.memory_bytes - before
+            self._enforce_budgets(keep=resource_id)
+
+        return {"data": entry.encoded, "mimeType": entry.mime_type}
+
+    def list(self, cursor: Optional[str] = None, limit: int = RESOURCE_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        List resources in the order they were added.
+
+        Args:
+            cursor: next_cursor from the previous page
+            limit: Maximum number of resources per page
+
+        Returns:
+            Dictionary with the resources and, when more remain, next_cursor
+        """
+        after = int(cursor) if cursor and cursor.isdigit() else 0
+        ordered = sorted((entry for entry in self.entries.values() if entry.seq > after), key=lambda entry: entry.seq)
+        page = ordered[:max(1, limit)]
+        result: Dict[str, Any] = {
+            "resources": [
+                {
+                    "uri": f"meta-ads://images/{entry.resource_id}",
+                    "mimeType": entry.mime_type,
+                    "name": entry.name,
+                }
+                for entry in page
+            ]
+        }
+        if len(ordered) > len(page):
+            result["next_cursor"] = str(page[-1].seq)
+        return result
+
+    def remove(self, resource_id: str) -> bool:
+        """Drop a resource from memory and disk"""
+        entry = self.entries.pop(resource_id, None)
+        if entry is None:
+            return False
+        self.memory_used -= entry.memory_bytes
+        self._drop_spill_file(entry)
+        return True
+
+    def clear(self) -> None:
+        """Drop all resources"""
+        for resource_id in list(self.entries):
+            self.remove(resource_id)
+
+    def _enforce_budgets(self, keep: Optional[str] = None) -> None:
+        """Spill least recently used resources past the memory budget, then drop them past the disk budget"""
+        for entry in list(self.entries.values()):
+            if self.memory_used <= self.memory_bytes:
+                break
+            if entry.resource_id == keep or entry.memory_bytes == 0:
+                continue
+            self._spill(entry)
+
+        for entry in list(self.entries.values()):
+            if self.disk_used <= self.disk_bytes:
+                break
+            if entry.path is None or entry.resource_id == keep:
+                continue
+            self.remove(entry.resource_id)
+            self.evictions += 1
+
+    def _spill(self, entry: ResourceEntry) -> None:
+        """Move an entry's bytes out of memory"""
+        if entry.path is None and entry.data is not None:
+            if self.spill_dir is None:
+                self.spill_dir = pathlib.Path(tempfile.mkdtemp(prefix="meta-ads-resources-"))
+                atexit.register(shutil.rmtree, self.spill_dir, True)
+            # Resource IDs come from callers, so file names only use the internal sequence number
+            path = self.spill_dir / f"{entry.seq}.bin"
+            try:
+                path.write_bytes(entry.data)
+            except OSError as e:
+                # No room to spill: drop the resource rather than exceed the memory budget
+                logger.warning(f"Could not spill resource {entry.resource_id} to disk: {e}")
+                self.remove(entry.resource_id)
+                self.evictions += 1
+                return
+            entry.path = path
+            self.disk_used += entry.size
+            self.spills += 1
+        self.memory_used -= entry.memory_bytes
+        entry.data = None
+        entry.encoded = None
+
+    def _read_spilled(self, entry: ResourceEntry) -> Optional[bytes]:
+        try:
+            return entry.path.read_bytes() if entry.path is not None else None
+        except OSError as e:
+            logger.warning(f"Could not read spilled resource {entry.resource_id}: {e}")
+            return None
+
+    def _drop_spill_file(self, entry: ResourceEntry) -> None:
+        if entry.path is None:
+            return
+        try:
+            entry.path.unlink()
+        except OSError:
+            pass
+        self.disk_used -= entry.size
+        entry.path = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        return {
+            "resources": len(self.entries),
+            "memory_bytes": self.memory_used,
+            "disk_bytes": self.disk_used,
+            "spills": self.spills,
+            "evictions": self.evictions,
+        }
+
+
+# Global instance for easy access
+resource_store = ResourceStore()
@@ -2,28 +2,31 @@
 
 import json
 from typing import Dict, Any
-import base64
-from .utils import ad_creative_images
+from .resource_store import resource_store
 
 
 async def list_resources() -> Dict[str, Any]:
     """
-    List all available resources (like ad creative images)
+    List available resources (like ad creative images)
     
     Returns:
-        Dictionary with resources list
+        Dictionary with the first page of resources and, when more remain,
+        next_cursor for meta-ads://resources/page/{cursor}
     """
-    resources = []
-    
-    # Add all ad creative images as resources
-    for resource_id, image_info in ad_creative_images.items():
-        resources.append({
-            "uri": f"meta-ads://images/{resource_id}",
-            "mimeType": image_info["mime_type"],
-            "name": image_info["name"]
-        })
+    return resource_store.list()
+
+
+async def list_resources_page(cursor: str) -> Dict[str, Any]:
+    """
+    List the page of resources that follows a cursor
     
-    return {"resources": resources}
+    Args:
+        cursor: next_cursor from the previous page
+        
+    Returns:
+        Dictionary with resources list and, when more remain, next_cursor
+    """
+    return resource_store.list(cursor)
 
 
 async def get_resource(resource_id: str) -> Dict[str, Any]:
@@ -36,12 +39,9 @@ async def get_resource(resource_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary with resource data
     """
-    if resource_id in ad_creative_images:
-        image_info = ad_creative_images[resource_id]
-        return {
-            "data": base64.b64encode(image_info["data"]).decode("utf-8"),
-            "mimeType": image_info["mime_type"]
-        }
+    resource = resource_store.get_base64(resource_id)
+    if resource is not None:
+        return resource
     
     # Resource not found
-    return json.dumps({"error": f"Resource not found: {resource_id}"}, indent=2) 
\ No newline at end of file
+    return json.dumps({"error": f"Resource not found: {resource_id}"}, indent=2) 
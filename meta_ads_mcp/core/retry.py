@@ -0,0 +1,165 @@
+"""Retry policy with exponential backoff and jitter for transient Graph API errors."""
+
+import os
+import random
+from typing import Any, Dict, Optional
+
+from .utils import logger
+
+
+# Retry configuration (overridable through environment variables)
+RETRY_MAX_ATTEMPTS = int(os.environ.get("META_ADS_RETRY_MAX_ATTEMPTS", "3"))
+RETRY_BACKOFF_BASE = float(os.environ.get("META_ADS_RETRY_BACKOFF_BASE", "0.5"))  # seconds
+RETRY_BACKOFF_MAX = float(os.environ.get("META_ADS_RETRY_BACKOFF_MAX", "30"))  # seconds
+RETRY_JITTER = float(os.environ.get("META_ADS_RETRY_JITTER", "0.5"))  # fraction of the delay randomized
+RETRY_WRITES = os.environ.get("META_ADS_RETRY_WRITES", "").lower() in ("1", "true", "yes", "on")
+
+# Graph API error codes that indicate a temporary condition
+# 1: unknown error, 2: service unavailable, 17: user request limit,
+# 32: page request limit, 613: calls exceeded rate limit
+TRANSIENT_ERROR_CODES = {1, 2, 17, 32, 613}
+
+IDEMPOTENT_METHODS = {"GET"}
+
+
+def _get_graph_error(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the Graph error object from a make_api_request error result, if present"""
+    details = result.get("error", {}).get("details")
+    if isinstance(details, dict) and isinstance(details.get("error"), dict):
+        return details["error"]
+    return {}
+
+
+def _get_status_code(result: Dict[str, Any]) -> Optional[int]:
+    """Get the HTTP status code from a make_api_request error result, if present"""
+    full_response = result.get("error", {}).get("full_response")
+    if isinstance(full_response, dict):
+        return full_response.get("status_code")
+    return None
+
+
+def is_transient_error(result: Any) -> bool:
+    """
+    Check whether a make_api_request result is an error worth retrying.
+
+    Args:
+        result: Value returned by make_api_request
+
+    Returns:
+        True for 5xx/429 responses, network timeouts and transient Graph error codes
+    """
+    if not isinstance(result, dict) or not isinstance(result.get("error"), dict):
+        return False
+
+    error = result["error"]
+    if error.get("is_transient"):
+        return True
+
+    graph_error = _get_graph_error(result)
+    if graph_error.get("is_transient") or graph_error.get("code") in TRANSIENT_ERROR_CODES:
+        return True
+
+    status_code = _get_status_code(result)
+    return status_code is not None and (status_code >= 500 or status_code == 429)
+
+
+def get_retry_after(result: Dict[str, Any]) -> Optional[float]:
+    """
+    Get the server-requested wait time in seconds from an error result.
+
+    Honors the Retry-After header and the estimated_time_to_regain_access
+    (in minutes) reported through x-business-use-case-usage.
+    """
+    full_response = result.get("error", {}).get("full_response")
+    headers = full_response.get("headers", {}) if isinstance(full_response, dict) else {}
+    headers = {str(k).lower(): v for k, v in headers.items()}
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+    buc_header = headers.get("x-business-use-case-usage")
+    if buc_header:
+        from .rate_limit import _parse_header_json
+        usage = _parse_header_json(buc_header)
+        regain_minutes = 0.0
+        if isinstance(usage, dict):
+            for entries in usage.values():
+                for entry in entries if isinstance(entries, list) else []:
+                    regain_minutes = max(regain_minutes, float(entry.get("estimated_time_to_regain_access", 0) or 0))
+        if regain_minutes > 0:
+            return regain_minutes * 60
+
+    return None
+
+
+class RetryPolicy:
+    """Decides whether and when a failed Graph API request is retried"""
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        backoff_base: float = RETRY_BACKOFF_BASE,
+        backoff_max: float = RETRY_BACKOFF_MAX,
+        jitter: float = RETRY_JITTER,
+        retry_writes: bool = RETRY_WRITES,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.retry_writes = retry_writes
+
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            retry_after: Server-requested wait time in seconds, if any
+
+        Returns:
+            Seconds to wait: exponential backoff with jitter, or the server-requested wait
+        """
+        if retry_after is not None:
+            return retry_after
+
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        # Randomize part of the delay so concurrent clients don't retry in lockstep
+        return delay * (1 - self.jitter) + random.uniform(0, delay * self.jitter)
+
+    def next_delay(self, method: str, result: Any, attempt: int, allow_retry: Optional[bool] = None) -> Optional[float]:
+        """
+        Decide whether a request should be retried.
+
+        Args:
+            method: HTTP method of the request
+            result: Value returned for the failed attempt
+            attempt: Number of the attempt that just failed (1-based)
+            allow_retry: True to retry even non-idempotent requests, False to never retry,
+                         None to retry idempotent methods only (writes follow the retry_writes setting)
+
+        Returns:
+            Seconds to wait before retrying, or None if the request should not be retried
+        """
+        if allow_retry is False or attempt >= self.max_attempts:
+            return None
+        if method.upper() not in IDEMPOTENT_METHODS and not (allow_retry or self.retry_writes):
+            return None
+        if not is_transient_error(result):
+            return None
+
+        retry_after = get_retry_after(result)
+        if retry_after is not None and retry_after > self.backoff_max:
+            # Meta asked us to back off longer than we are willing to block a tool call
+            logger.warning(f"Not retrying: server requested a {retry_after:.0f}s wait (limit {self.backoff_max:.0f}s)")
+            return None
+
+        return self.compute_delay(attempt, retry_after)
+
+
+# Global instance for easy access
+retry_policy = RetryPolicy()
@@ -30,10 +30,10 @@ async def search_postal_codes(
         JSON response with postal code search results
     """
     if not country_code:
-        return json.dumps({"error": "Country code is required for postal code search"}, indent=2)
+        return {"error": "Country code is required for postal code search"}
     
     if not search_term:
-        return json.dumps({"error": "Search term is required for postal code search"}, indent=2)
+        return {"error": "Search term is required for postal code search"}
     
     endpoint = "search"
     params = {
@@ -48,13 +48,13 @@ async def search_postal_codes(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to search postal codes",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -78,7 +78,7 @@ async def search_interests(
         JSON response with interest search results
     """
     if not search_term:
-        return json.dumps({"error": "Search term is required for interest search"}, indent=2)
+        return {"error": "Search term is required for interest search"}
     
     endpoint = "search"
     params = {
@@ -90,13 +90,13 @@ async def search_interests(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to search interests",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -120,7 +120,7 @@ async def search_behaviors(
         JSON response with behavior search results
     """
     if not search_term:
-        return json.dumps({"error": "Search term is required for behavior search"}, indent=2)
+        return {"error": "Search term is required for behavior search"}
     
     endpoint = "search"
     params = {
@@ -132,13 +132,13 @@ async def search_behaviors(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to search behaviors",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -162,7 +162,7 @@ async def search_demographics(
         JSON response with demographic search results
     """
     if not search_term:
-        return json.dumps({"error": "Search term is required for demographic search"}, indent=2)
+        return {"error": "Search term is required for demographic search"}
     
     endpoint = "search"
     params = {
@@ -175,13 +175,13 @@ async def search_demographics(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to search demographics",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -214,10 +214,10 @@ async def get_audience_size_estimate(
         if "data" in accounts_data and accounts_data["data"]:
             account_id = accounts_data["data"][0]["id"]
         else:
-            return json.dumps({"error": "No account ID specified and no accounts found for user"}, indent=2)
+            return {"error": "No account ID specified and no accounts found for user"}
     
     if not targeting:
-        return json.dumps({"error": "Targeting specifications are required for audience estimation"}, indent=2)
+        return {"error": "Targeting specifications are required for audience estimation"}
     
     endpoint = f"{account_id}/delivery_estimate"
     params = {
@@ -228,13 +228,13 @@ async def get_audience_size_estimate(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get audience size estimate",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -270,20 +270,20 @@ async def get_targeting_browse_categories(
         params["type"] = "adTargetingCategory"
         params["class"] = "demographics"
     else:
-        return json.dumps({"error": "Invalid type. Use 'interests', 'behaviors', or 'demographics'"}, indent=2)
+        return {"error": "Invalid type. Use 'interests', 'behaviors', or 'demographics'"}
     
     if parent_id:
         params["parent_id"] = parent_id
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to browse targeting categories",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -314,10 +314,10 @@ async def get_targeting_suggestions(
         if "data" in accounts_data and accounts_data["data"]:
             account_id = accounts_data["data"][0]["id"]
         else:
-            return json.dumps({"error": "No account ID specified and no accounts found for user"}, indent=2)
+            return {"error": "No account ID specified and no accounts found for user"}
     
     if not targeting:
-        return json.dumps({"error": "Targeting specifications are required for suggestions"}, indent=2)
+        return {"error": "Targeting specifications are required for suggestions"}
     
     endpoint = f"{account_id}/targetingsearch"
     params = {
@@ -327,13 +327,13 @@ async def get_targeting_suggestions(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get targeting suggestions",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -364,10 +364,10 @@ async def validate_targeting_spec(
         if "data" in accounts_data and accounts_data["data"]:
             account_id = accounts_data["data"][0]["id"]
         else:
-            return json.dumps({"error": "No account ID specified and no accounts found for user"}, indent=2)
+            return {"error": "No account ID specified and no accounts found for user"}
     
     if not targeting:
-        return json.dumps({"error": "Targeting specifications are required for validation"}, indent=2)
+        return {"error": "Targeting specifications are required for validation"}
     
     endpoint = f"{account_id}/targetingvalidation"
     params = {
@@ -377,13 +377,13 @@ async def validate_targeting_spec(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to validate targeting specifications",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -413,13 +413,13 @@ async def get_country_list(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get country list",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -445,10 +445,10 @@ async def search_cities(
         JSON response with city search results
     """
     if not country_code:
-        return json.dumps({"error": "Country code is required for city search"}, indent=2)
+        return {"error": "Country code is required for city search"}
     
     if not search_term:
-        return json.dumps({"error": "Search term is required for city search"}, indent=2)
+        return {"error": "Search term is required for city search"}
     
     endpoint = "search"
     params = {
@@ -462,13 +462,13 @@ async def search_cities(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to search cities",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
@@ -497,18 +497,19 @@ async def get_language_list(
     
     try:
         data = await make_api_request(endpoint, access_token, params)
-        return json.dumps(data, indent=2)
+        return data
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get language list",
             "details": str(e),
             "params_sent": params
-        }, indent=2)
+        }
 
 
 @mcp_server.tool()
 @meta_api_tool
 async def create_targeting_spec(
+    access_token: str = None,
     geo_locations: Dict[str, Any] = None,
     age_min: int = 18,
     age_max: int = 65,
@@ -534,6 +535,7 @@ async def create_targeting_spec(
     Create a comprehensive targeting specification.
     
     Args:
+        access_token: Meta API access token (optional - will use cached token if not provided)
         geo_locations: Geographic targeting (countries, regions, cities, zip codes)
         age_min: Minimum age for targeting
         age_max: Maximum age for targeting
@@ -631,7 +633,7 @@ async def create_targeting_spec(
     if targeting_automation:
         targeting_spec["targeting_automation"] = targeting_automation
     
-    return json.dumps({
+    return {
         "targeting_spec": targeting_spec,
         "usage": "Use this targeting specification in the 'targeting' parameter when creating ad sets"
-    }, indent=2)
\ No newline at end of file
+    }
\ No newline at end of file
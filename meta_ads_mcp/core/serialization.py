@@ -0,0 +1,46 @@
+"""JSON serialization of tool results.
+
+Tools return Python objects and meta_api_tool serializes them exactly once here.
+orjson is used when installed (pip install "meta-ads-mcp[fast-json]"); the
+standard library json module is the fallback.
+"""
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+# Serialization configuration (overridable through environment variables)
+COMPACT_JSON = os.environ.get("META_ADS_COMPACT_JSON", "").lower() in ("1", "true", "yes", "on")
+USE_ORJSON = os.environ.get("META_ADS_USE_ORJSON", "true").lower() not in ("0", "false", "no", "off")
+
+
+def dumps_result(data: Any, compact: bool = COMPACT_JSON) -> str:
+    """
+    Serialize a tool result to a JSON string.
+
+    Args:
+        data: Result to serialize; values JSON can't represent are converted with str()
+        compact: Omit indentation and whitespace (smaller payloads for large responses)
+
+    Returns:
+        JSON string, indented by 2 spaces unless compact
+    """
+    if orjson is not None and USE_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option, default=str).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; the json module copes with those
+            pass
+
+    if compact:
+        return json.dumps(data, separators=(",", ":"), default=str)
+    return json.dumps(data, indent=2, default=str)
@@ -4,13 +4,12 @@ from mcp.server.fastmcp import FastMCP
 import argparse
 import os
 import sys
-import webbrowser
 import json
 from typing import Dict, Any, Optional
-from .auth import login as login_auth
-from .resources import list_resources, get_resource
-from .utils import logger
+from .resources import list_resources, list_resources_page, get_resource
+from .utils import logger, set_log_level
 from .pipeboard_auth import pipeboard_auth_manager
+from .http_client import bind_to_server_lifecycle
 import time
 
 # Initialize FastMCP server
@@ -18,8 +17,15 @@ mcp_server = FastMCP("meta-ads", use_consistent_tool_format=True)
 
 # Register resource URIs
 mcp_server.resource(uri="meta-ads://resources")(list_resources)
+mcp_server.resource(uri="meta-ads://resources/page/{cursor}")(list_resources_page)
 mcp_server.resource(uri="meta-ads://images/{resource_id}")(get_resource)
 
+# Open the pooled HTTP client on startup and close it on shutdown
+bind_to_server_lifecycle(mcp_server)
+
+# Tells --workers processes which response format to serve
+WORKER_SSE_RESPONSE_ENV = "META_ADS_WORKER_SSE_RESPONSE"
+
 
 class StreamableHTTPHandler:
     """Handles stateless Streamable HTTP requests for Meta Ads MCP"""
@@ -196,16 +202,129 @@ def login_cli():
     print("Starting Meta Ads CLI authentication flow...")
     
     # Call the common login function
+    from .auth import login as login_auth
     login_auth()
 
 
+def configure_streamable_http(host: str, port: int, sse_response: bool = False) -> bool:
+    """
+    Configure the shared server for the Streamable HTTP transport.
+    
+    Used by main() for a single process and by create_streamable_http_app()
+    in every worker process.
+    
+    Args:
+        host: Host to listen on
+        port: Port to listen on
+        sse_response: Use SSE responses instead of JSON
+        
+    Returns:
+        True if header-based HTTP authentication was set up
+    """
+    mcp_server.settings.host = host
+    mcp_server.settings.port = port
+    mcp_server.settings.stateless_http = True
+    mcp_server.settings.json_response = not sse_response
+    
+    # Import all tool modules to ensure they are registered
+    logger.info("Ensuring all tools are registered for HTTP transport")
+    from . import accounts, campaigns, adsets, ads, insights, authentication
+    from . import ads_library, budget_schedules, reports, batch
+    
+    # Expose runtime metrics for Prometheus scraping
+    from .metrics import bind_metrics_endpoint, METRICS_ENABLED
+    if METRICS_ENABLED:
+        bind_metrics_endpoint(mcp_server)
+    
+    logger.info("Setting up HTTP authentication middleware")
+    try:
+        from .http_auth_integration import setup_fastmcp_http_auth
+        setup_fastmcp_http_auth(mcp_server)
+        logger.info("FastMCP HTTP authentication integration setup successful")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to setup FastMCP HTTP authentication integration: {e}")
+        return False
+
+
+def create_streamable_http_app():
+    """
+    Build the Streamable HTTP app for one worker process.
+    
+    Uvicorn calls this factory in every worker started by --workers; the
+    supervisor passes the response format through WORKER_SSE_RESPONSE_ENV.
+    
+    Returns:
+        Starlette app serving the MCP endpoint
+    """
+    from .http_auth_integration import setup_http_auth_patching, setup_starlette_middleware
+    from .http_client import bind_to_app_lifespan
+    
+    sse_response = os.environ.get(WORKER_SSE_RESPONSE_ENV, "").lower() in ("1", "true", "yes", "on")
+    configure_streamable_http(mcp_server.settings.host, mcp_server.settings.port, sse_response)
+    
+    # FastMCP.run() is bypassed here, so apply what its patched version would
+    setup_http_auth_patching()
+    app = mcp_server.streamable_http_app()
+    setup_starlette_middleware(app)
+    bind_to_app_lifespan(app)
+    logger.info(f"Worker {os.getpid()} ready")
+    return app
+
+
+def run_streamable_http_workers(host: str, port: int, workers: int, sse_response: bool = False) -> int:
+    """
+    Serve the Streamable HTTP transport from several worker processes.
+    
+    Uvicorn's supervisor binds the socket once and shares it with the workers,
+    replaces workers that die, restarts them one at a time on SIGHUP (graceful
+    reload) and adds or removes one on SIGTTIN / SIGTTOU.
+    
+    Args:
+        host: Host to listen on
+        port: Port to listen on
+        workers: Number of worker processes
+        sse_response: Use SSE responses instead of JSON
+        
+    Returns:
+        Process exit code
+    """
+    import uvicorn
+    
+    os.environ[WORKER_SSE_RESPONSE_ENV] = "true" if sse_response else "false"
+    
+    # Workers share cached reads and write invalidations through the persistent cache tier
+    if "META_ADS_DISK_CACHE" not in os.environ:
+        os.environ["META_ADS_DISK_CACHE"] = "true"
+        print("   Persistent response cache enabled so workers share cached reads (set META_ADS_DISK_CACHE=false to opt out)")
+        logger.info("META_ADS_DISK_CACHE not set; enabling the persistent response cache for --workers")
+    print(f"   Workers: {workers} (SIGHUP reloads them one at a time)")
+    print("   Rate limiting, circuit breakers and /metrics are tracked per worker")
+    logger.info(f"Starting {workers} Streamable HTTP workers on {host}:{port}")
+    
+    uvicorn.run(
+        "meta_ads_mcp.core.server:create_streamable_http_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level=mcp_server.settings.log_level.lower(),
+    )
+    return 0
+
+
 def main():
     """Main entry point for the package"""
     # Log startup information
     logger.info("Meta Ads MCP server starting")
     logger.debug(f"Python version: {sys.version}")
     logger.debug(f"Args: {sys.argv}")
-    
+
+    # Subcommands with their own options
+    if len(sys.argv) > 1 and sys.argv[1] == "bench-http":
+        from .load_test import main as bench_http_main
+        return bench_http_main(sys.argv[2:])
+
     # Initialize argument parser
     parser = argparse.ArgumentParser(
         description="Meta Ads MCP Server - Model Context Protocol server for Meta Ads API",
@@ -214,6 +333,12 @@ def main():
     parser.add_argument("--login", action="store_true", help="Authenticate with Meta and store the token")
     parser.add_argument("--app-id", type=str, help="Meta App ID (Client ID) for authentication")
     parser.add_argument("--version", action="store_true", help="Show the version of the package")
+    parser.add_argument("--log-level", type=str.upper, choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                       help="Log level for meta_ads_debug.log (default: META_ADS_LOG_LEVEL or INFO)")
+    parser.add_argument("--profile-startup", action="store_true",
+                       help="Report how long each module takes to import at startup, then exit")
+    parser.add_argument("--write-tool-manifest", action="store_true",
+                       help="Regenerate the tool manifest used by META_ADS_LAZY_TOOLS, then exit")
     
     # Transport configuration arguments
     parser.add_argument("--transport", type=str, choices=["stdio", "streamable-http"], 
@@ -225,14 +350,23 @@ def main():
                        help="Host for Streamable HTTP transport (default: localhost, only used with --transport streamable-http)")
     parser.add_argument("--sse-response", action="store_true", 
                        help="Use SSE response format instead of JSON (default: JSON, only used with --transport streamable-http)")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Worker processes sharing the listening socket (default: 1, only used with --transport streamable-http). "
+                            "More than one worker enables the persistent response cache unless META_ADS_DISK_CACHE is set")
     
     args = parser.parse_args()
+    if args.log_level:
+        set_log_level(args.log_level)
+        # Inherited by --workers processes
+        os.environ["META_ADS_LOG_LEVEL"] = args.log_level
     logger.debug(f"Parsed args: login={args.login}, app_id={args.app_id}, version={args.version}")
-    logger.debug(f"Transport args: transport={args.transport}, port={args.port}, host={args.host}, sse_response={args.sse_response}")
+    logger.debug(f"Transport args: transport={args.transport}, port={args.port}, host={args.host}, sse_response={args.sse_response}, workers={args.workers}")
     
     # Validate CLI argument combinations
-    if args.transport == "stdio" and (args.port != 8080 or args.host != "localhost" or args.sse_response):
-        logger.warning("HTTP transport arguments (--port, --host, --sse-response) are ignored when using stdio transport")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.transport == "stdio" and (args.port != 8080 or args.host != "localhost" or args.sse_response or args.workers != 1):
+        logger.warning("HTTP transport arguments (--port, --host, --sse-response, --workers) are ignored when using stdio transport")
         print("Warning: HTTP transport arguments are ignored when using stdio transport")
     
     # Update app ID if provided as environment variable or command line arg
@@ -267,6 +401,18 @@ def main():
         print(f"Meta Ads MCP v{__version__}")
         return 0
     
+    # Startup diagnostics and maintenance commands
+    if args.profile_startup:
+        from .startup_profile import profile_startup
+        print(profile_startup())
+        return 0
+    
+    if args.write_tool_manifest:
+        from .tool_manifest import write_manifest, MANIFEST_PATH
+        count = write_manifest()
+        print(f"Wrote {count} tools to {MANIFEST_PATH}")
+        return 0
+    
     # Handle login command
     if args.login:
         login_cli()
@@ -286,6 +432,7 @@ def main():
                 auth_data = pipeboard_auth_manager.initiate_auth_flow()
                 login_url = auth_data.get('loginUrl')
                 if login_url:
+                    import webbrowser
                     logger.info(f"Opening browser with login URL: {login_url}")
                     webbrowser.open(login_url)
                     print("Please authorize the application in your browser.")
@@ -328,31 +475,18 @@ def main():
         print("Fallback authentication: Custom Meta App OAuth (via X-META-APP-ID header)")
         
         # Configure the existing server with streamable HTTP settings
-        mcp_server.settings.host = args.host
-        mcp_server.settings.port = args.port
-        mcp_server.settings.stateless_http = True
-        mcp_server.settings.json_response = not args.sse_response
+        auth_enabled = configure_streamable_http(args.host, args.port, args.sse_response)
         
-        # Import all tool modules to ensure they are registered
-        logger.info("Ensuring all tools are registered for HTTP transport")
-        from . import accounts, campaigns, adsets, ads, insights, authentication
-        from . import ads_library, budget_schedules, reports
+        from .metrics import METRICS_ENABLED, METRICS_PATH
+        if METRICS_ENABLED:
+            print(f"Metrics available at http://{args.host}:{args.port}{METRICS_PATH}")
         
-        # ✅ NEW: Setup HTTP authentication middleware
-        logger.info("Setting up HTTP authentication middleware")
-        try:
-            from .http_auth_integration import setup_fastmcp_http_auth
-            
-            # Setup the FastMCP HTTP auth integration
-            setup_fastmcp_http_auth(mcp_server)
-            logger.info("FastMCP HTTP authentication integration setup successful")
+        if auth_enabled:
             print("[OK] FastMCP HTTP authentication integration enabled")
             print("   - Bearer tokens via Authorization: Bearer <token> header")
             print("   - Direct Meta tokens via X-META-ACCESS-TOKEN header")
-            
-        except Exception as e:
-            logger.error(f"Failed to setup FastMCP HTTP authentication integration: {e}")
-            print("[WARNING] FastMCP HTTP authentication integration setup failed: {e}")
+        else:
+            print("[WARNING] FastMCP HTTP authentication integration setup failed")
             print("   Server will still start but may not support header-based auth")
         
         # Log final server configuration
@@ -370,6 +504,8 @@ def main():
             print(f"   URL: http://{args.host}:{args.port}{mcp_server.settings.streamable_http_path}/")
             print(f"   Mode: {'Stateless' if mcp_server.settings.stateless_http else 'Stateful'}")
             print(f"   Format: {'JSON' if mcp_server.settings.json_response else 'SSE'}")
+            if args.workers > 1:
+                return run_streamable_http_workers(args.host, args.port, args.workers, args.sse_response)
             mcp_server.run(transport="streamable-http")
         except Exception as e:
             logger.error(f"Error starting Streamable HTTP server: {e}")
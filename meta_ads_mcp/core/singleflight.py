@@ -0,0 +1,84 @@
+"""Single-flight coalescing of identical concurrent Graph API reads."""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .utils import logger
+
+
+REQUEST_COALESCING_ENABLED = os.environ.get("META_ADS_REQUEST_COALESCING", "true").lower() not in ("0", "false", "no", "off")
+
+
+def token_identity(access_token: str) -> str:
+    """Get a short, non-reversible identifier for an access token"""
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()[:16]
+
+
+def make_request_key(access_token: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, str, str]:
+    """
+    Build the coalescing key for a request.
+
+    Params are normalized (sorted, access_token dropped, values JSON encoded) so
+    logically identical requests map to the same key regardless of dict order.
+    """
+    normalized = {k: v for k, v in (params or {}).items() if k != "access_token"}
+    return (
+        token_identity(access_token),
+        endpoint.strip("/"),
+        json.dumps(normalized, sort_keys=True, default=str),
+    )
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers asking for the same key"""
+
+    def __init__(self, enabled: bool = REQUEST_COALESCING_ENABLED):
+        self.enabled = enabled
+        self.in_flight: Dict[Any, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Any, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func once for all concurrent callers with the same key.
+
+        The first caller starts the call; callers arriving while it is in flight
+        await the same result. Followers get a deep copy so no caller can mutate
+        another caller's response.
+        """
+        if not self.enabled:
+            return await func()
+
+        loop = asyncio.get_running_loop()
+        task = self.in_flight.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self.coalesced += 1
+            logger.debug("Coalesced request for %s", key[1] if isinstance(key, tuple) else key)
+            # Shield so a cancelled follower does not cancel the shared call
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = loop.create_task(func())
+        self.in_flight[key] = task
+        self.executed += 1
+        task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Any, task: asyncio.Task) -> None:
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counts of executed and coalesced calls"""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self.in_flight),
+        }
+
+
+# Global instance for easy access
+request_coalescer = SingleFlight()
@@ -0,0 +1,90 @@
+"""Import-time profiling for server cold start (--profile-startup)."""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from .tool_manifest import LAZY_TOOLS
+
+
+PACKAGE = "meta_ads_mcp"
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """
+    Parse the stderr of `python -X importtime`.
+
+    Returns:
+        (module, self microseconds, cumulative microseconds) per imported module
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # Header row
+        rows.append((fields[2].strip(), self_us, cumulative_us))
+    return rows
+
+
+def profile_startup(top: int = 15, python: Optional[str] = None) -> str:
+    """
+    Measure what importing the server costs, module by module.
+
+    The import runs in a fresh interpreter so modules already loaded by this
+    process don't hide their cost; it inherits the environment, so settings
+    such as META_ADS_LAZY_TOOLS apply.
+
+    Args:
+        top: Number of third-party packages to list
+        python: Interpreter to profile with (defaults to the current one)
+
+    Returns:
+        Human-readable report
+    """
+    completed = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}"],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+    )
+    rows = parse_importtime(completed.stderr)
+    if completed.returncode != 0 or not rows:
+        return f"Import profiling failed (exit code {completed.returncode}):\n{completed.stderr.strip()}"
+
+    total_us = next((cumulative for name, _, cumulative in rows if name == PACKAGE), 0)
+    # A module can show up twice when importing it first imports its parent package
+    own_by_name: Dict[str, Tuple[int, int]] = {}
+    for name, self_us, cumulative_us in rows:
+        if name.startswith(PACKAGE + "."):
+            previous_self, previous_cumulative = own_by_name.get(name, (0, 0))
+            own_by_name[name] = (previous_self + self_us, max(previous_cumulative, cumulative_us))
+    own = sorted(
+        ((name, self_us, cumulative_us) for name, (self_us, cumulative_us) in own_by_name.items()),
+        key=lambda row: row[2],
+        reverse=True,
+    )
+    external: Dict[str, int] = {}
+    for name, self_us, _ in rows:
+        if not name.startswith(PACKAGE):
+            package = name.split(".", 1)[0]
+            external[package] = external.get(package, 0) + self_us
+
+    lines = [
+        f"Import of {PACKAGE}: {total_us / 1000:.1f} ms "
+        f"(lazy tools {'on' if LAZY_TOOLS else 'off'}, {len(rows)} modules)",
+        "",
+        f"{'module':<45} {'self ms':>9} {'cumulative ms':>14}",
+    ]
+    for name, self_us, cumulative_us in own:
+        lines.append(f"{name:<45} {self_us / 1000:>9.1f} {cumulative_us / 1000:>14.1f}")
+    lines += ["", f"Top {top} third-party packages by own import time:"]
+    for package, self_us in sorted(external.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"{package:<45} {self_us / 1000:>9.1f}")
+    return "\n".join(lines)
@@ -0,0 +1,166 @@
+"""Per-tenant state for HTTP deployments where each client sends its own token.
+
+In streamable HTTP mode every client authenticates with a bearer token, so one
+server process talks to Meta on behalf of many users. A tenant is identified by
+token_identity() of that bearer token, which keeps raw tokens out of memory
+dumps and logs. Tenants get their own account rate-limit buckets and circuit
+breakers, and an auth error only revokes the tenant whose token Meta rejected:
+it drops that tenant's cached responses and throttling state instead of
+invalidating the server's own token. Requests made with the server's own token
+(stdio mode, or HTTP clients without an Authorization header) have no tenant and
+behave as before.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .cache import response_cache
+from .circuit_breaker import circuit_breakers
+from .error_classifier import AUTH
+from .http_auth_integration import FastMCPAuthIntegration
+from .rate_limit import rate_limiter
+from .singleflight import token_identity
+from .utils import logger
+
+
+# Tenant configuration (overridable through environment variables)
+TENANT_MAX = int(os.environ.get("META_ADS_TENANT_MAX", "1000"))
+TENANT_IDLE_TTL = float(os.environ.get("META_ADS_TENANT_IDLE_TTL", "3600"))  # seconds
+TENANT_REVOKED_TTL = float(os.environ.get("META_ADS_TENANT_REVOKED_TTL", "60"))  # seconds
+
+
+class Tenant:
+    """Activity and revocation state of one bearer token"""
+
+    __slots__ = ("identity", "first_seen", "last_seen", "requests", "auth_errors", "revoked_at")
+
+    def __init__(self, identity: str, now: float):
+        self.identity = identity
+        self.first_seen = now
+        self.last_seen = now
+        self.requests = 0
+        self.auth_errors = 0
+        self.revoked_at: Optional[float] = None
+
+
+class TenantRegistry:
+    """LRU registry of tenants keyed by bearer token identity"""
+
+    def __init__(
+        self,
+        max_tenants: int = TENANT_MAX,
+        idle_ttl: float = TENANT_IDLE_TTL,
+        revoked_ttl: float = TENANT_REVOKED_TTL,
+    ):
+        self.max_tenants = max(1, max_tenants)
+        self.idle_ttl = idle_ttl
+        self.revoked_ttl = revoked_ttl
+        # Least recently active first
+        self.tenants: "OrderedDict[str, Tenant]" = OrderedDict()
+        self.revocations = 0
+        self.rejections = 0
+        self.evictions = 0
+
+    def current_identity(self) -> Optional[str]:
+        """Get the tenant of the current HTTP request, or None without a bearer token"""
+        token = FastMCPAuthIntegration.get_auth_token()
+        return token_identity(token) if token else None
+
+    def identity_for(self, access_token: Optional[str]) -> Optional[str]:
+        """
+        Get the tenant a request belongs to.
+
+        Returns:
+            The token's identity if it is the current request's bearer token,
+            None for the server's own token
+        """
+        token = FastMCPAuthIntegration.get_auth_token()
+        if not access_token or not token or token != access_token:
+            return None
+        return token_identity(access_token)
+
+    def _tenant(self, identity: str) -> Tenant:
+        now = time.monotonic()
+        tenant = self.tenants.get(identity)
+        if tenant is None:
+            tenant = Tenant(identity, now)
+            self.tenants[identity] = tenant
+        else:
+            self.tenants.move_to_end(identity)
+        tenant.last_seen = now
+        self._evict(now)
+        return tenant
+
+    def _evict(self, now: float) -> None:
+        """Forget tenants past the size cap or idle for longer than idle_ttl"""
+        while self.tenants:
+            identity, oldest = next(iter(self.tenants.items()))
+            if len(self.tenants) <= self.max_tenants and now - oldest.last_seen < self.idle_ttl:
+                break
+            del self.tenants[identity]
+            rate_limiter.forget(identity)
+            circuit_breakers.forget(identity)
+            self.evictions += 1
+
+    def check(self, identity: str) -> Optional[Dict[str, Any]]:
+        """
+        Record a request from a tenant and check that its token was not just rejected.
+
+        Returns:
+            None if the request may be sent, otherwise an error result to return immediately
+        """
+        tenant = self._tenant(identity)
+        tenant.requests += 1
+        if tenant.revoked_at is None or time.monotonic() - tenant.revoked_at >= self.revoked_ttl:
+            return None
+        self.rejections += 1
+        return {
+            "error": {
+                "message": "Meta rejected this access token; authenticate again and retry with a new token",
+                "category": AUTH,
+            }
+        }
+
+    def revoke(self, identity: str) -> None:
+        """
+        Handle an auth error for one tenant's token.
+
+        Drops the tenant's cached responses and throttling state and makes
+        further requests with the token fail fast for revoked_ttl seconds. The
+        server's own token and other tenants are not touched.
+        """
+        tenant = self._tenant(identity)
+        tenant.auth_errors += 1
+        tenant.revoked_at = time.monotonic()
+        self.revocations += 1
+        removed = response_cache.invalidate_tenant(identity)
+        rate_limiter.forget(identity)
+        circuit_breakers.forget(identity)
+        logger.warning(f"Access token of tenant {identity} rejected by Meta; dropped {removed} cached response(s)")
+
+    def clear(self) -> None:
+        """Forget all tenants and their throttling state"""
+        for identity in self.tenants:
+            rate_limiter.forget(identity)
+            circuit_breakers.forget(identity)
+        self.tenants.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tenant counts"""
+        now = time.monotonic()
+        return {
+            "tenants": len(self.tenants),
+            "revoked": sum(
+                1 for tenant in self.tenants.values()
+                if tenant.revoked_at is not None and now - tenant.revoked_at < self.revoked_ttl
+            ),
+            "revocations": self.revocations,
+            "rejections": self.rejections,
+            "evictions": self.evictions,
+        }
+
+
+# Global instance for easy access
+tenant_registry = TenantRegistry()
@@ -0,0 +1,195 @@
+"""Cached access token introspection through the Graph API debug_token endpoint.
+
+Without it, a revoked token or one missing a permission is only discovered
+after a full Graph request fails. When enabled, the first tool call with a token
+asks debug_token for its validity, scopes, expiry, app and user, and keeps the
+answer for a TTL. Later calls with a token Meta reported as invalid, or missing
+the scopes a tool needs, fail before any other request is sent. Introspection
+fails open: if debug_token itself cannot be reached, tools run as usual.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .error_classifier import AUTH, PERMISSION, classify_result
+from .singleflight import SingleFlight, token_identity
+from .utils import logger
+
+
+# Token introspection configuration (overridable through environment variables)
+TOKEN_INTROSPECTION_ENABLED = os.environ.get("META_ADS_TOKEN_INTROSPECTION", "false").lower() in ("1", "true", "yes", "on")
+TOKEN_INTROSPECTION_TTL = float(os.environ.get("META_ADS_TOKEN_INTROSPECTION_TTL", "600"))  # seconds
+TOKEN_INTROSPECTION_MAX_ENTRIES = int(os.environ.get("META_ADS_TOKEN_INTROSPECTION_MAX_ENTRIES", "1000"))
+
+
+class TokenIntrospection:
+    """What debug_token reported about one access token"""
+
+    __slots__ = ("is_valid", "scopes", "app_id", "user_id", "expires_at", "error")
+
+    def __init__(
+        self,
+        is_valid: bool,
+        scopes: Iterable[str] = (),
+        app_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        expires_at: Optional[float] = None,
+        error: Optional[str] = None,
+    ):
+        self.is_valid = is_valid
+        self.scopes: FrozenSet[str] = frozenset(scopes)
+        self.app_id = app_id
+        self.user_id = user_id
+        # Unix time, None for tokens that never expire
+        self.expires_at = expires_at
+        self.error = error
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "TokenIntrospection":
+        """Build from the "data" object of a debug_token response"""
+        error = data.get("error")
+        return cls(
+            is_valid=bool(data.get("is_valid")),
+            scopes=data.get("scopes") or (),
+            app_id=data.get("app_id"),
+            user_id=data.get("user_id"),
+            # debug_token reports 0 for tokens without an expiry
+            expires_at=float(data["expires_at"]) if data.get("expires_at") else None,
+            error=error.get("message") if isinstance(error, dict) else None,
+        )
+
+
+class TokenIntrospector:
+    """TTL cache of debug_token results keyed by token identity"""
+
+    def __init__(
+        self,
+        enabled: bool = TOKEN_INTROSPECTION_ENABLED,
+        ttl: float = TOKEN_INTROSPECTION_TTL,
+        max_entries: int = TOKEN_INTROSPECTION_MAX_ENTRIES,
+    ):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        # identity -> (expires_at, introspection), least recently used first
+        self.entries: "OrderedDict[str, Tuple[float, TokenIntrospection]]" = OrderedDict()
+        self._flights = SingleFlight(enabled=True)
+        self.hits = 0
+        self.lookups = 0
+        self.rejections = 0
+
+    async def introspect(self, access_token: str) -> Optional[TokenIntrospection]:
+        """
+        Get what Meta reports about a token, asking debug_token at most once per TTL.
+
+        Returns:
+            The introspection, or None when disabled or debug_token could not answer
+        """
+        if not self.enabled or not access_token:
+            return None
+
+        identity = token_identity(access_token)
+        entry = self.entries.get(identity)
+        if entry is not None:
+            if time.monotonic() < entry[0]:
+                self.entries.move_to_end(identity)
+                self.hits += 1
+                return entry[1]
+            del self.entries[identity]
+
+        return await self._flights.do(identity, lambda: self._fetch(identity, access_token))
+
+    async def _fetch(self, identity: str, access_token: str) -> Optional[TokenIntrospection]:
+        # Imported here: api imports this module for the meta_api_tool checks
+        from .api import make_api_request
+
+        self.lookups += 1
+        result = await make_api_request("debug_token", access_token, {"input_token": access_token})
+        if isinstance(result, dict) and isinstance(result.get("data"), dict):
+            info = TokenIntrospection.from_response(result["data"])
+        elif classify_result(result) == AUTH:
+            # Meta refused the token outright, which answers the question too
+            info = TokenIntrospection(is_valid=False, error="Meta rejected the access token")
+        else:
+            logger.debug("Token introspection unavailable: %s", result.get("error") if isinstance(result, dict) else result)
+            return None
+
+        self.entries[identity] = (time.monotonic() + self.ttl, info)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._apply_expiry(access_token, info)
+        return info
+
+    def _apply_expiry(self, access_token: str, info: TokenIntrospection) -> None:
+        """Fill in the expiry of the server's own token when it was not known"""
+        from .auth import auth_manager
+
+        token_info = auth_manager.token_info
+        if auth_manager.use_pipeboard or token_info is None or token_info.access_token != access_token:
+            return
+        if not token_info.expires_in and info.expires_at:
+            token_info.expires_in = max(0, int(info.expires_at) - token_info.created_at)
+            logger.info("Access token expiry learned from debug_token")
+        if not token_info.user_id and info.user_id:
+            token_info.user_id = info.user_id
+
+    async def check(self, access_token: str, required_scopes: Iterable[str] = (), tool: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Check that a token is valid and carries the given scopes.
+
+        Args:
+            access_token: Token the tool is about to use
+            required_scopes: Permissions the tool needs, e.g. ("leads_retrieval",)
+            tool: Tool name, for the error message
+
+        Returns:
+            None if the call may proceed (or nothing is known about the token),
+            otherwise an error result to return immediately
+        """
+        info = await self.introspect(access_token)
+        if info is None:
+            return None
+
+        if not info.is_valid:
+            self.rejections += 1
+            return {
+                "error": {
+                    "message": "The access token is no longer valid; authenticate again",
+                    "details": info.error,
+                    "category": AUTH,
+                }
+            }
+
+        missing = sorted(set(required_scopes) - info.scopes)
+        if missing:
+            self.rejections += 1
+            return {
+                "error": {
+                    "message": f"The access token is missing the {', '.join(missing)} permission(s)"
+                               + (f" required by {tool}" if tool else ""),
+                    "missing_scopes": missing,
+                    "granted_scopes": sorted(info.scopes),
+                    "category": PERMISSION,
+                }
+            }
+        return None
+
+    def clear(self) -> None:
+        """Forget all introspection results"""
+        self.entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            "enabled": self.enabled,
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "lookups": self.lookups,
+            "rejections": self.rejections,
+        }
+
+
+# Global instance for easy access
+token_introspector = TokenIntrospector()
@@ -0,0 +1,153 @@
+"""Background renewal of the server's own access token before it expires.
+
+Tokens are otherwise only checked when a request arrives, so the first call
+after expiry pays for the refresh (or fails). The refresher wakes up once a
+configurable fraction of the token's lifetime has passed and renews it off the
+request path:
+
+- Pipeboard tokens are fetched again from Pipeboard.
+- Tokens from the Meta OAuth flow are re-exchanged through
+  exchange_token_for_long_lived, which needs META_APP_SECRET.
+
+The new TokenInfo is published with a single attribute assignment, so
+concurrent requests see either the old token or the new one, never a partial
+update.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, Optional
+
+from .pipeboard_auth import pipeboard_auth_manager
+from .utils import logger
+
+
+# Token refresh configuration (overridable through environment variables)
+TOKEN_REFRESH_ENABLED = os.environ.get("META_ADS_TOKEN_REFRESH", "true").lower() not in ("0", "false", "no", "off")
+TOKEN_REFRESH_FRACTION = float(os.environ.get("META_ADS_TOKEN_REFRESH_FRACTION", "0.8"))  # of the token lifetime
+TOKEN_REFRESH_RETRY_DELAY = float(os.environ.get("META_ADS_TOKEN_REFRESH_RETRY_DELAY", "60"))  # seconds
+TOKEN_REFRESH_MAX_SLEEP = float(os.environ.get("META_ADS_TOKEN_REFRESH_MAX_SLEEP", "3600"))  # seconds
+
+
+class TokenRefresher:
+    """Renews the active token at a fraction of its lifetime from a background task"""
+
+    def __init__(
+        self,
+        enabled: bool = TOKEN_REFRESH_ENABLED,
+        fraction: float = TOKEN_REFRESH_FRACTION,
+        retry_delay: float = TOKEN_REFRESH_RETRY_DELAY,
+        max_sleep: float = TOKEN_REFRESH_MAX_SLEEP,
+    ):
+        self.enabled = enabled
+        self.fraction = min(max(fraction, 0.0), 1.0)
+        self.retry_delay = retry_delay
+        self.max_sleep = max_sleep
+        self._task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.failures = 0
+        self.last_refresh: Optional[float] = None
+
+    def _token_info(self):
+        """Get the TokenInfo the server is currently using"""
+        from .auth import auth_manager
+        if auth_manager.use_pipeboard:
+            return pipeboard_auth_manager.token_info
+        return auth_manager.token_info
+
+    def refresh_at(self, token_info) -> Optional[float]:
+        """Get the Unix time at which a token should be renewed, or None if it does not expire"""
+        if token_info is None:
+            return None
+        expires = token_info.expiry_time()
+        if expires is None:
+            return None
+        issued = min(token_info.created_at, expires)
+        return issued + self.fraction * (expires - issued)
+
+    async def refresh_once(self) -> bool:
+        """
+        Renew the active token now.
+
+        Returns:
+            True if a new token was published
+        """
+        from .auth import auth_manager, exchange_token_for_long_lived
+
+        if auth_manager.use_pipeboard:
+            token = await pipeboard_auth_manager.get_access_token_async(force_refresh=True)
+            refreshed = token is not None
+        else:
+            current = auth_manager.token_info
+            if current is None or not os.environ.get("META_APP_SECRET"):
+                return False
+            # The exchange uses blocking requests, so run it in a worker thread
+            new_token_info = await asyncio.to_thread(exchange_token_for_long_lived, current.access_token)
+            refreshed = new_token_info is not None
+            if refreshed:
+                auth_manager.token_info = new_token_info
+                await asyncio.to_thread(auth_manager._save_token_to_cache)
+
+        if refreshed:
+            self.refreshes += 1
+            self.last_refresh = time.time()
+            logger.info("Access token renewed in the background")
+        else:
+            self.failures += 1
+            logger.warning("Background token renewal failed; retrying in %.0f seconds", self.retry_delay)
+        return refreshed
+
+    async def _run(self) -> None:
+        while True:
+            refresh_at = self.refresh_at(self._token_info())
+            now = time.time()
+            if refresh_at is None:
+                delay = self.max_sleep
+            elif now >= refresh_at:
+                try:
+                    await self.refresh_once()
+                except Exception as e:
+                    self.failures += 1
+                    logger.error(f"Error renewing access token: {e}")
+                # Also covers a source that hands back the same token again
+                delay = self.retry_delay
+            else:
+                delay = min(refresh_at - now, self.max_sleep)
+            await asyncio.sleep(delay)
+
+    def ensure_started(self) -> None:
+        """Start the background task on the running event loop if it is not running yet"""
+        if not self.enabled or self.refresh_at(self._token_info()) is None:
+            return
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._task = loop.create_task(self._run())
+        logger.debug("Started background token refresher (fraction=%.2f)", self.fraction)
+
+    async def stop(self) -> None:
+        """Cancel the background task"""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get refresher status"""
+        token_info = self._token_info()
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None and not self._task.done(),
+            "next_refresh_at": self.refresh_at(token_info),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_refresh": self.last_refresh,
+        }
+
+
+# Global instance for easy access
+token_refresher = TokenRefresher()
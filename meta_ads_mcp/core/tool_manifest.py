@@ -0,0 +1,219 @@
+"""Precomputed tool manifest and lazy tool-module loading.
+
+Importing every tool module at startup (Pillow, requests, the OAuth callback
+server and one pydantic model per tool) is a noticeable part of cold start for
+stdio servers spawned per session. With META_ADS_LAZY_TOOLS enabled, tool
+schemas are registered from tool_manifest.json instead and a tool's module is
+only imported the first time one of its tools is called.
+
+Regenerate the manifest after adding or changing a tool:
+
+    meta-ads-mcp --write-tool-manifest
+"""
+
+import importlib
+import json
+import os
+import pathlib
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools.base import Tool
+from mcp.server.fastmcp.tools.tool_manager import ToolManager
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from .utils import logger
+
+
+LAZY_TOOLS = os.environ.get("META_ADS_LAZY_TOOLS", "").lower() in ("1", "true", "yes", "on")
+MANIFEST_PATH = pathlib.Path(__file__).with_name("tool_manifest.json")
+
+# Modules that register tools when imported, in registration order
+TOOL_MODULES = [
+    "accounts",
+    "campaigns",
+    "adsets",
+    "ads",
+    "insights",
+    "authentication",
+    "ads_library",
+    "budget_schedules",
+    "reports",
+    "duplication",
+    "leadgen_forms",
+    "search_targeting",
+    "batch",
+]
+
+# Modules that only register their tools when an environment variable is set
+CONDITIONAL_TOOL_MODULES = {
+    "reports": "META_ADS_ENABLE_REPORTS",
+    "duplication": "META_ADS_ENABLE_DUPLICATION",
+}
+
+
+class LazyTool(Tool):
+    """Tool registered from the manifest whose implementation is not imported yet"""
+
+    fn: Optional[Callable[..., Any]] = Field(None, exclude=True)
+    fn_metadata: Optional[FuncMetadata] = None
+    is_async: bool = True
+    module: str
+    function: str
+    manifest_output_schema: Optional[Dict[str, Any]] = None
+
+    @property
+    def output_schema(self) -> Optional[Dict[str, Any]]:
+        return self.manifest_output_schema
+
+    async def run(self, arguments: Dict[str, Any], context=None, convert_result: bool = False) -> Any:
+        raise ToolError(f"Tool {self.name} has not been loaded from {self.module}")
+
+
+class LazyToolManager(ToolManager):
+    """ToolManager that swaps manifest stubs for the real tools as modules get imported"""
+
+    def add_tool(self, fn: Callable[..., Any], name: Optional[str] = None, **kwargs) -> Tool:
+        existing = self._tools.get(name or fn.__name__)
+        if isinstance(existing, LazyTool):
+            # Replace in place so the tool keeps its position in list_tools()
+            tool = Tool.from_function(fn, name=name, **kwargs)
+            self._tools[tool.name] = tool
+            return tool
+        return super().add_tool(fn, name=name, **kwargs)
+
+    def get_tool(self, name: str) -> Optional[Tool]:
+        tool = self._tools.get(name)
+        if isinstance(tool, LazyTool):
+            load_tool_module(tool.module)
+            tool = self._tools.get(name)
+            if isinstance(tool, LazyTool):
+                raise ToolError(
+                    f"Tool {name} is listed in the tool manifest but {tool.module} did not register it; "
+                    "regenerate the manifest with: meta-ads-mcp --write-tool-manifest"
+                )
+        return tool
+
+
+def load_tool_module(module: str) -> Any:
+    """Import a tool module, registering its tools with the server"""
+    qualified = f"{__package__}.{module}"
+    if qualified not in sys.modules:
+        logger.debug("Loading tool module %s", module)
+    # __import__ rather than importlib.import_module so -X importtime (and so
+    # --profile-startup) attributes the cost to the tool module
+    __import__(qualified)
+    return sys.modules[qualified]
+
+
+def load_tool_modules() -> None:
+    """Import every tool module (the default, eager startup path)"""
+    for module in TOOL_MODULES:
+        load_tool_module(module)
+
+
+def build_manifest(tool_manager: ToolManager) -> List[Dict[str, Any]]:
+    """
+    Describe every registered tool.
+
+    Args:
+        tool_manager: Tool manager whose tool modules have all been imported
+
+    Returns:
+        List of manifest entries (name, module, function and the MCP tool schema)
+    """
+    entries = []
+    for tool in tool_manager.list_tools():
+        if isinstance(tool, LazyTool):
+            continue
+        entries.append({
+            "name": tool.name,
+            "module": tool.fn.__module__.rsplit(".", 1)[-1],
+            "function": tool.fn.__name__,
+            "title": tool.title,
+            "description": tool.description,
+            "parameters": tool.parameters,
+            "output_schema": tool.output_schema,
+            "annotations": tool.annotations.model_dump(exclude_none=True) if tool.annotations else None,
+        })
+    return entries
+
+
+def load_manifest(path: pathlib.Path = MANIFEST_PATH) -> Optional[List[Dict[str, Any]]]:
+    """Read the manifest, or return None if it is missing or unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["tools"]
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Could not read tool manifest %s: %s", path, e)
+        return None
+
+
+def register_lazy_tools(server: Any, path: pathlib.Path = MANIFEST_PATH) -> bool:
+    """
+    Register tool schemas from the manifest without importing the tool modules.
+
+    Args:
+        server: FastMCP server to register the tools with
+        path: Manifest location
+
+    Returns:
+        True if the tools were registered, False if the manifest could not be
+        used (callers should then import the tool modules eagerly)
+    """
+    manifest = load_manifest(path)
+    if manifest is None:
+        return False
+
+    previous = server._tool_manager
+    manager = LazyToolManager(warn_on_duplicate_tools=previous.warn_on_duplicate_tools, tools=previous.list_tools())
+    for entry in manifest:
+        env_var = CONDITIONAL_TOOL_MODULES.get(entry["module"])
+        if env_var and not os.environ.get(env_var, ""):
+            continue
+        if entry["name"] in manager._tools:
+            continue
+        annotations = entry.get("annotations")
+        manager._tools[entry["name"]] = LazyTool(
+            name=entry["name"],
+            title=entry.get("title"),
+            description=entry["description"],
+            parameters=entry["parameters"],
+            annotations=ToolAnnotations(**annotations) if annotations else None,
+            module=entry["module"],
+            function=entry["function"],
+            manifest_output_schema=entry.get("output_schema"),
+        )
+    server._tool_manager = manager
+    logger.info("Registered %d tools from manifest; tool modules load on first call", len(manager._tools))
+    return True
+
+
+def write_manifest(path: pathlib.Path = MANIFEST_PATH) -> int:
+    """
+    Import every tool module (conditional ones included) and write the manifest.
+
+    Returns:
+        Number of tools written
+    """
+    from .server import mcp_server
+
+    for env_var in CONDITIONAL_TOOL_MODULES.values():
+        os.environ.setdefault(env_var, "1")
+    for module in TOOL_MODULES:
+        qualified = f"{__package__}.{module}"
+        if module in CONDITIONAL_TOOL_MODULES and qualified in sys.modules:
+            # Already imported with the feature flag off; re-run it to register the tools
+            importlib.reload(sys.modules[qualified])
+        else:
+            load_tool_module(module)
+
+    entries = build_manifest(mcp_server._tool_manager)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"tools": entries}, f, indent=2, sort_keys=False)
+        f.write("\n")
+    return len(entries)
+
@@ -0,0 +1,298 @@
+"""Optional tracing spans for tool calls, Graph API requests and image handling.
+
+A span is created per tool invocation in meta_api_tool, with child spans for
+each make_api_request call and each HTTP attempt beneath it, so a tool that fans
+out into many Graph requests shows which step is slow.
+
+Exporters (META_ADS_TRACING):
+    json  Append one JSON object per finished span to a local file (written from
+          a background thread, rotated like the debug log)
+    otlp  Send spans to an OTLP collector through OpenTelemetry
+          (pip install "meta-ads-mcp[tracing]"; configured with the standard
+          OTEL_EXPORTER_OTLP_* environment variables)
+
+Tracing is off by default and then costs one function call per span.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import pathlib
+import platform
+import queue
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from .utils import logger, LOG_MAX_BYTES, LOG_BACKUP_COUNT
+
+
+# Tracing configuration (overridable through environment variables)
+TRACING_EXPORTER = os.environ.get("META_ADS_TRACING", "").lower()
+TRACING_FILE = os.environ.get("META_ADS_TRACING_FILE", "")
+SERVICE_NAME = "meta-ads-mcp"
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("meta_ads_current_span", default=None)
+
+
+def _get_trace_file_path() -> pathlib.Path:
+    """Get the platform-specific path for the JSON trace file"""
+    if TRACING_FILE:
+        path = pathlib.Path(TRACING_FILE).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    if platform.system() == "Windows":
+        base_path = pathlib.Path(os.environ.get("APPDATA", ""))
+    elif platform.system() == "Darwin":  # macOS
+        base_path = pathlib.Path.home() / "Library" / "Application Support"
+    else:  # Assume Linux/Unix
+        base_path = pathlib.Path.home() / ".config"
+
+    trace_dir = base_path / "meta-ads-mcp"
+    trace_dir.mkdir(parents=True, exist_ok=True)
+    return trace_dir / "traces.jsonl"
+
+
+class NoopSpan:
+    """Span used while tracing is disabled; every operation does nothing"""
+
+    is_recording = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class Span:
+    """A timed operation with attributes, parented to the span that was current when it started"""
+
+    is_recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Optional[Dict[str, Any]] = None):
+        parent = _current_span.get()
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = {}
+        self.status = "OK"
+        self.status_message: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter()
+        self._ended = False
+        if attributes:
+            for key, value in attributes.items():
+                self.set_attribute(key, value)
+        self._token = _current_span.set(self)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = "ERROR"
+        self.status_message = message
+
+    def end(self) -> None:
+        if self._ended:
+            return
+        self._ended = True
+        duration = time.perf_counter() - self._start_perf
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Ended from a different context than it started in; just drop it as current
+            _current_span.set(None)
+        self.tracer.export({
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.start_ns + int(duration * 1e9),
+            "duration_ms": round(duration * 1000, 3),
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes,
+            "service.name": SERVICE_NAME,
+        })
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.set_error(f"{exc_type.__name__}: {exc}")
+        self.end()
+
+
+class JsonFileExporter:
+    """Writes finished spans as JSON lines from a background thread"""
+
+    def __init__(self, path: Optional[pathlib.Path] = None):
+        self.path = path or _get_trace_file_path()
+        handler = logging.handlers.RotatingFileHandler(
+            str(self.path), mode="a", maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        span_queue = queue.SimpleQueue()
+        self._logger = logging.Logger("meta-ads-mcp.traces")
+        self._logger.addHandler(logging.handlers.QueueHandler(span_queue))
+        self._listener = logging.handlers.QueueListener(span_queue, handler)
+        self._listener.start()
+
+    def export(self, record: Dict[str, Any]) -> None:
+        self._logger.info(json.dumps(record, default=str))
+
+    def shutdown(self) -> None:
+        """Flush queued spans and stop the writer thread"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+class Tracer:
+    """Creates spans and hands finished ones to an exporter (no exporter = disabled)"""
+
+    def __init__(self, exporter: Any = None):
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """
+        Start a span that becomes the parent of spans started until it ends.
+
+        Use it as a context manager, or call end() on it explicitly.
+
+        Args:
+            name: Span name, e.g. "tool get_campaigns" or "graph.request"
+            attributes: Initial attributes; None values are dropped
+        """
+        if self.exporter is None:
+            return NOOP_SPAN
+        return Span(self, name, attributes)
+
+    def export(self, record: Dict[str, Any]) -> None:
+        try:
+            self.exporter.export(record)
+        except Exception as e:
+            logger.debug("Could not export span %s: %s", record.get("name"), e)
+
+
+class _OpenTelemetrySpan:
+    """Adapts an OpenTelemetry span to the Span interface used in this package"""
+
+    is_recording = True
+
+    def __init__(self, otel_trace, span, error_status):
+        self._span = span
+        self._error_status = error_status
+        self._scope = otel_trace.use_span(span, end_on_exit=True)
+        self._scope.__enter__()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self._span.set_attribute(key, value)
+
+    def set_error(self, message: str) -> None:
+        self._span.set_status(self._error_status(message))
+
+    def end(self) -> None:
+        if self._scope is not None:
+            scope, self._scope = self._scope, None
+            scope.__exit__(None, None, None)
+
+    def __enter__(self) -> "_OpenTelemetrySpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.set_error(f"{exc_type.__name__}: {exc}")
+        self.end()
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer that creates OpenTelemetry spans exported over OTLP"""
+
+    def __init__(self, otel_trace, error_status):
+        super().__init__(exporter=None)
+        self._otel_trace = otel_trace
+        self._otel_tracer = otel_trace.get_tracer("meta_ads_mcp")
+        self._error_status = error_status
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        attributes = {k: v for k, v in (attributes or {}).items() if v is not None}
+        span = self._otel_tracer.start_span(name, attributes=attributes)
+        return _OpenTelemetrySpan(self._otel_trace, span, self._error_status)
+
+
+def _create_otlp_tracer() -> Optional[Tracer]:
+    try:
+        from opentelemetry import trace as otel_trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.trace import Status, StatusCode
+    except ImportError:
+        logger.warning('META_ADS_TRACING=otlp needs OpenTelemetry: pip install "meta-ads-mcp[tracing]". '
+                       "Falling back to the JSON file exporter.")
+        return None
+
+    provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    otel_trace.set_tracer_provider(provider)
+    return OpenTelemetryTracer(otel_trace, lambda message: Status(StatusCode.ERROR, message))
+
+
+def create_tracer(exporter_name: str = TRACING_EXPORTER) -> Tracer:
+    """Build the tracer selected by META_ADS_TRACING"""
+    if exporter_name in ("", "0", "false", "no", "off", "none"):
+        return Tracer()
+
+    if exporter_name == "otlp":
+        otlp_tracer = _create_otlp_tracer()
+        if otlp_tracer is not None:
+            logger.info("Tracing enabled: exporting spans over OTLP")
+            return otlp_tracer
+    elif exporter_name != "json":
+        logger.warning("Unknown META_ADS_TRACING exporter %r; using json", exporter_name)
+
+    try:
+        exporter = JsonFileExporter()
+    except OSError as e:
+        logger.error("Could not open trace file, tracing disabled: %s", e)
+        return Tracer()
+    atexit.register(exporter.shutdown)
+    logger.info("Tracing enabled: writing spans to %s", exporter.path)
+    return Tracer(exporter)
+
+
+# Global instance for easy access
+tracer = create_tracer()
@@ -3,15 +3,18 @@
 from typing import Optional, Dict, Any
 import httpx
 import io
-from PIL import Image as PILImage
 import base64
 import time
 import asyncio
 import os
 import json
 import logging
+import logging.handlers
 import pathlib
 import platform
+import queue
+import atexit
+import urllib.parse
 
 # Check for Meta app credentials in environment
 META_APP_ID = os.environ.get("META_APP_ID", "")
@@ -32,9 +35,49 @@ if not using_pipeboard:
         print("NOTE: This is only needed for direct Meta authentication. Pipeboard authentication doesn't require this.")
         print("RECOMMENDED: Use Pipeboard authentication by setting PIPEBOARD_API_TOKEN instead.")
 
+# Logging configuration (overridable through environment variables or --log-level)
+_DEBUG_ENABLED = os.environ.get("META_ADS_DEBUG", "").lower() in ("1", "true", "yes", "on")
+LOG_LEVEL = os.environ.get("META_ADS_LOG_LEVEL", "DEBUG" if _DEBUG_ENABLED else "INFO").upper()
+LOG_MAX_BYTES = int(os.environ.get("META_ADS_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.environ.get("META_ADS_LOG_BACKUP_COUNT", "5"))
+
+# Background thread that writes queued log records to the log file
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _parse_log_level(level) -> int:
+    """Convert a level name or number to a logging level, defaulting to INFO"""
+    if isinstance(level, int):
+        return level
+    parsed = logging.getLevelName(str(level).upper())
+    return parsed if isinstance(parsed, int) else logging.INFO
+
+
+def set_log_level(level) -> None:
+    """
+    Change the log level at runtime.
+    
+    Args:
+        level: Level name (DEBUG, INFO, WARNING, ERROR) or number
+    """
+    numeric_level = _parse_log_level(level)
+    logging.getLogger().setLevel(numeric_level)
+    logging.getLogger("meta-ads-mcp").setLevel(numeric_level)
+
+
+def _stop_log_listener() -> None:
+    """Flush queued records on interpreter exit"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 # Configure logging to file
 def setup_logging():
     """Set up logging to file for troubleshooting."""
+    global _log_listener
+    
     # Get platform-specific path for logs
     if platform.system() == "Windows":
         base_path = pathlib.Path(os.environ.get("APPDATA", ""))
@@ -49,31 +92,39 @@ def setup_logging():
     
     log_file = log_dir / "meta_ads_debug.log"
     
-    # Configure file logger
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        filename=str(log_file),
-        filemode='a'  # Append mode
+    # The rotating file handler runs on a listener thread; request handlers only
+    # enqueue records, so file I/O never blocks the event loop
+    file_handler = logging.handlers.RotatingFileHandler(
+        str(log_file),
+        mode='a',  # Append mode
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8"
     )
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    
+    root_logger = logging.getLogger()
+    if _log_listener is None and not root_logger.handlers:
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_stop_log_listener)
     
     # Create a logger
     logger = logging.getLogger("meta-ads-mcp")
-    logger.setLevel(logging.DEBUG)
+    set_log_level(LOG_LEVEL)
     
     # Log startup information
-    logger.info(f"Logging initialized. Log file: {log_file}")
-    logger.info(f"Platform: {platform.system()} {platform.release()}")
-    logger.info(f"Using Pipeboard authentication: {using_pipeboard}")
+    logger.info("Logging initialized. Log file: %s (level %s)", log_file, logging.getLevelName(logger.level))
+    logger.info("Platform: %s %s", platform.system(), platform.release())
+    logger.info("Using Pipeboard authentication: %s", using_pipeboard)
     
     return logger
 
 # Create the logger instance to be imported by other modules
 logger = setup_logging()
 
-# Global store for ad creative images
-ad_creative_images = {}
-
 async def download_image(url: str) -> Optional[bytes]:
     """
     Download an image from a URL.
@@ -84,36 +135,48 @@ async def download_image(url: str) -> Optional[bytes]:
     Returns:
         Image data as bytes if successful, None otherwise
     """
-    try:
-        print(f"Attempting to download image from URL: {url}")
-        
-        # Use minimal headers like curl does
-        headers = {
-            "User-Agent": "curl/8.4.0",
-            "Accept": "*/*"
-        }
-        
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
+    # Imported here because these modules depend on this one for the logger
+    from .http_client import get_http_client
+    from .tracing import tracer
+    
+    with tracer.start_span("image.download", {"url.host": urllib.parse.urlsplit(url).hostname}) as span:
+        try:
+            print(f"Attempting to download image from URL: {url}")
+            
+            # Use minimal headers like curl does
+            headers = {
+                "User-Agent": "curl/8.4.0",
+                "Accept": "*/*"
+            }
+            
+            client = get_http_client()
+            
             # Simple GET request just like curl
-            response = await client.get(url, headers=headers)
+            response = await client.get(url, headers=headers, follow_redirects=True, timeout=30.0)
+            span.set_attribute("http.status_code", response.status_code)
             
             # Check response
             if response.status_code == 200:
                 print(f"Successfully downloaded image: {len(response.content)} bytes")
+                span.set_attribute("http.response.body.size", len(response.content))
                 return response.content
             else:
                 print(f"Failed to download image: HTTP {response.status_code}")
+                span.set_error(f"HTTP {response.status_code}")
                 return None
-                
-    except httpx.HTTPStatusError as e:
-        print(f"HTTP Error when downloading image: {e}")
-        return None
-    except httpx.RequestError as e:
-        print(f"Request Error when downloading image: {e}")
-        return None
-    except Exception as e:
-        print(f"Unexpected error downloading image: {e}")
-        return None
+                    
+        except httpx.HTTPStatusError as e:
+            print(f"HTTP Error when downloading image: {e}")
+            span.set_error(str(e))
+            return None
+        except httpx.RequestError as e:
+            print(f"Request Error when downloading image: {e}")
+            span.set_error(str(e))
+            return None
+        except Exception as e:
+            print(f"Unexpected error downloading image: {e}")
+            span.set_error(str(e))
+            return None
 
 
 async def try_multiple_download_methods(url: str) -> Optional[bytes]:
@@ -206,11 +269,8 @@ def create_resource_from_image(image_bytes: bytes, resource_id: str, name: str)
     Returns:
         Dictionary with resource information
     """
-    ad_creative_images[resource_id] = {
-        "data": image_bytes,
-        "mime_type": "image/jpeg",
-        "name": name
-    }
+    from .resource_store import resource_store
+    resource_store.put(resource_id, image_bytes, name, mime_type="image/jpeg")
     
     return {
         "resource_id": resource_id,
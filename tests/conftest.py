@@ -10,6 +10,55 @@ import time
 import os
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached Graph API responses, processed images, tenants and token introspection from leaking between tests"""
+    from meta_ads_mcp.core.cache import response_cache
+    from meta_ads_mcp.core.image_processing import image_processor
+    from meta_ads_mcp.core.tenants import tenant_registry
+    from meta_ads_mcp.core.token_introspection import token_introspector
+    response_cache.clear()
+    image_processor.clear()
+    tenant_registry.clear()
+    token_introspector.clear()
+    yield
+    response_cache.clear()
+    image_processor.clear()
+    tenant_registry.clear()
+    token_introspector.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_image_store(tmp_path, monkeypatch):
+    """Keep downloaded test images out of the user's image cache"""
+    from meta_ads_mcp.core.image_store import image_store
+    monkeypatch.setattr(image_store, "directory", tmp_path / "image_cache")
+    monkeypatch.setattr(image_store, "total_bytes", None)
+    for counter in ("hits", "misses", "evictions"):
+        monkeypatch.setattr(image_store, counter, 0)
+    return image_store
+
+
+@pytest.fixture
+def graph_simulator():
+    """
+    Route Graph API requests made by the tools to an in-process Graph API simulator.
+
+    Yields the GraphSimulator so tests can inspect its data or change fault injection.
+    """
+    import httpx
+    from unittest.mock import patch
+    from meta_ads_mcp.core.graph_simulator import GraphSimulator
+
+    simulator = GraphSimulator()
+    base_url = "http://graph.simulator"
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=simulator.create_app()), base_url=base_url)
+    with patch("meta_ads_mcp.core.api.META_GRAPH_API_BASE", f"{base_url}/v22.0"), \
+         patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.http_client.get_http_client", return_value=client):
+        yield simulator
+
+
 @pytest.fixture(scope="session")
 def server_url():
     """Default server URL for tests"""
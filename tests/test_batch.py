@@ -0,0 +1,165 @@
+"""Tests for the Graph API batch request engine."""
+
+import json
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from meta_ads_mcp.core.batch import (
+    build_relative_url,
+    make_batch_request,
+    batch_get,
+    _chunk_requests,
+    _limit_endpoint,
+    _normalize_sub_request,
+)
+from meta_ads_mcp.core.circuit_breaker import CircuitBreakerRegistry
+from meta_ads_mcp.core.error_classifier import THROTTLED
+
+
+def _graph_item(body, code=200):
+    return {"code": code, "headers": [], "body": json.dumps(body)}
+
+
+def test_build_relative_url_keeps_jsonpath_references():
+    """JSONPath result references must not be percent-encoded."""
+    url = build_relative_url("", {"ids": "{result=ad:$.creative.id}", "fields": "id,name"})
+    assert url == "?ids={result=ad:$.creative.id}&fields=id,name"
+
+
+def test_normalize_endpoint_form():
+    """The make_api_request style form is converted to Graph wire format."""
+    sub_request = _normalize_sub_request({"endpoint": "act_1/campaigns", "params": {"limit": 5}, "name": "c"})
+    assert sub_request["method"] == "GET"
+    assert sub_request["relative_url"] == "act_1/campaigns?limit=5"
+    assert sub_request["name"] == "c"
+    assert sub_request["omit_response_on_success"] is False
+
+
+def test_normalize_requires_url():
+    with pytest.raises(ValueError):
+        _normalize_sub_request({"method": "GET"})
+
+
+def test_chunking_respects_limit():
+    """120 independent requests need ceil(120/50) = 3 batch calls."""
+    sub_requests = [{"method": "GET", "relative_url": str(i)} for i in range(120)]
+    chunks = _chunk_requests(sub_requests)
+    assert [len(c) for c in chunks] == [50, 50, 20]
+
+
+def test_chunking_keeps_dependencies_together():
+    """A request and the one it references must land in the same batch call."""
+    sub_requests = [{"method": "GET", "relative_url": str(i)} for i in range(49)]
+    sub_requests.append({"method": "GET", "relative_url": "parent", "name": "parent"})
+    sub_requests.append({"method": "GET", "relative_url": "?ids={result=parent:$.id}"})
+    chunks = _chunk_requests(sub_requests)
+    assert any(49 in chunk and 50 in chunk for chunk in chunks)
+    assert all(len(chunk) <= 50 for chunk in chunks)
+
+
+def test_chunking_rejects_unknown_reference():
+    with pytest.raises(ValueError):
+        _chunk_requests([{"method": "GET", "relative_url": "x", "depends_on": "missing"}])
+
+
+@pytest.mark.asyncio
+async def test_make_batch_request_returns_per_item_results():
+    """Each sub-request gets its own parsed result, including errors and skipped items."""
+    graph_response = [
+        _graph_item({"id": "1", "name": "first"}),
+        _graph_item({"error": {"message": "bad", "code": 100}}, code=400),
+        None,
+    ]
+    with patch("meta_ads_mcp.core.batch.make_api_request", new=AsyncMock(return_value=graph_response)) as mock_request:
+        results = await make_batch_request(
+            [
+                {"relative_url": "1"},
+                {"relative_url": "2"},
+                {"relative_url": "3"},
+            ],
+            "test_token"
+        )
+
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert args[0] == ""
+    assert kwargs["method"] == "POST"
+    assert kwargs["limit_endpoint"] == "batch"
+    assert len(args[2]["batch"]) == 3
+
+    assert results[0] == {"status_code": 200, "data": {"id": "1", "name": "first"}}
+    assert results[1]["error"]["code"] == 100
+    assert results[2]["status_code"] is None and "error" in results[2]
+
+
+def test_limit_endpoint_uses_shared_account_or_batch_key():
+    """A batch counts against its sub-requests' ad account only when they all share one."""
+    assert _limit_endpoint([{"relative_url": "act_1/campaigns"}, {"relative_url": "act_1/adsets?limit=5"}]) == "act_1"
+    assert _limit_endpoint([{"relative_url": "act_1/campaigns"}, {"relative_url": "act_2/campaigns"}]) == "batch"
+    assert _limit_endpoint([{"relative_url": "act_1/campaigns"}, {"relative_url": "123"}]) == "batch"
+
+
+@pytest.mark.asyncio
+async def test_batch_for_one_account_respects_its_open_breaker():
+    """A batch of one account's reads is rejected while that account's breaker is open."""
+    client = MagicMock()
+    client.post = AsyncMock()
+    registry = CircuitBreakerRegistry(enabled=True)
+    breaker = registry._breaker("act_1")
+    breaker.failure_threshold = 1
+    breaker.record_failure(THROTTLED)
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.circuit_breakers", registry):
+        results = await make_batch_request(
+            [{"relative_url": "act_1/campaigns"}, {"relative_url": "act_1/adsets"}], "test_token"
+        )
+
+    client.post.assert_not_called()
+    assert all(r["error"]["circuit_breaker"] == "act_1" for r in results)
+    # Other accounts and the root endpoint are unaffected
+    assert registry.check("act_2/campaigns") is None
+    assert registry.check("") is None
+
+
+@pytest.mark.asyncio
+async def test_make_batch_request_reports_batch_failure_per_item():
+    """If the batch call itself fails, every item carries the error."""
+    with patch("meta_ads_mcp.core.batch.make_api_request", new=AsyncMock(return_value={"error": {"message": "boom"}})):
+        results = await make_batch_request([{"relative_url": "1"}, {"relative_url": "2"}], "test_token")
+    assert all(r["error"] == {"message": "boom"} for r in results)
+
+
+@pytest.mark.asyncio
+async def test_ad_image_tools_report_creative_errors():
+    """A failed creative sub-request is reported instead of looking like a creative without images."""
+    from meta_ads_mcp.core.ads import get_ad_image, save_ad_image_locally
+
+    results = [
+        {"status_code": 200, "data": {"id": "1", "account_id": "42", "creative": {"id": "2"}}},
+        {"status_code": 400, "error": {"message": "Unsupported get request", "code": 100}},
+    ]
+    with patch("meta_ads_mcp.core.ads.make_batch_request", new=AsyncMock(return_value=results)), \
+         patch("meta_ads_mcp.core.ads.get_ad_creatives", new=AsyncMock()) as fallback:
+        image = await get_ad_image(access_token="test_token", ad_id="1")
+        saved = await save_ad_image_locally(access_token="test_token", ad_id="1")
+
+    assert json.loads(image)["data"].startswith("Error: Could not get creative details")
+    assert "Unsupported get request" in json.loads(image)["data"]
+    assert "Unsupported get request" in json.loads(saved)["error"]
+    fallback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_uses_one_call_per_fifty_requests():
+    calls = []
+
+    async def fake_request(endpoint, access_token, params, method="GET", allow_retry=None, limit_endpoint=None):
+        calls.append(params["batch"])
+        return [_graph_item({"id": item["relative_url"].split("?")[0]}) for item in params["batch"]]
+
+    with patch("meta_ads_mcp.core.batch.make_api_request", new=fake_request):
+        pages = await batch_get([{"endpoint": f"{i}", "params": {"fields": "id"}} for i in range(75)], "test_token")
+
+    assert len(calls) == 2
+    assert [p["id"] for p in pages] == [str(i) for i in range(75)]
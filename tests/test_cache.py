@@ -0,0 +1,111 @@
+"""Tests for the in-memory Graph API response cache."""
+
+import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from meta_ads_mcp.core.api import make_api_request
+from meta_ads_mcp.core.cache import ResponseCache, response_cache
+from meta_ads_mcp.core.singleflight import make_request_key
+
+
+def _key(endpoint, params=None):
+    return make_request_key("token", endpoint, params or {})
+
+
+def test_per_endpoint_ttls():
+    cache = ResponseCache()
+    assert cache.ttl_for("search") == 6 * 3600
+    assert cache.ttl_for("act_123") == 600
+    assert cache.ttl_for("act_123/campaigns") == 60
+    assert cache.ttl_for("120000000/insights") == 300
+    assert cache.ttl_for("120000000/leads") == 0
+    assert cache.ttl_for("120000000") == 120
+
+
+def test_hit_miss_and_copy_on_read():
+    cache = ResponseCache()
+    key = _key("act_1")
+    assert cache.get(key) is None
+
+    cache.put(key, "act_1", {"id": "act_1", "tags": []})
+    first = cache.get(key)
+    first["tags"].append("mutated")
+
+    assert cache.get(key) == {"id": "act_1", "tags": []}
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+def test_errors_and_uncacheable_endpoints_are_skipped():
+    cache = ResponseCache()
+    cache.put(_key("act_1"), "act_1", {"error": {"message": "boom"}})
+    cache.put(_key("1/leads"), "1/leads", {"data": []})
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_expired_entries_miss():
+    cache = ResponseCache(policies=[(r".*", 0.001)])
+    key = _key("act_1")
+    cache.put(key, "act_1", {"id": "act_1"})
+    with patch("meta_ads_mcp.core.cache.time.monotonic", return_value=10**9):
+        assert cache.get(key) is None
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResponseCache(max_entries=2)
+    for i in range(3):
+        cache.put(_key(str(i)), str(i), {"id": str(i)})
+    assert cache.get(_key("0")) is None
+    assert cache.get(_key("2")) == {"id": "2"}
+    assert cache.get_stats()["evictions"] == 1
+
+    small = ResponseCache(max_bytes=100)
+    small.put(_key("1"), "1", {"blob": "x" * 60})
+    small.put(_key("2"), "2", {"blob": "y" * 60})
+    assert small.get_stats()["entries"] == 1
+    assert small.get(_key("2")) is not None
+
+
+def test_write_invalidates_object_and_lists():
+    cache = ResponseCache()
+    cache.put(_key("111"), "111", {"id": "111"})
+    cache.put(_key("111/insights"), "111/insights", {"data": []})
+    cache.put(_key("act_1/campaigns"), "act_1/campaigns", {"data": []})
+    cache.put(_key("222"), "222", {"id": "222"})
+
+    assert cache.invalidate_for_write("111", {"status": "PAUSED"}) == 3
+    assert cache.get(_key("222")) == {"id": "222"}
+
+
+def test_batch_write_invalidates_sub_request_objects():
+    cache = ResponseCache()
+    cache.put(_key("111"), "111", {"id": "111"})
+    cache.put(_key("222"), "222", {"id": "222"})
+
+    batch = '[{"method": "GET", "relative_url": "222"}, {"method": "POST", "relative_url": "111", "body": "status=PAUSED"}]'
+    cache.invalidate_for_write("", {"batch": batch})
+
+    assert cache.get(_key("111")) is None
+    assert cache.get(_key("222")) == {"id": "222"}
+
+
+@pytest.mark.asyncio
+async def test_make_api_request_serves_repeat_reads_from_cache():
+    request = httpx.Request("GET", "https://graph.facebook.com/v22.0/act_1")
+    client = MagicMock()
+    client.get = AsyncMock(return_value=httpx.Response(200, json={"id": "act_1", "name": "Old"}, request=request))
+    client.post = AsyncMock(return_value=httpx.Response(200, json={"success": True}, request=request))
+
+    hits_before = response_cache.get_stats()["hits"]
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client):
+        await make_api_request("act_1", "token", {"fields": "name"})
+        cached = await make_api_request("act_1", "token", {"fields": "name"})
+        assert client.get.await_count == 1
+        assert cached == {"id": "act_1", "name": "Old"}
+
+        await make_api_request("act_1", "token", {"name": "New"}, method="POST")
+        await make_api_request("act_1", "token", {"fields": "name"})
+
+    assert client.get.await_count == 2
+    assert response_cache.get_stats()["hits"] == hits_before + 1
@@ -0,0 +1,165 @@
+"""Tests for Graph error classification and the circuit breaker."""
+
+import asyncio
+import json
+import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from meta_ads_mcp.core.api import make_api_request
+from meta_ads_mcp.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    get_circuit_key,
+    CLOSED,
+    OPEN,
+    HALF_OPEN,
+)
+from meta_ads_mcp.core.error_classifier import (
+    classify_graph_error,
+    AUTH,
+    THROTTLED,
+    PERMISSION,
+    TRANSIENT,
+    CLIENT,
+)
+
+
+def _response(status_code, body):
+    request = httpx.Request("GET", "https://graph.facebook.com/v22.0/act_1/campaigns")
+    return httpx.Response(status_code, content=json.dumps(body).encode(), request=request)
+
+
+@pytest.mark.parametrize("code,status,expected", [
+    (190, 400, AUTH),
+    (102, 400, AUTH),
+    (4, 400, THROTTLED),
+    (17, 400, THROTTLED),
+    (80004, 400, THROTTLED),
+    (10, 400, PERMISSION),
+    (200, 403, PERMISSION),
+    (2, 500, TRANSIENT),
+    (100, 400, CLIENT),
+    (None, 401, AUTH),
+])
+def test_classify_graph_error(code, status, expected):
+    error_obj = {"code": code} if code is not None else {}
+    assert classify_graph_error(error_obj, status) == expected
+
+
+def test_circuit_key_groups_by_account_or_endpoint_shape():
+    assert get_circuit_key("act_123/campaigns") == "act_123"
+    assert get_circuit_key("120210000000/insights") == "{id}/insights"
+    assert get_circuit_key("me/adaccounts") == "me/adaccounts"
+
+
+def test_breaker_opens_after_threshold_and_half_opens():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0)
+    breaker.record_failure(THROTTLED)
+    assert breaker.state == CLOSED
+    breaker.record_failure(THROTTLED)
+    assert breaker.state == OPEN
+
+    # Recovery timeout elapsed: one trial request only
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_trial_reopens_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure(TRANSIENT)
+    assert not breaker.allow_request()
+    breaker.opened_until = 0
+    assert breaker.allow_request()
+    breaker.record_failure(TRANSIENT)
+    assert breaker.state == OPEN
+    assert breaker.retry_after() > 50
+
+
+def test_client_errors_do_not_trip_breaker():
+    registry = CircuitBreakerRegistry()
+    for _ in range(10):
+        registry.record("act_1/campaigns", CLIENT)
+        registry.record("act_1/campaigns", PERMISSION)
+    assert registry.check("act_1/campaigns") is None
+
+
+@pytest.mark.asyncio
+async def test_throttling_does_not_invalidate_token():
+    client = MagicMock()
+    client.get = AsyncMock(return_value=_response(400, {"error": {"code": 4, "message": "Application request limit reached"}}))
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.circuit_breakers", CircuitBreakerRegistry()), \
+         patch("meta_ads_mcp.core.api.auth_manager") as mock_auth_manager:
+        result = await make_api_request("act_1/campaigns", "token", {}, allow_retry=False)
+
+    assert result["error"]["category"] == THROTTLED
+    mock_auth_manager.invalidate_token.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_invalidated():
+    client = MagicMock()
+    client.get = AsyncMock(return_value=_response(400, {"error": {"code": 190, "message": "Error validating access token"}}))
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.circuit_breakers", CircuitBreakerRegistry()), \
+         patch("meta_ads_mcp.core.api.auth_manager") as mock_auth_manager:
+        result = await make_api_request("act_1/campaigns", "token", {})
+
+    assert result["error"]["category"] == AUTH
+    mock_auth_manager.invalidate_token.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast():
+    client = MagicMock()
+    client.get = AsyncMock(return_value=_response(400, {"error": {"code": 17, "message": "User request limit reached"}}))
+    registry = CircuitBreakerRegistry()
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.circuit_breakers", registry), \
+         patch("meta_ads_mcp.core.api.asyncio.sleep", new=AsyncMock()):
+        for _ in range(registry._breaker("act_1").failure_threshold):
+            await make_api_request("act_1/campaigns", "token", {}, allow_retry=False)
+        calls_before = client.get.call_count
+        result = await make_api_request("act_1/insights", "token", {})
+
+    assert client.get.call_count == calls_before
+    assert result["error"]["circuit_breaker"] == "act_1"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_releases_the_slot():
+    started = asyncio.Event()
+
+    async def hang(*args, **kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    client = MagicMock()
+    client.post = AsyncMock(side_effect=hang)
+    registry = CircuitBreakerRegistry()
+    breaker = registry._breaker("act_1")
+    breaker.failure_threshold = 1
+    breaker.recovery_timeout = 0
+    breaker.record_failure(THROTTLED)
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.circuit_breakers", registry):
+        trial = asyncio.create_task(make_api_request("act_1/campaigns", "token", {"name": "x"}, method="POST"))
+        await asyncio.wait_for(started.wait(), timeout=5)
+        assert breaker.state == HALF_OPEN and breaker.trial_in_flight
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+    # The next request gets the trial slot instead of being rejected forever
+    assert not breaker.trial_in_flight
+    assert registry.check("act_1/campaigns") is None
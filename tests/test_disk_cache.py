@@ -0,0 +1,114 @@
+"""Tests for the persistent SQLite response cache tier."""
+
+import pytest
+from unittest.mock import patch
+
+from meta_ads_mcp.core.cache import ResponseCache
+from meta_ads_mcp.core.disk_cache import DiskCache
+from meta_ads_mcp.core.singleflight import make_request_key
+
+
+def _key(endpoint):
+    return make_request_key("token", endpoint, {"fields": "id"})
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "response_cache.sqlite3"
+
+
+@pytest.mark.asyncio
+async def test_second_tier_is_shared_between_instances(db_path):
+    writer = ResponseCache(second_tier=DiskCache(path=db_path))
+    await writer.store(_key("act_1"), "act_1", {"id": "act_1"})
+
+    # A fresh process starts with an empty memory tier but the same database
+    reader_disk = DiskCache(path=db_path)
+    reader = ResponseCache(second_tier=reader_disk)
+    assert await reader.lookup(_key("act_1")) == {"id": "act_1"}
+    assert reader_disk.hits == 1
+
+    # Promoted into memory: the next lookup does not touch the database
+    assert await reader.lookup(_key("act_1")) == {"id": "act_1"}
+    assert reader_disk.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_rows_are_not_served(db_path):
+    disk = DiskCache(path=db_path)
+    await disk.put(_key("act_1"), "act_1", {"id": "act_1"}, ttl=60)
+    with patch("meta_ads_mcp.core.disk_cache.time.time", return_value=10**12):
+        assert await disk.get(_key("act_1")) is None
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_both_tiers(db_path):
+    cache = ResponseCache(second_tier=DiskCache(path=db_path))
+    await cache.store(_key("111"), "111", {"id": "111"})
+    await cache.store(_key("act_1/campaigns"), "act_1/campaigns", {"data": []})
+    await cache.store(_key("222"), "222", {"id": "222"})
+
+    await cache.invalidate_write("111", {"status": "PAUSED"})
+
+    fresh = ResponseCache(second_tier=DiskCache(path=db_path))
+    assert await fresh.lookup(_key("111")) is None
+    assert await fresh.lookup(_key("act_1/campaigns")) is None
+    assert await fresh.lookup(_key("222")) == {"id": "222"}
+
+
+@pytest.mark.asyncio
+async def test_writes_in_another_process_evict_the_memory_tier(db_path):
+    worker_a = ResponseCache(second_tier=DiskCache(path=db_path), sync_interval=0)
+    worker_b = ResponseCache(second_tier=DiskCache(path=db_path), sync_interval=0)
+    await worker_a.store(_key("111"), "111", {"id": "111", "status": "ACTIVE"})
+    await worker_a.store(_key("222"), "222", {"id": "222"})
+    assert await worker_b.lookup(_key("111")) == {"id": "111", "status": "ACTIVE"}
+    assert await worker_b.lookup(_key("222")) == {"id": "222"}
+
+    await worker_a.invalidate_write("111", {"status": "PAUSED"})
+    await worker_a.store(_key("111"), "111", {"id": "111", "status": "PAUSED"})
+
+    # Worker B's promoted memory copy is dropped instead of served stale
+    assert await worker_b.lookup(_key("111")) == {"id": "111", "status": "PAUSED"}
+    assert worker_b.get(_key("222")) == {"id": "222"}
+    # A process never replays its own writes
+    assert await worker_a.sync_invalidations(force=True) == 0
+
+
+@pytest.mark.asyncio
+async def test_maintenance_expires_and_enforces_caps(db_path):
+    disk = DiskCache(path=db_path, max_entries=2)
+    await disk.put(_key("1"), "1", {"id": "1"}, ttl=0.0001)
+    for i in range(2, 5):
+        await disk.put(_key(str(i)), str(i), {"id": str(i)}, ttl=60)
+
+    result = await disk.maintain()
+
+    assert result["expired"] == 1
+    assert result["evicted"] == 1
+    assert disk.get_stats()["entries"] == 2
+    # Least recently used row went first
+    assert await disk.get(_key("2")) is None
+    assert await disk.get(_key("4")) is not None
+
+
+def test_database_errors_are_contained(tmp_path):
+    disk = DiskCache(path=tmp_path / "missing-dir" / "cache.sqlite3")
+    assert disk.get_stats()["entries"] == 0
+    assert disk.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_clear_tenant_only_drops_that_tokens_rows(db_path):
+    from meta_ads_mcp.core.singleflight import token_identity
+
+    cache = ResponseCache(second_tier=DiskCache(path=db_path))
+    other_key = make_request_key("other-token", "act_2", {"fields": "id"})
+    await cache.store(_key("act_1"), "act_1", {"id": "act_1"})
+    await cache.store(other_key, "act_2", {"id": "act_2"})
+
+    assert await cache.clear_tenant(token_identity("token")) == 2
+
+    fresh = ResponseCache(second_tier=DiskCache(path=db_path))
+    assert await fresh.lookup(_key("act_1")) is None
+    assert await fresh.lookup(other_key) == {"id": "act_2"}
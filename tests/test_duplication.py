@@ -47,8 +47,8 @@ async def test_forward_duplication_request_with_token():
     mock_response.status_code = 403
     mock_response.json.return_value = {"error": "premium_feature"}
     
-    with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+    with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
+        mock_client.return_value.post.return_value = mock_response
         
         result = await _forward_duplication_request("campaign", "123456789", "test_token", {
             "name_suffix": " - Test"
@@ -60,8 +60,8 @@ async def test_forward_duplication_request_with_token():
         assert "premium feature" in result_json["message"]
         
         # Verify the HTTP request was made with correct parameters
-        mock_client.return_value.__aenter__.return_value.post.assert_called_once()
-        call_args = mock_client.return_value.__aenter__.return_value.post.call_args
+        mock_client.return_value.post.assert_called_once()
+        call_args = mock_client.return_value.post.call_args
         
         # Check URL
         assert call_args[0][0] == "https://mcp.pipeboard.co/api/meta/duplicate/campaign/123456789"
@@ -131,18 +131,18 @@ class TestDuplicationAPIContract:
         ]
         
         for resource_type, resource_id, expected_url in test_cases:
-            with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+            with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
                 mock_response = AsyncMock()
                 mock_response.status_code = 200
                 mock_response.json.return_value = {"success": True}
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                mock_client.return_value.post.return_value = mock_response
                 
                 await duplication._forward_duplication_request(
                     resource_type, resource_id, "test_token", {}
                 )
                 
                 # Verify the correct URL was called
-                call_args = mock_client.return_value.__aenter__.return_value.post.call_args
+                call_args = mock_client.return_value.post.call_args
                 actual_url = call_args[0][0]
                 assert actual_url == expected_url, f"Expected {expected_url}, got {actual_url}"
     
@@ -151,18 +151,18 @@ class TestDuplicationAPIContract:
         """Test that request headers are formatted correctly."""
         duplication = enable_feature
         
-        with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+        with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
             
             await duplication._forward_duplication_request(
                 "campaign", "123456789", "test_token_12345", {"name_suffix": " - Test"}
             )
             
             # Verify headers
-            call_args = mock_client.return_value.__aenter__.return_value.post.call_args
+            call_args = mock_client.return_value.post.call_args
             headers = call_args[1]["headers"]
             
             assert headers["Authorization"] == "Bearer test_token_12345"
@@ -174,18 +174,19 @@ class TestDuplicationAPIContract:
         """Test that request timeout is configured correctly."""
         duplication = enable_feature
         
-        with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+        with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
             
             await duplication._forward_duplication_request(
                 "campaign", "123456789", "test_token", {}
             )
             
-            # Verify timeout is set to 30 seconds
-            mock_client.assert_called_once_with(timeout=30.0)
+            # Verify timeout is set to 30 seconds on the shared client request
+            call_args = mock_client.return_value.post.call_args
+            assert call_args[1]["timeout"] == 30.0
 
 
 class TestDuplicationErrorHandling:
@@ -226,7 +227,7 @@ class TestDuplicationErrorHandling:
         ]
         
         for status_code, expected_error_type, response_type in status_code_tests:
-            with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+            with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
                 # Use MagicMock instead of AsyncMock for more predictable behavior
                 mock_response = MagicMock()
                 mock_response.status_code = status_code
@@ -241,7 +242,7 @@ class TestDuplicationErrorHandling:
                     mock_response.json.side_effect = Exception("No JSON")
                     mock_response.text = f"Error {status_code}"
                 
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                mock_client.return_value.post.return_value = mock_response
                 
                 result = await duplication._forward_duplication_request(
                     "campaign", "123", "token", {}
@@ -265,8 +266,8 @@ class TestDuplicationErrorHandling:
         ]
         
         for exception, expected_error in network_errors:
-            with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.post.side_effect = exception
+            with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
+                mock_client.return_value.post.side_effect = exception
                 
                 result = await duplication._forward_duplication_request(
                     "campaign", "123", "token", {}
@@ -293,11 +294,11 @@ class TestDuplicationParameterHandling:
         """Test that None values are filtered from options."""
         duplication = enable_feature
         
-        with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+        with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
             
             # Test with options containing None values
             options_with_none = {
@@ -312,7 +313,7 @@ class TestDuplicationParameterHandling:
             )
             
             # Verify None values were filtered out
-            call_args = mock_client.return_value.__aenter__.return_value.post.call_args
+            call_args = mock_client.return_value.post.call_args
             json_payload = call_args[1]["json"]
             
             expected_payload = {
@@ -424,7 +425,7 @@ class TestDuplicationIntegration:
                     mock_auth_manager.use_pipeboard = False
                     mock_meta_config.get_app_id.return_value = "valid_app_id"
                     
-                    with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+                    with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
                         # Mock successful response
                         mock_response = MagicMock()
                         mock_response.status_code = 200
@@ -438,7 +439,7 @@ class TestDuplicationIntegration:
                                 "creatives": 8
                             }
                         }
-                        mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                        mock_client.return_value.post.return_value = mock_response
                         
                         # Call the function with explicit token
                         result = await duplication.duplicate_campaign(
@@ -473,12 +474,12 @@ class TestDuplicationIntegration:
                     mock_auth_manager.use_pipeboard = False
                     mock_meta_config.get_app_id.return_value = "valid_app_id"
                     
-                    with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+                    with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
                         # Mock 403 response (premium feature required)
                         mock_response = MagicMock()
                         mock_response.status_code = 403
                         mock_response.json.return_value = {"error": "premium_feature"}
-                        mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                        mock_client.return_value.post.return_value = mock_response
                         
                         result = await duplication.duplicate_campaign(
                             campaign_id="123456789",
@@ -594,11 +595,11 @@ class TestDuplicationRegressionEdgeCases:
         """Test handling of unicode parameters."""
         duplication = enable_feature
         
-        with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+        with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
             
             # Test with unicode characters
             unicode_suffix = " - 复制版本 🚀"
@@ -607,7 +608,7 @@ class TestDuplicationRegressionEdgeCases:
             )
             
             # Verify unicode is preserved in the request
-            call_args = mock_client.return_value.__aenter__.return_value.post.call_args
+            call_args = mock_client.return_value.post.call_args
             json_payload = call_args[1]["json"]
             assert json_payload["name_suffix"] == unicode_suffix
     
@@ -616,11 +617,11 @@ class TestDuplicationRegressionEdgeCases:
         """Test handling of large parameter values."""
         duplication = enable_feature
         
-        with patch("meta_ads_mcp.core.duplication.httpx.AsyncClient") as mock_client:
+        with patch("meta_ads_mcp.core.duplication.get_http_client", return_value=AsyncMock()) as mock_client:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
             
             # Test with very large budget value
             large_budget = 999999999.99
@@ -629,7 +630,7 @@ class TestDuplicationRegressionEdgeCases:
             )
             
             # Verify large values are preserved
-            call_args = mock_client.return_value.__aenter__.return_value.post.call_args
+            call_args = mock_client.return_value.post.call_args
             json_payload = call_args[1]["json"]
             assert json_payload["new_daily_budget"] == large_budget
     
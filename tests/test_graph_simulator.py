@@ -0,0 +1,145 @@
+"""Tests for the offline Graph API simulator, driving real tools against it."""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from meta_ads_mcp.core.api import make_api_request
+from meta_ads_mcp.core.ads import get_ad_image
+from meta_ads_mcp.core.campaigns import get_campaigns
+from meta_ads_mcp.core.circuit_breaker import CircuitBreakerRegistry
+from meta_ads_mcp.core.graph_simulator import parse_fields, resolve_json_path, select_fields
+from meta_ads_mcp.core.rate_limit import RateLimiter
+from meta_ads_mcp.core.retry import RetryPolicy
+
+
+def test_field_selection_handles_nested_fields():
+    fields = parse_fields("id,creative{id},targeting,insights.date_preset(last_7d)")
+    assert fields == {"id": None, "creative": {"id": None}, "targeting": None, "insights": None}
+
+    ad = {"id": "1", "name": "Ad", "creative": {"id": "2", "name": "Creative"}, "status": "ACTIVE"}
+    assert select_fields(ad, parse_fields("creative{id},status")) == {"id": "1", "creative": {"id": "2"}, "status": "ACTIVE"}
+
+
+def test_json_path_references():
+    data = {"creative": {"id": "42"}, "data": [{"id": "1"}, {"id": "2"}]}
+    assert resolve_json_path(data, "$.creative.id") == "42"
+    assert resolve_json_path(data, "$.data.*.id") == "1,2"
+    assert resolve_json_path(data, "$.missing") is None
+
+
+@pytest.mark.asyncio
+async def test_tools_follow_simulated_pagination(graph_simulator):
+    account_id = graph_simulator.first("account")
+
+    result = json.loads(await get_campaigns(access_token="token", account_id=account_id, limit=3, max_items=8))
+
+    assert len(result["data"]) == 8
+    # max_items caps the page size, so one page is enough
+    assert result["summary"]["pages_fetched"] == 1
+    assert result["summary"]["has_more"] is True
+
+    result = json.loads(await get_campaigns(access_token="token", account_id=account_id, limit=3, fetch_all=True))
+
+    assert len(result["data"]) == 10
+    assert result["summary"]["pages_fetched"] == 1
+    assert result["summary"]["has_more"] is False
+    assert {"id", "objective", "effective_status"} <= set(result["data"][0])
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_enumerates_large_accounts_in_few_pages():
+    import httpx
+    from meta_ads_mcp.core.ads import get_ads
+    from meta_ads_mcp.core.graph_simulator import GraphSimulator
+
+    simulator = GraphSimulator(accounts=1, campaigns_per_account=10, adsets_per_campaign=10, ads_per_adset=12)
+    base_url = "http://graph.simulator"
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=simulator.create_app()), base_url=base_url)
+    with patch("meta_ads_mcp.core.api.META_GRAPH_API_BASE", f"{base_url}/v22.0"), \
+         patch("meta_ads_mcp.core.api.get_http_client", return_value=client):
+        result = json.loads(await get_ads(access_token="token", account_id=simulator.first("account"), fetch_all=True))
+
+    assert len(result["data"]) == 1200
+    assert result["summary"] == {"total_items": 1200, "pages_fetched": 3, "has_more": False}
+
+
+@pytest.mark.asyncio
+async def test_get_ad_image_uses_batch_references_and_image_download(graph_simulator):
+    result = await get_ad_image(access_token="token", ad_id=graph_simulator.first("ad"))
+
+    assert not isinstance(result, str), result
+    assert result._format == "jpeg"
+    assert graph_simulator.stats()["responses_by_status"] == {200: 2}
+
+
+@pytest.mark.asyncio
+async def test_insights_levels_and_breakdowns(graph_simulator):
+    account_id = graph_simulator.first("account")
+
+    result = await make_api_request(f"{account_id}/insights", "token",
+                                    {"level": "campaign", "breakdowns": "gender", "limit": 100})
+
+    assert len(result["data"]) == 10 * 3
+    row = result["data"][0]
+    assert row["campaign_id"] in graph_simulator.objects
+    assert row["gender"] == "female"
+    assert "next" not in result["paging"]
+
+
+@pytest.mark.asyncio
+async def test_usage_headers_feed_the_rate_limiter(graph_simulator):
+    graph_simulator.configure(account_call_limit=10)
+    account_id = graph_simulator.first("account")
+    limiter = RateLimiter()
+
+    with patch("meta_ads_mcp.core.api.rate_limiter", limiter):
+        for fields in ("id", "name", "currency"):
+            await make_api_request(account_id, "token", {"fields": fields})
+
+    assert limiter.get_status(account_id)["accounts"][account_id]["utilization_pct"] == 30
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_are_retried_then_reported(graph_simulator):
+    graph_simulator.configure(error_rate=1.0)
+
+    with patch("meta_ads_mcp.core.api.retry_policy", RetryPolicy(max_attempts=2, backoff_base=0, jitter=0)), \
+         patch("meta_ads_mcp.core.api.circuit_breakers", CircuitBreakerRegistry()):
+        result = await make_api_request(graph_simulator.first("campaign"), "token", {"fields": "id"})
+
+    assert result["error"]["category"] == "transient"
+    assert graph_simulator.stats()["responses_by_status"] == {500: 2}
+
+
+@pytest.mark.asyncio
+async def test_unknown_objects_return_graph_errors(graph_simulator):
+    with patch("meta_ads_mcp.core.api.circuit_breakers", CircuitBreakerRegistry()):
+        result = await make_api_request("999", "token", {"fields": "id"})
+
+    assert result["error"]["details"]["error"]["code"] == 100
+
+
+@pytest.mark.asyncio
+async def test_every_registered_tool_has_a_simulator_fixture(graph_simulator, tmp_path):
+    from meta_ads_mcp.core.graph_simulator import UNSIMULATED_TOOLS
+    from meta_ads_mcp.core.load_test import text_reports_error
+    from meta_ads_mcp.core.server import mcp_server
+    from meta_ads_mcp.core.tool_manifest import load_manifest
+
+    names = [tool["name"] for tool in load_manifest()]
+    assert set(UNSIMULATED_TOOLS) <= set(names)
+    cases = graph_simulator.manifest_cases(names)
+    assert {tool for _, tool, _ in cases} | set(UNSIMULATED_TOOLS) == set(names)
+
+    failures = []
+    for label, tool, arguments in cases:
+        if tool == "save_ad_image_locally":
+            arguments = dict(arguments, output_dir=str(tmp_path))
+        content = await mcp_server.call_tool(tool, dict(arguments, access_token="token"))
+        content = content[0] if isinstance(content, tuple) else content
+        failures += [label for item in content if text_reports_error(getattr(item, "text", None) or "")]
+    assert failures == []
+
+    with pytest.raises(ValueError, match="new_tool"):
+        graph_simulator.manifest_cases(names + ["new_tool"])
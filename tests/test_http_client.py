@@ -0,0 +1,128 @@
+"""Tests for the shared, pooled HTTP client manager."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+import threading
+
+from meta_ads_mcp.core.http_client import HTTPClientManager, bind_to_server_lifecycle, run_with_private_client
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_within_event_loop():
+    """The same pooled client should be returned for every call on one loop."""
+    manager = HTTPClientManager()
+    try:
+        first = manager.get_client()
+        second = manager.get_client()
+        assert first is second
+        assert first.is_closed is False
+    finally:
+        await manager.aclose()
+
+
+def test_new_event_loop_gets_new_client():
+    """A client bound to a finished event loop must not be reused."""
+    manager = HTTPClientManager()
+
+    async def grab():
+        return manager.get_client()
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_client():
+    """Closing the manager should close the underlying client."""
+    manager = HTTPClientManager()
+    client = manager.get_client()
+    await manager.aclose()
+    assert client.is_closed
+    # A later request transparently creates a new client
+    assert manager.get_client() is not client
+    await manager.aclose()
+
+
+def test_http2_falls_back_without_h2():
+    """Requesting HTTP/2 without the h2 package should not break client creation."""
+    manager = HTTPClientManager(http2=True)
+    with patch("meta_ads_mcp.core.http_client._http2_available", return_value=False):
+        client = manager._create_client()
+    assert client is not None
+
+
+@pytest.mark.asyncio
+async def test_bind_to_server_lifecycle_closes_client_on_shutdown():
+    """The transport coroutine should open the client on start and close it on exit."""
+
+    class FakeServer:
+        async def run_stdio_async(self):
+            return "done"
+
+    server = FakeServer()
+    with patch("meta_ads_mcp.core.http_client.http_client_manager", HTTPClientManager()) as manager:
+        bind_to_server_lifecycle(server)
+        assert await server.run_stdio_async() == "done"
+        assert len(manager._clients) == 0
+
+
+@pytest.mark.asyncio
+async def test_other_event_loop_does_not_replace_client():
+    """A request from another thread's loop must leave this loop's pool alone."""
+    manager = HTTPClientManager()
+    try:
+        client = manager.get_client()
+        other = []
+
+        async def grab():
+            other.append(manager.get_client())
+
+        thread = threading.Thread(target=asyncio.run, args=(grab(),))
+        thread.start()
+        thread.join()
+        assert other[0] is not client
+        assert manager.get_client() is client
+        assert not client.is_closed
+    finally:
+        await manager.aclose()
+
+
+def test_private_client_is_closed_and_leaves_shared_pool_alone():
+    """Throwaway loops get their own client, closed when the coroutine finishes."""
+    manager = HTTPClientManager()
+    seen = []
+
+    async def request():
+        from meta_ads_mcp.core.http_client import get_http_client
+        seen.append(get_http_client())
+        return "ok"
+
+    with patch("meta_ads_mcp.core.http_client.http_client_manager", manager):
+        assert run_with_private_client(request()) == "ok"
+
+    assert seen[0].is_closed
+    assert len(manager._clients) == 0 and manager._unbound is None
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_token_refresher():
+    from meta_ads_mcp.core.token_refresher import TokenRefresher
+
+    refresher = TokenRefresher(enabled=True)
+
+    class FakeServer:
+        async def run_stdio_async(self):
+            refresher._task = asyncio.get_running_loop().create_task(asyncio.sleep(3600))
+            return refresher._task
+
+    server = FakeServer()
+    with patch("meta_ads_mcp.core.http_client.http_client_manager", HTTPClientManager()), \
+         patch("meta_ads_mcp.core.http_client.token_refresher", refresher):
+        bind_to_server_lifecycle(server)
+        task = await server.run_stdio_async()
+
+    assert task.cancelled()
+    assert refresher.get_stats()["running"] is False
@@ -0,0 +1,75 @@
+"""Tests for off-loop image processing used by get_ad_image."""
+
+import asyncio
+import io
+import pytest
+from PIL import Image as PILImage
+
+from meta_ads_mcp.core.ads import get_ad_image
+from meta_ads_mcp.core.image_processing import ImageProcessor, image_processor, process_image
+
+
+def _png(size=(4000, 2000), mode="RGBA"):
+    buffer = io.BytesIO()
+    PILImage.new(mode, size, (200, 10, 10, 255) if mode == "RGBA" else (200, 10, 10)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_process_image_downscales_and_converts_to_jpeg():
+    jpeg, info = process_image(_png(), max_dimension=1000, quality=80)
+
+    output = PILImage.open(io.BytesIO(jpeg))
+    assert output.format == "JPEG"
+    assert output.mode == "RGB"
+    assert output.size == (1000, 500)
+    assert (info["width"], info["height"]) == (4000, 2000)
+    assert (info["output_width"], info["output_height"]) == (1000, 500)
+
+
+def test_process_image_keeps_small_images_and_optionally_original_size():
+    assert PILImage.open(io.BytesIO(process_image(_png((300, 200)), max_dimension=1000)[0])).size == (300, 200)
+    assert PILImage.open(io.BytesIO(process_image(_png((3000, 200)), max_dimension=0)[0])).size == (3000, 200)
+
+
+@pytest.mark.asyncio
+async def test_identical_hashes_are_processed_once():
+    processor = ImageProcessor(workers=2, max_dimension=500)
+    image = _png((1200, 800), mode="RGB")
+
+    results = await asyncio.gather(*(processor.process(image, "abc") for _ in range(5)))
+    await processor.process(image, "abc")
+
+    assert processor.processed == 1
+    assert all(result[0] == results[0][0] for result in results)
+    assert processor.lookup("abc")[1]["output_width"] == 500
+
+    await processor.process(image)
+    assert processor.processed == 2
+    assert processor.get_stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_processed_images_are_evicted_by_size():
+    processor = ImageProcessor(max_dimension=200)
+    first, _ = await processor.process(_png((400, 400), mode="RGB"), "first")
+    processor.cache_max_bytes = len(first) + 1
+
+    await processor.process(_png((300, 300), mode="RGB"), "second")
+
+    assert processor.lookup("first") is None
+    assert processor.lookup("second") is not None
+    assert processor.total_bytes <= processor.cache_max_bytes
+
+
+@pytest.mark.asyncio
+async def test_get_ad_image_reuses_processed_image(graph_simulator):
+    ad_id = graph_simulator.first("ad")
+
+    first = await get_ad_image(access_token="token", ad_id=ad_id)
+    requests = graph_simulator.stats()["requests"]
+    second = await get_ad_image(access_token="token", ad_id=ad_id)
+
+    assert first.data == second.data
+    assert image_processor.processed >= 1
+    # Only the ad/creative lookup is repeated; the image is neither listed nor downloaded again
+    assert graph_simulator.stats()["requests"] == requests + 1
@@ -0,0 +1,97 @@
+"""Tests for the content-addressed ad image cache."""
+
+import asyncio
+import json
+import os
+import pytest
+
+from meta_ads_mcp.core.ads import get_ad_image, save_ad_image_locally
+from meta_ads_mcp.core.image_processing import image_processor
+from meta_ads_mcp.core.image_store import ImageStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ImageStore(directory=tmp_path / "images", max_bytes=1000)
+
+
+@pytest.mark.asyncio
+async def test_images_round_trip_with_metadata(store):
+    assert await store.put("abc123", b"x" * 100, {"url": "https://cdn/abc.png", "width": 10})
+
+    assert await store.get("abc123") == b"x" * 100
+    metadata = await store.get_metadata("abc123")
+    assert metadata["url"] == "https://cdn/abc.png"
+    assert metadata["width"] == 10
+    assert await store.get("missing") is None
+    assert (store.hits, store.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_unsafe_hashes_are_not_cached(store):
+    assert not await store.put("../escape", b"x")
+    assert not await store.put("", b"x")
+    assert not (store.directory.parent / "escape").exists()
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_images_are_evicted(store):
+    for name, mtime in (("old", 1000), ("recent", 2000)):
+        await store.put(name, b"x" * 400)
+        path = store.directory / name[:2] / name
+        os.utime(path, (mtime, mtime))
+
+    await store.put("new", b"x" * 400)
+
+    assert await store.get("old") is None
+    assert await store.get("recent") is not None
+    assert await store.get("new") is not None
+    assert store.total_bytes == 800
+    assert store.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_puts_keep_size_accounting_exact(store):
+    await asyncio.gather(*(store.put(f"img{i:02d}", b"x" * (50 + i)) for i in range(40)))
+
+    on_disk = sum(size for _, size, _ in store._entries())
+    assert store.total_bytes == on_disk
+    assert on_disk <= store.max_bytes
+    assert store.evictions == 40 - len(store._entries())
+
+
+@pytest.mark.asyncio
+async def test_copy_to_places_cached_image(store, tmp_path):
+    await store.put("abc123", b"image")
+    destination = tmp_path / "out" / "ad.jpg"
+
+    assert await store.copy_to("abc123", str(destination))
+    assert destination.read_bytes() == b"image"
+    # The saved file is the user's own: writable and separate from the cache
+    assert os.access(destination, os.W_OK)
+    assert not os.path.samefile(destination, store._paths("abc123")[0])
+    destination.write_bytes(b"edited")
+    assert await store.get("abc123") == b"image"
+    # Saving again replaces the previous copy
+    assert await store.copy_to("abc123", str(destination))
+    assert destination.read_bytes() == b"image"
+    assert not await store.copy_to("missing", str(tmp_path / "other.jpg"))
+
+
+@pytest.mark.asyncio
+async def test_tools_reuse_downloaded_images(graph_simulator, isolated_image_store, tmp_path):
+    ad_id = graph_simulator.first("ad")
+
+    await get_ad_image(access_token="token", ad_id=ad_id)
+    assert graph_simulator.stats()["requests"] == 2
+
+    # A new process has an empty memory tier but finds the bytes on disk
+    image_processor.clear()
+    await get_ad_image(access_token="token", ad_id=ad_id)
+    result = await save_ad_image_locally(access_token="token", ad_id=ad_id, output_dir=str(tmp_path / "saved"))
+    filepath = json.loads(result)["filepath"]
+
+    assert os.path.exists(filepath)
+    # Only the ad/creative lookups were repeated: no adimages request and no download
+    assert graph_simulator.stats()["requests"] == 4
+    assert isolated_image_store.hits == 2
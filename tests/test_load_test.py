@@ -0,0 +1,69 @@
+"""Tests for the bench-http load generator."""
+
+import json
+import httpx
+import pytest
+
+from meta_ads_mcp.core.load_test import classify_response, main, parse_tool_mix, percentile, summarize
+
+
+CASES = [
+    ("get_campaigns", "get_campaigns", {"limit": 25}),
+    ("get_campaigns[fetch_all]", "get_campaigns", {"fetch_all": True}),
+    ("get_ad_image", "get_ad_image", {"ad_id": "1"}),
+]
+
+
+def _rpc_response(message, status=200, content_type="application/json"):
+    body = message if isinstance(message, str) else json.dumps(message)
+    return httpx.Response(status, text=body, headers={"content-type": content_type})
+
+
+def test_percentiles_and_summary():
+    values = [i / 1000 for i in range(1, 101)]
+    assert percentile(values, 0.5) == 0.05
+    assert percentile(values, 0.99) == 0.099
+
+    summary = summarize(values, errors=5, wall_time=2.0)
+    assert summary["calls"] == 100
+    assert summary["error_rate"] == 0.05
+    assert summary["p95_ms"] == 95.0
+    assert summary["ops_per_second"] == 50.0
+
+
+def test_parse_tool_mix_matches_labels_and_tool_names():
+    mix = parse_tool_mix("get_campaigns=3,get_ad_image", CASES)
+    assert [(case[0], weight) for case, weight in mix] == [
+        ("get_campaigns", 3.0), ("get_campaigns[fetch_all]", 3.0), ("get_ad_image", 1.0)
+    ]
+    assert len(parse_tool_mix(None, CASES)) == 3
+    with pytest.raises(ValueError):
+        parse_tool_mix("no_such_tool", CASES)
+
+
+def test_classify_response():
+    ok = {"jsonrpc": "2.0", "id": 1, "result": {"content": [{"type": "text", "text": '{"data": []}'}], "isError": False}}
+    graph_error = {"jsonrpc": "2.0", "id": 1, "result": {"content": [{"type": "text", "text": '{"error": {"code": 17}}'}]}}
+    tool_error = {"jsonrpc": "2.0", "id": 1, "result": {"content": [], "isError": True}}
+
+    assert classify_response(_rpc_response(ok)) is None
+    assert classify_response(_rpc_response(f"event: message\ndata: {json.dumps(ok)}\n\n",
+                                           content_type="text/event-stream")) is None
+    assert classify_response(_rpc_response(graph_error)) == "graph_error"
+    assert classify_response(_rpc_response(tool_error)) == "tool_error"
+    assert classify_response(_rpc_response({"jsonrpc": "2.0", "id": 1, "error": {"code": -32602}})) == "jsonrpc_error"
+    assert classify_response(_rpc_response("", status=503)) == "http_503"
+
+
+def test_bench_http_against_simulator(tmp_path):
+    report_path = tmp_path / "report.json"
+
+    assert main(["--duration", "1", "--warmup", "0", "--concurrency", "2",
+                 "--mix", "get_account_info", "--json", str(report_path)]) == 0
+
+    report = json.loads(report_path.read_text())
+    assert report["overall"]["calls"] > 0
+    assert report["overall"]["errors"] == 0
+    assert report["settings"]["auth"] == "bearer"
+    assert set(report["tools"]) == {"get_account_info"}
+    assert report["graph"]["responses_by_status"].get("200", 0) > 0
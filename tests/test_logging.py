@@ -0,0 +1,56 @@
+"""Tests for log level configuration and level-gated hot-path logging."""
+
+import logging
+import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from meta_ads_mcp.core.api import make_api_request
+from meta_ads_mcp.core.utils import logger, set_log_level, _parse_log_level
+
+
+@pytest.fixture
+def restore_log_level():
+    previous = logger.level
+    yield
+    set_log_level(previous)
+
+
+def test_parse_log_level():
+    assert _parse_log_level("debug") == logging.DEBUG
+    assert _parse_log_level("WARNING") == logging.WARNING
+    assert _parse_log_level(logging.ERROR) == logging.ERROR
+    assert _parse_log_level("nonsense") == logging.INFO
+
+
+def test_set_log_level(restore_log_level):
+    set_log_level("WARNING")
+    assert logger.level == logging.WARNING
+    assert not logger.isEnabledFor(logging.INFO)
+
+
+@pytest.mark.asyncio
+async def test_request_params_are_not_formatted_above_debug(restore_log_level):
+    set_log_level("INFO")
+    request = httpx.Request("GET", "https://graph.facebook.com/v22.0/123")
+    client = MagicMock()
+    client.get = AsyncMock(return_value=httpx.Response(200, json={"id": "123"}, request=request))
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api._mask_params", side_effect=AssertionError("formatted")):
+        assert await make_api_request("123", "token", {"fields": "id"}) == {"id": "123"}
+
+
+@pytest.mark.asyncio
+async def test_debug_logging_masks_token(restore_log_level, caplog):
+    set_log_level("DEBUG")
+    request = httpx.Request("GET", "https://graph.facebook.com/v22.0/456")
+    client = MagicMock()
+    client.get = AsyncMock(return_value=httpx.Response(200, json={"id": "456"}, request=request))
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         caplog.at_level(logging.DEBUG, logger="meta-ads-mcp"):
+        await make_api_request("456", "secret-token-value", {"fields": "id"})
+
+    assert "***TOKEN***" in caplog.text
+    assert "secret-token-value" not in caplog.text
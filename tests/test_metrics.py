@@ -0,0 +1,150 @@
+"""Tests for the Prometheus-style runtime metrics."""
+
+import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+from mcp.server.fastmcp import FastMCP
+from starlette.testclient import TestClient
+
+from meta_ads_mcp.core.api import make_api_request, meta_api_tool
+from meta_ads_mcp.core.metrics import (
+    Counter,
+    Histogram,
+    RuntimeMetrics,
+    bind_metrics_endpoint,
+    endpoint_template,
+)
+
+
+@pytest.fixture
+def metrics():
+    fresh = RuntimeMetrics(enabled=True)
+    with patch("meta_ads_mcp.core.api.runtime_metrics", fresh), \
+         patch("meta_ads_mcp.core.metrics.runtime_metrics", fresh):
+        yield fresh
+
+
+def _client(response):
+    client = MagicMock()
+    client.get = AsyncMock(return_value=response)
+    return client
+
+
+def test_endpoint_template_collapses_ids():
+    assert endpoint_template("act_123456/campaigns") == "act_{id}/campaigns"
+    assert endpoint_template("120211/insights") == "{id}/insights"
+    assert endpoint_template("/987654321") == "{id}"
+    assert endpoint_template("me/adaccounts?limit=5") == "me/adaccounts"
+
+
+def test_counter_and_histogram_exposition():
+    counter = Counter("requests_total", "Requests", ["status"])
+    counter.inc(status=200)
+    counter.inc(2, status=200)
+    histogram = Histogram("latency_seconds", "Latency", ["tool"], buckets=(0.1, 1.0))
+    histogram.observe(0.05, tool="t")
+    histogram.observe(0.5, tool="t")
+    histogram.observe(5, tool="t")
+
+    assert counter.render() == [
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{status="200"} 3',
+    ]
+    assert histogram.render()[2:] == [
+        'latency_seconds_bucket{tool="t",le="0.1"} 1',
+        'latency_seconds_bucket{tool="t",le="1"} 2',
+        'latency_seconds_bucket{tool="t",le="+Inf"} 3',
+        'latency_seconds_sum{tool="t"} 5.55',
+        'latency_seconds_count{tool="t"} 3',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_graph_requests_are_counted_by_endpoint_and_status(metrics):
+    ok = httpx.Response(200, json={"id": "1"}, request=httpx.Request("GET", "https://graph.facebook.com/v22.0/act_1"))
+    denied = httpx.Response(400, json={"error": {"code": 100, "message": "Invalid"}},
+                            request=httpx.Request("GET", "https://graph.facebook.com/v22.0/act_2"))
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=_client(ok)):
+        await make_api_request("act_1", "token", {"fields": "id"})
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=_client(denied)):
+        await make_api_request("act_2", "token", {"fields": "id"})
+
+    assert metrics.graph_requests.get(method="GET", endpoint="act_{id}", status=200) == 1
+    assert metrics.graph_requests.get(method="GET", endpoint="act_{id}", status=400) == 1
+    assert metrics.graph_duration.get_count(method="GET", endpoint="act_{id}") == 2
+    assert metrics.graph_in_flight.get() == 0
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_counted_by_outcome(metrics):
+    @meta_api_tool
+    async def good_tool(access_token: str = None):
+        return {"data": []}
+
+    @meta_api_tool
+    async def failing_tool(access_token: str = None):
+        return {"error": {"message": "boom"}}
+
+    await good_tool(access_token="token")
+    await failing_tool(access_token="token")
+
+    assert metrics.tool_calls.get(tool="good_tool", status="ok") == 1
+    assert metrics.tool_calls.get(tool="failing_tool", status="error") == 1
+    assert metrics.tool_duration.get_count(tool="good_tool") == 1
+    assert metrics.tool_calls_in_flight.get() == 0
+
+
+def test_metrics_endpoint_serves_exposition(metrics):
+    metrics.tool_calls.inc(tool="get_campaigns", status="ok")
+    server = FastMCP("metrics-test")
+    bind_metrics_endpoint(server)
+
+    response = TestClient(server.streamable_http_app()).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'meta_ads_tool_calls_total{tool="get_campaigns",status="ok"} 1' in response.text
+    assert 'meta_ads_cache_hits_total{tier="memory"}' in response.text
+    assert 'meta_ads_rate_limit_utilization_percent{bucket="app"}' in response.text
+
+
+def _busy_limiter():
+    from meta_ads_mcp.core.rate_limit import RateLimiter
+
+    limiter = RateLimiter()
+    limiter.record_response("act_111/insights", {"x-ad-account-usage": '{"acc_id_util_pct": 90}'})
+    limiter.record_response("act_222/insights", {"x-ad-account-usage": '{"acc_id_util_pct": 10}'})
+    return limiter
+
+
+def test_account_ids_are_not_labels_by_default(metrics):
+    with patch("meta_ads_mcp.core.metrics.rate_limiter", _busy_limiter()):
+        text = metrics.render()
+
+    assert "act_" not in text
+    assert 'meta_ads_rate_limit_utilization_percent{bucket="accounts_max"} 90' in text
+    assert "meta_ads_rate_limit_throttled_accounts 1" in text
+    assert 'meta_ads_circuit_breakers{state="open"} 0' in text
+
+
+def test_detailed_mode_labels_each_account():
+    detailed = RuntimeMetrics(enabled=True, detailed=True)
+    with patch("meta_ads_mcp.core.metrics.rate_limiter", _busy_limiter()):
+        text = detailed.render()
+
+    assert 'meta_ads_rate_limit_utilization_percent{bucket="act_111"} 90' in text
+    assert 'meta_ads_rate_limit_utilization_percent{bucket="act_222"} 10' in text
+
+
+def test_metrics_endpoint_checks_token(metrics):
+    server = FastMCP("metrics-test")
+    bind_metrics_endpoint(server, token="scrape-secret")
+    client = TestClient(server.streamable_http_app())
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "meta_ads_tool_calls_total" in response.text
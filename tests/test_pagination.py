@@ -0,0 +1,108 @@
+"""Tests for cursor pagination over Graph API list endpoints."""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from meta_ads_mcp.core.pagination import paginate, fetch_all_pages, _next_page_params
+
+
+def _fake_graph(total, page_size_default=25):
+    """Build a fake make_api_request serving `total` items with cursor paging"""
+    calls = []
+
+    async def fake_request(endpoint, access_token, params=None, method="GET", allow_retry=None):
+        calls.append(dict(params))
+        start = int(params.get("after", 0))
+        size = int(params.get("limit", page_size_default))
+        items = [{"id": str(i)} for i in range(start, min(start + size, total))]
+        response = {"data": items, "paging": {"cursors": {"before": str(start), "after": str(start + len(items))}}}
+        if start + len(items) < total:
+            response["paging"]["next"] = f"https://graph.facebook.com/v22.0/{endpoint}?after={start + len(items)}"
+        return response
+
+    return fake_request, calls
+
+
+def test_next_page_params_prefers_cursor_then_next_url():
+    assert _next_page_params({"paging": {"cursors": {"after": "abc"}, "next": "https://x/y?after=abc"}}) == {"after": "abc"}
+    assert _next_page_params({"paging": {"next": "https://x/y?offset=50&access_token=secret"}}) == {"offset": "50"}
+    assert _next_page_params({"paging": {"cursors": {"after": "abc"}}}) is None
+
+
+@pytest.mark.asyncio
+async def test_paginate_follows_cursors_to_the_end():
+    fake_request, calls = _fake_graph(55)
+    with patch("meta_ads_mcp.core.pagination.make_api_request", new=fake_request):
+        ids = [item["id"] async for item in paginate("act_1/ads", "token", {"limit": 20})]
+
+    assert ids == [str(i) for i in range(55)]
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_respects_max_items_and_resumes_exactly():
+    fake_request, calls = _fake_graph(100)
+    with patch("meta_ads_mcp.core.pagination.make_api_request", new=fake_request):
+        result = await fetch_all_pages("act_1/ads", "token", {"limit": 20}, max_items=45)
+
+    assert len(result["data"]) == 45
+    assert result["summary"] == {"total_items": 45, "pages_fetched": 3, "has_more": True}
+    # Last page is shrunk so the cursor points right after the 45th item
+    assert calls[-1]["limit"] == 5
+    assert result["paging"]["cursors"]["after"] == "45"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_items", [0, -5])
+async def test_fetch_all_rejects_max_items_below_one(max_items):
+    """max_items=0 is an invalid cap, not "no cap"."""
+    fake_request, calls = _fake_graph(100)
+    with patch("meta_ads_mcp.core.pagination.make_api_request", new=fake_request):
+        result = await fetch_all_pages("act_1/ads", "token", {"limit": 20}, max_items=max_items)
+        with pytest.raises(ValueError):
+            [item async for item in paginate("act_1/ads", "token", max_items=max_items)]
+
+    assert result["error"]["message"] == f"max_items must be at least 1, got {max_items}"
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_respects_max_pages():
+    fake_request, calls = _fake_graph(100)
+    with patch("meta_ads_mcp.core.pagination.make_api_request", new=fake_request):
+        result = await fetch_all_pages("act_1/ads", "token", {"limit": 10}, max_pages=2)
+
+    assert len(calls) == 2
+    assert len(result["data"]) == 20
+    assert result["summary"]["has_more"] is True
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_keeps_partial_results_on_later_error():
+    fake_request, _ = _fake_graph(100)
+
+    async def flaky_request(endpoint, access_token, params=None, method="GET", allow_retry=None):
+        if params.get("after"):
+            return {"error": {"message": "boom"}}
+        return await fake_request(endpoint, access_token, params)
+
+    with patch("meta_ads_mcp.core.pagination.make_api_request", new=flaky_request):
+        result = await fetch_all_pages("act_1/ads", "token", {"limit": 10})
+        first_page_error = await fetch_all_pages("act_1/ads", "token", {"after": "10"})
+
+    assert len(result["data"]) == 10
+    assert result["error"] == {"message": "boom"}
+    assert first_page_error == {"error": {"message": "boom"}}
+
+
+@pytest.mark.asyncio
+async def test_get_ads_fetch_all():
+    from meta_ads_mcp.core.ads import get_ads
+
+    fake_request, _ = _fake_graph(60)
+    with patch("meta_ads_mcp.core.pagination.make_api_request", new=fake_request):
+        result = json.loads(await get_ads(access_token="token", account_id="act_1", limit=25, fetch_all=True))
+
+    assert len(result["data"]) == 60
+    assert result["summary"]["has_more"] is False
@@ -0,0 +1,90 @@
+"""Tests for Pipeboard token retrieval."""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+
+from meta_ads_mcp.core.pipeboard_auth import PipeboardAuthManager, TokenInfo
+
+
+@pytest.fixture
+def manager(tmp_path):
+    with patch.dict("os.environ", {"PIPEBOARD_API_TOKEN": "pk_test"}), \
+         patch.object(PipeboardAuthManager, "_get_token_cache_path", return_value=tmp_path / "token.json"):
+        yield PipeboardAuthManager()
+
+
+@pytest.fixture
+def pipeboard():
+    """Serve /meta/token from a mock transport, counting requests"""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"access_token": f"EAAB{'x' * 30}{len(calls)}",
+                                         "expires_at": "2999-01-01T00:00:00Z"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("meta_ads_mcp.core.http_client.get_http_client", return_value=client):
+        yield calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_refresh(manager, pipeboard):
+    tokens = await asyncio.gather(*(manager.get_access_token_async() for _ in range(10)))
+
+    assert len(pipeboard) == 1
+    assert set(tokens) == {manager.token_info.access_token}
+    assert pipeboard[0].url.params["api_token"] == "pk_test"
+
+
+@pytest.mark.asyncio
+async def test_valid_cached_token_needs_no_request(manager, pipeboard):
+    manager.token_info = TokenInfo("cached_token", expires_at="2999-01-01T00:00:00Z")
+
+    assert await manager.get_access_token_async() == "cached_token"
+    assert pipeboard == []
+
+    manager.token_info = TokenInfo("expired_token", expires_at="2000-01-01T00:00:00Z")
+    assert await manager.get_access_token_async() != "expired_token"
+    assert len(pipeboard) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_failures_return_none(manager):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(404, text="no token")))
+    with patch("meta_ads_mcp.core.http_client.get_http_client", return_value=client):
+        assert await manager.get_access_token_async() is None
+    assert manager.token_info is None
+
+
+@pytest.mark.parametrize("expires_at, expected", [
+    ("2030-01-01T00:00:00Z", 1893456000.0),
+    ("2030-01-01T00:00:00.123456789Z", 1893456000.123456),
+    ("2030-01-01T05:30:00+05:30", 1893456000.0),
+    ("2029-12-31T16:00:00-08:00", 1893456000.0),
+    ("2030-01-01T00:00:00", 1893456000.0),
+    ("not a date", None),
+    (None, None),
+])
+def test_expiry_is_parsed_once_for_any_iso_offset(expires_at, expected):
+    token = TokenInfo("token", expires_at=expires_at)
+    if expected is None:
+        assert token.expiry_time() is None
+    else:
+        assert token.expiry_time() == pytest.approx(expected)
+
+
+def test_is_expired_applies_the_safety_skew():
+    token = TokenInfo("token", expires_at="2030-01-01T00:00:00Z")
+
+    with patch("meta_ads_mcp.core.pipeboard_auth.time.time", return_value=1893456000.0 - 30):
+        assert token.is_expired(skew=60)
+        assert not token.is_expired(skew=0)
+
+    # Reassigning expires_at (e.g. on deserialize) re-parses it
+    token.expires_at = "2000-01-01T00:00:00Z"
+    assert token.is_expired(skew=0)
+    assert not TokenInfo("token").is_expired()
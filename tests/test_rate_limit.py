@@ -0,0 +1,105 @@
+"""Tests for usage-header driven rate limiting."""
+
+import json
+import time
+import pytest
+
+from meta_ads_mcp.core.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    get_rate_limit_key,
+    RATE_LIMIT_SLOWDOWN_THRESHOLD,
+    RATE_LIMIT_PAUSE_THRESHOLD,
+)
+
+
+def test_rate_limit_key_extracts_ad_account():
+    assert get_rate_limit_key("act_123/campaigns") == "act_123"
+    assert get_rate_limit_key("123456") is None
+
+
+def test_low_utilization_keeps_full_rate():
+    bucket = TokenBucket(rate=10, capacity=10)
+    bucket.update_utilization(RATE_LIMIT_SLOWDOWN_THRESHOLD - 1)
+    assert bucket.rate == 10
+
+
+def test_high_utilization_slows_rate():
+    bucket = TokenBucket(rate=10, capacity=10)
+    midpoint = (RATE_LIMIT_SLOWDOWN_THRESHOLD + RATE_LIMIT_PAUSE_THRESHOLD) / 2
+    bucket.update_utilization(midpoint)
+    assert 0 < bucket.rate < 10
+
+
+def test_regain_time_blocks_bucket():
+    bucket = TokenBucket(rate=10, capacity=10)
+    bucket.update_utilization(100, regain_seconds=30)
+    assert bucket.try_consume() > 25
+
+
+def test_empty_bucket_reports_wait_time():
+    bucket = TokenBucket(rate=2, capacity=1)
+    bucket.update_utilization(RATE_LIMIT_SLOWDOWN_THRESHOLD)
+    assert bucket.try_consume() == 0
+    assert bucket.try_consume() > 0
+
+
+def test_low_utilization_needs_no_tokens():
+    bucket = TokenBucket(rate=2, capacity=1)
+    assert all(bucket.try_consume() == 0 for _ in range(100))
+    assert bucket.status()["current_rate_per_second"] is None
+
+    bucket.update_utilization(RATE_LIMIT_SLOWDOWN_THRESHOLD - 1)
+    assert all(bucket.try_consume() == 0 for _ in range(100))
+
+    bucket.update_utilization(RATE_LIMIT_SLOWDOWN_THRESHOLD)
+    assert bucket.try_consume() == 0
+    assert bucket.try_consume() > 0
+    assert bucket.status()["current_rate_per_second"] == 2
+
+
+def test_record_response_parses_usage_headers():
+    limiter = RateLimiter(enabled=True)
+    headers = {
+        "x-app-usage": json.dumps({"call_count": 80, "total_time": 10, "total_cputime": 5}),
+        "x-ad-account-usage": json.dumps({"acc_id_util_pct": 40, "reset_time_duration": 120}),
+        "x-business-use-case-usage": json.dumps({
+            "999": [{"type": "ads_management", "call_count": 60, "total_time": 1,
+                     "total_cputime": 1, "estimated_time_to_regain_access": 0}]
+        }),
+    }
+    limiter.record_response("act_42/ads", headers)
+    status = limiter.get_status()
+
+    assert status["app"]["utilization_pct"] == 80
+    assert status["accounts"]["act_42"]["utilization_pct"] == 60
+    # Account is not at its limit, so reset_time_duration must not block it
+    assert status["accounts"]["act_42"]["blocked_for_seconds"] == 0
+    assert "999" in status["business_use_cases"]
+
+
+def test_business_use_case_regain_time_blocks_account():
+    limiter = RateLimiter(enabled=True)
+    headers = {
+        "x-business-use-case-usage": json.dumps({
+            "999": [{"type": "ads_management", "call_count": 100, "total_time": 1,
+                     "total_cputime": 1, "estimated_time_to_regain_access": 2}]
+        }),
+    }
+    limiter.record_response("act_42/ads", headers)
+    assert limiter.get_status("42")["accounts"]["act_42"]["blocked_for_seconds"] > 100
+
+
+def test_malformed_headers_are_ignored():
+    limiter = RateLimiter(enabled=True)
+    limiter.record_response("act_1/ads", {"x-app-usage": "not json"})
+    assert limiter.get_status()["app"]["utilization_pct"] == 0
+
+
+@pytest.mark.asyncio
+async def test_disabled_limiter_never_waits():
+    limiter = RateLimiter(enabled=False)
+    limiter.record_response("act_1/ads", {"x-app-usage": json.dumps({"call_count": 100})})
+    start = time.monotonic()
+    assert await limiter.acquire("act_1/ads") == 0
+    assert time.monotonic() - start < 0.1
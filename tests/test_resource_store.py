@@ -0,0 +1,83 @@
+"""Tests for the bounded image resource store."""
+
+import base64
+import json
+import pytest
+
+from meta_ads_mcp.core.resource_store import ResourceStore, resource_store
+from meta_ads_mcp.core.resources import get_resource, list_resources, list_resources_page
+from meta_ads_mcp.core.utils import create_resource_from_image
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResourceStore(memory_bytes=1000, disk_bytes=2000, spill_dir=tmp_path)
+
+
+def test_least_recently_used_resources_spill_to_disk(store, tmp_path):
+    store.put("a", b"a" * 600, "A")
+    store.put("b", b"b" * 600, "B")
+
+    assert store.memory_used == 600
+    assert store.disk_used == 600
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Spilled resources are still served, from disk
+    assert base64.b64decode(store.get_base64("a")["data"]) == b"a" * 600
+    assert store.memory_used <= store.memory_bytes + len(store.get_base64("a")["data"])
+
+
+def test_resources_past_the_disk_budget_are_dropped(store):
+    for name in "abcd":
+        store.put(name, name.encode() * 900, name)
+
+    assert "a" not in store
+    assert store.get_base64("a") is None
+    assert store.get_base64("d")["mimeType"] == "image/jpeg"
+    assert store.disk_used <= store.disk_bytes
+    assert store.evictions == 1
+
+
+def test_base64_encoding_is_cached(store):
+    store.put("a", b"image", "A")
+
+    first = store.get_base64("a")["data"]
+    assert store.get_base64("a")["data"] is first
+
+
+def test_replacing_and_removing_resources(store):
+    store.put("a", b"x" * 800, "A")
+    store.put("b", b"y" * 800, "B")
+    store.put("a", b"z" * 10, "A2")
+    store.remove("b")
+
+    assert store.memory_used == 10
+    assert store.disk_used == 0
+    assert store.list()["resources"][0]["name"] == "A2"
+
+
+def test_list_paginates_in_insertion_order(store):
+    for i in range(5):
+        store.put(f"r{i}", b"x", f"R{i}")
+    store.get_base64("r0")  # access order does not change the listing
+
+    first = store.list(limit=2)
+    second = store.list(first["next_cursor"], limit=2)
+    last = store.list(second["next_cursor"], limit=2)
+
+    assert [r["name"] for r in first["resources"]] == ["R0", "R1"]
+    assert [r["name"] for r in second["resources"]] == ["R2", "R3"]
+    assert [r["uri"] for r in last["resources"]] == ["meta-ads://images/r4"]
+    assert "next_cursor" not in last
+
+
+@pytest.mark.asyncio
+async def test_resource_handlers_use_the_shared_store():
+    create_resource_from_image(b"image-bytes", "creative_1", "Creative 1")
+    try:
+        assert (await list_resources())["resources"][0]["uri"] == "meta-ads://images/creative_1"
+        assert (await list_resources_page("0"))["resources"][0]["name"] == "Creative 1"
+        assert base64.b64decode((await get_resource("creative_1"))["data"]) == b"image-bytes"
+        assert "error" in json.loads(await get_resource("missing"))
+    finally:
+        resource_store.clear()
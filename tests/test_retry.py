@@ -0,0 +1,131 @@
+"""Tests for retrying transient Graph API errors."""
+
+import json
+import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from meta_ads_mcp.core.api import make_api_request
+from meta_ads_mcp.core.retry import RetryPolicy, is_transient_error, get_retry_after
+
+
+def _http_error(status_code, error=None, headers=None):
+    return {
+        "error": {
+            "message": f"HTTP Error: {status_code}",
+            "details": {"error": error} if error else {},
+            "full_response": {"status_code": status_code, "headers": headers or {}}
+        }
+    }
+
+
+def _response(status_code, body, headers=None):
+    request = httpx.Request("GET", "https://graph.facebook.com/v22.0/act_1/campaigns")
+    return httpx.Response(status_code, content=json.dumps(body).encode(), headers=headers or {}, request=request)
+
+
+def test_transient_error_classification():
+    assert is_transient_error(_http_error(503))
+    assert is_transient_error(_http_error(400, {"code": 17, "message": "User request limit reached"}))
+    assert is_transient_error(_http_error(400, {"code": 100, "is_transient": True}))
+    assert is_transient_error({"error": {"message": "Network error: timed out", "is_transient": True}})
+    assert not is_transient_error(_http_error(400, {"code": 100, "message": "Invalid parameter"}))
+    assert not is_transient_error({"data": []})
+
+
+def test_retry_after_sources():
+    assert get_retry_after(_http_error(503, headers={"Retry-After": "7"})) == 7
+    buc = json.dumps({"123": [{"type": "ads_management", "estimated_time_to_regain_access": 2}]})
+    assert get_retry_after(_http_error(400, headers={"x-business-use-case-usage": buc})) == 120
+    assert get_retry_after(_http_error(503)) is None
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=0)
+    assert [policy.compute_delay(a) for a in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+
+def test_jitter_stays_within_delay():
+    policy = RetryPolicy(backoff_base=1, backoff_max=10, jitter=0.5)
+    for _ in range(20):
+        assert 1 <= policy.compute_delay(2) <= 2
+
+
+def test_writes_are_not_retried_by_default():
+    policy = RetryPolicy(max_attempts=3, jitter=0)
+    error = _http_error(503)
+    assert policy.next_delay("GET", error, 1) is not None
+    assert policy.next_delay("POST", error, 1) is None
+    assert policy.next_delay("POST", error, 1, allow_retry=True) is not None
+    assert policy.next_delay("GET", error, 1, allow_retry=False) is None
+    assert policy.next_delay("GET", error, 3) is None
+
+
+def test_long_server_wait_is_not_retried():
+    policy = RetryPolicy(backoff_max=30)
+    assert policy.next_delay("GET", _http_error(503, headers={"retry-after": "600"}), 1) is None
+
+
+@pytest.mark.asyncio
+async def test_make_api_request_retries_transient_get():
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=[
+        _response(500, {"error": {"code": 2, "message": "Service temporarily unavailable"}}),
+        _response(200, {"data": [{"id": "1"}]}),
+    ])
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        result = await make_api_request("act_1/campaigns", "token", {})
+
+    assert result == {"data": [{"id": "1"}]}
+    assert client.get.call_count == 2
+    mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_make_api_request_retries_timeouts():
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=[httpx.ReadTimeout("timed out"), _response(200, {"id": "1"})])
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.asyncio.sleep", new=AsyncMock()):
+        result = await make_api_request("123", "token", {})
+
+    assert result == {"id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_make_api_request_does_not_retry_post():
+    client = MagicMock()
+    client.post = AsyncMock(return_value=_response(503, {"error": {"code": 2, "message": "Service unavailable"}}))
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        result = await make_api_request("act_1/campaigns", "token", {"name": "x"}, method="POST")
+
+    assert "error" in result
+    assert client.post.call_count == 1
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_throttled_response_with_retry_after_is_retried():
+    from meta_ads_mcp.core.circuit_breaker import CircuitBreakerRegistry
+
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=[
+        _response(429, {"error": {"code": 17, "message": "User request limit reached"}}, headers={"Retry-After": "2"}),
+        _response(200, {"data": [{"id": "1"}]}),
+    ])
+    breakers = CircuitBreakerRegistry(enabled=True)
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.circuit_breakers", breakers), \
+         patch("meta_ads_mcp.core.api.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        result = await make_api_request("act_1/campaigns", "token", {})
+
+    assert result == {"data": [{"id": "1"}]}
+    assert client.get.call_count == 2
+    assert mock_sleep.await_args.args[0] >= 2
+    assert breakers.get_status() == {}
@@ -0,0 +1,67 @@
+"""Tests for single-pass serialization of tool results."""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from meta_ads_mcp.core import serialization
+from meta_ads_mcp.core.api import meta_api_tool
+from meta_ads_mcp.core.serialization import dumps_result
+
+
+def test_dumps_result_indented_and_compact():
+    data = {"data": [{"id": "1", "name": "Campaign"}]}
+    assert json.loads(dumps_result(data)) == data
+    assert "\n  " in dumps_result(data)
+    assert dumps_result(data, compact=True) == '{"data":[{"id":"1","name":"Campaign"}]}'
+
+
+def test_dumps_result_falls_back_to_json_module():
+    with patch.object(serialization, "orjson", None):
+        assert dumps_result({"a": 1}) == json.dumps({"a": 1}, indent=2)
+        assert dumps_result({"a": 1}, compact=True) == '{"a":1}'
+
+
+def test_dumps_result_stringifies_unknown_types():
+    class Opaque:
+        def __str__(self):
+            return "opaque"
+
+    assert json.loads(dumps_result({"value": Opaque()})) == {"value": "opaque"}
+
+
+@pytest.mark.asyncio
+async def test_meta_api_tool_serializes_dict_results_without_reparsing():
+    @meta_api_tool
+    async def tool(access_token: str = None):
+        return {"data": [1, 2, 3]}
+
+    with patch("meta_ads_mcp.core.api.json.loads", side_effect=AssertionError("re-parsed")):
+        result = await tool(access_token="token")
+
+    assert json.loads(result) == {"data": [1, 2, 3]}
+
+
+@pytest.mark.asyncio
+async def test_meta_api_tool_rewrites_app_id_errors():
+    @meta_api_tool
+    async def tool(access_token: str = None):
+        return {"error": "HTTP Error: 400", "details": {"error": {"code": 200, "message": "Provide valid app ID"}}}
+
+    result = json.loads(await tool(access_token="token"))
+
+    assert result["error"]["message"] == "Meta API Configuration Issue"
+
+
+@pytest.mark.asyncio
+async def test_meta_api_tool_still_accepts_json_strings():
+    @meta_api_tool
+    async def tool(access_token: str = None):
+        return json.dumps({"id": "1"})
+
+    @meta_api_tool
+    async def plain_text_tool(access_token: str = None):
+        return "Error: No ad ID provided"
+
+    assert json.loads(await tool(access_token="token")) == {"id": "1"}
+    assert json.loads(await plain_text_tool(access_token="token")) == {"data": "Error: No ad ID provided"}
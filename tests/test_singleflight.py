@@ -0,0 +1,91 @@
+"""Tests for coalescing identical concurrent Graph API reads."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from meta_ads_mcp.core.api import make_api_request
+from meta_ads_mcp.core.singleflight import SingleFlight, make_request_key
+
+
+def test_request_key_ignores_param_order_and_token_value():
+    a = make_request_key("token-a", "123", {"fields": "id,name", "limit": 10})
+    b = make_request_key("token-a", "/123/", {"limit": 10, "fields": "id,name", "access_token": "token-a"})
+    c = make_request_key("token-b", "123", {"fields": "id,name", "limit": 10})
+    assert a == b
+    assert a != c
+    assert "token-a" not in a[0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"data": [1, 2]}
+
+    results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(5)])
+
+    assert calls == 1
+    assert all(r == {"data": [1, 2]} for r in results)
+    # Each caller gets its own copy
+    results[1]["data"].append(3)
+    assert results[0] == {"data": [1, 2]}
+    assert flight.get_stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+    fetch = AsyncMock(return_value={"id": "1"})
+
+    await flight.do("key", fetch)
+    await flight.do("key", fetch)
+
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_follower_does_not_cancel_shared_call():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await asyncio.sleep(0.02)
+        return "done"
+
+    leader = asyncio.ensure_future(flight.do("key", fetch))
+    await started.wait()
+    follower = asyncio.ensure_future(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert await leader == "done"
+
+
+@pytest.mark.asyncio
+async def test_make_api_request_coalesces_identical_gets():
+    async def slow_get(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        request = httpx.Request("GET", "https://graph.facebook.com/v22.0/123")
+        return httpx.Response(200, json={"id": "123"}, request=request)
+
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=slow_get)
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client):
+        results = await asyncio.gather(
+            make_api_request("123", "token", {"fields": "id"}),
+            make_api_request("123", "token", {"fields": "id"}),
+            make_api_request("123", "token", {"fields": "name"}),
+        )
+
+    assert results[0] == results[1] == {"id": "123"}
+    assert client.get.await_count == 2
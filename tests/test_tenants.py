@@ -0,0 +1,155 @@
+"""Tests for per-tenant isolation of bearer tokens in HTTP mode."""
+
+import json
+import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from meta_ads_mcp.core.api import make_api_request
+from meta_ads_mcp.core.cache import response_cache
+from meta_ads_mcp.core.circuit_breaker import CircuitBreakerRegistry
+from meta_ads_mcp.core.error_classifier import AUTH
+from meta_ads_mcp.core.http_auth_integration import FastMCPAuthIntegration
+from meta_ads_mcp.core.rate_limit import RateLimiter
+from meta_ads_mcp.core.singleflight import make_request_key, token_identity
+from meta_ads_mcp.core.tenants import TenantRegistry, tenant_registry
+
+
+def _response(status_code, body, headers=None):
+    request = httpx.Request("GET", "https://graph.facebook.com/v22.0/act_1/campaigns")
+    return httpx.Response(status_code, content=json.dumps(body).encode(), headers=headers, request=request)
+
+
+@pytest.fixture
+def bearer_token():
+    """Act as an HTTP request carrying its own bearer token"""
+    token = "tenant-a-token-0123456789"
+    FastMCPAuthIntegration.set_auth_token(token)
+    yield token
+    FastMCPAuthIntegration.clear_auth_token()
+
+
+def test_server_token_has_no_tenant():
+    assert tenant_registry.identity_for("server-token") is None
+    assert tenant_registry.current_identity() is None
+
+
+def test_only_the_request_bearer_token_is_a_tenant(bearer_token):
+    assert tenant_registry.identity_for(bearer_token) == token_identity(bearer_token)
+    assert tenant_registry.identity_for("server-token") is None
+
+
+@pytest.mark.asyncio
+async def test_tenant_auth_error_does_not_invalidate_server_token(bearer_token):
+    client = MagicMock()
+    client.get = AsyncMock(return_value=_response(400, {"error": {"code": 190, "message": "Error validating access token"}}))
+
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client), \
+         patch("meta_ads_mcp.core.api.circuit_breakers", CircuitBreakerRegistry()), \
+         patch("meta_ads_mcp.core.api.auth_manager") as mock_auth_manager:
+        first = await make_api_request("act_1/campaigns", bearer_token, {})
+        second = await make_api_request("act_1/campaigns", bearer_token, {"limit": 5})
+
+    assert first["error"]["category"] == AUTH
+    mock_auth_manager.invalidate_token.assert_not_called()
+    # The rejected token fails fast instead of reaching Meta again
+    assert second["error"]["category"] == AUTH
+    assert client.get.call_count == 1
+    assert tenant_registry.get_stats()["revocations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_revoked_tenant_does_not_affect_other_tokens(bearer_token):
+    other_key = make_request_key("other-token-0123456789", "act_2")
+    response_cache.put(other_key, "act_2", {"id": "act_2"})
+    response_cache.put(make_request_key(bearer_token, "act_1"), "act_1", {"id": "act_1"})
+
+    tenant_registry.revoke(token_identity(bearer_token))
+
+    assert len(response_cache.entries) == 1
+    assert response_cache.get(other_key) == {"id": "act_2"}
+    assert tenant_registry.check(token_identity("other-token-0123456789")) is None
+    assert tenant_registry.check(token_identity(bearer_token))["error"]["category"] == AUTH
+
+
+def test_revocation_expires():
+    registry = TenantRegistry(revoked_ttl=0)
+    registry.revoke("tenant")
+    assert registry.check("tenant") is None
+
+
+@pytest.mark.asyncio
+async def test_account_buckets_are_per_tenant_and_app_bucket_is_shared():
+    limiter = RateLimiter()
+    headers = {
+        "x-app-usage": json.dumps({"call_count": 50}),
+        "x-ad-account-usage": json.dumps({"acc_id_util_pct": 100, "reset_time_duration": 60}),
+    }
+    limiter.record_response("act_1/insights", headers, tenant="a")
+
+    assert limiter.get_status("act_1", tenant="a")["accounts"]["act_1"]["utilization_pct"] == 100
+    assert limiter.get_status("act_1", tenant="b")["accounts"] == {}
+    assert limiter.get_status("act_1")["accounts"] == {}
+    assert limiter.get_status(tenant="b")["app"]["utilization_pct"] == 50
+    # Tenant b is not held back by tenant a's exhausted account
+    assert await limiter.acquire("act_1/insights", tenant="b") == 0
+
+
+def test_circuit_breakers_are_per_tenant():
+    registry = CircuitBreakerRegistry()
+    for _ in range(10):
+        registry.record("act_1/campaigns", "throttled", tenant="a")
+
+    assert registry.check("act_1/campaigns", tenant="a") is not None
+    assert registry.check("act_1/campaigns", tenant="b") is None
+    assert registry.check("act_1/campaigns") is None
+
+
+def test_evicted_tenants_lose_their_throttling_state():
+    registry = TenantRegistry(max_tenants=2)
+    limiter = RateLimiter()
+    with patch("meta_ads_mcp.core.tenants.rate_limiter", limiter):
+        for identity in ("a", "b"):
+            registry.check(identity)
+            limiter.record_response("act_1", {"x-ad-account-usage": json.dumps({"acc_id_util_pct": 10})}, tenant=identity)
+        registry.check("c")
+
+    assert list(registry.tenants) == ["b", "c"]
+    assert set(limiter.tenant_buckets) == {"b"}
+    assert registry.get_stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_business_usage_is_kept_per_tenant():
+    limiter = RateLimiter()
+    headers = {"x-business-use-case-usage": json.dumps({
+        "999": [{"type": "ads_management", "call_count": 100, "total_time": 1,
+                 "total_cputime": 1, "estimated_time_to_regain_access": 5}]
+    })}
+    limiter.record_response("me/adaccounts", headers, tenant="a")
+
+    assert limiter.get_status()["app"]["blocked_for_seconds"] == 0
+    assert limiter.get_status(tenant="a")["business"]["blocked_for_seconds"] > 200
+    assert limiter.get_status(tenant="a")["business_use_cases"] == {"999": json.loads(headers["x-business-use-case-usage"])["999"]}
+    # Other tenants and the server's own token neither wait nor see tenant a's businesses
+    assert await limiter.acquire("me/adaccounts", tenant="b") == 0
+    assert await limiter.acquire("me/adaccounts") == 0
+    assert limiter.get_status(tenant="b")["business_use_cases"] == {}
+    assert limiter.get_status()["business_use_cases"] == {}
+
+    limiter.forget("a")
+    assert limiter.get_status(tenant="a")["business_use_cases"] == {}
+
+
+@pytest.mark.asyncio
+async def test_tenant_cache_clear_keeps_other_tenants_entries(bearer_token):
+    from meta_ads_mcp.core.accounts import get_api_cache_stats
+
+    other_key = make_request_key("other-token-0123456789", "act_2")
+    response_cache.put(other_key, "act_2", {"id": "act_2"})
+    response_cache.put(make_request_key(bearer_token, "act_1"), "act_1", {"id": "act_1"})
+
+    result = json.loads(await get_api_cache_stats(clear=True))
+
+    assert result["cleared_entries"] == 1
+    assert response_cache.get(other_key) == {"id": "act_2"}
@@ -0,0 +1,112 @@
+"""Tests for the debug_token introspection cache."""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from meta_ads_mcp.core.error_classifier import AUTH, PERMISSION
+from meta_ads_mcp.core.token_introspection import TokenIntrospector, token_introspector
+
+
+def _debug_token(is_valid=True, scopes=("ads_read", "ads_management"), expires_at=0):
+    return {"data": {"is_valid": is_valid, "app_id": "123", "user_id": "456", "scopes": list(scopes), "expires_at": expires_at}}
+
+
+@pytest.mark.asyncio
+async def test_disabled_introspection_sends_nothing():
+    introspector = TokenIntrospector(enabled=False)
+    with patch("meta_ads_mcp.core.api.make_api_request", new=AsyncMock()) as request:
+        assert await introspector.check("token", ("leads_retrieval",)) is None
+    request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_result_is_cached_per_token():
+    introspector = TokenIntrospector(enabled=True, ttl=60)
+    with patch("meta_ads_mcp.core.api.make_api_request", new=AsyncMock(return_value=_debug_token(expires_at=2000000000))) as request:
+        first = await introspector.introspect("token-a")
+        second = await introspector.introspect("token-a")
+        await introspector.introspect("token-b")
+
+    assert first is second
+    assert first.scopes == {"ads_read", "ads_management"}
+    assert first.expires_at == 2000000000
+    assert request.call_count == 2
+    assert request.call_args_list[0].args == ("debug_token", "token-a", {"input_token": "token-a"})
+    assert introspector.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_fetched_again():
+    introspector = TokenIntrospector(enabled=True, ttl=0)
+    with patch("meta_ads_mcp.core.api.make_api_request", new=AsyncMock(return_value=_debug_token())) as request:
+        await introspector.introspect("token")
+        await introspector.introspect("token")
+    assert request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_scope_fails_fast():
+    introspector = TokenIntrospector(enabled=True)
+    with patch("meta_ads_mcp.core.api.make_api_request", new=AsyncMock(return_value=_debug_token())):
+        rejected = await introspector.check("token", ("leads_retrieval",), "get_lead_form_submissions")
+        allowed = await introspector.check("token", ("ads_read",))
+
+    assert rejected["error"]["category"] == PERMISSION
+    assert rejected["error"]["missing_scopes"] == ["leads_retrieval"]
+    assert "get_lead_form_submissions" in rejected["error"]["message"]
+    assert allowed is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_and_rejected_tokens_fail_fast():
+    introspector = TokenIntrospector(enabled=True)
+    refused = {"error": {"message": "HTTP Error: 400", "category": AUTH}}
+    with patch("meta_ads_mcp.core.api.make_api_request", new=AsyncMock(side_effect=[_debug_token(is_valid=False), refused])):
+        invalid = await introspector.check("invalid-token")
+        rejected = await introspector.check("rejected-token")
+
+    assert invalid["error"]["category"] == AUTH
+    assert rejected["error"]["category"] == AUTH
+
+
+@pytest.mark.asyncio
+async def test_unreachable_debug_token_fails_open():
+    introspector = TokenIntrospector(enabled=True)
+    unavailable = {"error": {"message": "Network error: timeout", "is_transient": True}}
+    with patch("meta_ads_mcp.core.api.make_api_request", new=AsyncMock(return_value=unavailable)) as request:
+        assert await introspector.check("token", ("leads_retrieval",)) is None
+        assert await introspector.check("token", ("leads_retrieval",)) is None
+    # Failures are not cached
+    assert request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_server_token_expiry_is_filled_in():
+    from meta_ads_mcp.core.auth import TokenInfo
+
+    token_info = TokenInfo("server-token")
+    with patch("meta_ads_mcp.core.auth.auth_manager") as auth_manager, \
+         patch("meta_ads_mcp.core.api.make_api_request",
+               new=AsyncMock(return_value=_debug_token(expires_at=token_info.created_at + 3600))):
+        auth_manager.use_pipeboard = False
+        auth_manager.token_info = token_info
+        await TokenIntrospector(enabled=True).introspect("server-token")
+
+    assert token_info.expiry_time() == token_info.created_at + 3600
+    assert token_info.user_id == "456"
+
+
+@pytest.mark.asyncio
+async def test_lead_submissions_skip_request_without_leads_retrieval():
+    from meta_ads_mcp.core.leadgen_forms import get_lead_form_submissions
+
+    debug_token = AsyncMock(return_value=_debug_token())
+    leads = AsyncMock(return_value={"data": []})
+    with patch.object(token_introspector, "enabled", True), \
+         patch("meta_ads_mcp.core.api.make_api_request", new=debug_token), \
+         patch("meta_ads_mcp.core.leadgen_forms.make_api_request", new=leads):
+        result = json.loads(await get_lead_form_submissions(access_token="token-without-leads", form_id="789"))
+
+    assert result["error"]["missing_scopes"] == ["leads_retrieval"]
+    leads.assert_not_called()
@@ -0,0 +1,72 @@
+"""Tests for background access token renewal."""
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from meta_ads_mcp.core.auth import TokenInfo
+from meta_ads_mcp.core.token_refresher import TokenRefresher
+
+
+def _meta_auth_manager(token_info):
+    return SimpleNamespace(use_pipeboard=False, token_info=token_info, _save_token_to_cache=lambda: None)
+
+
+def _token(expires_in, age=0):
+    token = TokenInfo("EAAB" + "x" * 40, expires_in=expires_in)
+    token.created_at = int(time.time()) - age
+    return token
+
+
+def test_refresh_is_scheduled_at_a_fraction_of_the_lifetime():
+    refresher = TokenRefresher(fraction=0.8)
+    token = TokenInfo("token", expires_in=1000)
+    token.created_at = 5000
+
+    assert refresher.refresh_at(token) == 5800
+    assert refresher.refresh_at(TokenInfo("token")) is None
+    assert refresher.refresh_at(None) is None
+
+
+@pytest.mark.asyncio
+async def test_meta_tokens_are_exchanged_off_the_request_path():
+    manager = _meta_auth_manager(_token(expires_in=100, age=90))
+    renewed = _token(expires_in=5_184_000)
+
+    with patch("meta_ads_mcp.core.auth.auth_manager", manager), \
+         patch("meta_ads_mcp.core.auth.exchange_token_for_long_lived", return_value=renewed) as exchange, \
+         patch.dict("os.environ", {"META_APP_SECRET": "secret"}):
+        refresher = TokenRefresher(fraction=0.8, retry_delay=0.01)
+        refresher.ensure_started()
+        for _ in range(100):
+            if refresher.refreshes:
+                break
+            await asyncio.sleep(0.01)
+        await refresher.stop()
+
+    assert manager.token_info is renewed
+    assert refresher.refreshes == 1
+    exchange.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_renewals_keep_the_current_token():
+    current = _token(expires_in=100, age=90)
+    manager = _meta_auth_manager(current)
+
+    with patch("meta_ads_mcp.core.auth.auth_manager", manager), \
+         patch("meta_ads_mcp.core.auth.exchange_token_for_long_lived", return_value=None), \
+         patch.dict("os.environ", {"META_APP_SECRET": "secret"}):
+        assert await TokenRefresher().refresh_once() is False
+
+    assert manager.token_info is current
+
+
+@pytest.mark.asyncio
+async def test_not_started_without_an_expiring_token():
+    refresher = TokenRefresher()
+    with patch("meta_ads_mcp.core.auth.auth_manager", _meta_auth_manager(TokenInfo("token"))):
+        refresher.ensure_started()
+    assert refresher.get_stats()["running"] is False
@@ -0,0 +1,100 @@
+"""Tests for the tool manifest, lazy tool loading and startup profiling."""
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from meta_ads_mcp.core import mcp_server
+from meta_ads_mcp.core.startup_profile import parse_importtime
+from meta_ads_mcp.core.tool_manifest import (
+    CONDITIONAL_TOOL_MODULES,
+    LazyTool,
+    build_manifest,
+    load_manifest,
+    register_lazy_tools,
+)
+
+
+def _unconditional(entries):
+    return {
+        entry["name"]: {k: entry[k] for k in ("module", "function", "description", "parameters", "output_schema")}
+        for entry in entries
+        if entry["module"] not in CONDITIONAL_TOOL_MODULES
+    }
+
+
+def test_manifest_matches_registered_tools():
+    # Fails when a tool changes without `meta-ads-mcp --write-tool-manifest`
+    assert _unconditional(load_manifest()) == _unconditional(build_manifest(mcp_server._tool_manager))
+
+
+@pytest.mark.asyncio
+async def test_lazy_registration_lists_manifest_schemas(monkeypatch):
+    for env_var in CONDITIONAL_TOOL_MODULES.values():
+        monkeypatch.delenv(env_var, raising=False)
+    server = FastMCP("lazy-test")
+
+    assert register_lazy_tools(server)
+
+    manifest = load_manifest()
+    listed = {tool.name: tool for tool in await server.list_tools()}
+    assert set(listed) == set(_unconditional(manifest))
+    entry = manifest[0]
+    assert listed[entry["name"]].inputSchema == entry["parameters"]
+    assert isinstance(server._tool_manager._tools[entry["name"]], LazyTool)
+
+
+def test_real_registration_replaces_stub_in_place(monkeypatch):
+    monkeypatch.setenv("META_ADS_ENABLE_REPORTS", "1")
+    server = FastMCP("lazy-test")
+    register_lazy_tools(server)
+    names = list(server._tool_manager._tools)
+
+    @server.tool()
+    async def generate_report(access_token: str = None) -> str:
+        return "report"
+
+    tool = server._tool_manager.get_tool("generate_report")
+    assert not isinstance(tool, LazyTool)
+    assert tool.fn is generate_report
+    assert list(server._tool_manager._tools) == names
+
+
+def test_missing_manifest_falls_back(tmp_path):
+    server = FastMCP("lazy-test")
+    assert not register_lazy_tools(server, path=tmp_path / "missing.json")
+    assert server._tool_manager.list_tools() == []
+
+
+def test_lazy_startup_defers_tool_modules():
+    script = (
+        "import asyncio, json, sys\n"
+        "from meta_ads_mcp.core import mcp_server\n"
+        "before = 'meta_ads_mcp.core.ads' in sys.modules, 'PIL' in sys.modules\n"
+        "tool = mcp_server._tool_manager.get_tool('get_ad_image')\n"
+        "print(json.dumps({'before': before, 'after': 'meta_ads_mcp.core.ads' in sys.modules,\n"
+        "                  'type': type(tool).__name__}))\n"
+    )
+    env = dict(os.environ, META_ADS_LAZY_TOOLS="1", META_APP_ID="1", META_APP_SECRET="1")
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=120)
+
+    assert completed.returncode == 0, completed.stderr
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert result == {"before": [False, False], "after": True, "type": "Tool"}
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     json.decoder\n"
+        "import time:       300 |        420 |   json\n"
+        "import time:      1000 |       1420 | meta_ads_mcp\n"
+    )
+    assert parse_importtime(output) == [
+        ("json.decoder", 120, 120),
+        ("json", 300, 420),
+        ("meta_ads_mcp", 1000, 1420),
+    ]
@@ -0,0 +1,95 @@
+"""Tests for tracing spans around tools and Graph API requests."""
+
+import json
+import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from meta_ads_mcp.core.api import make_api_request, meta_api_tool
+from meta_ads_mcp.core.tracing import JsonFileExporter, NOOP_SPAN, Tracer, create_tracer
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, record):
+        self.spans.append(record)
+
+
+@pytest.fixture
+def exporter():
+    recording = RecordingExporter()
+    with patch("meta_ads_mcp.core.api.tracer", Tracer(recording)):
+        yield recording
+
+
+def _client(*responses):
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=list(responses))
+    return client
+
+
+def _response(status, body, endpoint):
+    return httpx.Response(status, json=body, request=httpx.Request("GET", f"https://graph.facebook.com/v22.0/{endpoint}"))
+
+
+def test_disabled_tracer_returns_noop_span():
+    tracer = create_tracer("")
+    assert not tracer.enabled
+    assert tracer.start_span("anything") is NOOP_SPAN
+
+
+@pytest.mark.asyncio
+async def test_tool_span_parents_graph_request_spans(exporter):
+    @meta_api_tool
+    async def fan_out_tool(access_token: str = None):
+        first = await make_api_request("act_1/campaigns", access_token, {"fields": "id"})
+        second = await make_api_request("act_1/adsets", access_token, {"fields": "id"})
+        return {"campaigns": first, "adsets": second}
+
+    client = _client(_response(200, {"data": []}, "act_1/campaigns"), _response(200, {"data": [1]}, "act_1/adsets"))
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client):
+        await fan_out_tool(access_token="token")
+
+    spans = {(span["name"], span["attributes"].get("meta.endpoint")): span for span in exporter.spans}
+    tool = spans[("tool fan_out_tool", None)]
+    campaigns = spans[("graph.request", "act_{id}/campaigns")]
+    http_spans = [span for span in exporter.spans if span["name"] == "graph.http"]
+
+    assert tool["parent_span_id"] is None
+    assert tool["attributes"]["mcp.tool.status"] == "ok"
+    assert campaigns["parent_span_id"] == tool["span_id"]
+    assert campaigns["attributes"]["meta.cache_hit"] is False
+    assert len(http_spans) == 2
+    assert {span["trace_id"] for span in exporter.spans} == {tool["trace_id"]}
+    assert http_spans[0]["parent_span_id"] == campaigns["span_id"]
+    assert http_spans[0]["attributes"]["http.status_code"] == 200
+    assert http_spans[0]["attributes"]["http.response.body.size"] == len(b'{"data":[]}')
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_mark_spans_as_errors(exporter):
+    client = _client(_response(400, {"error": {"code": 100, "message": "Invalid parameter"}}, "act_2"))
+    with patch("meta_ads_mcp.core.api.get_http_client", return_value=client):
+        await make_api_request("act_2", "token", {"fields": "id"})
+
+    request_span = next(span for span in exporter.spans if span["name"] == "graph.request")
+    http_span = next(span for span in exporter.spans if span["name"] == "graph.http")
+    assert request_span["status"] == "ERROR"
+    assert http_span["status"] == "ERROR"
+    assert http_span["attributes"]["http.status_code"] == 400
+
+
+def test_json_file_exporter_writes_span_lines(tmp_path):
+    exporter = JsonFileExporter(tmp_path / "traces.jsonl")
+    tracer = Tracer(exporter)
+    with tracer.start_span("outer", {"key": "value"}):
+        with tracer.start_span("inner"):
+            pass
+    exporter.shutdown()
+
+    lines = [json.loads(line) for line in (tmp_path / "traces.jsonl").read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["inner", "outer"]
+    assert lines[0]["parent_span_id"] == lines[1]["span_id"]
+    assert lines[1]["attributes"] == {"key": "value"}